@@ -0,0 +1,81 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks for applying operations to the state of default.qubit.
+"""
+import tracemalloc
+
+import numpy as np
+import pytest
+
+import pennylane as qml
+
+WIRES = [10, 14, 18] + [pytest.param(n, marks=pytest.mark.slow) for n in (22, 24)]
+
+
+def _layer(n_wires):
+    """A layer of single-qubit rotations followed by a ring of CNOTs"""
+    angles = np.random.random((n_wires, 3))
+    ops = [qml.Rot(*angles[i], wires=i) for i in range(n_wires)]
+    ops += [qml.CNOT(wires=[i, (i + 1) % n_wires]) for i in range(n_wires)]
+    return ops
+
+
+@pytest.mark.parametrize("n_wires", WIRES)
+def bm_apply(benchmark, n_wires):
+    """Applies a layer of rotations and CNOTs to the state"""
+    dev = qml.device("default.qubit", wires=n_wires)
+    ops = _layer(n_wires)
+
+    def apply():
+        dev.reset()
+        dev.apply(ops)
+
+    benchmark(apply)
+
+
+@pytest.mark.parametrize("n_wires", WIRES)
+def bm_apply_diagonal(benchmark, n_wires):
+    """Applies a layer of diagonal gates, which take the elementwise multiplication path"""
+    dev = qml.device("default.qubit", wires=n_wires)
+    ops = [qml.RZ(x, wires=i) for i, x in enumerate(np.random.random(n_wires))]
+    ops += [qml.CZ(wires=[i, (i + 1) % n_wires]) for i in range(n_wires)]
+
+    def apply():
+        dev.reset()
+        dev.apply(ops)
+
+    benchmark(apply)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("inplace", [True, False])
+@pytest.mark.parametrize("n_wires", [24, 25, 26])
+def bm_apply_inplace(benchmark, n_wires, inplace):
+    """Applies a layer of rotations and CNOTs to the state, with and without in-place
+    updates of the state, and records the peak memory allocated while applying it"""
+    dev = qml.device("default.qubit", wires=n_wires)
+    dev._inplace_updates = inplace  # pylint: disable=protected-access
+    ops = _layer(n_wires) + [qml.Hadamard(wires=i) for i in range(n_wires)]
+
+    def apply():
+        dev.reset()
+        dev.apply(ops)
+
+    tracemalloc.start()
+    apply()
+    benchmark.extra_info["peak_memory_mib"] = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+
+    benchmark.pedantic(apply, rounds=3)
@@ -0,0 +1,57 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks for executing tapes and computing their Jacobian with qml.execute.
+"""
+import pytest
+
+import pennylane as qml
+
+N_LAYERS = 2
+N_WIRES = 6
+
+GRADIENT_METHODS = {
+    "parameter-shift": {"gradient_fn": qml.gradients.param_shift},
+    "finite-diff": {"gradient_fn": qml.gradients.finite_diff},
+    "adjoint": {"gradient_fn": "device", "gradient_kwargs": {"method": "adjoint_jacobian"}},
+    "backprop": {"gradient_fn": "backprop"},
+}
+
+
+def _device(method):
+    name = "default.qubit.autograd" if method == "backprop" else "default.qubit"
+    return qml.device(name, wires=N_WIRES)
+
+
+@pytest.mark.parametrize("method", list(GRADIENT_METHODS))
+def bm_execute_forward(benchmark, layered_tape, method):
+    """Executes a layered circuit, without differentiating it"""
+    tape = layered_tape(N_LAYERS, N_WIRES)
+    dev = _device(method)
+
+    benchmark(qml.execute, [tape], dev, cache=False, **GRADIENT_METHODS[method])
+
+
+@pytest.mark.parametrize("method", list(GRADIENT_METHODS))
+def bm_execute_jacobian(benchmark, layered_tape, method):
+    """Computes the Jacobian of a layered circuit with respect to all of its parameters"""
+    tape = layered_tape(N_LAYERS, N_WIRES)
+    params = qml.numpy.array(tape.get_parameters(), requires_grad=True)
+    dev = _device(method)
+
+    def cost(x):
+        tape.set_parameters(x)
+        return qml.execute([tape], dev, cache=False, **GRADIENT_METHODS[method])[0]
+
+    benchmark(qml.jacobian(cost), params)
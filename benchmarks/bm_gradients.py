@@ -0,0 +1,39 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks for the gradient transforms.
+"""
+import pytest
+
+import pennylane as qml
+
+
+@pytest.mark.parametrize("n_layers", [1, 3, 6])
+def bm_param_shift_tapes(benchmark, layered_tape, n_layers):
+    """Generates the parameter-shift tapes of layered templates"""
+    tape = layered_tape(n_layers, 4)
+    benchmark(qml.gradients.param_shift, tape)
+
+
+@pytest.mark.parametrize("n_layers", [1, 3])
+def bm_param_shift(benchmark, layered_tape, n_layers):
+    """Generates, executes and post-processes the parameter-shift tapes of layered templates"""
+    tape = layered_tape(n_layers, 4)
+    dev = qml.device("default.qubit", wires=4)
+
+    def jacobian():
+        tapes, fn = qml.gradients.param_shift(tape)
+        return fn(dev.batch_execute(tapes))
+
+    benchmark(jacobian)
@@ -0,0 +1,35 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks for the construction of molecular Hamiltonians.
+"""
+import numpy as np
+import pytest
+
+import pennylane as qml
+
+MOLECULES = {
+    "H2": (["H", "H"], np.array([0.0, 0.0, -0.6614, 0.0, 0.0, 0.6614])),
+    "HeH+": (["He", "H"], np.array([0.0, 0.0, 0.0, 0.0, 0.0, 1.5])),
+}
+
+
+@pytest.mark.qchem
+@pytest.mark.parametrize("molecule", list(MOLECULES))
+def bm_molecular_hamiltonian(benchmark, molecule):
+    """Builds the qubit Hamiltonian of a molecule with the differentiable Hartree-Fock solver"""
+    symbols, coordinates = MOLECULES[molecule]
+    charge = 1 if molecule.endswith("+") else 0
+
+    benchmark(qml.qchem.molecular_hamiltonian, symbols, coordinates, charge=charge)
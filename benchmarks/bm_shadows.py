@@ -0,0 +1,36 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks for the post-processing of classical shadows.
+"""
+import numpy as np
+import pytest
+
+import pennylane as qml
+from pennylane.shadows import ClassicalShadow
+
+
+@pytest.mark.parametrize("shots", [1000, 10000])
+def bm_classical_shadow_expval(benchmark, shots):
+    """Estimates the expectation value of a Hamiltonian from a classical shadow"""
+    n_wires = 8
+    bits = np.random.randint(0, 2, size=(shots, n_wires))
+    recipes = np.random.randint(0, 3, size=(shots, n_wires))
+    shadow = ClassicalShadow(bits, recipes)
+
+    obs = [qml.PauliX(i) @ qml.PauliX(i + 1) for i in range(n_wires - 1)]
+    obs += [qml.PauliZ(i) @ qml.PauliZ(i + 1) for i in range(n_wires - 1)]
+    H = qml.Hamiltonian(np.ones(len(obs)), obs)
+
+    benchmark(shadow.expval, H, k=10)
@@ -0,0 +1,64 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Benchmarks for circuit transforms.
+"""
+import pytest
+
+import pennylane as qml
+
+
+def _hamiltonian(n_wires, n_terms):
+    """Random Hamiltonian made of n_terms two-local Pauli words"""
+    paulis = [qml.PauliX, qml.PauliY, qml.PauliZ]
+    coeffs = []
+    obs = []
+
+    for i in range(n_terms):
+        w = i % (n_wires - 1)
+        obs.append(paulis[i % 3](w) @ paulis[(i // 3) % 3](w + 1))
+        coeffs.append(0.1 * (i + 1))
+
+    return qml.Hamiltonian(coeffs, obs)
+
+
+@pytest.mark.parametrize("group", [False, True])
+def bm_hamiltonian_expand(benchmark, layered_tape, group):
+    """Splits the measurement of a Hamiltonian into measurements of its terms"""
+    H = _hamiltonian(6, 50)
+
+    if group:
+        H.compute_grouping()
+
+    tape = layered_tape(2, 6, obs=H)
+    benchmark(qml.transforms.hamiltonian_expand, tape, group=group)
+
+
+def bm_cut_circuit(benchmark):
+    """Cuts a circuit into fragments, executes them and recombines their results"""
+    dev = qml.device("default.qubit", wires=4)
+
+    @qml.cut_circuit
+    @qml.qnode(dev)
+    def circuit(x):
+        for i in range(3):
+            qml.RX(x, wires=i)
+            qml.RY(0.9, wires=i + 3)
+
+        qml.broadcast(qml.CZ, wires=range(3), pattern="chain")
+        qml.WireCut(wires=2)
+        qml.broadcast(qml.CZ, wires=range(2, 6), pattern="chain")
+        return qml.expval(qml.grouping.string_to_pauli_word("ZZZZZZ"))
+
+    benchmark(circuit, 0.5)
@@ -0,0 +1,46 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Pytest configuration file for the PennyLane benchmark suite.
+"""
+import numpy as np
+import pytest
+
+import pennylane as qml
+
+
+@pytest.fixture(autouse=True)
+def seed():
+    """Seeds the global random number generator, so that every benchmark
+    run works on the same inputs"""
+    np.random.seed(42)
+
+
+@pytest.fixture
+def layered_tape():
+    """Factory returning a tape of strongly entangling layers, expanded to native gates,
+    with trainable weights and the expectation value of ``obs`` (by default ``PauliZ``
+    on the first wire)"""
+
+    def _layered_tape(n_layers, n_wires, obs=None):
+        shape = qml.StronglyEntanglingLayers.shape(n_layers=n_layers, n_wires=n_wires)
+        weights = qml.numpy.array(np.random.random(shape), requires_grad=True)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.StronglyEntanglingLayers(weights, wires=range(n_wires))
+            qml.expval(obs or qml.PauliZ(0))
+
+        return tape.expand(depth=2)
+
+    return _layered_tape
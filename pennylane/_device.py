@@ -37,7 +37,9 @@ from pennylane.measurements import (
     Expectation,
     Probability,
     MidMeasure,
+    MutualInfo,
     ShadowExpval,
+    VnEntropy,
 )
 from pennylane.wires import Wires, WireError
 
@@ -146,6 +148,7 @@ class Device(abc.ABC):
 
         self.tracker = qml.Tracker()
         self.custom_expand_fn = None
+        self.expansion_cache = None
 
     def __repr__(self):
         """String representation."""
@@ -590,6 +593,28 @@ class Device(abc.ABC):
         gradient_method = getattr(self, method)
         return [gradient_method(circuit, **kwargs) for circuit in circuits]
 
+    def vjps(self, circuits, dys, method, **kwargs):
+        """Return the vector-Jacobian products of a batch of quantum circuits on the device.
+
+        The vector-Jacobian product method ``method`` is called sequentially for each
+        circuit and the corresponding output gradient, and the results are collected in a
+        list. Unlike :meth:`~.gradients`, this allows devices to contract the output
+        gradients during the computation, without computing the Jacobians.
+
+        Args:
+            circuits (list[.tape.QuantumTape]): circuits to execute on the device
+            dys (list[tensor_like]): gradients with respect to the outputs of the circuits
+            method (str): the device method to call to compute the vector-Jacobian product of
+                a single circuit, for example ``"adjoint_vjp"``
+            **kwargs: keyword argument to pass when calling ``method``
+
+        Returns:
+            list[array[float]]: List of vector-Jacobian products, with one entry for each
+            trainable parameter of the circuit.
+        """
+        vjp_method = getattr(self, method)
+        return [vjp_method(circuit, dy, **kwargs) for circuit, dy in zip(circuits, dys)]
+
     @property
     def stopping_condition(self):
         """.BooleanFn: Returns the stopping condition for the device. The returned
@@ -681,11 +706,27 @@ class Device(abc.ABC):
         Returns:
             .QuantumTape: The expanded/decomposed circuit, such that the device
             will natively support all operations.
+
+        .. note::
+
+            Setting the ``expansion_cache`` attribute of the device to an
+            :class:`~.ExpansionCache` stores the results of the default expansion. Circuits
+            differing only by their parameter values from a previously expanded circuit are
+            then not decomposed again; instead, their parameters are bound to a copy of the
+            stored expansion. By default, ``expansion_cache`` is ``None`` and circuits are
+            expanded in every execution.
         """
         if self.custom_expand_fn is not None:
             return self.custom_expand_fn(circuit, max_expansion=max_expansion)
 
-        return self.default_expand_fn(circuit, max_expansion=max_expansion)
+        if self.expansion_cache is None:
+            return self.default_expand_fn(circuit, max_expansion=max_expansion)
+
+        return self.expansion_cache.expand(
+            circuit,
+            lambda tape: self.default_expand_fn(tape, max_expansion=max_expansion),
+            key=max_expansion,
+        )
 
     def batch_transform(self, circuit):
         """Apply a differentiable batch transform for preprocessing a circuit
@@ -765,9 +806,14 @@ class Device(abc.ABC):
             def hamiltonian_fn(res):
                 return res[0]
 
+        # Entropies are computed from a single state, and are not supported with broadcasting
+        supports_broadcasting = self.capabilities().get("supports_broadcasting") and not any(
+            t in return_types for t in [VnEntropy, MutualInfo]
+        )
+
         # Check whether the circuit was broadcasted (then the Hamiltonian-expanded
         # ones will be as well) and whether broadcasting is supported
-        if circuit.batch_size is None or self.capabilities().get("supports_broadcasting"):
+        if circuit.batch_size is None or supports_broadcasting:
             # If the circuit wasn't broadcasted or broadcasting is supported, no action required
             return circuits, hamiltonian_fn
 
@@ -19,8 +19,11 @@ This module contains the :class:`QubitDevice` abstract base class.
 # e.g. instead of expval(self, observable, wires, par) have expval(self, observable)
 # pylint: disable=arguments-differ, abstract-method, no-value-for-parameter,too-many-instance-attributes,too-many-branches, no-member, bad-option-value, arguments-renamed
 import abc
+import copy
 import itertools
+import queue
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -28,7 +31,6 @@ import pennylane as qml
 from pennylane import Device, DeviceError
 from pennylane.interfaces import set_shots
 from pennylane.math import multiply as qmlmul
-from pennylane.math import sum as qmlsum
 
 from pennylane.measurements import (
     Counts,
@@ -44,10 +46,27 @@ from pennylane.measurements import (
     Variance,
     VnEntropy,
 )
-from pennylane.operation import operation_derivative
+from pennylane.tracker import Tracker, stage
 from pennylane.wires import Wires
 
 
+class _ExecutionRecords(Tracker):
+    """Tracker of a device copy executing circuits in a worker thread of
+    :meth:`.QubitDevice.batch_execute`.
+
+    The updates of each execution are stored in ``updates``, such that they can be
+    recorded by the tracker of the device once all circuits are executed.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.active = True
+        self.updates = []
+
+    def update(self, **kwargs):
+        self.updates.append(kwargs)
+
+
 class QubitDevice(Device):
     """Abstract base class for PennyLane qubit devices.
 
@@ -86,6 +105,11 @@ class QubitDevice(Device):
             If a list of integers is passed, the circuit evaluations are batched over the list of shots.
         r_dtype: Real floating point precision type.
         c_dtype: Complex floating point precision type.
+        max_workers (None, int): Maximum number of threads used by :meth:`~.batch_execute`
+            to execute circuits in parallel. If ``None`` (default), circuits are executed serially.
+        seed (None, int, array_like[int], SeedSequence, BitGenerator, Generator): Seed used to
+            initialize a ``numpy.random.Generator`` private to the device, from which samples
+            are drawn. If ``None`` (default), the global NumPy random state is used.
     """
 
     # pylint: disable=too-many-public-methods
@@ -200,7 +224,15 @@ class QubitDevice(Device):
     }
 
     def __init__(
-        self, wires=1, shots=None, *, r_dtype=np.float64, c_dtype=np.complex128, analytic=None
+        self,
+        wires=1,
+        shots=None,
+        *,
+        r_dtype=np.float64,
+        c_dtype=np.complex128,
+        analytic=None,
+        max_workers=None,
+        seed=None,
     ):
         super().__init__(wires=wires, shots=shots, analytic=analytic)
 
@@ -208,13 +240,50 @@ class QubitDevice(Device):
             raise DeviceError("Real datatype must be a floating point type.")
         if "complex" not in str(c_dtype):
             raise DeviceError("Complex datatype must be a complex floating point type.")
+        if max_workers is not None and max_workers < 1:
+            raise DeviceError("The maximum number of workers must be a positive integer.")
 
         self.C_DTYPE = c_dtype
         self.R_DTYPE = r_dtype
+        self.max_workers = max_workers
 
-        self._samples = None
+        self._rng = None if seed is None else np.random.default_rng(seed)
+        """None or numpy.random.Generator: the source of random numbers used for sampling.
+        If ``None``, the global NumPy random state is used."""
+
+        self._binary_samples = None
+        self._basis_state_samples = None
+        """None or array[int]: stores the samples generated by the device as computational
+        basis states in base 10 representation, which are expanded to ``self._samples``
+        only if needed."""
+
+        self._basis_state_counts = None
+        """None or array[int]: stores the number of samples of each computational basis state,
+        if no individual samples are measured."""
+
+        self._sample_indices_cache = None
+        """None or tuple[array[int], dict]: the samples for which the sampled basis states
+        were computed, and the sampled basis states of each set of wires."""
+
+    @property
+    def _samples(self):
         """None or array[int]: stores the samples generated by the device
-        *after* rotation to diagonalize the observables."""
+        *after* rotation to diagonalize the observables.
+
+        If the samples are stored as basis states in base 10 representation, they are
+        converted to the binary representation once this attribute is accessed."""
+        self._expand_basis_state_counts()
+
+        if self._binary_samples is None and self._basis_state_samples is not None:
+            self._binary_samples = self.states_to_binary(self._basis_state_samples, self.num_wires)
+
+        return self._binary_samples
+
+    @_samples.setter
+    def _samples(self, samples):
+        self._binary_samples = samples
+        self._basis_state_samples = None
+        self._basis_state_counts = None
 
     @classmethod
     def capabilities(cls):
@@ -236,21 +305,128 @@ class QubitDevice(Device):
         Most importantly the quantum state is reset to its initial value.
         """
         self._samples = None
+        self._sample_indices_cache = None
+
+    def _partitioned_statistics(self, observables):
+        """Compute the expectation values, variances and probabilities for all partitions
+        of the shot vector at once.
+
+        Each sample is labelled with the bin of the shot vector it belongs to, and the
+        statistics of all bins are accumulated with a single ``np.bincount`` per measurement,
+        instead of slicing the samples for each partition. This is an auxiliary method of
+        :meth:`execute` and :meth:`execute_new`.
+
+        Args:
+            observables (List[.Observable]): the observables to be measured
+
+        Returns:
+            list[list] or None: for each element of the shot vector, the statistics
+            returned by :meth:`statistics` for its ``shot_range`` and ``bin_size``, or ``None``
+            if the measurements or samples are not supported
+        """
+        if (
+            self._sample_batch_size() is not None
+            or (
+                self._basis_state_samples is None
+                and not isinstance(self._binary_samples, np.ndarray)
+            )
+            or type(self).sample is not QubitDevice.sample
+            or type(self).estimate_probability is not QubitDevice.estimate_probability
+        ):
+            return None
+
+        shots, copies = np.array(self._shot_vector, dtype=np.int64).reshape((-1, 2)).T
+        bin_sizes = np.repeat(shots, copies)
+        num_bins = len(bin_sizes)
+        first_bins = np.cumsum(copies) - copies
+
+        # Probabilities, and projector statistics computed from them, are estimated from
+        # consecutive samples of each bin, whereas other expectation values and variances are
+        # averaged over the first axis of the samples reshaped to ``(bin_size, copies)``, such
+        # that the i-th sample of a partition falls into its bin ``i % copies``.
+        labels = np.repeat(np.arange(num_bins), bin_sizes)
+        partition_sizes = shots * copies
+        partitions = np.repeat(np.arange(len(shots)), partition_sizes)
+        positions = np.arange(len(labels)) - np.repeat(
+            np.cumsum(partition_sizes) - partition_sizes, partition_sizes
+        )
+        strided_labels = first_bins[partitions] + positions % copies[partitions]
+
+        stats = []
+
+        for obs in observables:
+            if obs.return_type not in (Expectation, Variance, Probability):
+                return None
+
+            if obs.return_type is not Probability and obs.name in (
+                "Hamiltonian",
+                "SparseHamiltonian",
+            ):
+                return None
+
+            device_wires = self.map_wires(obs.wires or self.wires)
+            idx = self._sample_indices(device_wires)
+
+            if obs.return_type is Probability:
+                dim = 2 ** len(device_wires)
+                counts = np.bincount(labels * dim + idx, minlength=num_bins * dim)
+                prob = counts.reshape((num_bins, dim)).T / bin_sizes
+                stats.append(self._asarray(prob, dtype=self.R_DTYPE))
+                continue
+
+            try:
+                values = np.asarray(obs.eigvals())[idx]
+            except qml.operation.EigvalsUndefinedError:
+                return None
+
+            bins = labels if obs.name == "Projector" else strided_labels
+            mean = np.bincount(bins, weights=values, minlength=num_bins) / bin_sizes
+            if obs.return_type is Variance:
+                squares = np.bincount(bins, weights=values**2, minlength=num_bins)
+                mean = squares / bin_sizes - mean**2
+            stats.append(mean)
+
+        # binned projector statistics are computed from probabilities, and keep their bin axis
+        keep_bin_axis = [
+            obs.return_type is Probability or obs.name == "Projector" for obs in observables
+        ]
+        results = []
+
+        for start, num_copies in zip(first_bins, copies):
+            results.append(
+                [
+                    stat[..., start]
+                    if num_copies == 1 and not keep
+                    else stat[..., start : start + num_copies]
+                    for stat, keep in zip(stats, keep_bin_axis)
+                ]
+            )
+
+        return results
 
     def _collect_shotvector_results(self, circuit, counts_exist):
         """Obtain and process statistics when using a shot vector.
         This routine is part of the ``execute()`` method."""
 
-        if self._ndim(self._samples) == 3:
+        if self._sample_batch_size() is not None:
             raise NotImplementedError(
                 "Parameter broadcasting when using a shot vector is not supported yet."
             )
         results = []
         s1 = 0
 
-        for shot_tuple in self._shot_vector:
+        # the statistics of all partitions are computed from the samples in a single pass
+        # if possible
+        partitioned = self._partitioned_statistics(circuit.observables)
+
+        for i, shot_tuple in enumerate(self._shot_vector):
             s2 = s1 + np.prod(shot_tuple)
-            r = self.statistics(circuit.observables, shot_range=[s1, s2], bin_size=shot_tuple.shots)
+            if partitioned is None:
+                r = self.statistics(
+                    circuit.observables, shot_range=[s1, s2], bin_size=shot_tuple.shots
+                )
+            else:
+                r = partitioned[i]
 
             if qml.math._multi_dispatch(r) == "jax":  # pylint: disable=protected-access
                 r = r[0]
@@ -312,22 +488,24 @@ class QubitDevice(Device):
         self.check_validity(circuit.operations, circuit.observables)
 
         # apply all circuit operations
-        self.apply(circuit.operations, rotations=circuit.diagonalizing_gates, **kwargs)
-
-        # generate computational basis samples
-        if self.shots is not None or circuit.is_sampled:
-            self._samples = self.generate_samples()
+        with stage("device_apply"):
+            self.apply(circuit.operations, rotations=circuit.diagonalizing_gates, **kwargs)
 
         ret_types = [m.return_type for m in circuit.measurements]
         counts_exist = any(
             ret in (qml.measurements.Counts, qml.measurements.AllCounts) for ret in ret_types
         )
 
-        # compute the required statistics
-        if not self.analytic and self._shot_vector is not None:
-            results = self._collect_shotvector_results(circuit, counts_exist)
-        else:
-            results = self.statistics(circuit.observables, circuit=circuit)
+        with stage("measurement"):
+            # generate computational basis samples
+            if self.shots is not None or circuit.is_sampled:
+                self._store_samples(circuit)
+
+            # compute the required statistics
+            if not self.analytic and self._shot_vector is not None:
+                results = self._collect_shotvector_results(circuit, counts_exist)
+            else:
+                results = self.statistics(circuit.observables, circuit=circuit)
 
         if not circuit.is_sampled:
 
@@ -400,25 +578,27 @@ class QubitDevice(Device):
         self.check_validity(circuit.operations, circuit.observables)
 
         # apply all circuit operations
-        self.apply(circuit.operations, rotations=circuit.diagonalizing_gates, **kwargs)
-
-        # generate computational basis samples
-        if self.shots is not None:
-            self._samples = self.generate_samples()
+        with stage("device_apply"):
+            self.apply(circuit.operations, rotations=circuit.diagonalizing_gates, **kwargs)
 
-        # compute the required statistics
-        if self._shot_vector is not None:
+        with stage("measurement"):
+            # generate computational basis samples
+            if self.shots is not None:
+                self._store_samples(circuit)
 
-            results = self.shot_vec_statistics(circuit)
+            # compute the required statistics
+            if self._shot_vector is not None:
 
-        else:
-            results = self.statistics_new(circuit.observables)
-            single_measurement = len(circuit.measurements) == 1
+                results = self.shot_vec_statistics(circuit)
 
-            if single_measurement:
-                results = results[0]
             else:
-                results = tuple(results)
+                results = self.statistics_new(circuit.observables)
+                single_measurement = len(circuit.measurements) == 1
+
+                if single_measurement:
+                    results = results[0]
+                else:
+                    results = tuple(results)
 
         # increment counter for number of executions of qubit device
         # self._num_executions += 1
@@ -454,12 +634,19 @@ class QubitDevice(Device):
             ret in (qml.measurements.Counts, qml.measurements.AllCounts) for ret in ret_types
         )
         single_measurement = len(circuit.measurements) == 1
+        partitioned = self._partitioned_statistics(circuit.observables)
 
-        for shot_tuple in self._shot_vector:
+        for i, shot_tuple in enumerate(self._shot_vector):
             s2 = s1 + np.prod(shot_tuple)
-            r = self.statistics_new(
-                circuit.observables, shot_range=[s1, s2], bin_size=shot_tuple.shots
-            )
+            if partitioned is None:
+                r = self.statistics_new(
+                    circuit.observables, shot_range=[s1, s2], bin_size=shot_tuple.shots
+                )
+            else:
+                # post-process the results as statistics_new does
+                r = [
+                    qml.math.squeeze(self._asarray(r_, dtype=self.R_DTYPE)) for r_ in partitioned[i]
+                ]
 
             # This will likely be required:
             # if qml.math._multi_dispatch(r) == "jax":  # pylint: disable=protected-access
@@ -576,15 +763,19 @@ class QubitDevice(Device):
         # TODO: This method and the tests can be globally implemented by Device
         # once it has the same signature in the execute() method
 
-        results = []
-        for circuit in circuits:
-            # we need to reset the device here, else it will
-            # not start the next computation in the zero state
-            self.reset()
+        if self.max_workers is not None and self.max_workers > 1 and len(circuits) > 1:
+            results = self._parallel_execute(circuits, "execute")
 
-            # TODO: Insert control on value here
-            res = self.execute(circuit)
-            results.append(res)
+        else:
+            results = []
+            for circuit in circuits:
+                # we need to reset the device here, else it will
+                # not start the next computation in the zero state
+                self.reset()
+
+                # TODO: Insert control on value here
+                res = self.execute(circuit)
+                results.append(res)
 
         if self.tracker.active:
             self.tracker.update(batches=1, batch_len=len(circuits))
@@ -611,6 +802,9 @@ class QubitDevice(Device):
         # TODO: This method and the tests can be globally implemented by Device
         # once it has the same signature in the execute() method
 
+        if self.max_workers is not None and self.max_workers > 1 and len(circuits) > 1:
+            return self._parallel_execute(circuits, "execute_new")
+
         results = []
         for circuit in circuits:
             # we need to reset the device here, else it will
@@ -627,6 +821,96 @@ class QubitDevice(Device):
 
         return results
 
+    def _worker_copy(self):
+        """Return a copy of the device executing circuits in a worker thread of
+        :meth:`batch_execute`.
+
+        The copy shares the configuration of the device, while the attributes storing the
+        state of an execution, such as samples, the debugger and the tracker, are private
+        to the copy.
+
+        Returns:
+            .QubitDevice: the copy of the device
+        """
+        # pylint: disable=protected-access,attribute-defined-outside-init
+        worker = copy.copy(self)
+        worker._num_executions = 0
+        worker._debugger = None
+        worker._samples = None
+        worker._sample_indices_cache = None
+        worker.tracker = _ExecutionRecords()
+        return worker
+
+    def _parallel_execute(self, circuits, method):
+        """Execute circuits concurrently in a pool of threads.
+
+        Each thread executes circuits on a copy of the device (see :meth:`_worker_copy`),
+        such that the simulator state is private to the thread, while the final circuit is
+        executed on the device itself. The device is therefore left in the same state as
+        after a serial execution.
+
+        Each circuit executed by a thread draws samples from its own random number generator,
+        spawned from a seed drawn from the device generator, or from the global NumPy random
+        state if the device is not seeded. Seeded executions are thus reproducible,
+        independently of the scheduling of the threads.
+
+        Args:
+            circuits (list[.tapes.QuantumTape]): circuits to execute on the device
+            method (str): name of the method executing a single circuit, either
+                ``"execute"`` or ``"execute_new"``
+
+        Returns:
+            list[array[float]]: list of measured value(s)
+        """
+        num_workers = min(self.max_workers, len(circuits)) - 1
+        workers = queue.SimpleQueue()
+
+        for _ in range(num_workers):
+            workers.put(self._worker_copy())
+
+        if self.shots is None:
+            seeds = [None] * (len(circuits) - 1)
+        else:
+            if self._rng is None:
+                entropy = np.random.randint(2**32, size=4)
+            else:
+                entropy = self._rng.integers(2**32, size=4)
+
+            seeds = np.random.SeedSequence(entropy).spawn(len(circuits) - 1)
+
+        records = [[] for _ in seeds]
+
+        def _execute(idx):
+            worker = workers.get()
+            try:
+                # pylint: disable=protected-access
+                worker._rng = np.random.default_rng(seeds[idx])
+                worker.tracker.updates = records[idx]
+                worker.reset()
+                return getattr(worker, method)(circuits[idx])
+            finally:
+                workers.put(worker)
+
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = [executor.submit(_execute, idx) for idx in range(len(circuits) - 1)]
+
+            self.reset()
+            last_result = getattr(self, method)(circuits[-1])
+            results = [f.result() for f in futures] + [last_result]
+
+        for _ in range(num_workers):
+            # pylint: disable=protected-access
+            self._num_executions += workers.get()._num_executions
+
+        if self.tracker.active:
+            # the executions of the worker threads are recorded in the order of the circuits
+            for updates in records:
+                for update in updates:
+                    self.tracker.update(**update)
+                    self.tracker.record()
+
+        return results
+
     @abc.abstractmethod
     def apply(self, operations, **kwargs):
         """Apply quantum operations, rotate the circuit into the measurement
@@ -1037,6 +1321,118 @@ class QubitDevice(Device):
         samples = self.sample_basis_states(number_of_states, rotated_prob)
         return self.states_to_binary(samples, self.num_wires)
 
+    def _generate_basis_state_samples(self):
+        """Return the computational basis samples generated for all wires as basis states
+        in base 10 representation.
+
+        Returns:
+            array[int] or None: array of samples in the shape ``(dev.shots,)``, or ``None``
+            if the device generates its own samples by overriding :meth:`generate_samples`
+        """
+        if type(self).generate_samples is not QubitDevice.generate_samples:
+            return None
+
+        return self.sample_basis_states(2**self.num_wires, self.analytic_probability())
+
+    def sample_basis_state_counts(self, number_of_states, state_probability):
+        """Sample the number of occurrences of each computational basis state based on the
+        state probability.
+
+        The counts are drawn from a single multinomial distribution, such that the memory and
+        time required do not grow with the number of shots.
+
+        Args:
+            number_of_states (int): the number of basis states to sample from
+            state_probability (array[float]): the computational basis probability vector
+
+        Returns:
+            array[int]: the number of samples of each basis state
+        """
+        if self.shots is None:
+            raise qml.QuantumFunctionError(
+                "The number of shots has to be explicitly set on the device "
+                "when using sample-based measurements."
+            )
+
+        # the probabilities are normalized in double precision, as required by the
+        # multinomial distribution
+        state_probability = np.reshape(
+            np.asarray(state_probability, dtype=np.float64), (number_of_states,)
+        )
+        state_probability = state_probability / np.sum(state_probability)
+        rng = np.random if self._rng is None else self._rng
+
+        return rng.multinomial(self.shots, state_probability)
+
+    def _store_samples(self, circuit):
+        """Generate the computational basis samples and store them on the device.
+
+        Samples are stored as basis states in base 10 representation, using one integer per
+        shot instead of one per shot and wire, unless the device overrides
+        :meth:`generate_samples` or the sampled basis states are not a NumPy array. If no
+        individual samples are measured, but only counts, probabilities, expectation values and
+        variances, the number of samples of each basis state is sampled instead with
+        :meth:`sample_basis_state_counts`. This is an auxiliary method of :meth:`execute` and
+        :meth:`execute_new`.
+
+        Args:
+            circuit (~.tape.QuantumTape): the circuit to execute
+        """
+        if (
+            self._shot_vector is None
+            and self.shots is not None
+            and type(self).generate_samples is QubitDevice.generate_samples
+            and type(self).sample_basis_states is QubitDevice.sample_basis_states
+            and all(
+                m.return_type in (Counts, AllCounts, Probability)
+                or (
+                    m.return_type in (Expectation, Variance)
+                    and m.obs.name not in ("Hamiltonian", "SparseHamiltonian")
+                )
+                for m in circuit.measurements
+            )
+        ):
+            prob = self.analytic_probability()
+
+            if isinstance(prob, np.ndarray) and prob.ndim == 1:
+                self._samples = None
+                self._basis_state_counts = self.sample_basis_state_counts(2**self.num_wires, prob)
+                return
+
+        samples = self._generate_basis_state_samples()
+
+        if samples is None:
+            self._samples = self.generate_samples()
+        elif isinstance(samples, np.ndarray):
+            self._binary_samples = None
+            self._basis_state_samples = samples
+        else:
+            self._samples = self.states_to_binary(samples, self.num_wires)
+
+    def _expand_basis_state_counts(self):
+        """Store samples in a random order with the sampled number of occurrences of each
+        basis state, if only their number was sampled."""
+        if self._basis_state_counts is None or self._basis_state_samples is not None:
+            return
+
+        rng = np.random if self._rng is None else self._rng
+        samples = np.repeat(np.arange(len(self._basis_state_counts)), self._basis_state_counts)
+        rng.shuffle(samples)
+        self._basis_state_samples = samples
+
+    def _sample_batch_size(self):
+        """The batch size of the stored samples, or ``None`` if they are not broadcasted."""
+        if self._basis_state_counts is not None:
+            return None
+
+        if self._basis_state_samples is not None:
+            return (
+                self._basis_state_samples.shape[0] if self._basis_state_samples.ndim == 2 else None
+            )
+
+        samples = self._binary_samples
+        return self._shape(samples)[0] if self._ndim(samples) == 3 else None
+
     def sample_basis_states(self, number_of_states, state_probability):
         """Sample from the computational basis states based on the state
         probability.
@@ -1058,13 +1454,26 @@ class QubitDevice(Device):
 
         shots = self.shots
 
-        basis_states = np.arange(number_of_states)
-        if self._ndim(state_probability) == 2:
-            # np.random.choice does not support broadcasting as needed here.
-            return np.array(
-                [np.random.choice(basis_states, shots, p=prob) for prob in state_probability]
-            )
-        return np.random.choice(basis_states, shots, p=state_probability)
+        state_probability = np.asarray(state_probability)
+
+        # Inverse transform sampling: the cumulative distribution is computed once, and
+        # uniform samples are located in it by binary search. Broadcasted distributions
+        # are shifted by their batch index, so that all of them are searched in one call.
+        # the cumulative distribution is accumulated in double precision, as rounding errors
+        # of single-precision probabilities would add up over the basis states
+        cdf = np.cumsum(state_probability, axis=-1, dtype=np.float64)
+        cdf /= cdf[..., -1:]
+        rng = np.random if self._rng is None else self._rng
+
+        if cdf.ndim == 1:
+            samples = np.searchsorted(cdf, rng.random(shots), side="right")
+            return np.minimum(samples, number_of_states - 1)
+
+        offsets = np.arange(cdf.shape[0])[:, np.newaxis]
+        uniform = rng.random((cdf.shape[0], shots)) + offsets
+        samples = np.searchsorted((cdf + offsets).ravel(), uniform.ravel(), side="right")
+        samples = samples.reshape(uniform.shape) - number_of_states * offsets
+        return np.minimum(samples, number_of_states - 1)
 
     def generate_basis_states(self, num_wires, dtype=np.uint32):
         """
@@ -1282,7 +1691,12 @@ class QubitDevice(Device):
                 self.reset()
                 self.apply(circuit.operations, rotations=circuit.diagonalizing_gates + rotations)
 
-                outcomes[t] = self.generate_samples()[0][mapped_wires]
+                samples = self._generate_basis_state_samples()
+                if samples is None:
+                    outcomes[t] = self.generate_samples()[0][mapped_wires]
+                else:
+                    # extract the bits of the wires from the sampled basis state
+                    outcomes[t] = (samples[0] >> (self.num_wires - 1 - mapped_wires)) & 1
 
         return self._cast(self._stack([outcomes, recipes]), dtype=np.int8)
 
@@ -1329,6 +1743,99 @@ class QubitDevice(Device):
         """
         raise NotImplementedError
 
+    @staticmethod
+    def _marginal_indices(indices, num_wires, wires):
+        """Extract the computational basis states of some wires from basis states
+        in base 10 representation.
+
+        The bits of the wires are extracted from the integers with ``(indices >> k) & 1``, and
+        runs of consecutive wires with a single shift and mask, such that the binary
+        representation of the basis states is never created.
+
+        Args:
+            indices (array[int]): basis states of ``num_wires`` wires in base 10 representation
+            num_wires (int): the number of wires of the basis states
+            wires (Sequence[int]): the positions of the wires to extract, the first wire
+                corresponding to the most significant bit
+
+        Returns:
+            array[int]: the basis states of ``wires`` in base 10 representation
+        """
+        wires = [int(w) for w in wires]
+
+        if wires == list(range(num_wires)):
+            return indices
+
+        marginal = 0
+        start = 0
+
+        while start < len(wires):
+            stop = start + 1
+            while stop < len(wires) and wires[stop] == wires[stop - 1] + 1:
+                stop += 1
+
+            bits = (indices >> (num_wires - 1 - wires[stop - 1])) & ((1 << (stop - start)) - 1)
+            marginal = marginal + (bits << (len(wires) - stop))
+            start = stop
+
+        return marginal
+
+    def _sample_indices(self, device_wires=None):
+        """Return the sampled computational basis states of some wires in base 10
+        representation.
+
+        The basis states of all wires are stored by the device, or computed from the binary
+        samples once, and the basis states of fewer wires are extracted from them with :meth:`_marginal_indices`. Results
+        are cached for each set of wires until new samples are stored, such that measurements
+        on the same or overlapping wires share the conversion of the samples.
+
+        Args:
+            device_wires (Sequence[int]): the device wires, defaults to all wires of the device
+
+        Returns:
+            array[int]: the sampled basis states, of shape ``(shots,)`` or
+            ``(batch_size, shots)`` with broadcasting
+        """
+        self._expand_basis_state_counts()
+
+        basis_states = self._basis_state_samples
+        if basis_states is None:
+            samples = self._binary_samples
+            num_wires = np.shape(samples)[-1]
+        else:
+            samples = basis_states
+            num_wires = self.num_wires
+
+        all_wires = tuple(range(num_wires))
+        device_wires = all_wires if device_wires is None else tuple(int(w) for w in device_wires)
+
+        if not isinstance(samples, np.ndarray):
+            # samples of other interfaces, like traced JAX arrays, are not cached
+            indices = {}
+        else:
+            if self._sample_indices_cache is None or self._sample_indices_cache[0] is not samples:
+                self._sample_indices_cache = (samples, {})
+            indices = self._sample_indices_cache[1]
+
+        if basis_states is not None:
+            indices[all_wires] = basis_states
+
+        if device_wires in indices:
+            return indices[device_wires]
+
+        # the basis states of all wires fit into 64 bit integers with fewer than 63 wires
+        if num_wires < 63:
+            if all_wires not in indices:
+                powers_of_two = 2 ** np.arange(num_wires)[::-1]
+                indices[all_wires] = samples @ powers_of_two
+            result = self._marginal_indices(indices[all_wires], num_wires, device_wires)
+        else:
+            powers_of_two = 2 ** np.arange(len(device_wires))[::-1]
+            result = samples[..., np.array(device_wires)] @ powers_of_two
+
+        indices[device_wires] = result
+        return result
+
     def estimate_probability(self, wires=None, shot_range=None, bin_size=None):
         """Return the estimated probability of each computational basis state
         using the generated samples.
@@ -1349,28 +1856,30 @@ class QubitDevice(Device):
         wires = wires or self.wires
         # convert to a Wires object
         wires = Wires(wires)
+
+        if self._basis_state_counts is not None and shot_range is None and bin_size is None:
+            # only the number of samples of each basis state was sampled
+            prob = self._marginal_basis_state_counts(wires) / self.shots
+            return self._asarray(prob, dtype=self.R_DTYPE)
+
         # translate to wire labels used by device
         device_wires = self.map_wires(wires)
         num_wires = len(device_wires)
 
-        if shot_range is None:
-            # The Ellipsis (...) corresponds to broadcasting and shots dimensions or only shots
-            samples = self._samples[..., device_wires]
-        else:
-            # The Ellipsis (...) corresponds to the broadcasting dimension or no axis at all
-            samples = self._samples[..., slice(*shot_range), device_wires]
+        # the sampled basis states in base 10 representation
+        indices = self._sample_indices(device_wires)
 
-        # convert samples from a list of 0, 1 integers, to base 10 representation
-        powers_of_two = 2 ** np.arange(num_wires)[::-1]
-        indices = samples @ powers_of_two
+        if shot_range is not None:
+            # The Ellipsis (...) corresponds to the broadcasting dimension or no axis at all
+            indices = indices[..., slice(*shot_range)]
 
-        # `self._samples` typically has two axes ((shots, wires)) but can also have three with
-        # broadcasting ((batch_size, shots, wires)) so that we simply read out the batch_size.
-        batch_size = self._samples.shape[0] if np.ndim(self._samples) == 3 else None
+        # `indices` typically has one axis (shots,) but can also have two with
+        # broadcasting ((batch_size, shots)) so that we simply read out the batch_size.
+        batch_size = indices.shape[0] if np.ndim(indices) == 2 else None
         dim = 2**num_wires
         # count the basis state occurrences, and construct the probability vector
         if bin_size is not None:
-            num_bins = samples.shape[-2] // bin_size
+            num_bins = indices.shape[-1] // bin_size
             prob = self._count_binned_samples(indices, batch_size, dim, bin_size, num_bins)
         else:
             prob = self._count_unbinned_samples(indices, batch_size, dim)
@@ -1382,46 +1891,29 @@ class QubitDevice(Device):
         """Count the occurences of sampled indices and convert them to relative
         counts in order to estimate their occurence probability."""
         if batch_size is None:
-            prob = np.zeros(dim, dtype=np.float64)
-            basis_states, counts = np.unique(indices, return_counts=True)
-            prob[basis_states] = counts / len(indices)
-
-            return prob
+            return np.bincount(indices, minlength=dim) / len(indices)
 
-        prob = np.zeros((batch_size, dim), dtype=np.float64)
+        # the indices of each broadcasting index are shifted, such that they are
+        # counted in a single call
+        offsets = dim * np.arange(batch_size)[:, np.newaxis]
+        counts = np.bincount(np.ravel(indices + offsets), minlength=batch_size * dim)
 
-        for i, idx in enumerate(indices):  # iterate over the broadcasting dimension
-            basis_states, counts = np.unique(idx, return_counts=True)
-            prob[i, basis_states] = counts / len(idx)
-
-        return prob
+        return counts.reshape((batch_size, dim)) / np.shape(indices)[-1]
 
     @staticmethod
     def _count_binned_samples(indices, batch_size, dim, bin_size, num_bins):
         """Count the occurences of bins of sampled indices and convert them to relative
         counts in order to estimate their occurence probability per bin."""
+        num_batches = 1 if batch_size is None else batch_size
+        indices = np.reshape(indices, (num_batches * num_bins, bin_size))
 
-        if batch_size is None:
-            prob = np.zeros((dim, num_bins), dtype=np.float64)
-            indices = indices.reshape((num_bins, bin_size))
-            # count the basis state occurrences, and construct the probability vector for each bin
-            for b, idx in enumerate(indices):
-                basis_states, counts = np.unique(idx, return_counts=True)
-                prob[basis_states, b] = counts / bin_size
-
-            return prob
-
-        prob = np.zeros((batch_size, dim, num_bins), dtype=np.float64)
-        indices = indices.reshape((batch_size, num_bins, bin_size))
-
-        # count the basis state occurrences, and construct the probability vector
-        # for each bin and broadcasting index
-        for i, _indices in enumerate(indices):  # First iterate over broadcasting dimension
-            for b, idx in enumerate(_indices):  # Then iterate over bins dimension
-                basis_states, counts = np.unique(idx, return_counts=True)
-                prob[i, basis_states, b] = counts / bin_size
+        # the indices of each bin and broadcasting index are shifted, such that they are
+        # counted in a single call
+        offsets = dim * np.arange(num_batches * num_bins)[:, np.newaxis]
+        counts = np.bincount(np.ravel(indices + offsets), minlength=num_batches * num_bins * dim)
+        prob = np.swapaxes(counts.reshape((num_batches, num_bins, dim)), 1, 2) / bin_size
 
-        return prob
+        return prob[0] if batch_size is None else prob
 
     def probability(self, wires=None, shot_range=None, bin_size=None):
         """Return either the analytic probability or estimated probability of
@@ -1522,11 +2014,11 @@ class QubitDevice(Device):
         # If this is the case, we must permute the marginalized probability so that
         # it corresponds to the orders of the wires passed.
         num_wires = len(device_wires)
-        basis_states = self.generate_basis_states(num_wires)
-        basis_states = basis_states[:, np.argsort(np.argsort(device_wires))]
+        positions = np.argsort(np.argsort(device_wires))
+        if np.all(positions == np.arange(num_wires)):
+            return prob
 
-        powers_of_two = 2 ** np.arange(len(device_wires))[::-1]
-        perm = basis_states @ powers_of_two
+        perm = self._marginal_indices(np.arange(2**num_wires), num_wires, positions)
         # The permutation happens on the last axis both with and without broadcasting
         out = self._gather(prob, perm, axis=1 if batch_size is not None else 0)
 
@@ -1559,6 +2051,11 @@ class QubitDevice(Device):
             # In case of broadcasting, `prob` has two axes and this is a matrix-vector product
             return self._dot(prob, eigvals)
 
+        if self._basis_state_counts is not None and shot_range is None and bin_size is None:
+            # estimate the ev from the number of samples of each basis state
+            state_counts = self._marginal_basis_state_counts(observable.wires)
+            return np.dot(state_counts, self._sample_eigvals(observable)) / self.shots
+
         # estimate the ev
         samples = self.sample(observable, shot_range=shot_range, bin_size=bin_size)
         # With broadcasting, we want to take the mean over axis 1, which is the -1st/-2nd with/
@@ -1594,6 +2091,13 @@ class QubitDevice(Device):
             # In case of broadcasting, `prob` has two axes and these are a matrix-vector products
             return self._dot(prob, (eigvals**2)) - self._dot(prob, eigvals) ** 2
 
+        if self._basis_state_counts is not None and shot_range is None and bin_size is None:
+            # estimate the variance from the number of samples of each basis state
+            state_counts = self._marginal_basis_state_counts(observable.wires)
+            eigvals = self._sample_eigvals(observable)
+            mean = np.dot(state_counts, eigvals) / self.shots
+            return np.dot(state_counts, eigvals**2) / self.shots - mean**2
+
         # estimate the variance
         samples = self.sample(observable, shot_range=shot_range, bin_size=bin_size)
         # With broadcasting, we want to take the variance over axis 1, which is the -1st/-2nd with/
@@ -1671,6 +2175,142 @@ class QubitDevice(Device):
 
         return outcome_dict
 
+    @staticmethod
+    def _basis_states_to_counts(indices, obs, num_wires, counts=None):
+        """Groups sampled basis states in base 10 representation into a dictionary showing
+        the number of occurences for each outcome.
+
+        Equivalent to :meth:`_samples_to_counts` for a measurement process without an
+        observable, but only the observed basis states are converted to bit strings.
+
+        Args:
+            indices (array[int]): sampled basis states in base 10 representation, or
+                distinct basis states if ``counts`` is provided
+            obs (MeasurementProcess): the measurement process
+            num_wires (int): number of wires the samples were measured on
+            counts (array[int]): the number of occurrences of each basis state in ``indices``,
+                if they were already counted
+
+        Returns:
+            dict: dictionary with format ``{'outcome': num_occurences}``
+        """
+        outcome_dict = {}
+
+        if obs.return_type is AllCounts:
+            outcome_dict = {
+                format(state, f"0{num_wires}b"): np.int64(0) for state in range(2**num_wires)
+            }
+
+        states = indices
+        if counts is None:
+            states, counts = np.unique(indices, return_counts=True)
+
+        for state, count in zip(states, counts):
+            outcome_dict[format(state, f"0{num_wires}b")] = count
+
+        return outcome_dict
+
+    def _samples_to_binned_counts(self, samples, obs, num_wires, bin_size=None):
+        """Groups the samples into counts as in :meth:`_samples_to_counts`, separately for
+        each bin of ``bin_size`` samples if provided."""
+        if bin_size is None:
+            return self._samples_to_counts(samples, obs, num_wires)
+
+        shape = (-1, bin_size, num_wires) if isinstance(obs, MeasurementProcess) else (-1, bin_size)
+        return [self._samples_to_counts(s, obs, num_wires) for s in samples.reshape(shape)]
+
+    def _basis_states_to_binned_counts(self, indices, obs, num_wires, bin_size=None):
+        """Groups sampled basis states in base 10 representation into counts as in
+        :meth:`_basis_states_to_counts`, separately for each bin of ``bin_size`` samples
+        if provided."""
+        if bin_size is None:
+            return self._basis_states_to_counts(indices, obs, num_wires)
+
+        return [
+            self._basis_states_to_counts(bin_indices, obs, num_wires)
+            for bin_indices in indices.reshape((-1, bin_size))
+        ]
+
+    def _marginal_basis_state_counts(self, wires=None):
+        """Return the sampled number of occurrences of each basis state of some wires, as
+        computed from ``self._basis_state_counts``.
+
+        The basis states of ``wires`` are extracted from the basis states of all wires like
+        in :meth:`_sample_indices`, such that the counts follow the order of ``wires``.
+
+        Args:
+            wires (Iterable[Number, str], Number, str, Wires): wires to count the basis states
+                of, defaults to all wires of the device
+
+        Returns:
+            array[int]: the number of occurrences of each basis state of ``wires``
+        """
+        if wires is None or len(wires) == 0:
+            return self._basis_state_counts
+
+        device_wires = self.map_wires(wires)
+        indices = self._marginal_indices(
+            np.arange(2**self.num_wires), self.num_wires, device_wires
+        )
+        counts = np.bincount(
+            indices, weights=self._basis_state_counts, minlength=2 ** len(device_wires)
+        )
+        return counts.astype(np.int64)
+
+    @staticmethod
+    def _sample_eigvals(observable):
+        """Return the eigenvalues of an observable in the computational basis of its wires,
+        as they are returned by :meth:`sample`."""
+        name = observable.name
+        if isinstance(name, str) and name in {"PauliX", "PauliY", "PauliZ", "Hadamard"}:
+            # samples of observables with eigenvalues {1, -1} are integers
+            return 1 - 2 * np.arange(2)
+
+        try:
+            return observable.eigvals()
+        except qml.operation.EigvalsUndefinedError as e:
+            # if observable has no info on eigenvalues, we cannot return this measurement
+            raise qml.operation.EigvalsUndefinedError(
+                f"Cannot compute samples of {observable.name}."
+            ) from e
+
+    def _sampled_counts(self, observable, bin_size=None):
+        """Return the counts of an observable from the sampled number of occurrences of each
+        basis state, as stored in ``self._basis_state_counts``.
+
+        This is an auxiliary method of :meth:`sample`.
+
+        Args:
+            observable (Observable): the observable to sample
+            bin_size (int): the bin size, which has to be ``None`` or the number of shots
+
+        Returns:
+            Union[dict, list[dict]]: the counts, in the format returned by :meth:`sample`
+        """
+        wires = observable.wires or None
+        num_wires = len(observable.wires) or self.num_wires
+        state_counts = self._marginal_basis_state_counts(wires)
+
+        if isinstance(observable, MeasurementProcess):
+            states = np.flatnonzero(state_counts)
+            outcome_dict = self._basis_states_to_counts(
+                states, observable, num_wires, counts=state_counts[states]
+            )
+
+        else:
+            eigvals = self._sample_eigvals(observable)
+            outcomes = qml.eigvals(observable) if observable.return_type is AllCounts else []
+            outcome_dict = {outcome: np.int64(0) for outcome in outcomes}
+
+            # sum the counts of basis states with the same eigenvalue
+            values, inverse = np.unique(eigvals, return_inverse=True)
+            value_counts = np.bincount(inverse, weights=state_counts, minlength=len(values))
+            for value, count in zip(values, value_counts.astype(np.int64)):
+                if count > 0:
+                    outcome_dict[value] = count
+
+        return outcome_dict if bin_size is None else [outcome_dict]
+
     def sample(self, observable, shot_range=None, bin_size=None, counts=False):
         """Return samples of an observable.
 
@@ -1696,23 +2336,43 @@ class QubitDevice(Device):
         # translate to wire labels used by device
         device_wires = self.map_wires(observable.wires)
         name = observable.name
-        # Select the samples from self._samples that correspond to ``shot_range`` if provided
-        if shot_range is None:
-            sub_samples = self._samples
-        else:
-            # Indexing corresponds to: (potential broadcasting, shots, wires). Note that the last
-            # colon (:) is required because shots is the second-to-last axis and the
-            # Ellipsis (...) otherwise would take up broadcasting and shots axes.
-            sub_samples = self._samples[..., slice(*shot_range), :]
+        # The samples are selected from ``shot_range`` if provided. The Ellipsis (...)
+        # corresponds to the broadcasting dimension or no axis at all.
+        shot_slice = slice(None) if shot_range is None else slice(*shot_range)
 
         no_observable_provided = isinstance(observable, MeasurementProcess)
+        num_wires = len(device_wires) if len(device_wires) > 0 else self.num_wires
+
+        if counts and self._basis_state_counts is not None and shot_range is None:
+            # only the number of samples of each basis state was sampled
+            return self._sampled_counts(observable, bin_size)
 
         if isinstance(name, str) and name in {"PauliX", "PauliY", "PauliZ", "Hadamard"}:
-            # Process samples for observables with eigenvalues {1, -1}
-            samples = 1 - 2 * sub_samples[..., device_wires[0]]
+            # Process samples for observables with eigenvalues {1, -1}, given by the bit
+            # of the sampled basis states
+            samples = 1 - 2 * self._sample_indices(device_wires[:1])[..., shot_slice]
+
+        elif no_observable_provided and counts and num_wires < 63:
+            # counts of the sampled basis states are computed without the binary samples
+            indices = self._sample_indices(device_wires or None)[..., shot_slice]
+
+            if indices.ndim == 2:
+                # the counts of each element of a broadcasted batch are computed separately
+                return [
+                    self._basis_states_to_binned_counts(
+                        batch_indices, observable, num_wires, bin_size
+                    )
+                    for batch_indices in indices
+                ]
+
+            return self._basis_states_to_binned_counts(indices, observable, num_wires, bin_size)
 
         elif no_observable_provided:
             # if no observable was provided then return the raw samples
+            # Indexing corresponds to: (potential broadcasting, shots, wires). Note that the last
+            # colon (:) is required because shots is the second-to-last axis and the
+            # Ellipsis (...) otherwise would take up broadcasting and shots axes.
+            sub_samples = self._samples[..., shot_slice, :]
             if len(observable.wires) != 0:
                 # if wires are provided, then we only return samples from those wires
                 samples = sub_samples[..., np.array(device_wires)]
@@ -1722,10 +2382,8 @@ class QubitDevice(Device):
         else:
 
             # Replace the basis state in the computational basis with the correct eigenvalue.
-            # Extract only the columns of the basis samples required based on ``wires``.
-            samples = sub_samples[..., np.array(device_wires)]  # Add np.array here for Jax support.
-            powers_of_two = 2 ** np.arange(samples.shape[-1])[::-1]
-            indices = samples @ powers_of_two
+            # The sampled basis states of ``wires`` are shared with other measurements.
+            indices = self._sample_indices(device_wires)[..., shot_slice]
             indices = np.array(indices)  # Add np.array here for Jax support.
             try:
                 samples = observable.eigvals()[indices]
@@ -1735,19 +2393,19 @@ class QubitDevice(Device):
                     f"Cannot compute samples of {observable.name}."
                 ) from e
 
-        num_wires = len(device_wires) if len(device_wires) > 0 else self.num_wires
+        if counts:
+            if self._sample_batch_size() is not None:
+                # the counts of each element of a broadcasted batch are computed separately
+                return [
+                    self._samples_to_binned_counts(batch_samples, observable, num_wires, bin_size)
+                    for batch_samples in samples
+                ]
+
+            return self._samples_to_binned_counts(samples, observable, num_wires, bin_size)
+
         if bin_size is None:
-            if counts:
-                return self._samples_to_counts(samples, observable, num_wires)
             return samples
 
-        if counts:
-            shape = (-1, bin_size, num_wires) if no_observable_provided else (-1, bin_size)
-            return [
-                self._samples_to_counts(bin_sample, observable, num_wires)
-                for bin_sample in samples.reshape(shape)
-            ]
-
         res = (
             samples.reshape((num_wires, bin_size, -1))
             if no_observable_provided
@@ -1760,7 +2418,10 @@ class QubitDevice(Device):
         `Jones and Gacon <https://arxiv.org/abs/2009.02823>`__ to differentiate an input tape.
 
         After a forward pass, the circuit is reversed by iteratively applying inverse (adjoint)
-        gates to scan backwards through the circuit.
+        gates to scan backwards through the circuit. The bra vectors of all observables, and of
+        all batch elements of a broadcasted tape, are stacked and propagated together, and the
+        derivative of each gate is obtained by applying its generator, whose matrix is computed
+        once per gate type.
 
         .. note::
             The adjoint differentiation method has the following restrictions:
@@ -1785,17 +2446,98 @@ class QubitDevice(Device):
 
         Returns:
             array: the derivative of the tape with respect to trainable parameters.
-            Dimensions are ``(len(observables), len(trainable_params))``.
+            Dimensions are ``(len(observables), len(trainable_params))``. For a broadcasted
+            tape, the dimensions are ``(len(observables), batch_size, len(trainable_params))``,
+            and the derivative of each batch element is taken with respect to its own value of
+            the broadcasted parameters.
 
         Raises:
             QuantumFunctionError: if the input tape has measurements that are not expectation values
                 or contains a multi-parameter operation aside from :class:`~.Rot`
         """
-        # broadcasted inner product not summing over first dimension of b
-        sum_axes = tuple(range(1, self.num_wires + 1))
-        # pylint: disable=unnecessary-lambda-assignment)
-        dot_product_real = lambda b, k: self._real(qmlsum(self._conj(b) * k, axis=sum_axes))
+        ket = self._adjoint_initial_state(tape, starting_state, use_device_state)
+
+        n_obs = len(tape.observables)
+        dtype = ket.dtype if isinstance(ket, np.ndarray) else np.complex128
+        bras = np.empty((n_obs,) + ket.shape, dtype=dtype)
+        for kk in range(n_obs):
+            bras[kk, ...] = self._apply_operation(ket, tape.observables[kk])
+
+        return self._adjoint_backward(tape, ket, bras)[0]
+
+    def adjoint_vjp(self, tape, dy, starting_state=None, use_device_state=False):
+        """Computes the vector-Jacobian product of an input tape with the adjoint method.
+
+        Instead of propagating the bra vector of each observable backwards through the
+        circuit, as :meth:`~.adjoint_jacobian` does, a single bra vector is prepared from the
+        sum of the observables weighted by the entries of ``dy``. The cost of the backward
+        pass therefore does not depend on the number of observables, and the Jacobian is
+        never computed.
+
+        Args:
+            tape (.QuantumTape): circuit that the function takes the gradient of
+            dy (tensor_like): gradient of a scalar cost function with respect to the output
+                of the tape. It has the same shape as the result of executing the tape.
+
+        Keyword Args:
+            starting_state (tensor_like): post-forward pass state to start execution with. It should be
+                complex-valued. Takes precedence over ``use_device_state``.
+            use_device_state (bool): use current device state to initialize. A forward pass of the same
+                circuit should be the last thing the device has executed. If a ``starting_state`` is
+                provided, that takes precedence.
+
+        Returns:
+            array or list: the vector-Jacobian product with respect to the trainable parameters,
+            of length ``len(trainable_params)``. For a broadcasted tape, a list is returned, in
+            which the entries of broadcasted parameters have the shape of the parameter and the
+            entries of the other parameters are summed over the batch.
+
+        Raises:
+            QuantumFunctionError: if the input tape has measurements that are not expectation values
+                or contains a multi-parameter operation aside from :class:`~.Rot`
 
+        **Example**
+
+        >>> dev = qml.device("default.qubit", wires=2)
+        >>> with qml.tape.QuantumTape() as tape:
+        ...     qml.RX(0.4, wires=0)
+        ...     qml.CNOT(wires=[0, 1])
+        ...     qml.expval(qml.PauliZ(0))
+        ...     qml.expval(qml.PauliZ(1))
+        >>> dev.adjoint_vjp(tape, np.array([1.0, 0.5]))
+        array([-0.58412751])
+        """
+        ket = self._adjoint_initial_state(tape, starting_state, use_device_state)
+        batch_shape = list(ket.shape[: ket.ndim - self.num_wires])
+
+        dy = np.reshape(qml.math.to_numpy(dy), [len(tape.observables)] + batch_shape)
+        dtype = ket.dtype if isinstance(ket, np.ndarray) else np.complex128
+        bra = np.zeros((1,) + ket.shape, dtype=dtype)
+        for d, obs in zip(dy, tape.observables):
+            # weight the bra of the observable by its cotangent, for each batch element
+            d = np.reshape(d, batch_shape + [1] * self.num_wires)
+            bra[0] += d * self._apply_operation(ket, obs)
+
+        vjp, trainable_params = self._adjoint_backward(tape, ket, bra)
+        vjp = vjp[0]
+
+        if not batch_shape:
+            return vjp
+
+        # parameters that are not broadcasted contribute to all batch elements
+        params = tape.get_parameters(trainable_only=False, operations_only=True)
+        return [
+            vjp[:, i] if qml.math.ndim(params[k]) > 0 else np.sum(vjp[:, i])
+            for i, k in enumerate(trainable_params)
+        ]
+
+    def _adjoint_initial_state(self, tape, starting_state, use_device_state):
+        """Validates a tape for the adjoint method and returns the state after its
+        operations, of shape ``[batch_size] + [2] * num_wires`` for a broadcasted tape and
+        ``[2] * num_wires`` otherwise.
+
+        See :meth:`~.adjoint_jacobian` for a description of the arguments.
+        """
         for m in tape.measurements:
             if m.return_type is not Expectation:
                 raise qml.QuantumFunctionError(
@@ -1818,19 +2560,43 @@ class QubitDevice(Device):
                 UserWarning,
             )
 
+        batch_shape = [] if tape.batch_size is None else [tape.batch_size]
+
         # Initialization of state
         if starting_state is not None:
-            ket = self._reshape(starting_state, [2] * self.num_wires)
-        else:
-            if not use_device_state:
-                self.reset()
-                self.execute(tape)
-            ket = self._pre_rotated_state
+            return self._reshape(starting_state, batch_shape + [2] * self.num_wires)
 
-        n_obs = len(tape.observables)
-        bras = np.empty([n_obs] + [2] * self.num_wires, dtype=np.complex128)
-        for kk in range(n_obs):
-            bras[kk, ...] = self._apply_operation(ket, tape.observables[kk])
+        if not use_device_state:
+            self.reset()
+            self.execute(tape)
+        return self._pre_rotated_state
+
+    def _adjoint_backward(self, tape, ket, bras):
+        """Scans backwards through the operations of a tape, propagating the ket and the
+        stacked bras, and computes the derivatives of the bra-ket overlaps.
+
+        Args:
+            tape (.QuantumTape): circuit that the function takes the gradient of
+            ket (array): state after the operations of the tape
+            bras (array): bra vectors after the operations of the tape, stacked along the
+                first dimension
+
+        Returns:
+            tuple[array, list[int]]: derivatives of shape ``bras.shape[:-num_wires] +
+            (len(trainable_params),)``, and the indices of the trainable parameters with
+            respect to which they are computed
+        """
+        batch_shape = list(ket.shape[: ket.ndim - self.num_wires])
+        state_shape = [2] * self.num_wires
+        n_obs = bras.shape[0]
+
+        def dot_product_real(b, k):
+            """Real part of the inner products of the stacked bras with the ket, contracted
+            as a matrix-vector product for each batch element. As the real part of an inner
+            product is symmetric, only the ket is conjugated."""
+            k = self._reshape(self._conj(k), batch_shape + [-1, 1])
+            b = self._reshape(b, [n_obs] + batch_shape + [1, -1])
+            return self._real(self._reshape(b @ k, [n_obs] + batch_shape))
 
         expanded_ops = []
         for op in reversed(tape.operations):
@@ -1863,26 +2629,73 @@ class QubitDevice(Device):
             else:
                 trainable_params.append(k)
 
-        jac = np.zeros((len(tape.observables), len(trainable_params)))
+        jac_shape = bras.shape[: bras.ndim - self.num_wires] + (len(trainable_params),)
+        jac = np.zeros(jac_shape, dtype=bras.real.dtype)
+        generators = {}
 
         param_number = len(tape.get_parameters(trainable_only=False, operations_only=True)) - 1
         trainable_param_number = len(trainable_params) - 1
         for op in expanded_ops:
 
-            adj_op = qml.adjoint(op)
-            ket = self._apply_operation(ket, adj_op)
-
             if op.grad_method is not None:
                 if param_number in trainable_params:
-                    d_op_matrix = operation_derivative(op)
-                    ket_temp = self._apply_unitary(ket, d_op_matrix, op.wires)
+                    # For U = exp(i x G), the derivative of U applied to the state preceding the
+                    # operation is i G applied to the current state
+                    generator = self._generator_matrix(op, generators)
+                    ket_temp = self._apply_unitary(ket, generator, op.wires)
 
-                    jac[:, trainable_param_number] = 2 * dot_product_real(bras, ket_temp)
+                    jac[..., trainable_param_number] = 2 * dot_product_real(bras, ket_temp)
 
                     trainable_param_number -= 1
                 param_number -= 1
 
-            for kk in range(n_obs):
-                bras[kk, ...] = self._apply_operation(bras[kk, ...], adj_op)
+            if op.batch_size is None or op.inverse:
+                adj_op = qml.adjoint(op)
+            else:
+                # the matrices of lazy adjoints do not support broadcasting
+                adj_op = qml.adjoint(op, lazy=False)
+
+            ket = self._apply_operation(ket, adj_op)
+
+            if op.batch_size is None:
+                # apply the operation to the bras of all observables and batch elements at once
+                stacked_bras = self._reshape(bras, [-1] + state_shape)
+                stacked_bras = self._apply_operation(stacked_bras, adj_op)
+                bras = self._reshape(stacked_bras, bras.shape)
+            else:
+                # the broadcasted operation acts on the batch dimension of each observable
+                bras = np.stack([self._apply_operation(bra, adj_op) for bra in bras])
+
+        return jac, trainable_params
+
+    @staticmethod
+    def _generator_matrix(op, cache):
+        """Matrix of ``i`` times the generator of an operation, in the order of its wires.
+
+        The matrix does not depend on the parameters or wire labels of the operation, and is
+        stored in ``cache`` for later operations of the same type, acting on the same number
+        of wires with the same hyperparameters.
+
+        Args:
+            op (.Operation): operation with a generator
+            cache (dict): matrices of previously encountered operations
+
+        Returns:
+            array[complex]: matrix of ``i`` times the generator
+        """
+        try:
+            key = (op.name, len(op.wires), tuple(op.hyperparameters.items()))
+            hash(key)
+        except TypeError:
+            # hyperparameters that are not hashable, such as arrays, are not cached
+            key = None
+
+        if key in cache:
+            return cache[key]
+
+        generator = qml.generator(op, format="observable")
+        matrix = 1j * qml.matrix(generator, wire_order=op.wires)
 
-        return jac
+        if key is not None:
+            cache[key] = matrix
+        return matrix
@@ -29,6 +29,8 @@ to verify and test quantum gradient computations.
     default_qubit_autograd
     default_gaussian
     default_mixed
+    default_trajectory
+    default_mps
     default_qutrit
     tests
 """
@@ -38,3 +40,5 @@ to verify and test quantum gradient computations.
 from .default_qubit import DefaultQubit
 from .default_gaussian import DefaultGaussian
 from .default_mixed import DefaultMixed
+from .default_trajectory import DefaultTrajectory
+from .default_mps import DefaultMPS
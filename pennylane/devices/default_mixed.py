@@ -31,11 +31,12 @@ from pennylane import (
     QubitDensityMatrix,
     QubitDevice,
     QubitStateVector,
+    QubitUnitary,
     Snapshot,
 )
 from pennylane import numpy as np
 from pennylane.measurements import Counts, AllCounts, MutualInfo, Sample, State, VnEntropy
-from pennylane.operation import Channel
+from pennylane.operation import Channel, _structure_value
 from pennylane.ops.qubit.attributes import diagonal_in_z_basis
 from pennylane.wires import Wires
 
@@ -58,6 +59,14 @@ class DefaultMixed(QubitDevice):
         readout_prob (None, int, float): Probability for adding readout error to the measurement
             outcomes of observables. Defaults to ``None`` if not specified, which means that the outcomes are
             without any readout error.
+        seed (None, int, array_like[int], SeedSequence, BitGenerator, Generator): Seed for the
+            random number generator used to draw samples. Defaults to ``None``, in which case
+            the global NumPy random state is used.
+        max_fusion_wires (None, int): If provided, runs of consecutive gates and channels acting
+            on at most this many wires (up to 3) are fused before being applied, reducing the
+            number of passes over the density matrix. Runs of gates are fused into a single
+            unitary, and runs containing channels into a single superoperator. Defaults to
+            ``None``, in which case operations are applied one by one.
     """
 
     name = "Default mixed-state qubit PennyLane plugin"
@@ -124,11 +133,17 @@ class DefaultMixed(QubitDevice):
 
     _reshape = staticmethod(qnp.reshape)
     _flatten = staticmethod(qnp.flatten)
-    # Allow for the `axis` keyword argument for integration with broadcasting-enabling
-    # code in QubitDevice. However, it is not used as DefaultMixed does not support broadcasting
-    # pylint: disable=unnecessary-lambda
-    _gather = staticmethod(lambda *args, axis=0, **kwargs: qnp.gather(*args, **kwargs))
     _dot = staticmethod(qnp.dot)
+    _size = staticmethod(qnp.size)
+    _ndim = staticmethod(qnp.ndim)
+
+    @staticmethod
+    def _gather(array, indices, axis=0):
+        if axis == 1:
+            # gather along the last axis of a broadcasted array of shape (batch_size, dim)
+            return qnp.transpose(qnp.gather(qnp.transpose(array), indices))
+
+        return qnp.gather(array, indices)
 
     @staticmethod
     def _reduce_sum(array, axes):
@@ -159,6 +174,16 @@ class DefaultMixed(QubitDevice):
 
         return res
 
+    # pylint: disable=arguments-differ
+    def _get_batch_size(self, tensor, expected_shape, expected_size):
+        """Determine whether a tensor has an additional batch dimension for broadcasting,
+        compared to an expected_shape."""
+        size = self._size(tensor)
+        if self._ndim(tensor) > len(expected_shape) or size > expected_size:
+            return size // expected_size
+
+        return None
+
     def __init__(
         self,
         wires,
@@ -168,6 +193,8 @@ class DefaultMixed(QubitDevice):
         shots=None,
         analytic=None,
         readout_prob=None,
+        seed=None,
+        max_fusion_wires=None,
     ):
         if isinstance(wires, int) and wires > 23:
             raise ValueError(
@@ -184,8 +211,17 @@ class DefaultMixed(QubitDevice):
             if self.readout_err < 0 or self.readout_err > 1:
                 raise ValueError("The readout error probability should be in the range [0,1].")
 
+        if max_fusion_wires is not None and not 1 <= max_fusion_wires <= 3:
+            raise DeviceError("The maximum number of fused wires must be between 1 and 3.")
+
+        self.max_fusion_wires = max_fusion_wires
+        self._superoperator_cache = {}
+        """dict: superoperators of channels with fixed parameters, computed when fusing operations"""
+
         # call QubitDevice init
-        super().__init__(wires, shots, r_dtype=r_dtype, c_dtype=c_dtype, analytic=analytic)
+        super().__init__(
+            wires, shots, r_dtype=r_dtype, c_dtype=c_dtype, analytic=analytic, seed=seed
+        )
         self._debugger = None
 
         # Create the initial state.
@@ -214,6 +250,7 @@ class DefaultMixed(QubitDevice):
         capabilities = super().capabilities().copy()
         capabilities.update(
             returns_state=True,
+            supports_broadcasting=True,
             passthru_devices={
                 "autograd": "default.mixed",
                 "tf": "default.mixed",
@@ -227,8 +264,33 @@ class DefaultMixed(QubitDevice):
     def state(self):
         """Returns the state density matrix of the circuit prior to measurement"""
         dim = 2**self.num_wires
-        # User obtains state as a matrix
-        return qnp.reshape(self._pre_rotated_state, (dim, dim))
+        batch_size = self._get_batch_size(
+            self._pre_rotated_state, [2] * 2 * self.num_wires, dim**2
+        )
+        # User obtains state as a matrix, with a leading broadcasting dimension if there is one
+        shape = (batch_size, dim, dim) if batch_size is not None else (dim, dim)
+        return qnp.reshape(self._pre_rotated_state, shape)
+
+    def density_matrix(self, wires):
+        """Returns the reduced density matrix over the given wires.
+
+        Args:
+            wires (Wires): wires of the reduced system
+
+        Returns:
+            array[complex]: complex array of shape ``(2 ** len(wires), 2 ** len(wires))``
+            representing the reduced density matrix of the state prior to measurement,
+            with a leading broadcasting dimension if the state is broadcasted.
+        """
+        state = self.state
+
+        if self._ndim(state) == 2:
+            return super().density_matrix(wires)
+
+        wires = self.map_wires(wires)
+        return qnp.stack(
+            [qnp.reduced_dm(rho, indices=wires, c_dtype=self.C_DTYPE) for rho in state]
+        )
 
     def reset(self):
         """Resets the device"""
@@ -242,11 +304,18 @@ class DefaultMixed(QubitDevice):
         if self._state is None:
             return None
 
-        # convert rho from tensor to matrix
-        rho = qnp.reshape(self._state, (2**self.num_wires, 2**self.num_wires))
+        dim = 2**self.num_wires
+        batch_size = self._get_batch_size(self._state, [2] * 2 * self.num_wires, dim**2)
+
+        # convert rho from tensor to matrix and take the diagonal elements
+        if batch_size is None:
+            diag = qnp.diagonal(qnp.reshape(self._state, (dim, dim)))
+        else:
+            # the diagonal elements of each flattened density matrix are dim + 1 entries apart
+            diag = qnp.reshape(self._state, (batch_size, dim**2))[:, :: dim + 1]
 
         # probs are diagonal elements
-        probs = self.marginal_prob(qnp.diagonal(rho), wires)
+        probs = self.marginal_prob(diag, wires)
 
         # take the real part so probabilities are not shown as complex numbers
         probs = qnp.real(probs)
@@ -275,22 +344,34 @@ class DefaultMixed(QubitDevice):
         r"""Apply a quantum channel specified by a list of Kraus operators to subsystems of the
         quantum state. For a unitary gate, there is a single Kraus operator.
 
+        Both the state and the Kraus operators may have a leading broadcasting dimension,
+        in which case the channel is applied to all states in a single contraction.
+
         Args:
-            kraus (list[array]): Kraus operators
+            kraus (list[array]): Kraus operators, each of shape ``(2**len(wires), 2**len(wires))``
+                or ``(batch_size, 2**len(wires), 2**len(wires))``
             wires (Wires): target wires
         """
         channel_wires = self.map_wires(wires)
         rho_dim = 2 * self.num_wires
         num_ch_wires = len(channel_wires)
 
+        kraus_batch_size = self._get_batch_size(
+            kraus[0], (2**num_ch_wires,) * 2, 4**num_ch_wires
+        )
+        state_batch_size = self._get_batch_size(self._state, [2] * rho_dim, 4**self.num_wires)
+
         # Computes K^\dagger, needed for the transformation K \rho K^\dagger
-        kraus_dagger = [qnp.conj(qnp.transpose(k)) for k in kraus]
+        matrix_axes = (0, 2, 1) if kraus_batch_size is not None else (1, 0)
+        kraus_dagger = [qnp.conj(qnp.transpose(k, matrix_axes)) for k in kraus]
 
         kraus = qnp.stack(kraus)
         kraus_dagger = qnp.stack(kraus_dagger)
 
         # Shape kraus operators
         kraus_shape = [len(kraus)] + [2] * num_ch_wires * 2
+        if kraus_batch_size is not None:
+            kraus_shape.insert(1, kraus_batch_size)
         kraus = qnp.cast(qnp.reshape(kraus, kraus_shape), dtype=self.C_DTYPE)
         kraus_dagger = qnp.cast(qnp.reshape(kraus_dagger, kraus_shape), dtype=self.C_DTYPE)
 
@@ -312,6 +393,12 @@ class DefaultMixed(QubitDevice):
         # index for summation over Kraus operators
         kraus_index = ABC[rho_dim + 2 * num_ch_wires : rho_dim + 2 * num_ch_wires + 1]
 
+        # index of the broadcasting dimension, shared by the Kraus operators and the state
+        batch_index = ABC[rho_dim + 2 * num_ch_wires + 1]
+        kraus_batch = batch_index if kraus_batch_size is not None else ""
+        state_batch = batch_index if state_batch_size is not None else ""
+        new_state_batch = kraus_batch or state_batch
+
         # new state indices replace row and column indices with new ones
         new_state_indices = functools.reduce(
             lambda old_string, idx_pair: old_string.replace(idx_pair[0], idx_pair[1]),
@@ -321,8 +408,10 @@ class DefaultMixed(QubitDevice):
 
         # index mapping for einsum, e.g., 'iga,abcdef,idh->gbchef'
         einsum_indices = (
-            f"{kraus_index}{new_row_indices}{row_indices}, {state_indices},"
-            f"{kraus_index}{col_indices}{new_col_indices}->{new_state_indices}"
+            f"{kraus_index}{kraus_batch}{new_row_indices}{row_indices}, "
+            f"{state_batch}{state_indices},"
+            f"{kraus_index}{kraus_batch}{col_indices}{new_col_indices}->"
+            f"{new_state_batch}{new_state_indices}"
         )
 
         self._state = qnp.einsum(einsum_indices, kraus, self._state, kraus_dagger)
@@ -332,7 +421,8 @@ class DefaultMixed(QubitDevice):
         the fact that the unitary is diagonal for a more efficient implementation.
 
         Args:
-            eigvals (array): eigenvalues (phases) of the diagonal unitary
+            eigvals (array): eigenvalues (phases) of the diagonal unitary, of shape
+                ``(2**len(wires),)`` or ``(batch_size, 2**len(wires))``
             wires (Wires): target wires
         """
 
@@ -340,8 +430,17 @@ class DefaultMixed(QubitDevice):
 
         eigvals = qnp.stack(eigvals)
 
+        dim = 2 ** len(channel_wires)
+        eigvals_batch_size = self._get_batch_size(eigvals, (dim,), dim)
+        state_batch_size = self._get_batch_size(
+            self._state, [2] * 2 * self.num_wires, 4**self.num_wires
+        )
+
         # reshape vectors
-        eigvals = qnp.cast(qnp.reshape(eigvals, [2] * len(channel_wires)), dtype=self.C_DTYPE)
+        eigvals_shape = [2] * len(channel_wires)
+        if eigvals_batch_size is not None:
+            eigvals_shape.insert(0, eigvals_batch_size)
+        eigvals = qnp.cast(qnp.reshape(eigvals, eigvals_shape), dtype=self.C_DTYPE)
 
         # Tensor indices of the state. For each qubit, need an index for rows *and* columns
         state_indices = ABC[: 2 * self.num_wires]
@@ -354,10 +453,172 @@ class DefaultMixed(QubitDevice):
         col_wires_list = [w + self.num_wires for w in row_wires_list]
         col_indices = "".join(ABC_ARRAY[col_wires_list].tolist())
 
-        einsum_indices = f"{row_indices},{state_indices},{col_indices}->{state_indices}"
+        # index of the broadcasting dimension, shared by the eigenvalues and the state
+        batch_index = ABC[2 * self.num_wires]
+        eigvals_batch = batch_index if eigvals_batch_size is not None else ""
+        state_batch = batch_index if state_batch_size is not None else ""
+        new_state_batch = eigvals_batch or state_batch
+
+        einsum_indices = (
+            f"{eigvals_batch}{row_indices},{state_batch}{state_indices},"
+            f"{eigvals_batch}{col_indices}->{new_state_batch}{state_indices}"
+        )
 
         self._state = qnp.einsum(einsum_indices, eigvals, self._state, qnp.conj(eigvals))
 
+    def _apply_superoperator(self, superoperator, wires):
+        r"""Apply a superoperator to subsystems of the quantum state.
+
+        The superoperator :math:`S` acts on the density matrix of the subsystem flattened in
+        row-major order, :math:`\text{vec}(\rho) \mapsto S\,\text{vec}(\rho)`, and is applied
+        to the row and column indices of the state in a single tensor contraction.
+
+        Args:
+            superoperator (array): superoperator of shape ``(4**len(wires), 4**len(wires))``
+            wires (Wires): target wires
+        """
+        channel_wires = self.map_wires(wires).tolist()
+        num_ch_wires = len(channel_wires)
+
+        state_batch_size = self._get_batch_size(
+            self._state, [2] * 2 * self.num_wires, 4**self.num_wires
+        )
+        # the broadcasting dimension of the state, if any, is the first axis
+        offset = int(state_batch_size is not None)
+
+        superoperator = qnp.cast(
+            qnp.reshape(superoperator, [2] * 4 * num_ch_wires), dtype=self.C_DTYPE
+        )
+
+        # row and column axes of the state affected by this operation
+        state_axes = [offset + w for w in channel_wires]
+        state_axes += [offset + self.num_wires + w for w in channel_wires]
+        remaining_axes = [ax for ax in range(offset + 2 * self.num_wires) if ax not in state_axes]
+
+        state = qnp.tensordot(
+            superoperator,
+            self._state,
+            axes=[list(range(2 * num_ch_wires, 4 * num_ch_wires)), state_axes],
+        )
+
+        # the new row and column axes come first in the contracted state, followed by the
+        # remaining axes, and are moved back to their original positions
+        perm = np.argsort(state_axes + remaining_axes).tolist()
+        self._state = qnp.transpose(state, perm)
+
+    @staticmethod
+    def _superoperator_key(operation):
+        """Returns the key under which the superoperator of an operation is cached, or ``None``
+        if it is not cached. Only channels with fixed, scalar parameters are cached, keyed
+        by their class, parameters and exact hyperparameters."""
+        if not isinstance(operation, Channel):
+            return None
+
+        for p in operation.data:
+            if qnp.ndim(p) > 0 or qnp.is_abstract(p) or qnp.requires_grad(p):
+                return None
+
+        params = tuple(qnp.toarray(p).item() for p in operation.data)
+        return (
+            type(operation),
+            operation.name,
+            len(operation.wires),
+            params,
+            _structure_value(operation.hyperparameters),
+        )
+
+    def _superoperator(self, operation, wires):
+        r"""Returns the superoperator of an operation, expanded to the given wires.
+
+        For a channel with Kraus operators :math:`K_i`, this is
+        :math:`S = \sum_i K_i \otimes K_i^\ast`, acting on density matrices flattened
+        in row-major order.
+
+        Args:
+            operation (.Operation): a unitary operation or channel
+            wires (Wires): wires of the superoperator, containing the wires of the operation
+
+        Returns:
+            array[complex]: superoperator of shape ``(4**len(wires), 4**len(wires))``
+        """
+        key = self._superoperator_key(operation)
+        superoperator = self._superoperator_cache.get(key) if key is not None else None
+
+        if superoperator is None:
+            if isinstance(operation, Channel):
+                kraus = operation.kraus_matrices()
+            else:
+                kraus = [operation.matrix()]
+
+            superoperator = sum(qnp.kron(k, qnp.conj(k)) for k in kraus)
+
+            if key is not None:
+                self._superoperator_cache[key] = superoperator
+
+        # The superoperator acts on the row and column indices of each wire
+        op_wires = [("row", w) for w in operation.wires] + [("col", w) for w in operation.wires]
+        wire_order = [("row", w) for w in wires] + [("col", w) for w in wires]
+
+        return qnp.expand_matrix(superoperator, op_wires, wire_order=wire_order)
+
+    def _fuse_operations(self, operations):
+        """Fuses runs of consecutive operations acting on at most ``max_fusion_wires`` wires.
+
+        Runs of unitary operations are fused into a single :class:`~.QubitUnitary`. Runs that
+        contain a channel are fused into a single superoperator, which is returned as a tuple
+        ``(superoperator, wires)``.
+
+        Broadcasted operations, state preparations, snapshots and operations acting on more
+        wires are left untouched, and interrupt the current run.
+
+        Args:
+            operations (list[~.Operation]): operations to fuse
+
+        Returns:
+            list[~.Operation or tuple[array, Wires]]: the fused operations
+        """
+        fused = []
+        block = []
+        block_wires = Wires([])
+
+        def flush():
+            if len(block) == 1:
+                fused.append(block[0])
+            elif any(isinstance(op, Channel) for op in block):
+                superoperator = self._superoperator(block[0], block_wires)
+                for op in block[1:]:
+                    superoperator = qnp.dot(self._superoperator(op, block_wires), superoperator)
+                fused.append((superoperator, block_wires))
+            elif block:
+                matrix = block[0].matrix(wire_order=block_wires)
+                for op in block[1:]:
+                    matrix = qnp.dot(op.matrix(wire_order=block_wires), matrix)
+                fused.append(QubitUnitary(matrix, wires=block_wires, do_queue=False))
+
+        for op in operations:
+            fusable = (
+                (op.has_matrix or isinstance(op, Channel))
+                and op.batch_size is None
+                and not isinstance(op, (QubitStateVector, BasisState, QubitDensityMatrix, Snapshot))
+            )
+            wires = Wires.all_wires([block_wires, op.wires])
+
+            if fusable and len(wires) <= self.max_fusion_wires:
+                block.append(op)
+                block_wires = wires
+                continue
+
+            flush()
+
+            if fusable and len(op.wires) <= self.max_fusion_wires:
+                block, block_wires = [op], op.wires
+            else:
+                fused.append(op)
+                block, block_wires = [], Wires([])
+
+        flush()
+        return fused
+
     def _apply_basis_state(self, state, wires):
         """Initialize the device in a specified computational basis state.
 
@@ -388,34 +649,39 @@ class DefaultMixed(QubitDevice):
         """Initialize the internal state in a specified pure state.
 
         Args:
-            state (array[complex]): normalized input state of length
-                ``2**len(wires)``
+            state (array[complex]): normalized input state of length ``2**len(wires)``
+                or broadcasted state of shape ``(batch_size, 2**len(wires))``
             device_wires (Wires): wires that get initialized in the state
         """
 
         # translate to wire labels used by device
         device_wires = self.map_wires(device_wires)
+        dim = 2 ** len(device_wires)
 
         state = qnp.asarray(state, dtype=self.C_DTYPE)
-        n_state_vector = state.shape[0]
+        batch_size = self._get_batch_size(state, (dim,), dim)
+        output_shape = [2] * 2 * self.num_wires
+        if batch_size is not None:
+            output_shape.insert(0, batch_size)
 
-        if state.ndim != 1 or n_state_vector != 2 ** len(device_wires):
+        if state.shape not in [(dim,), (batch_size, dim)]:
             raise ValueError("State vector must be of length 2**wires.")
 
-        if not qnp.allclose(qnp.linalg.norm(state, ord=2), 1.0, atol=tolerance):
+        norm = qnp.linalg.norm(state, axis=-1, ord=2)
+        if not qnp.allclose(norm, 1.0, atol=tolerance):
             raise ValueError("Sum of amplitudes-squared does not equal one.")
 
         if len(device_wires) == self.num_wires and sorted(device_wires.labels) == list(
             device_wires.labels
         ):
             # Initialize the entire wires with the state
-            rho = qnp.outer(state, qnp.conj(state))
-            self._state = qnp.reshape(rho, [2] * 2 * self.num_wires)
+            rho = self._outer(state)
+            self._state = qnp.reshape(rho, output_shape)
 
         else:
             # generate basis states on subset of qubits via the cartesian product
             basis_states = qnp.asarray(
-                list(itertools.product([0, 1], repeat=len(device_wires))), dtype=self.C_DTYPE
+                list(itertools.product([0, 1], repeat=len(device_wires))), dtype=int
             )
 
             # get basis states to alter on full set of qubits
@@ -425,11 +691,24 @@ class DefaultMixed(QubitDevice):
             # get indices for which the state is changed to input state vector elements
             ravelled_indices = qnp.ravel_multi_index(unravelled_indices.T, [2] * self.num_wires)
 
-            state = qnp.scatter(ravelled_indices, state, [2**self.num_wires])
-            rho = qnp.outer(state, qnp.conj(state))
-            rho = qnp.reshape(rho, [2] * 2 * self.num_wires)
+            if batch_size is not None:
+                state = qnp.scatter(
+                    (slice(None), ravelled_indices), state, [batch_size, 2**self.num_wires]
+                )
+            else:
+                state = qnp.scatter(ravelled_indices, state, [2**self.num_wires])
+            rho = self._outer(state)
+            rho = qnp.reshape(rho, output_shape)
             self._state = qnp.asarray(rho, dtype=self.C_DTYPE)
 
+    @staticmethod
+    def _outer(state):
+        """Returns the density matrix of a state vector, or of each state vector in a batch."""
+        if qnp.ndim(state) == 1:
+            return qnp.outer(state, qnp.conj(state))
+
+        return qnp.einsum("ai,aj->aij", state, qnp.conj(state))
+
     def _apply_density_matrix(self, state, device_wires):
         r"""Initialize the internal state in a specified mixed state.
         If not all the wires are specified in the full state :math:`\rho`, remaining subsystem is filled by
@@ -503,8 +782,13 @@ class DefaultMixed(QubitDevice):
         """Applies operations to the internal device state.
 
         Args:
-            operation (.Operation): operation to apply on the device
+            operation (.Operation or tuple[array, Wires]): operation to apply on the device,
+                or a superoperator and its wires obtained from fusing operations
         """
+        if isinstance(operation, tuple):
+            self._apply_superoperator(*operation)
+            return
+
         wires = operation.wires
         if operation.base_name == "Identity":
             return
@@ -524,7 +808,9 @@ class DefaultMixed(QubitDevice):
         if isinstance(operation, Snapshot):
             if self._debugger and self._debugger.active:
                 dim = 2**self.num_wires
-                density_matrix = qnp.reshape(self._state, (dim, dim))
+                batch_size = self._get_batch_size(self._state, [2] * 2 * self.num_wires, dim**2)
+                shape = (batch_size, dim, dim) if batch_size is not None else (dim, dim)
+                density_matrix = qnp.reshape(self._state, shape)
                 if operation.tag:
                     self._debugger.snapshots[operation.tag] = density_matrix
                 else:
@@ -606,6 +892,10 @@ class DefaultMixed(QubitDevice):
                     f"on a {self.short_name} device."
                 )
 
+        if self.max_fusion_wires:
+            operations = self._fuse_operations(operations)
+            rotations = self._fuse_operations(rotations)
+
         for operation in operations:
             self._apply_operation(operation)
 
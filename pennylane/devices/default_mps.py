@@ -0,0 +1,454 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""
+The default.mps device is PennyLane's matrix product state simulator.
+
+It stores the state of the qubits as a matrix product state, whose bond dimensions are
+truncated after each two-qubit gate, such that circuits creating little entanglement, like
+the :class:`~.MPS` and :class:`~.TTN` templates, can be simulated on many qubits.
+"""
+import numpy as np
+
+import pennylane as qml
+from pennylane import QubitDevice, DeviceError, BasisState
+from pennylane.operation import Tensor
+from .._version import __version__
+
+SWAP = np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]])
+
+
+class DefaultMPS(QubitDevice):
+    r"""Matrix product state simulator for PennyLane.
+
+    The state is stored as a chain of tensors :math:`A^{(i)}_{a s b}` of shape
+    ``(left_bond, 2, right_bond)``, one per wire, in the order of the device wires. Gates acting
+    on two neighbouring wires are contracted with the two corresponding tensors, which are then
+    split again with a singular value decomposition. Singular values smaller than ``cutoff``
+    times the largest one are discarded, and at most ``max_bond_dim`` of them are kept. Gates on
+    wires that are not neighbours are applied by moving one of the wires next to the other with
+    ``SWAP`` gates. Gates acting on more than two wires are decomposed.
+
+    The memory and run time grow with the bond dimension instead of exponentially with the
+    number of wires, so that circuits with gates between nearby wires and little entanglement
+    can be simulated on many wires. Expectation values of tensor products of single-wire
+    observables and marginal probabilities of few wires are computed by contracting the
+    matrix product state, and samples are drawn wire by wire.
+
+    .. warning::
+
+        The :attr:`~.state` of the device, and therefore ``qml.state()`` and
+        ``qml.density_matrix()``, are computed by contracting the full state vector, whose
+        size grows exponentially with the number of wires.
+
+    Args:
+        wires (int, Iterable[Number, str]): Number of subsystems represented by the device,
+            or iterable that contains unique labels for the subsystems as numbers (i.e., ``[-1, 0, 2]``)
+            or strings (``['ancilla', 'q1', 'q2']``). The order of the wires is the order of
+            the tensors in the chain.
+        shots (None, int): How many times the circuit should be evaluated (or sampled) to estimate
+            the expectation values. Defaults to ``None`` if not specified, which means that the device
+            returns analytical results.
+        max_bond_dim (None, int): Maximum bond dimension of the matrix product state. Defaults
+            to ``None``, in which case the bond dimensions are only limited by ``cutoff``.
+        cutoff (float): Singular values smaller than ``cutoff`` times the largest singular value
+            of a bond are discarded. Defaults to ``1e-10``.
+        seed (None, int, array_like[int], SeedSequence, BitGenerator, Generator): Seed for the
+            random number generator used to draw samples. Defaults to ``None``, in which case
+            the global NumPy random state is used.
+    """
+
+    name = "Default matrix product state PennyLane plugin"
+    short_name = "default.mps"
+    pennylane_requires = __version__
+    version = __version__
+    author = "Xanadu Inc."
+
+    operations = {
+        "Identity",
+        "BasisState",
+        "QubitUnitary",
+        "ControlledQubitUnitary",
+        "DiagonalQubitUnitary",
+        "PauliX",
+        "PauliY",
+        "PauliZ",
+        "MultiRZ",
+        "Hadamard",
+        "S",
+        "Adjoint(S)",
+        "T",
+        "Adjoint(T)",
+        "SX",
+        "Adjoint(SX)",
+        "CNOT",
+        "SWAP",
+        "ISWAP",
+        "PSWAP",
+        "Adjoint(ISWAP)",
+        "SISWAP",
+        "Adjoint(SISWAP)",
+        "SQISW",
+        "CY",
+        "CZ",
+        "PhaseShift",
+        "ControlledPhaseShift",
+        "CPhase",
+        "RX",
+        "RY",
+        "RZ",
+        "Rot",
+        "CRX",
+        "CRY",
+        "CRZ",
+        "CRot",
+        "IsingXX",
+        "IsingYY",
+        "IsingZZ",
+        "IsingXY",
+        "SingleExcitation",
+        "SingleExcitationPlus",
+        "SingleExcitationMinus",
+        "ECR",
+    }
+
+    observables = {
+        "PauliX",
+        "PauliY",
+        "PauliZ",
+        "Hadamard",
+        "Hermitian",
+        "Identity",
+        "Projector",
+    }
+
+    def __init__(
+        self,
+        wires,
+        *,
+        r_dtype=np.float64,
+        c_dtype=np.complex128,
+        shots=None,
+        max_bond_dim=None,
+        cutoff=1e-10,
+        seed=None,
+    ):
+        if max_bond_dim is not None and max_bond_dim < 1:
+            raise DeviceError("The maximum bond dimension must be a positive integer.")
+
+        if cutoff < 0:
+            raise DeviceError("The cutoff must be non-negative.")
+
+        super().__init__(wires, shots, r_dtype=r_dtype, c_dtype=c_dtype, seed=seed)
+        self.max_bond_dim = max_bond_dim
+        self.cutoff = cutoff
+
+        self._tensors = self._basis_state_tensors([0] * self.num_wires)
+        self._center = 0
+        self._pre_rotated_tensors = self._tensors
+        self.discarded_weight = 0.0
+        """float: sum of the squared singular values discarded since the last reset"""
+
+    @classmethod
+    def capabilities(cls):
+        capabilities = super().capabilities().copy()
+        capabilities.update(
+            model="qubit",
+            supports_inverse_operations=True,
+            supports_analytic_computation=True,
+            supports_broadcasting=False,
+            returns_state=True,
+        )
+        return capabilities
+
+    @property
+    def stopping_condition(self):
+        def accepts_obj(obj):
+            return obj.name in self.operations and len(obj.wires) <= 2
+
+        return qml.BooleanFn(accepts_obj)
+
+    @property
+    def bond_dims(self):
+        """list[int]: bond dimensions between neighbouring wires"""
+        return [tensor.shape[2] for tensor in self._tensors[:-1]]
+
+    def _basis_state_tensors(self, bits):
+        """Tensors of the matrix product state of a computational basis state."""
+        tensors = []
+        for bit in bits:
+            tensor = np.zeros((1, 2, 1), dtype=self.C_DTYPE)
+            tensor[0, bit, 0] = 1
+            tensors.append(tensor)
+        return tensors
+
+    def reset(self):
+        """Reset the device"""
+        super().reset()
+
+        self._tensors = self._basis_state_tensors([0] * self.num_wires)
+        self._center = 0
+        self._pre_rotated_tensors = self._tensors
+        self.discarded_weight = 0.0
+
+    # pylint: disable=arguments-differ
+    def apply(self, operations, rotations=None, **kwargs):
+        rotations = rotations or []
+
+        for i, operation in enumerate(operations):
+
+            if isinstance(operation, BasisState):
+                if i > 0:
+                    raise DeviceError(
+                        f"Operation {operation.name} cannot be used after other Operations have "
+                        f"already been applied on a {self.short_name} device."
+                    )
+                self._apply_basis_state(operation.parameters[0], operation.wires)
+            else:
+                self._apply_operation(operation)
+
+        # store the pre-rotated state
+        self._pre_rotated_tensors = list(self._tensors)
+
+        for operation in rotations:
+            self._apply_operation(operation)
+
+    def _apply_basis_state(self, state, wires):
+        """Initialize the matrix product state in a specified computational basis state.
+
+        Args:
+            state (array[int]): computational basis state of shape ``(wires,)``
+                consisting of 0s and 1s.
+            wires (Wires): wires that the provided computational state should be initialized on
+        """
+        state = np.asarray(state)
+
+        if not set(state.tolist()).issubset({0, 1}):
+            raise ValueError("BasisState parameter must consist of 0 or 1 integers.")
+
+        if len(state) != len(wires):
+            raise ValueError("BasisState parameter and wires must be of equal length.")
+
+        bits = [0] * self.num_wires
+        for wire, bit in zip(self.wires.indices(wires), state):
+            bits[wire] = int(bit)
+
+        self._tensors = self._basis_state_tensors(bits)
+        self._center = 0
+
+    def _apply_operation(self, operation):
+        """Applies an operation acting on one or two wires to the matrix product state.
+
+        Args:
+            operation (~.Operation): operation to apply on the device
+        """
+        if operation.name == "Identity":
+            return
+
+        if len(operation.wires) > 2:
+            raise DeviceError(
+                f"Operation {operation.name} acts on more than two wires and cannot be applied "
+                f"on a {self.short_name} device."
+            )
+
+        sites = self.wires.indices(operation.wires)
+        matrix = np.asarray(qml.math.toarray(operation.matrix()), dtype=self.C_DTYPE)
+
+        if len(sites) == 1:
+            site = sites[0]
+            self._tensors[site] = np.einsum("st,atb->asb", matrix, self._tensors[site])
+            return
+
+        self._apply_two_site(matrix, *sites)
+
+    def _apply_two_site(self, matrix, first, second):
+        """Applies a two-wire matrix to any two sites, moving the second site next to the first
+        one with ``SWAP`` gates if they are not neighbours."""
+        if first > second:
+            # exchange the roles of the two wires of the matrix
+            matrix = np.reshape(np.transpose(np.reshape(matrix, [2] * 4), [1, 0, 3, 2]), (4, 4))
+            first, second = second, first
+
+        for site in range(second - 1, first, -1):
+            self._apply_adjacent(SWAP, site)
+
+        self._apply_adjacent(matrix, first)
+
+        for site in range(first + 1, second):
+            self._apply_adjacent(SWAP, site)
+
+    def _apply_adjacent(self, matrix, site):
+        """Applies a two-wire matrix to the sites ``site`` and ``site + 1``, and truncates their
+        bond.
+
+        The orthogonality center of the matrix product state is first moved to ``site``, such that
+        the singular values of the bond are its Schmidt coefficients and the truncation is
+        optimal. The center ends on ``site + 1``.
+        """
+        self._move_center(site)
+        left, right = self._tensors[site], self._tensors[site + 1]
+
+        theta = np.einsum("asb,btc->astc", left, right)
+        theta = np.einsum("stuv,auvc->astc", np.reshape(matrix, [2] * 4), theta)
+        theta = np.reshape(theta, (left.shape[0] * 2, 2 * right.shape[2]))
+
+        u, s, vh = np.linalg.svd(theta, full_matrices=False)
+
+        keep = max(1, int(np.sum(s > self.cutoff * s[0])))
+        if self.max_bond_dim is not None:
+            keep = min(keep, self.max_bond_dim)
+
+        self.discarded_weight += float(np.sum(s[keep:] ** 2))
+        s = s[:keep] / np.linalg.norm(s[:keep])
+
+        self._tensors[site] = np.reshape(u[:, :keep], (left.shape[0], 2, keep))
+        self._tensors[site + 1] = np.reshape(s[:, np.newaxis] * vh[:keep], (keep, 2, -1))
+        self._center = site + 1
+
+    def _move_center(self, site):
+        """Moves the orthogonality center of the matrix product state to ``site`` with QR
+        decompositions, leaving the tensors on its left left-canonical and the tensors on its
+        right right-canonical."""
+        while self._center < site:
+            tensor = self._tensors[self._center]
+            q, r = np.linalg.qr(np.reshape(tensor, (-1, tensor.shape[2])))
+            self._tensors[self._center] = np.reshape(q, tensor.shape[:2] + (-1,))
+            self._tensors[self._center + 1] = np.einsum(
+                "ab,bsc->asc", r, self._tensors[self._center + 1]
+            )
+            self._center += 1
+
+        while self._center > site:
+            tensor = self._tensors[self._center]
+            q, r = np.linalg.qr(np.reshape(tensor, (tensor.shape[0], -1)).T)
+            self._tensors[self._center] = np.reshape(q.T, (-1,) + tensor.shape[1:])
+            self._tensors[self._center - 1] = np.einsum(
+                "asb,cb->asc", self._tensors[self._center - 1], r
+            )
+            self._center -= 1
+
+    @property
+    def state(self):
+        state = np.ones((1, 1), dtype=self.C_DTYPE)
+        for tensor in self._pre_rotated_tensors:
+            state = np.reshape(np.einsum("ia,asb->isb", state, tensor), (-1, tensor.shape[2]))
+        return np.reshape(state, (-1,))
+
+    def _contract_diagonal(self, diagonals):
+        """Contracts the matrix product state with a tensor product of diagonal matrices.
+
+        Args:
+            diagonals (dict[int, array]): diagonals of the matrices acting on each site;
+                sites that are not included are traced out
+
+        Returns:
+            float: the expectation value of the tensor product of the diagonal matrices
+        """
+        env = np.ones((1, 1), dtype=self.C_DTYPE)
+        for site, tensor in enumerate(self._tensors):
+            if site in diagonals:
+                env = np.einsum("ab,asc,s,bsd->cd", env, tensor, diagonals[site], tensor.conj())
+            else:
+                env = np.einsum("ab,asc,bsd->cd", env, tensor, tensor.conj())
+        return float(env[0, 0].real)
+
+    def _diagonals(self, observable):
+        """Eigenvalues of the single-wire factors of an observable, by site, if the observable
+        is a tensor product of single-wire observables other than projectors, and ``None``
+        otherwise."""
+        factors = observable.obs if isinstance(observable, Tensor) else [observable]
+
+        if any(len(obs.wires) != 1 or obs.name == "Projector" for obs in factors):
+            return None
+
+        return {
+            self.wires.index(obs.wires[0]): np.asarray(obs.eigvals(), dtype=self.R_DTYPE)
+            for obs in factors
+        }
+
+    def expval(self, observable, shot_range=None, bin_size=None):
+        if self.shots is None:
+            diagonals = self._diagonals(observable)
+            if diagonals is not None:
+                return self._contract_diagonal(diagonals)
+
+        return super().expval(observable, shot_range=shot_range, bin_size=bin_size)
+
+    def var(self, observable, shot_range=None, bin_size=None):
+        if self.shots is None:
+            diagonals = self._diagonals(observable)
+            if diagonals is not None:
+                squared = {site: diagonal**2 for site, diagonal in diagonals.items()}
+                return self._contract_diagonal(squared) - self._contract_diagonal(diagonals) ** 2
+
+        return super().var(observable, shot_range=shot_range, bin_size=bin_size)
+
+    def analytic_probability(self, wires=None):
+        """Marginal probabilities of the computational basis states of some wires, computed by
+        contracting the matrix product state.
+
+        The memory grows exponentially with the number of wires, but only linearly with the
+        number of wires of the device.
+
+        Args:
+            wires (Iterable[Number, str], Number, str, Wires): wires to return
+                marginal probabilities for. Defaults to all wires of the device.
+
+        Returns:
+            array[float]: the marginal probabilities
+        """
+        wires = self.wires if wires is None else qml.wires.Wires(wires)
+        sites = self.wires.indices(wires)
+
+        # the environment has one axis for the kept sites, in increasing order
+        env = np.ones((1, 1, 1), dtype=self.C_DTYPE)
+        for site, tensor in enumerate(self._tensors):
+            if site in sites:
+                env = np.einsum("pab,asc,bsd->pscd", env, tensor, tensor.conj())
+                env = np.reshape(env, (-1,) + env.shape[2:])
+            else:
+                env = np.einsum("pab,asc,bsd->pcd", env, tensor, tensor.conj())
+
+        probs = np.reshape(env[:, 0, 0].real, [2] * len(sites))
+        probs = np.transpose(probs, np.argsort(np.argsort(sites)))
+        return self._asarray(np.reshape(probs, (-1,)), dtype=self.R_DTYPE)
+
+    def generate_samples(self):
+        r"""Returns the computational basis samples generated for all wires.
+
+        The samples are drawn wire by wire: the orthogonality center of the matrix product state
+        is moved to the first wire, such that the marginal probability of the next wire, given
+        the outcomes of the previous ones, only depends on the tensors of the wires sampled so
+        far.
+
+        Returns:
+             array[int]: array of samples in the shape ``(dev.shots, dev.num_wires)``
+        """
+        self._move_center(0)
+        rng = np.random if self._rng is None else self._rng
+        shots = np.arange(self.shots)
+
+        samples = np.empty((self.shots, self.num_wires), dtype=np.int64)
+        left = np.ones((self.shots, 1), dtype=self.C_DTYPE)
+
+        for site, tensor in enumerate(self._tensors):
+            amplitudes = np.einsum("na,asb->nsb", left, tensor)
+            probs = np.sum(np.abs(amplitudes) ** 2, axis=2)
+
+            bits = (rng.random(self.shots) * np.sum(probs, axis=1) >= probs[:, 0]).astype(int)
+            samples[:, site] = bits
+
+            norms = np.sqrt(probs[shots, bits])
+            left = amplitudes[shots, bits] / norms[:, np.newaxis]
+
+        return samples
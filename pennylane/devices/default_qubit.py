@@ -26,8 +26,16 @@ import numpy as np
 from scipy.sparse import csr_matrix
 
 import pennylane as qml
-from pennylane import QubitDevice, DeviceError, QubitStateVector, BasisState, Snapshot
+from pennylane import (
+    QubitDevice,
+    DeviceError,
+    QubitStateVector,
+    BasisState,
+    Snapshot,
+    QubitUnitary,
+)
 from pennylane.ops.qubit.attributes import diagonal_in_z_basis
+from pennylane.utils import _parity
 from pennylane.wires import WireError
 from .._version import __version__
 
@@ -68,6 +76,28 @@ def _get_slice(index, axis, num_axes):
     return tuple(idx)
 
 
+def _get_slices(indices, axes, num_axes):
+    """Allows slicing along several axes of an array or tensor at once.
+
+    Args:
+        indices (Sequence[int or slice]): the indices to access
+        axes (Sequence[int]): the axes to slice into, in the order of ``indices``
+        num_axes (int): total number of axes
+
+    Returns:
+        tuple[slice or int]: a tuple that can be used to slice into an array or tensor
+
+    **Example:**
+
+    >>> _get_slices([1, 0], [2, 0], 3)
+    (0, slice(None, None, None), 1)
+    """
+    idx = [slice(None)] * num_axes
+    for index, axis in zip(indices, axes):
+        idx[axis] = index
+    return tuple(idx)
+
+
 # pylint: disable=unused-argument
 class DefaultQubit(QubitDevice):
     """Default qubit device for PennyLane.
@@ -79,6 +109,20 @@ class DefaultQubit(QubitDevice):
         shots (None, int): How many times the circuit should be evaluated (or sampled) to estimate
             the expectation values. Defaults to ``None`` if not specified, which means that the device
             returns analytical results.
+        max_workers (None, int): Maximum number of threads used to execute batches of circuits,
+            such as the tapes generated by gradient transforms, in parallel. Defaults to ``None``,
+            in which case circuits are executed serially.
+        seed (None, int, array_like[int], SeedSequence, BitGenerator, Generator): Seed for the
+            random number generator used to draw samples. Defaults to ``None``, in which case
+            the global NumPy random state is used.
+        max_fusion_wires (None, int): If provided, runs of consecutive gates acting on at most
+            this many wires (up to 3) are fused into a single unitary before being applied,
+            reducing the number of passes over the state vector. Defaults to ``None``, in
+            which case gates are applied one by one.
+        c_dtype (numpy.dtype): Complex datatype of the state vector. Use ``np.complex64`` for
+            single precision, which halves the memory of the state. Defaults to ``np.complex128``.
+        r_dtype (None, numpy.dtype): Real datatype of the results. Defaults to ``None``, in which
+            case the precision of ``c_dtype`` is used.
     """
 
     name = "Default qubit PennyLane plugin"
@@ -163,12 +207,45 @@ class DefaultQubit(QubitDevice):
         "Exp",
     }
 
+    # Whether NumPy states owned by the device are updated in place while a circuit is applied.
+    # Interface devices that trace the state for differentiation must not overwrite it.
+    _inplace_updates = True
+
     def __init__(
-        self, wires, *, r_dtype=np.float64, c_dtype=np.complex128, shots=None, analytic=None
+        self,
+        wires,
+        *,
+        r_dtype=None,
+        c_dtype=np.complex128,
+        shots=None,
+        analytic=None,
+        max_workers=None,
+        seed=None,
+        max_fusion_wires=None,
     ):
-        super().__init__(wires, shots, r_dtype=r_dtype, c_dtype=c_dtype, analytic=analytic)
+        if r_dtype is None:
+            r_dtype = np.float32 if "complex64" in str(c_dtype) else np.float64
+
+        super().__init__(
+            wires,
+            shots,
+            r_dtype=r_dtype,
+            c_dtype=c_dtype,
+            analytic=analytic,
+            max_workers=max_workers,
+            seed=seed,
+        )
+        if max_fusion_wires is not None and not 1 <= max_fusion_wires <= 3:
+            raise DeviceError("The maximum number of fused wires must be between 1 and 3.")
+
+        self.max_fusion_wires = max_fusion_wires
         self._debugger = None
 
+        # While a circuit is applied, gates may overwrite the state of the device or write
+        # into the scratch buffer instead of allocating new arrays
+        self._inplace = False
+        self._scratch = None
+
         # Create the initial state. Internally, we store the
         # state as an array of dimension [2]*wires.
         self._state = self._create_basis_state(0)
@@ -233,28 +310,49 @@ class DefaultQubit(QubitDevice):
     def apply(self, operations, rotations=None, **kwargs):
         rotations = rotations or []
 
+        if self.max_fusion_wires:
+            operations = self._fuse_operations(operations)
+            rotations = self._fuse_operations(rotations)
+
+        # the state may alias arrays outside of the device, such as the state of a previous
+        # execution or the input of QubitStateVector, and is copied before updating it in place
+        owns_state = False
+
         # apply the circuit operations
-        for i, operation in enumerate(operations):
+        try:
+            for i, operation in enumerate(operations):
 
-            if i > 0 and isinstance(operation, (QubitStateVector, BasisState)):
-                raise DeviceError(
-                    f"Operation {operation.name} cannot be used after other Operations have already been applied "
-                    f"on a {self.short_name} device."
-                )
+                if i > 0 and isinstance(operation, (QubitStateVector, BasisState)):
+                    raise DeviceError(
+                        f"Operation {operation.name} cannot be used after other Operations have already been applied "
+                        f"on a {self.short_name} device."
+                    )
 
-            if isinstance(operation, QubitStateVector):
-                self._apply_state_vector(operation.parameters[0], operation.wires)
-            elif isinstance(operation, BasisState):
-                self._apply_basis_state(operation.parameters[0], operation.wires)
-            elif isinstance(operation, Snapshot):
-                if self._debugger and self._debugger.active:
-                    state_vector = np.array(self._flatten(self._state))
-                    if operation.tag:
-                        self._debugger.snapshots[operation.tag] = state_vector
-                    else:
-                        self._debugger.snapshots[len(self._debugger.snapshots)] = state_vector
-            else:
-                self._state = self._apply_operation(self._state, operation)
+                if isinstance(operation, QubitStateVector):
+                    self._apply_state_vector(operation.parameters[0], operation.wires)
+                elif isinstance(operation, BasisState):
+                    self._apply_basis_state(operation.parameters[0], operation.wires)
+                elif isinstance(operation, Snapshot):
+                    if self._debugger and self._debugger.active:
+                        state_vector = np.array(self._flatten(self._state))
+                        if operation.tag:
+                            self._debugger.snapshots[operation.tag] = state_vector
+                        else:
+                            self._debugger.snapshots[len(self._debugger.snapshots)] = state_vector
+                else:
+                    if self._inplace_updates and not owns_state:
+                        owns_state = isinstance(self._state, np.ndarray)
+                        if owns_state:
+                            # release the reference to the initial state, so that the copy
+                            # does not add to the peak memory
+                            self._pre_rotated_state = None
+                            self._state = np.array(self._state, dtype=self.C_DTYPE)
+                            self._inplace = True
+
+                    self._state = self._apply_operation(self._state, operation)
+        finally:
+            self._inplace = False
+            self._scratch = None
 
         # store the pre-rotated state
         self._pre_rotated_state = self._state
@@ -263,6 +361,56 @@ class DefaultQubit(QubitDevice):
         for operation in rotations:
             self._state = self._apply_operation(self._state, operation)
 
+    def _fuse_operations(self, operations):
+        """Fuses runs of consecutive operations acting on at most ``max_fusion_wires`` wires
+        into single :class:`~.QubitUnitary` operations.
+
+        Operations without a matrix representation, broadcasted operations and operations
+        acting on more wires are left untouched, and interrupt the current run.
+
+        Args:
+            operations (list[~.Operation]): operations to fuse
+
+        Returns:
+            list[~.Operation]: the fused operations
+        """
+        fused = []
+        block = []
+        block_wires = qml.wires.Wires([])
+
+        def flush():
+            if len(block) == 1:
+                fused.append(block[0])
+            elif block:
+                matrix = block[0].matrix(wire_order=block_wires)
+                for op in block[1:]:
+                    matrix = qml.math.dot(op.matrix(wire_order=block_wires), matrix)
+                fused.append(QubitUnitary(matrix, wires=block_wires, do_queue=False))
+
+        for op in operations:
+            fusable = (
+                op.has_matrix
+                and op.batch_size is None
+                and not isinstance(op, (QubitStateVector, BasisState, Snapshot))
+            )
+            wires = qml.wires.Wires.all_wires([block_wires, op.wires])
+
+            if fusable and len(wires) <= self.max_fusion_wires:
+                block.append(op)
+                block_wires = wires
+                continue
+
+            flush()
+
+            if fusable and len(op.wires) <= self.max_fusion_wires:
+                block, block_wires = [op], op.wires
+            else:
+                fused.append(op)
+                block, block_wires = [], qml.wires.Wires([])
+
+        flush()
+        return fused
+
     def _apply_operation(self, state, operation):
         """Applies operations to the input state.
 
@@ -277,6 +425,11 @@ class DefaultQubit(QubitDevice):
             return state
         wires = operation.wires
 
+        if self._inplace and state is self._state:
+            new_state = self._apply_operation_inplace(state, operation)
+            if new_state is not None:
+                return new_state
+
         if operation.__class__.__name__ in self._apply_ops:
             shift = int(self._ndim(state) > self.num_wires)
             axes = [ax + shift for ax in self.wires.indices(wires)]
@@ -292,6 +445,109 @@ class DefaultQubit(QubitDevice):
 
         return self._apply_unitary(state, matrix, wires)
 
+    def _apply_operation_inplace(self, state, operation):
+        """Applies an operation to a NumPy state owned by the device without allocating a
+        new state.
+
+        Permutations and phases of the gates with special apply methods, as well as diagonal
+        gates, overwrite the input state. Dense gates acting on one or two wires write their
+        output into the scratch buffer of the device, which then takes the input state as its
+        new scratch buffer (double buffering).
+
+        Args:
+            state (array[complex]): input state, overwritten by this method
+            operation (~.Operation): operation to apply on the device
+
+        Returns:
+            array[complex] or None: output state, or ``None`` if the operation has no
+            allocation-free implementation
+        """
+        name = operation.__class__.__name__
+        ndim = state.ndim
+        shift = int(ndim > self.num_wires)
+        axes = [ax + shift for ax in self.map_wires(operation.wires)]
+
+        # slices rather than integers keep the sliced axes, such that indexing returns views
+        # even if all axes of the state are sliced
+        zero, one = slice(0, 1), slice(1, 2)
+
+        if name in {"PauliX", "PauliY", "CNOT", "Toffoli"}:
+            # swap the amplitudes of the target qubit in the subspace where all controls are 1
+            controls = [one] * (len(axes) - 1)
+            index_0 = _get_slices(controls + [zero], axes, ndim)
+            index_1 = _get_slices(controls + [one], axes, ndim)
+            self._swap_slices(state, index_0, index_1)
+
+            if name == "PauliY":
+                state[index_0] *= -1j
+                state[index_1] *= 1j
+            return state
+
+        if name in {"PauliZ", "CZ", "S", "T"}:
+            phase = {"S": 1j, "T": TPHASE}.get(name, -1)
+            if operation.inverse:
+                phase = np.conj(phase)
+            state[_get_slices([one] * len(axes), axes, ndim)] *= phase
+            return state
+
+        if name == "SWAP":
+            # transposition does not allocate a new state
+            return None
+
+        diagonal = operation in diagonal_in_z_basis
+        if not diagonal and len(axes) > 2:
+            return None
+
+        matrix = np.asarray(self._get_unitary_matrix(operation), dtype=state.dtype)
+        if matrix.ndim > (1 if diagonal else 2):
+            # broadcasted operations change the shape of the state
+            return None
+
+        if diagonal:
+            # broadcast the phases along the target axes of the state, in increasing order
+            phases = np.transpose(np.reshape(matrix, [2] * len(axes)), np.argsort(axes))
+            shape = [1] * ndim
+            for ax in axes:
+                shape[ax] = 2
+            state *= np.reshape(phases, shape)
+            return state
+
+        scratch = self._scratch_like(state)
+        self._apply_unitary_einsum(state, matrix, operation.wires, out=scratch)
+        self._scratch = state if state.flags.c_contiguous else None
+        return scratch
+
+    def _scratch_like(self, state):
+        """Returns the scratch buffer of the device, allocating it if it does not match the
+        shape and data type of the state.
+
+        Args:
+            state (array[complex]): state the buffer is used for
+
+        Returns:
+            array[complex]: C-contiguous scratch buffer with the shape of ``state``
+        """
+        scratch = self._scratch
+        if scratch is None or scratch.shape != state.shape or scratch.dtype != state.dtype:
+            scratch = self._scratch = np.empty(state.shape, dtype=state.dtype)
+        return scratch
+
+    def _swap_slices(self, state, index_0, index_1):
+        """Swaps two disjoint slices of a state in place, using the scratch buffer of the
+        device as temporary storage.
+
+        Args:
+            state (array[complex]): state to update
+            index_0 (tuple[slice or int]): index of the first slice
+            index_1 (tuple[slice or int]): index of the second slice
+        """
+        slice_0 = state[index_0]
+        tmp = self._scratch_like(state).reshape(-1)[: slice_0.size].reshape(slice_0.shape)
+        np.copyto(tmp, slice_0)
+        # unlike assignments, ufuncs do not copy slices of the same array that do not overlap
+        np.positive(state[index_1], out=slice_0)
+        np.positive(tmp, out=state[index_1])
+
     def _apply_x(self, state, axes, **kwargs):
         """Applies a PauliX gate by rolling 1 unit along the axis specified in ``axes``.
 
@@ -528,6 +784,14 @@ class DefaultQubit(QubitDevice):
         if observable.name in ("Hamiltonian", "SparseHamiltonian"):
             assert self.shots is None, f"{observable.name} must be used with shots=None"
 
+            if observable.name == "Hamiltonian" and all(
+                qml.math.get_interface(d) in ("numpy", "autograd")
+                for d in [self.state, *observable.data]
+            ):
+                masks = observable.pauli_masks(self.wires)
+                if masks is not None:
+                    return self._expval_pauli_words(observable.data, masks)
+
             backprop_mode = (
                 not isinstance(self.state, np.ndarray)
                 or any(not isinstance(d, (float, np.ndarray)) for d in observable.data)
@@ -566,9 +830,10 @@ class DefaultQubit(QubitDevice):
                     c = qml.math.convert_like(coeff, product)
 
                     if interface == "tensorflow":
-                        c = qml.math.cast(c, "complex128")
+                        c = qml.math.cast_like(c, product)
 
-                    res = qml.math.convert_like(res, product) + qml.math.sum(c * product)
+                    res = qml.math.cast_like(qml.math.convert_like(res, product), product)
+                    res = res + qml.math.sum(c * product)
 
             else:
                 # Coefficients and the state are not trainable, we can be more
@@ -579,6 +844,8 @@ class DefaultQubit(QubitDevice):
                     Hmat = observable.sparse_matrix()
 
                 state = qml.math.toarray(self.state)
+                if state.dtype == np.complex64:
+                    Hmat = Hmat.astype(np.complex64)
                 if self._ndim(state) == 2:
                     res = qml.math.array(
                         [
@@ -602,6 +869,52 @@ class DefaultQubit(QubitDevice):
 
         return super().expval(observable, shot_range=shot_range, bin_size=bin_size)
 
+    def _expval_pauli_words(self, coeffs, masks):
+        r"""Expectation value of a linear combination of Pauli words, computed directly
+        from the state vector without constructing any matrix.
+
+        Writing each Pauli word as :math:`P = i^{n_Y} X^{\mathbf{x}} Z^{\mathbf{z}}`, its action
+        on a basis state index :math:`k` is a bit flip :math:`k \oplus \mathbf{x}` together with the
+        phase :math:`(-i)^{n_Y} (-1)^{|k \wedge \mathbf{z}|}`. Terms sharing the same :math:`\mathbf{x}`
+        mask, i.e., the same permutation of the state, are combined into a single weight vector.
+
+        Args:
+            coeffs (list[tensor_like[float]]): coefficients of the Pauli words
+            masks (tuple[array[int]]): the ``x`` masks, ``z`` masks and numbers of :math:`Y`
+                operators of the Pauli words, as returned by :meth:`~.Hamiltonian.pauli_masks`
+
+        Returns:
+            float or tensor_like[float]: the expectation value, with a leading broadcasting
+            dimension if the state is broadcasted
+        """
+        x_masks, z_masks, num_y = masks
+        dim = 2**self.num_wires
+        state = self.state
+        batched = self._ndim(state) == 2
+        state = self._reshape(state, (-1, dim))
+        conj_state = self._conj(state)
+
+        indices = np.arange(dim)
+        coeffs = qml.math.stack(coeffs) * (-1j) ** num_y
+        # limit the size of the intermediate array of signs to that of a few states
+        chunk_size = max(1, 2**20 // dim)
+
+        res = 0.0
+        for x in np.unique(x_masks):
+            terms = np.flatnonzero(x_masks == x)
+            weights = 0.0
+            for start in range(0, len(terms), chunk_size):
+                chunk = terms[start : start + chunk_size]
+                signs = 1 - 2 * _parity(indices & z_masks[chunk, np.newaxis], self.num_wires)
+                weights = weights + qml.math.dot(coeffs[chunk], signs)
+
+            weights = qml.math.cast_like(weights, state)
+            flipped_state = self._gather(state, indices ^ x, axis=1) if x else state
+            res = res + qml.math.sum(conj_state * weights * flipped_state, axis=1)
+
+        res = self._real(res)
+        return res if batched else res[0]
+
     def _get_unitary_matrix(self, unitary):  # pylint: disable=no-self-use
         """Return the matrix representing a unitary operation.
 
@@ -648,7 +961,9 @@ class DefaultQubit(QubitDevice):
 
         Note: This function does not support broadcasted inputs yet.
         """
-        state = np.zeros(2**self.num_wires, dtype=np.complex128)
+        # allocate the state directly in single precision, rather than casting it afterwards
+        dtype = np.complex64 if "complex64" in str(self.C_DTYPE) else np.complex128
+        state = np.zeros(2**self.num_wires, dtype=dtype)
         state[index] = 1
         state = self._asarray(state, dtype=self.C_DTYPE)
         return self._reshape(state, [2] * self.num_wires)
@@ -798,7 +1113,7 @@ class DefaultQubit(QubitDevice):
         inv_perm = np.argsort(perm)  # argsort gives inverse permutation
         return self._transpose(tdot, inv_perm)
 
-    def _apply_unitary_einsum(self, state, mat, wires):
+    def _apply_unitary_einsum(self, state, mat, wires, out=None):
         r"""Apply multiplication of a matrix to subsystems of the quantum state.
 
         This function uses einsum instead of tensordot. This approach is only
@@ -808,6 +1123,7 @@ class DefaultQubit(QubitDevice):
             state (array[complex]): input state
             mat (array): matrix to multiply
             wires (Wires): target wires
+            out (None, array[complex]): NumPy array the output state is written to
 
         Returns:
             array[complex]: output state
@@ -847,6 +1163,9 @@ class DefaultQubit(QubitDevice):
             f"...{new_indices}{affected_indices},...{state_indices}->...{new_state_indices}"
         )
 
+        if out is not None:
+            return self._einsum(einsum_indices, mat, state, out=out)
+
         return self._einsum(einsum_indices, mat, state)
 
     def _apply_diagonal_unitary(self, state, phases, wires):
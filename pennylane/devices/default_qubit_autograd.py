@@ -74,6 +74,8 @@ class DefaultQubitAutograd(DefaultQubit):
             and variances analytically. In non-analytic mode, the ``diff_method="backprop"``
             QNode differentiation method is not supported and it is recommended to consider
             switching device to ``default.qubit`` and using ``diff_method="parameter-shift"``.
+        c_dtype (numpy.dtype): Complex datatype of the state vector. Use ``np.complex64`` for
+            single precision. Defaults to ``np.complex128``.
     """
 
     name = "Default qubit (Autograd) PennyLane plugin"
@@ -96,6 +98,9 @@ class DefaultQubitAutograd(DefaultQubit):
     _size = staticmethod(np.size)
     _ndim = staticmethod(np.ndim)
 
+    # Autograd may hold on to intermediate states to compute gradients
+    _inplace_updates = False
+
     @staticmethod
     def _asarray(array, dtype=None):
         res = np.asarray(array, dtype=dtype)
@@ -109,9 +114,8 @@ class DefaultQubitAutograd(DefaultQubit):
     def _const_mul(constant, array):
         return constant * array
 
-    def __init__(self, wires, *, shots=None, analytic=None):
-        r_dtype = np.float64
-        c_dtype = np.complex128
+    def __init__(self, wires, *, shots=None, analytic=None, c_dtype=np.complex128):
+        r_dtype = np.float32 if "complex64" in str(c_dtype) else np.float64
         super().__init__(wires, shots=shots, r_dtype=r_dtype, c_dtype=c_dtype, analytic=analytic)
 
         # prevent using special apply methods for these gates due to slowdown in Autograd
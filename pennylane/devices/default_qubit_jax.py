@@ -126,6 +126,9 @@ class DefaultQubitJax(DefaultQubit):
             switching device to ``default.qubit`` and using ``diff_method="parameter-shift"``.
         prng_key (Optional[jax.random.PRNGKey]): An optional ``jax.random.PRNGKey``. This is the key to the
             pseudo random number generator. If None, a random key will be generated.
+        c_dtype (None, numpy.dtype): Complex datatype of the state vector. Defaults to ``None``,
+            in which case ``jnp.complex128`` is used if 64-bit precision is enabled in JAX, and
+            ``jnp.complex64`` otherwise.
 
     """
 
@@ -155,13 +158,10 @@ class DefaultQubitJax(DefaultQubit):
     _size = staticmethod(jnp.size)
     _ndim = staticmethod(jnp.ndim)
 
-    def __init__(self, wires, *, shots=None, prng_key=None, analytic=None):
-        if jax_config.read("jax_enable_x64"):
-            c_dtype = jnp.complex128
-            r_dtype = jnp.float64
-        else:
-            c_dtype = jnp.complex64
-            r_dtype = jnp.float32
+    def __init__(self, wires, *, shots=None, prng_key=None, analytic=None, c_dtype=None):
+        if c_dtype is None:
+            c_dtype = jnp.complex128 if jax_config.read("jax_enable_x64") else jnp.complex64
+        r_dtype = jnp.float32 if "complex64" in str(c_dtype) else jnp.float64
         super().__init__(wires, r_dtype=r_dtype, c_dtype=c_dtype, shots=shots, analytic=analytic)
 
         # prevent using special apply methods for these gates due to slowdown in jax
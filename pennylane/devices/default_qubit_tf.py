@@ -113,6 +113,8 @@ class DefaultQubitTF(DefaultQubit):
             If ``shots > 0`` is used, the ``diff_method="backprop"``
             QNode differentiation method is not supported and it is recommended to consider
             switching device to ``default.qubit`` and using ``diff_method="parameter-shift"``.
+        c_dtype (tf.DType, numpy.dtype): Complex datatype of the state vector. Use
+            ``tf.complex64`` for single precision. Defaults to ``tf.complex128``.
     """
 
     name = "Default qubit (TensorFlow) PennyLane plugin"
@@ -159,9 +161,9 @@ class DefaultQubitTF(DefaultQubit):
 
         return res
 
-    def __init__(self, wires, *, shots=None, analytic=None):
-        r_dtype = tf.float64
-        c_dtype = tf.complex128
+    def __init__(self, wires, *, shots=None, analytic=None, c_dtype=tf.complex128):
+        c_dtype = tf.as_dtype(c_dtype)
+        r_dtype = c_dtype.real_dtype
 
         super().__init__(wires, shots=shots, r_dtype=r_dtype, c_dtype=c_dtype, analytic=analytic)
 
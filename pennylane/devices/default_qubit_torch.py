@@ -128,6 +128,8 @@ class DefaultQubitTorch(DefaultQubit):
             switching device to ``default.qubit`` and using ``diff_method="parameter-shift"``.
         torch_device='cpu' (str): the device on which the computation will be
         run, e.g., ``'cpu'`` or ``'cuda'``
+        c_dtype (torch.dtype, numpy.dtype): Complex datatype of the state vector. Use
+            ``torch.complex64`` for single precision. Defaults to ``torch.complex128``.
     """
 
     name = "Default qubit (Torch) PennyLane plugin"
@@ -154,15 +156,18 @@ class DefaultQubitTorch(DefaultQubit):
     _size = staticmethod(torch.numel)
     _ndim = staticmethod(lambda tensor: tensor.ndim)
 
-    def __init__(self, wires, *, shots=None, analytic=None, torch_device=None):
+    def __init__(
+        self, wires, *, shots=None, analytic=None, torch_device=None, c_dtype=torch.complex128
+    ):
 
         # Store if the user specified a Torch device. Otherwise the execute
         # method attempts to infer the Torch device from the gate parameters.
         self._torch_device_specified = torch_device is not None
         self._torch_device = torch_device
 
-        r_dtype = torch.float64
-        c_dtype = torch.complex128
+        if not isinstance(c_dtype, torch.dtype):
+            c_dtype = getattr(torch, np.dtype(c_dtype).name)
+        r_dtype = torch.float32 if c_dtype is torch.complex64 else torch.float64
 
         super().__init__(wires, r_dtype=r_dtype, c_dtype=c_dtype, shots=shots, analytic=analytic)
 
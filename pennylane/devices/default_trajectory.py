@@ -0,0 +1,280 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+r"""
+The default.trajectory device is PennyLane's trajectory-based simulator of noisy circuits.
+
+It samples the Kraus operators of noise channels stochastically for each trajectory
+(Monte Carlo wavefunction method), such that noisy circuits are simulated with state vectors
+rather than density matrices.
+"""
+import numpy as np
+
+from pennylane import DeviceError
+from pennylane.operation import Channel
+
+from .default_qubit import DefaultQubit
+
+# number of amplitudes of the state vectors of a batch of trajectories, if the batch size
+# is not set explicitly
+_BATCH_AMPLITUDES = 2**22
+
+
+class DefaultTrajectory(DefaultQubit):
+    r"""Trajectory-based simulator of noisy qubit circuits.
+
+    Each shot is drawn from a separate trajectory: a pure state that evolves under the gates of
+    the circuit, and under a single Kraus operator :math:`K_k` of each noise channel, sampled
+    with probability :math:`\|K_k|\psi\rangle\|^2`. Averaged over trajectories, the samples
+    follow the distribution of the noisy circuit, while the memory only grows linearly with the
+    size of the state vector instead of quadratically, as for ``default.mixed``.
+
+    Trajectories are simulated in batches, stored along the broadcasting dimension of the
+    state, such that the state vector kernels of ``default.qubit`` evolve all trajectories of
+    a batch at once. Gates preceding the first channel are only applied to a single state.
+
+    Args:
+        wires (int, Iterable[Number, str]): Number of subsystems represented by the device,
+            or iterable that contains unique labels for the subsystems as numbers (i.e., ``[-1, 0, 2]``)
+            or strings (``['ancilla', 'q1', 'q2']``).
+        shots (int, Sequence[int]): Number of trajectories, each of which yields one sample.
+            Defaults to 1000. Analytic computation with ``shots=None`` is not supported.
+        trajectory_batch_size (None, int): Number of trajectories simulated at once. Defaults
+            to ``None``, in which case a batch holds about :math:`2^{22}` amplitudes.
+        seed (None, int, array_like[int], SeedSequence, BitGenerator, Generator): Seed for the
+            random number generator used to sample Kraus operators and basis states. Defaults
+            to ``None``, in which case the global NumPy random state is used.
+        max_fusion_wires (None, int): If provided, runs of consecutive gates acting on at most
+            this many wires (up to 3) are fused into a single unitary before being applied.
+            Channels interrupt these runs.
+    """
+
+    name = "Default trajectory PennyLane plugin"
+    short_name = "default.trajectory"
+
+    operations = DefaultQubit.operations | {
+        "AmplitudeDamping",
+        "GeneralizedAmplitudeDamping",
+        "PhaseDamping",
+        "DepolarizingChannel",
+        "BitFlip",
+        "PhaseFlip",
+        "PauliError",
+        "ResetError",
+        "QubitChannel",
+        "ThermalRelaxationError",
+    }
+
+    observables = DefaultQubit.observables - {"SparseHamiltonian"}
+
+    def __init__(
+        self,
+        wires,
+        *,
+        r_dtype=np.float64,
+        c_dtype=np.complex128,
+        shots=1000,
+        trajectory_batch_size=None,
+        seed=None,
+        max_fusion_wires=None,
+    ):
+        if shots is None:
+            raise DeviceError("The default.trajectory device requires a finite number of shots.")
+
+        if trajectory_batch_size is not None and trajectory_batch_size < 1:
+            raise DeviceError("The trajectory batch size must be a positive integer.")
+
+        super().__init__(
+            wires,
+            r_dtype=r_dtype,
+            c_dtype=c_dtype,
+            shots=shots,
+            seed=seed,
+            max_fusion_wires=max_fusion_wires,
+        )
+        self.trajectory_batch_size = trajectory_batch_size or max(
+            1, _BATCH_AMPLITUDES // 2**self.num_wires
+        )
+        self._num_trajectories = None
+        self._trajectory_samples = None
+
+    @classmethod
+    def capabilities(cls):
+        capabilities = super().capabilities().copy()
+        capabilities.update(
+            supports_analytic_computation=False,
+            # the broadcasting dimension of the state holds the trajectories
+            supports_broadcasting=False,
+            returns_state=False,
+            passthru_devices={},
+        )
+        return capabilities
+
+    def apply(self, operations, rotations=None, **kwargs):
+        if self.shots is None:
+            raise DeviceError("The default.trajectory device requires a finite number of shots.")
+
+        samples = []
+
+        for start in range(0, self.shots, self.trajectory_batch_size):
+            self._num_trajectories = min(self.trajectory_batch_size, self.shots - start)
+            self._state = self._create_basis_state(0)
+            super().apply(operations, rotations=rotations, **kwargs)
+            samples.append(self._sample_trajectories(self._state))
+
+        self._trajectory_samples = self.states_to_binary(np.concatenate(samples), self.num_wires)
+
+    def generate_samples(self):
+        r"""Returns the computational basis samples drawn from the trajectories of the last
+        execution, one sample per trajectory.
+
+        Returns:
+             array[int]: array of samples in the shape ``(dev.shots, dev.num_wires)``
+        """
+        return self._trajectory_samples
+
+    def _apply_operation(self, state, operation):
+        """Applies operations to the input state, sampling a Kraus operator for each trajectory
+        if the operation is a channel.
+
+        Args:
+            state (array[complex]): input state, either a single state shared by all
+                trajectories or a batch of trajectories
+            operation (~.Operation): operation to apply on the device
+
+        Returns:
+            array[complex]: output state
+        """
+        if isinstance(operation, Channel):
+            return self._apply_channel(state, operation)
+
+        return super()._apply_operation(state, operation)
+
+    def _apply_kraus(self, state, kraus, wires):
+        """Multiplies a batch of trajectories by a Kraus operator."""
+        if len(wires) <= 2:
+            return self._apply_unitary_einsum(state, kraus, wires)
+
+        return self._apply_unitary(state, kraus, wires)
+
+    def _kraus_probabilities(self, state, kraus, wires):
+        """Probabilities of the Kraus operators of a channel for each trajectory of a batch,
+        computed from the reduced density matrices of the trajectories on the channel wires.
+
+        Args:
+            state (array[complex]): batch of trajectories
+            kraus (list[array[complex]]): Kraus operators of the channel
+            wires (Wires): wires of the channel
+
+        Returns:
+            array[float]: probabilities of shape ``(len(kraus), num_trajectories)``
+        """
+        num_trajectories = state.shape[0]
+        axes = [ax + 1 for ax in self.wires.indices(wires)]
+        dim = 2 ** len(axes)
+
+        state = np.moveaxis(state, axes, range(1, len(axes) + 1))
+        state = np.reshape(state, (num_trajectories, dim, -1))
+        rho = np.einsum("aij,akj->aik", state, state.conj())
+
+        # tr(K rho K^dagger) = sum_ij (K^dagger K)_ji rho_ij
+        gram = np.stack([k.conj().T @ k for k in kraus])
+        return np.einsum("kji,aij->ka", gram, rho).real
+
+    def _apply_channel(self, state, operation):
+        r"""Applies a channel to a batch of trajectories, sampling one of its Kraus operators
+        for each trajectory.
+
+        If all Kraus operators satisfy :math:`K_k^\dagger K_k \propto I`, as for mixtures of
+        unitaries like the depolarizing channel, the sampling probabilities do not depend on the
+        state. Otherwise, they are computed from the reduced density matrices of the
+        trajectories on the wires of the channel. In both cases, each trajectory is only
+        multiplied by its sampled Kraus operator, and Kraus operators proportional to the
+        identity are skipped.
+
+        Args:
+            state (array[complex]): input state, either a single state shared by all
+                trajectories or a batch of trajectories
+            operation (~.Channel): channel to apply
+
+        Returns:
+            array[complex]: batch of trajectories of shape ``(num_trajectories, 2, ..., 2)``
+        """
+        if self._ndim(state) == self.num_wires:
+            # the trajectories split at the first channel
+            state = np.repeat(state[np.newaxis], self._num_trajectories, axis=0)
+
+        wires = operation.wires
+        kraus = [np.asarray(k, dtype=self.C_DTYPE) for k in operation.kraus_matrices()]
+        rng = np.random if self._rng is None else self._rng
+        num_trajectories = state.shape[0]
+        identity = np.eye(2 ** len(wires))
+
+        gram = [k.conj().T @ k for k in kraus]
+        if all(np.allclose(g, g[0, 0] * identity) for g in gram):
+            probs = np.array([g[0, 0].real for g in gram])
+            choices = rng.choice(len(kraus), size=num_trajectories, p=probs / probs.sum())
+            norms = np.sqrt(probs[choices])
+        else:
+            probs = self._kraus_probabilities(state, kraus, wires)
+            cdf = np.cumsum(probs, axis=0)
+            uniform = rng.random(num_trajectories) * cdf[-1]
+            choices = np.minimum(np.sum(cdf <= uniform, axis=0), len(kraus) - 1)
+            norms = np.sqrt(probs[choices, np.arange(num_trajectories)])
+
+        norms = norms.reshape((-1,) + (1,) * self.num_wires)
+
+        for k in np.unique(choices):
+            selected = choices == k
+            scale = kraus[k][0, 0]
+
+            if np.allclose(kraus[k], scale * identity):
+                factors = scale / norms[selected]
+                if not np.allclose(factors, 1.0):
+                    state[selected] *= factors
+            elif selected.all():
+                state = self._apply_kraus(state, kraus[k], wires) / norms
+            else:
+                state[selected] = (
+                    self._apply_kraus(state[selected], kraus[k], wires) / norms[selected]
+                )
+
+        return state
+
+    def _sample_trajectories(self, state):
+        """Samples one computational basis state from each trajectory of a batch.
+
+        Args:
+            state (array[complex]): a single state shared by all trajectories, or a batch of
+                trajectories
+
+        Returns:
+            array[int]: the sampled basis states in base 10 representation
+        """
+        dim = 2**self.num_wires
+        rng = np.random if self._rng is None else self._rng
+        batched = self._ndim(state) > self.num_wires
+
+        probs = np.abs(np.reshape(state, (-1, dim) if batched else (dim,))) ** 2
+        cdf = np.cumsum(probs, axis=-1)
+        cdf /= cdf[..., -1:]
+
+        if not batched:
+            samples = np.searchsorted(cdf, rng.random(self._num_trajectories), side="right")
+            return np.minimum(samples, dim - 1)
+
+        # each trajectory is shifted by its index, so that all of them are searched in one call
+        offsets = np.arange(cdf.shape[0])
+        uniform = rng.random(cdf.shape[0]) + offsets
+        samples = np.searchsorted((cdf + offsets[:, np.newaxis]).ravel(), uniform, side="right")
+        return np.minimum(samples - dim * offsets, dim - 1)
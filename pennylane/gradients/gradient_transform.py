@@ -17,6 +17,7 @@ including a decorator for specifying gradient expansions."""
 import warnings
 
 import pennylane as qml
+from pennylane.tracker import stage
 from pennylane.transforms.tape_expand import expand_invalid_trainable
 
 
@@ -249,6 +250,27 @@ class gradient_transform(qml.batch_transform):
         self.hybrid = hybrid
         super().__init__(transform_fn, expand_fn=expand_fn, differentiable=differentiable)
 
+    def construct(self, tape, *args, **kwargs):
+        """Applies the gradient transform to an input tape.
+
+        The generation of the gradient tapes and the post-processing of their results
+        are timed as the ``"gradient_tapes"`` and ``"postprocessing"`` stages by
+        trackers with ``timing=True``.
+
+        Args:
+            tape (.QuantumTape): the tape to be differentiated
+            *args: positional arguments to pass to the gradient transform
+            **kwargs: keyword arguments to pass to the gradient transform
+
+        Returns:
+            tuple[list[tapes], callable]: list of gradient tapes
+            to execute and a post-processing function.
+        """
+        with stage("gradient_tapes"):
+            tapes, processing_fn = super().construct(tape, *args, **kwargs)
+
+        return tapes, stage("postprocessing")(processing_fn)
+
     def default_qnode_wrapper(self, qnode, targs, tkwargs):
         # Here, we overwrite the QNode execution wrapper in order
         # to take into account that classical processing may be present
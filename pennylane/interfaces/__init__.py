@@ -26,6 +26,7 @@ Execution functions and utilities
     ~execute
     ~execute_new
     ~interfaces.cache_execute
+    ~interfaces.DiskCache
     ~interfaces.set_shots
 
 Supported interfaces
@@ -43,6 +44,7 @@ Supported interfaces
 
 """
 from .execution import cache_execute, execute, execute_new, INTERFACE_MAP, SUPPORTED_INTERFACES
+from .disk_cache import DiskCache
 from .set_shots import set_shots
 
 
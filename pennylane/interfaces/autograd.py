@@ -45,13 +45,14 @@ def execute(tapes, device, execute_fn, gradient_fn, gradient_kwargs, _n=1, max_d
             for higher order derivatives to be extracted, at the cost of additional
             (classical) computational overhead during the backwards pass.
         mode (str): Whether the gradients should be computed on the forward
-            pass (``forward``) or the backward pass (``backward``).
+            pass (``forward``) or the backward pass (``backward``), or whether
+            ``gradient_fn`` computes the vector-Jacobian products on the backward
+            pass (``vjp``).
 
     Returns:
         list[list[float]]: A nested list of tape results. Each element in
         the returned list corresponds in order to the provided tapes.
     """
-    # pylint: disable=unused-argument
     for tape in tapes:
         # set the trainable parameters
         params = tape.get_parameters(trainable_only=False)
@@ -72,6 +73,7 @@ def execute(tapes, device, execute_fn, gradient_fn, gradient_kwargs, _n=1, max_d
         gradient_kwargs=gradient_kwargs,
         _n=_n,
         max_diff=max_diff,
+        mode=mode,
     )[0]
 
 
@@ -85,6 +87,7 @@ def _execute(
     gradient_kwargs=None,
     _n=1,
     max_diff=2,
+    mode=None,
 ):  # pylint: disable=dangerous-default-value,unused-argument
     """Autodifferentiable wrapper around ``Device.batch_execute``.
 
@@ -142,6 +145,7 @@ def vjp(
     gradient_kwargs=None,
     _n=1,
     max_diff=2,
+    mode=None,
 ):  # pylint: disable=dangerous-default-value,unused-argument
     """Returns the vector-Jacobian product operator for a batch of quantum tapes.
 
@@ -166,6 +170,9 @@ def vjp(
             the maximum number of derivatives to support. Increasing this value allows
             for higher order derivatives to be extracted, at the cost of additional
             (classical) computational overhead during the backwards pass.
+        mode (str): Whether the gradients are computed on the forward pass (``forward``),
+            on the backward pass (``backward``), or whether ``gradient_fn`` computes the
+            vector-Jacobian products on the backward pass (``vjp``).
 
     Returns:
         function: this function accepts the backpropagation
@@ -245,6 +252,12 @@ def vjp(
                         )
                     )
 
+            elif mode == "vjp":
+                # Gradient function computes the vector-Jacobian products on the device,
+                # from the output gradients in the shape of the tape results.
+                with qml.tape.Unwrap(*tapes):
+                    vjps = gradient_fn(tapes, [qml.math.T(d) for d in dy], **gradient_kwargs)
+
             else:
                 # Gradient function is not a gradient transform
                 # (e.g., it might be a device method).
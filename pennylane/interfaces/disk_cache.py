@@ -0,0 +1,356 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Contains the DiskCache class, a persistent execution cache that
+can be shared across processes via an SQLite database.
+"""
+# pylint: disable=protected-access
+from collections.abc import MutableMapping
+import copy
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+from autograd.numpy.numpy_boxes import ArrayBox
+import numpy as np
+from scipy import sparse
+
+import pennylane as qml
+from pennylane.operation import Operator, Tensor
+from pennylane.wires import Wires
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+)
+"""
+
+_EVICT = """
+DELETE FROM results WHERE key IN (
+    SELECT key FROM (
+        SELECT key, SUM(size) OVER (ORDER BY accessed DESC, key) AS total FROM results
+    ) WHERE total > ?
+)
+"""
+
+
+def _value_fingerprint(value):
+    """Returns an exact representation of a parameter, hyperparameter or observable that
+    does not depend on the process. Tensors are represented by their datatype, shape and
+    raw bytes, such that, unlike their string representation, they are neither truncated
+    nor rounded."""
+    if isinstance(value, Operator):
+        return _op_fingerprint(value)
+
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__,) + tuple(_value_fingerprint(v) for v in value)
+
+    if isinstance(value, dict):
+        return ("dict",) + tuple((repr(k), _value_fingerprint(v)) for k, v in value.items())
+
+    if sparse.issparse(value):
+        value = value.tocsr()
+        arrays = (value.data, value.indices, value.indptr)
+        return ("csr", value.shape) + tuple(_value_fingerprint(a) for a in arrays)
+
+    if value is None or isinstance(value, (str, Wires)):
+        return repr(value)
+
+    array = np.asarray(qml.math.unwrap([value])[0])
+
+    if array.dtype == object:
+        # not a tensor; objects without an exact representation fall back to ``repr``
+        return repr(value)
+
+    return (array.dtype.str, array.shape, array.tobytes())
+
+
+def _op_fingerprint(op):
+    """Returns an exact representation of an operator or observable, including the
+    terms of tensor products and Hamiltonians."""
+    if isinstance(op, Tensor):
+        return ("Tensor",) + tuple(_op_fingerprint(o) for o in op.obs)
+
+    return (
+        str(op.name),
+        tuple(op.wires.tolist()),
+        _value_fingerprint(op.data),
+        _value_fingerprint(op.hyperparameters),
+    )
+
+
+def _tape_fingerprint(tape):
+    """Returns a string representation of a tape that, unlike :attr:`.QuantumTape.hash`,
+    does not depend on the salted built-in ``hash`` and is therefore stable across processes.
+    Parameters are represented exactly, and observables by their full structure."""
+    fingerprint = [_op_fingerprint(op) for op in tape.operations]
+
+    for m in tape.measurements:
+        fingerprint.append(
+            (
+                str(m.return_type),
+                tuple(m.wires.tolist()),
+                None if m.obs is None else _op_fingerprint(m.obs),
+                _value_fingerprint(m._eigvals),
+                _value_fingerprint(getattr(m, "H", None)),
+                repr(getattr(m, "seed", None)),
+            )
+        )
+
+    fingerprint.extend(tape.trainable_params)
+    return repr(tuple(fingerprint))
+
+
+_CONFIG_TYPES = (type(None), bool, int, float, complex, str, type, np.dtype)
+
+# attributes of devices updated during execution, rather than set by their configuration
+_EXECUTION_ATTRIBUTES = {"_num_executions"}
+
+
+def _device_fingerprint(device):
+    """Returns a representation of a device class and its configuration, such as its
+    precision, noise parameters or truncation, independent of the executed tapes.
+
+    Devices may provide the configuration by defining a ``cache_fingerprint`` method.
+    Otherwise, it is extracted from the attributes of the device that are scalars, strings
+    or datatypes; execution state, such as the simulated state vector, is not included."""
+    cls = type(device)
+    name = f"{cls.__module__}.{cls.__qualname__}"
+
+    if hasattr(device, "cache_fingerprint"):
+        return repr((name, device.cache_fingerprint()))
+
+    config = sorted(
+        (attr, repr(value))
+        for attr, value in vars(device).items()
+        if isinstance(value, _CONFIG_TYPES) and attr not in _EXECUTION_ATTRIBUTES
+    )
+    return repr((name, tuple(config)))
+
+
+def _is_serializable(value):
+    """Whether a result can be persisted; results that carry autodifferentiation
+    information, or that belong to a framework other than NumPy, are kept in memory only."""
+    if isinstance(value, (list, tuple)):
+        return all(_is_serializable(v) for v in value)
+
+    if qml.math.get_interface(value) not in ("numpy", "autograd"):
+        return False
+
+    return not isinstance(value, ArrayBox)
+
+
+class _Database:
+    """Lazily opened SQLite connection, shared between all views of a :class:`~.DiskCache`."""
+
+    def __init__(self, path, timeout):
+        self.path = path
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self._connection = None
+        # access times of read entries, written with the next write transaction such
+        # that reads do not need to lock the database for writing
+        self.accessed = {}
+
+    @property
+    def connection(self):
+        """sqlite3.Connection: the connection to the database, opened on first use"""
+        if self._connection is None:
+            self._connection = sqlite3.connect(
+                self.path, timeout=self.timeout, check_same_thread=False
+            )
+            # write-ahead logging allows readers to proceed while another process writes
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            with self._connection:
+                self._connection.execute(_SCHEMA)
+
+        return self._connection
+
+    def flush_accessed(self, conn):
+        """Writes the recorded access times of read entries within a write transaction.
+
+        Args:
+            conn (sqlite3.Connection): the connection of the transaction
+        """
+        if self.accessed:
+            conn.executemany(
+                "UPDATE results SET accessed = ? WHERE key = ?",
+                [(t, key) for key, t in self.accessed.items()],
+            )
+            self.accessed.clear()
+
+    def close(self):
+        """Closes the connection, if open."""
+        if self._connection is not None:
+            with self.lock, self._connection as conn:
+                self.flush_accessed(conn)
+
+            self._connection.close()
+            self._connection = None
+
+    def __getstate__(self):
+        # connections and locks cannot be sent to other processes; they are re-created there
+        return {"path": self.path, "timeout": self.timeout}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"], state["timeout"])
+
+
+class DiskCache(MutableMapping):
+    """Persistent execution cache backed by an SQLite database.
+
+    The cache can be passed to :func:`~.execute` or :class:`~.QNode` via the ``cache``
+    argument. Since it is stored on disk, results survive the Python process, and
+    can be shared between workers running on the same node; previously seen tapes
+    are then extracted from the cache rather than re-simulated.
+
+    Tapes are keyed by a digest of their operations, measurements, trainable parameters
+    and the configuration (class, wires, shots and settings such as precision or noise
+    parameters) of the device executing them. When
+    the total size of the stored results exceeds ``maxsize``, the least recently
+    used entries are evicted.
+
+    Args:
+        path (str): location of the database file. It is created if it does not exist.
+        maxsize (int): maximum total size of the stored results, in bytes
+        timeout (float): number of seconds to wait for a lock held by
+            another process before raising an exception
+
+    **Example**
+
+    >>> cache = qml.interfaces.DiskCache("vqe_cache.db", maxsize=2**30)
+    >>> dev = qml.device("default.qubit", wires=2)
+    >>> @qml.qnode(dev, cache=cache)
+    ... def circuit(x):
+    ...     qml.RX(x, wires=0)
+    ...     return qml.expval(qml.PauliZ(0))
+    >>> circuit(0.5)
+    tensor(0.87758256, requires_grad=True)
+    >>> len(cache)
+    1
+
+    Re-creating the cache with the same path in a new process, and evaluating the QNode
+    at the same parameter, will not execute the device.
+
+    .. warning::
+
+        Results are serialized using :mod:`pickle`. Only load cache files that
+        were created by a trusted source.
+    """
+
+    def __init__(self, path, maxsize=2**30, timeout=60.0):
+        self.path = os.fspath(path)
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._namespace = ""
+        self._db = _Database(self.path, timeout)
+
+    def bind(self, device, shots=False):
+        """Returns a view of the cache whose keys are restricted to a given device
+        configuration. Views share the underlying database.
+
+        Args:
+            device (.Device): the device executing the tapes
+            shots (None or int or Sequence[int] or bool): shots overriding those of the device.
+                If ``False``, the device shots are used.
+
+        Returns:
+            .DiskCache: the bound cache
+        """
+        if shots is False:
+            shots = device._raw_shot_sequence if device._shot_vector else device.shots
+
+        view = copy.copy(self)
+        view._namespace = repr((_device_fingerprint(device), tuple(device.wires.tolist()), shots))
+        return view
+
+    def tape_key(self, tape):
+        """Returns the key under which the results of a tape are stored.
+
+        Args:
+            tape (.QuantumTape): the executed tape
+
+        Returns:
+            str: hexadecimal digest of the tape and the bound device configuration
+        """
+        fingerprint = self._namespace + _tape_fingerprint(tape)
+        return hashlib.blake2b(fingerprint.encode(), digest_size=20).hexdigest()
+
+    def __getitem__(self, key):
+        with self._db.lock:
+            query = "SELECT value FROM results WHERE key = ?"
+            row = self._db.connection.execute(query, (key,)).fetchone()
+
+            if row is None:
+                raise KeyError(key)
+
+            self._db.accessed[key] = time.time()
+
+        return pickle.loads(row[0])
+
+    def __setitem__(self, key, value):
+        if not _is_serializable(value):
+            return
+
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+        if len(blob) > self.maxsize:
+            return
+
+        with self._db.lock, self._db.connection as conn:
+            self._db.flush_accessed(conn)
+            conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (key, blob, len(blob), time.time()),
+            )
+            conn.execute(_EVICT, (self.maxsize,))
+
+    def __delitem__(self, key):
+        with self._db.lock, self._db.connection as conn:
+            if conn.execute("DELETE FROM results WHERE key = ?", (key,)).rowcount == 0:
+                raise KeyError(key)
+
+    def __contains__(self, key):
+        with self._db.lock:
+            row = self._db.connection.execute("SELECT 1 FROM results WHERE key = ?", (key,))
+            return row.fetchone() is not None
+
+    def __iter__(self):
+        with self._db.lock:
+            keys = self._db.connection.execute("SELECT key FROM results").fetchall()
+
+        return iter([k for (k,) in keys])
+
+    def __len__(self):
+        with self._db.lock:
+            return self._db.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    @property
+    def currsize(self):
+        """int: total size of the stored results, in bytes"""
+        with self._db.lock:
+            res = self._db.connection.execute("SELECT SUM(size) FROM results").fetchone()[0]
+
+        return res or 0
+
+    def close(self):
+        """Closes the connection to the database. It is re-opened on next use."""
+        self._db.close()
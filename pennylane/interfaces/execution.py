@@ -30,7 +30,9 @@ from contextlib import _GeneratorContextManager
 from cachetools import LRUCache
 
 import pennylane as qml
+from pennylane.tracker import stage
 
+from .disk_cache import DiskCache
 from .set_shots import set_shots
 
 
@@ -55,6 +57,46 @@ INTERFACE_MAP = {
 SUPPORTED_INTERFACES = list(INTERFACE_MAP)
 """list[str]: allowed interface strings"""
 
+_CACHE_MISS = object()
+"""object: sentinel returned by cache lookups of tapes that are not in the cache"""
+
+
+def _adjoint_vjp_fns(device, batch_execute, cache, override_shots):
+    """Returns the execution and vector-Jacobian product functions of the ``vjp`` mode
+    for the adjoint method.
+
+    The device state may have changed between the forward and the backward pass. The final
+    state of each tape executed on the forward pass is therefore stored, and the adjoint
+    backward pass starts from it. Tapes whose results were retrieved from the cache are
+    executed again on the backward pass.
+    """
+    states = {}
+
+    def execute_and_store_states(tapes):
+        res = []
+
+        for tape in tapes:
+            res.extend(batch_execute([tape]))
+            states[id(tape)] = (tape, qml.math.copy(device._pre_rotated_state))
+
+        return res
+
+    def vjps(tapes, dys, **gradient_kwargs):  # pylint: disable=unused-argument
+        res = []
+
+        for tape, dy in zip(tapes, dys):
+            stored_tape, state = states.get(id(tape), (None, None))
+
+            if stored_tape is not tape:
+                state = None
+
+            res.extend(device.vjps([tape], [dy], method="adjoint_vjp", starting_state=state))
+
+        return res
+
+    execute_fn = qml.interfaces.cache_execute(execute_and_store_states, cache)
+    return execute_fn, set_shots(device, override_shots)(vjps)
+
 
 def _adjoint_jacobian_expansion(tapes, mode, interface, max_expansion):
     """Performs adjoint jacobian specific expansion.  Expands so that every
@@ -82,7 +124,8 @@ def cache_execute(fn, cache, pass_kwargs=False, return_tuple=True, expand_fn=Non
     multiple tapes on a device.
 
     This decorator makes use of :attr:`.QuantumTape.hash` to identify
-    unique tapes.
+    unique tapes. Caches that define a ``tape_key(tape)`` method, such as
+    :class:`~.interfaces.DiskCache`, may instead provide their own key.
 
     - If a tape does not match a hash in the cache, then the tape
       has not been previously executed. It is executed, and the result
@@ -138,8 +181,11 @@ def cache_execute(fn, cache, pass_kwargs=False, return_tuple=True, expand_fn=Non
         hashes = {}
         repeated = {}
 
+        # persistent caches cannot rely on the salted built-in hash used by ``tape.hash``
+        tape_key = getattr(cache, "tape_key", lambda tape: tape.hash)
+
         for i, tape in enumerate(tapes):
-            h = tape.hash
+            h = tape_key(tape)
 
             if h in hashes.values():
                 # Tape already exists within ``tapes``. Determine the
@@ -151,9 +197,17 @@ def cache_execute(fn, cache, pass_kwargs=False, return_tuple=True, expand_fn=Non
 
             hashes[i] = h
 
-            if hashes[i] in cache:
+            # a single lookup, since entries of caches shared between processes
+            # may be evicted between a membership test and a read. Caches are only
+            # required to implement ``__getitem__``, ``__setitem__`` and ``__delitem__``.
+            try:
+                result = cache[hashes[i]]
+            except KeyError:
+                result = _CACHE_MISS
+
+            if result is not _CACHE_MISS:
                 # Tape exists within the cache, store the cached result
-                cached_results[i] = cache[hashes[i]]
+                cached_results[i] = result
 
                 # Introspect the set_shots decorator of the input function:
                 #   warn the user in case of finite shots with cached results
@@ -233,6 +287,7 @@ def execute(
     expand_fn="device",
     max_expansion=10,
     device_batch_transform=True,
+    device_vjp=False,
 ):
     """Execute a batch of tapes on a device in an autodifferentiable-compatible manner.
 
@@ -254,8 +309,9 @@ def execute(
             pass.
         gradient_kwargs (dict): dictionary of keyword arguments to pass when
             determining the gradients of tapes
-        cache (bool): Whether to cache evaluations. This can result in
+        cache (bool or dict or Cache): Whether to cache evaluations. This can result in
             a significant reduction in quantum evaluations during gradient computations.
+            A :class:`~.interfaces.DiskCache` may be passed to persist results across processes.
         cachesize (int): the size of the cache
         max_diff (int): If ``gradient_fn`` is a gradient transform, this option specifies
             the maximum number of derivatives to support. Increasing this value allows
@@ -273,6 +329,12 @@ def execute(
             (within :meth:`Device.batch_transform`) to each tape to be executed. The default behaviour
             of the device batch transform is to expand out Hamiltonian measurements into
             constituent terms if not supported on the device.
+        device_vjp (bool): Whether the device should compute the vector-Jacobian products
+            on the backward pass, instead of the Jacobians, if it is queried for the gradient.
+            For the adjoint method, this is done by :meth:`~.QubitDevice.adjoint_vjp` with a
+            single backward pass per tape, independently of the number of measurements,
+            starting from the state stored on the forward pass. It is required to differentiate
+            broadcasted tapes with the adjoint method.
 
     Returns:
         list[tensor_like[float]]: A nested list of tape results. Each element in
@@ -335,7 +397,10 @@ def execute(
     gradient_kwargs = gradient_kwargs or {}
 
     if device_batch_transform:
-        tapes, batch_fn = qml.transforms.map_batch_transform(device.batch_transform, tapes)
+        with stage("expansion"):
+            tapes, batch_fn = qml.transforms.map_batch_transform(device.batch_transform, tapes)
+
+        batch_fn = stage("postprocessing")(batch_fn)
     else:
         batch_fn = lambda res: res
 
@@ -345,11 +410,18 @@ def execute(
         cache = LRUCache(maxsize=cachesize, getsizeof=lambda x: qml.math.shape(x)[0])
         setattr(cache, "_persistent_cache", False)
 
+    elif isinstance(cache, DiskCache):
+        # results may only be shared between identically configured devices
+        cache = cache.bind(device, override_shots)
+
     batch_execute = set_shots(device, override_shots)(device.batch_execute)
 
     if expand_fn == "device":
         expand_fn = lambda tape: device.expand_fn(tape, max_expansion=max_expansion)
 
+    if expand_fn is not None:
+        expand_fn = stage("expansion")(expand_fn)
+
     if gradient_fn is None:
         # don't unwrap if it's an interface device
         if "passthru_interface" in device.capabilities():
@@ -389,7 +461,36 @@ def execute(
         if gradient_kwargs.get("method", "") == "adjoint_jacobian":
             tapes = _adjoint_jacobian_expansion(tapes, mode, interface, max_expansion)
 
-        if mode in ("forward", "best"):
+        supports_vjp = gradient_kwargs.get("method", "") == "adjoint_jacobian" and hasattr(
+            device, "adjoint_vjp"
+        )
+
+        if device_vjp:
+            if mode == "forward":
+                raise ValueError(
+                    "Device vector-Jacobian products cannot be used with mode='forward'"
+                )
+
+            if not supports_vjp:
+                raise ValueError(
+                    f"The {device.short_name} device does not support vector-Jacobian products "
+                    f"for the gradient method {gradient_kwargs.get('method', '')}."
+                )
+
+        elif supports_vjp and any(t.batch_size is not None for t in tapes):
+            # the interfaces cannot contract the Jacobians of broadcasted tapes
+            raise ValueError(
+                "Broadcasted tapes can only be differentiated with the adjoint method "
+                "if device_vjp=True."
+            )
+
+        if device_vjp:
+            # contract the output gradients within the backward pass of the adjoint method,
+            # instead of computing the Jacobians
+            execute_fn, gradient_fn = _adjoint_vjp_fns(device, batch_execute, cache, override_shots)
+            _mode = "vjp"
+
+        elif mode in ("forward", "best"):
             # replace the forward execution function to return
             # both results and gradients
             execute_fn = set_shots(device, override_shots)(device.execute_and_gradients)
@@ -479,6 +580,7 @@ def execute_new(
     expand_fn="device",
     max_expansion=10,
     device_batch_transform=True,
+    device_vjp=False,
 ):
     """New function to execute a batch of tapes on a device in an autodifferentiable-compatible manner. More cases will be added,
     during the project. The current version is supporting forward execution for Numpy and does not support shot vectors.
@@ -501,8 +603,9 @@ def execute_new(
             pass.
         gradient_kwargs (dict): dictionary of keyword arguments to pass when
             determining the gradients of tapes
-        cache (bool): Whether to cache evaluations. This can result in
+        cache (bool or dict or Cache): Whether to cache evaluations. This can result in
             a significant reduction in quantum evaluations during gradient computations.
+            A :class:`~.interfaces.DiskCache` may be passed to persist results across processes.
         cachesize (int): the size of the cache
         max_diff (int): If ``gradient_fn`` is a gradient transform, this option specifies
             the maximum number of derivatives to support. Increasing this value allows
@@ -520,11 +623,17 @@ def execute_new(
             (within :meth:`Device.batch_transform`) to each tape to be executed. The default behaviour
             of the device batch transform is to expand out Hamiltonian measurements into
             constituent terms if not supported on the device.
+        device_vjp (bool): Whether the device should compute the vector-Jacobian products
+            on the backward pass. Gradients are not supported yet with the new return types,
+            and an error is raised if ``True``.
 
     Returns:
         list[tensor_like[float]]: A nested list of tape results. Each element in
         the returned list corresponds in order to the provided tapes.
 
+    Raises:
+        ValueError: if ``device_vjp=True``
+
     **Example**
 
     Consider the following cost function:
@@ -581,8 +690,16 @@ def execute_new(
     """
     # gradient_kwargs = gradient_kwargs or {}
 
+    if device_vjp:
+        raise ValueError(
+            "Device vector-Jacobian products are not supported yet with the new return types."
+        )
+
     if device_batch_transform:
-        tapes, batch_fn = qml.transforms.map_batch_transform(device.batch_transform, tapes)
+        with stage("expansion"):
+            tapes, batch_fn = qml.transforms.map_batch_transform(device.batch_transform, tapes)
+
+        batch_fn = stage("postprocessing")(batch_fn)
     else:
         batch_fn = lambda res: res  # pragma: no cover
 
@@ -591,11 +708,18 @@ def execute_new(
         cache = LRUCache(maxsize=cachesize)
         setattr(cache, "_persistent_cache", False)
 
+    elif isinstance(cache, DiskCache):
+        # results may only be shared between identically configured devices
+        cache = cache.bind(device, override_shots)
+
     batch_execute = set_shots(device, override_shots)(device.batch_execute_new)
 
     if expand_fn == "device":
         expand_fn = lambda tape: device.expand_fn(tape, max_expansion=max_expansion)
 
+    if expand_fn is not None:
+        expand_fn = stage("expansion")(expand_fn)
+
     if gradient_fn is None:
         # don't unwrap if it's an interface device
         if "passthru_interface" in device.capabilities() or device.short_name == "default.mixed":
@@ -83,7 +83,9 @@ def execute(tapes, device, execute_fn, gradient_fn, gradient_kwargs, _n=1, max_d
             for higher order derivatives to be extracted, at the cost of additional
             (classical) computational overhead during the backwards pass.
         mode (str): Whether the gradients should be computed on the forward
-            pass (``forward``) or the backward pass (``backward``).
+            pass (``forward``) or the backward pass (``backward``), or whether
+            ``gradient_fn`` computes the vector-Jacobian products on the backward
+            pass (``vjp``).
 
     Returns:
         list[list[float]]: A nested list of tape results. Each element in
@@ -120,6 +122,7 @@ def execute(tapes, device, execute_fn, gradient_fn, gradient_kwargs, _n=1, max_d
         gradient_fn=gradient_fn,
         gradient_kwargs=gradient_kwargs,
         _n=_n,
+        mode=mode,
     )
 
 
@@ -159,6 +162,7 @@ def _execute(
     gradient_fn=None,
     gradient_kwargs=None,
     _n=1,
+    mode=None,
 ):  # pylint: disable=dangerous-default-value,unused-argument
     """The main interface execution function where jacobians of the execute
     function are computed by the registered backward function."""
@@ -261,6 +265,14 @@ def _execute(
 
             return (tuple(res),)
 
+        if mode == "vjp":
+            # Gradient function computes the vector-Jacobian products on the device.
+            with qml.tape.Unwrap(*tapes):
+                vjps = gradient_fn(tapes, g if len(tapes) > 1 else [g], **gradient_kwargs)
+
+            res = [[jnp.array(p) for p in v] for v in vjps]
+            return (tuple(res),)
+
         # Gradient function is a device method.
         with qml.tape.Unwrap(*tapes):
             jacs = gradient_fn(tapes, **gradient_kwargs)
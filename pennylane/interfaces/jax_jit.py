@@ -51,7 +51,9 @@ def execute(tapes, device, execute_fn, gradient_fn, gradient_kwargs, _n=1, max_d
             for higher order derivatives to be extracted, at the cost of additional
             (classical) computational overhead during the backwards pass.
         mode (str): Whether the gradients should be computed on the forward
-            pass (``forward``) or the backward pass (``backward``).
+            pass (``forward``) or the backward pass (``backward``), or whether
+            ``gradient_fn`` computes the vector-Jacobian products on the backward
+            pass (``vjp``).
 
     Returns:
         list[list[float]]: A nested list of tape results. Each element in
@@ -86,6 +88,7 @@ def execute(tapes, device, execute_fn, gradient_fn, gradient_kwargs, _n=1, max_d
         gradient_fn=gradient_fn,
         gradient_kwargs=gradient_kwargs,
         _n=_n,
+        mode=mode,
     )
 
 
@@ -132,6 +135,7 @@ def _execute(
     gradient_fn=None,
     gradient_kwargs=None,
     _n=1,
+    mode=None,
 ):  # pylint: disable=dangerous-default-value,unused-argument
     total_params = np.sum([len(p) for p in params])
 
@@ -209,6 +213,21 @@ def _execute(
 
             return (tuple(res),)
 
+        if mode == "vjp":
+
+            def vjps_wrapper(args):
+                """Compute the vector-Jacobian products on the device."""
+                p, dy = args
+                new_tapes = [cp_tape(t, a) for t, a in zip(tapes, p)]
+                with qml.tape.Unwrap(*new_tapes):
+                    vjps = gradient_fn(new_tapes, dy, **gradient_kwargs)
+                return [np.asarray(v, dtype=dtype) for v in vjps]
+
+            shapes = [jax.ShapeDtypeStruct((len(p),), dtype) for p in params]
+            vjps = host_callback.call(vjps_wrapper, (params, g), result_shape=shapes)
+            res = [[jnp.array(p) for p in v] for v in vjps]
+            return (tuple(res),)
+
         def jacs_wrapper(p):
             """Compute the jacs"""
             new_tapes = [cp_tape(t, a) for t, a in zip(tapes, p)]
@@ -61,14 +61,14 @@ def execute(tapes, device, execute_fn, gradient_fn, gradient_kwargs, _n=1, max_d
             for higher order derivatives to be extracted, at the cost of additional
             (classical) computational overhead during the backwards pass.
         mode (str): Whether the gradients should be computed on the forward
-            pass (``forward``) or the backward pass (``backward``).
+            pass (``forward``) or the backward pass (``backward``), or whether
+            ``gradient_fn`` computes the vector-Jacobian products on the backward
+            pass (``vjp``).
 
     Returns:
         list[list[tf.Tensor]]: A nested list of tape results. Each element in
         the returned list corresponds in order to the provided tapes.
     """
-    # pylint: disable=unused-argument
-
     parameters = []
     params_unwrapped = []
 
@@ -166,6 +166,16 @@ def execute(tapes, device, execute_fn, gradient_fn, gradient_kwargs, _n=1, max_d
                             )
                         )
 
+                elif mode == "vjp":
+                    # Gradient function computes the vector-Jacobian products on the device,
+                    # from the output gradients in the shape of the tape results.
+                    with qml.tape.Unwrap(*tapes, params=params_unwrapped):
+                        device_vjps = gradient_fn(
+                            tapes, [qml.math.T(d) for d in dy], **gradient_kwargs
+                        )
+
+                    vjps = [tf.cast(v, d.dtype) for d, vjp in zip(dy, device_vjps) for v in vjp]
+
                 else:
                     # Gradient function is not a gradient transform
                     # (e.g., it might be a device method).
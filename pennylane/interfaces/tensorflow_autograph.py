@@ -47,7 +47,9 @@ def execute(tapes, device, execute_fn, gradient_fn, gradient_kwargs, _n=1, max_d
             for higher order derivatives to be extracted, at the cost of additional
             (classical) computational overhead during the backwards pass.
         mode (str): Whether the gradients should be computed on the forward
-            pass (``forward``) or the backward pass (``backward``).
+            pass (``forward``) or the backward pass (``backward``), or whether
+            ``gradient_fn`` computes the vector-Jacobian products on the backward
+            pass (``vjp``).
 
     Returns:
         list[list[tf.Tensor]]: A nested list of tape results. Each element in
@@ -217,7 +219,18 @@ def execute(tapes, device, execute_fn, gradient_fn, gradient_kwargs, _n=1, max_d
                         params_unwrapped = _nest_params(all_params)
 
                         with qml.tape.Unwrap(*tapes, params=params_unwrapped):
-                            vjps = _compute_vjp(dy, gradient_fn(tapes, **gradient_kwargs))
+                            if mode == "vjp":
+                                # the device computes the vector-Jacobian products directly
+                                dy = [qml.math.T(d) for d in dy]
+                                device_vjps = gradient_fn(tapes, dy, **gradient_kwargs)
+                                vjps = [
+                                    np.asarray(v, dtype=np.float64)
+                                    for vjp in device_vjps
+                                    for v in vjp
+                                ]
+
+                            else:
+                                vjps = _compute_vjp(dy, gradient_fn(tapes, **gradient_kwargs))
 
                         return vjps
 
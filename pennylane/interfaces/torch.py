@@ -54,6 +54,9 @@ class ExecuteTapes(torch.autograd.Function):
         gradient function
       * ``"max_diff``: the maximum order of derivatives to support
 
+      and may contain ``"mode"``, which is ``"vjp"`` if ``"gradient_fn"`` computes the
+      vector-Jacobian products directly.
+
     Further, note that the ``parameters`` argument is dependent on the
     ``tapes``; this function should always be called
     with the parameters extracted directly from the tapes as follows:
@@ -80,6 +83,7 @@ class ExecuteTapes(torch.autograd.Function):
         ctx.gradient_kwargs = kwargs["gradient_kwargs"]
         ctx.max_diff = kwargs["max_diff"]
         ctx._n = kwargs.get("_n", 1)
+        ctx.mode = kwargs.get("mode", None)
 
         with qml.tape.Unwrap(*ctx.tapes):
             res, ctx.jacs = ctx.execute_fn(ctx.tapes, **ctx.gradient_kwargs)
@@ -177,6 +181,17 @@ class ExecuteTapes(torch.autograd.Function):
 
                         vjps = processing_fn(ctx.execute_fn(vjp_tapes)[0])
 
+            elif ctx.mode == "vjp":
+                # Gradient function computes the vector-Jacobian products on the device.
+                with qml.tape.Unwrap(*ctx.tapes):
+                    device_vjps = ctx.gradient_fn(ctx.tapes, dy, **ctx.gradient_kwargs)
+
+                vjps = [
+                    torch.as_tensor(v, dtype=d.dtype, device=ctx.torch_device)
+                    for d, vjp in zip(dy, device_vjps)
+                    for v in vjp
+                ]
+
             else:
                 # Gradient function is not a gradient transform
                 # (e.g., it might be a device method).
@@ -222,13 +237,14 @@ def execute(tapes, device, execute_fn, gradient_fn, gradient_kwargs, _n=1, max_d
             for higher order derivatives to be extracted, at the cost of additional
             (classical) computational overhead during the backwards pass.
         mode (str): Whether the gradients should be computed on the forward
-            pass (``forward``) or the backward pass (``backward``).
+            pass (``forward``) or the backward pass (``backward``), or whether
+            ``gradient_fn`` computes the vector-Jacobian products on the backward
+            pass (``vjp``).
 
     Returns:
         list[list[torch.Tensor]]: A nested list of tape results. Each element in
         the returned list corresponds in order to the provided tapes.
     """
-    # pylint: disable=unused-argument
     parameters = []
     for tape in tapes:
         # set the trainable parameters
@@ -244,5 +260,6 @@ def execute(tapes, device, execute_fn, gradient_fn, gradient_kwargs, _n=1, max_d
         gradient_kwargs=gradient_kwargs,
         _n=_n,
         max_diff=max_diff,
+        mode=mode,
     )
     return ExecuteTapes.apply(kwargs, *parameters)
@@ -27,6 +27,9 @@ from .postprocessing import (
     mitigate_depolarizing_noise,
 )
 from .utils import (
+    fidelity_kernel_matrix,
+    fidelity_kernel_tiles,
     kernel_matrix,
+    square_fidelity_kernel_matrix,
     square_kernel_matrix,
 )
@@ -14,6 +14,9 @@
 """
 This file contains functionalities that simplify working with kernels.
 """
+import numpy as onp
+
+import pennylane as qml
 from pennylane import numpy as np
 
 
@@ -55,6 +58,12 @@ def square_kernel_matrix(X, kernel, assume_normalized_kernel=False):
             [0.9532702 , 1.        , 0.99727485, 0.95685561],
             [0.96864001, 0.99727485, 1.        , 0.96605621],
             [0.90932897, 0.95685561, 0.96605621, 1.        ]], requires_grad=True)
+
+    .. seealso::
+
+        If the kernel is the fidelity between two embedding states, as above,
+        :func:`~.square_fidelity_kernel_matrix` computes the same matrix from a single
+        simulation per datapoint.
     """
     N = len(X)
     matrix = [0] * N**2
@@ -110,6 +119,12 @@ def kernel_matrix(X1, X2, kernel):
 
     As we can see, for :math:`n` and :math:`m` datapoints in the first and second
     dataset respectively, the output matrix has the shape :math:`n\times m`.
+
+    .. seealso::
+
+        If the kernel is the fidelity between two embedding states, as above,
+        :func:`~.fidelity_kernel_matrix` computes the same matrix from a single
+        simulation per datapoint.
     """
     N = len(X1)
     M = len(X2)
@@ -120,3 +135,193 @@ def kernel_matrix(X1, X2, kernel):
             matrix[M * i + j] = kernel(X1[i], X2[j])
 
     return np.array(matrix).reshape((N, M))
+
+
+def _embedding_states(X, state):
+    """Evaluates the embedding state of each datapoint and stacks the states into a matrix."""
+    return qml.math.stack([qml.math.reshape(state(x), (-1,)) for x in X])
+
+
+def _fidelities(states1, states2):
+    """Computes the matrix of squared overlaps between two stacks of states."""
+    overlaps = qml.math.dot(qml.math.conj(states1), qml.math.transpose(states2))
+    return qml.math.real(overlaps * qml.math.conj(overlaps))
+
+
+def fidelity_kernel_tiles(X1, X2, state, tile_size):
+    r"""Iterates over the tiles of the fidelity kernel matrix of two datasets.
+
+    The fidelity kernel :math:`k(x_1, x_2) = |\langle\psi(x_1)|\psi(x_2)\rangle|^2` is computed
+    from the embedding states :math:`|\psi(x)\rangle`. The embedding state of each datapoint is
+    evaluated once, after which the kernel matrix is produced tile by tile, such that at no point
+    more than a :math:`\texttt{tile_size}\times\texttt{tile_size}` block of kernel values is
+    held in memory. This allows to process or store kernel matrices that do not fit in memory.
+
+    Args:
+        X1 (list[datapoint]): List of datapoints (first argument)
+        X2 (list[datapoint] or None): List of datapoints (second argument). If ``None``,
+            the square kernel matrix of ``X1`` is computed, and only the tiles on or
+            above the diagonal are produced; the remaining tiles are their transposes.
+        state (datapoint -> array[complex]): Function that maps a datapoint to its
+            embedding state vector, for example a QNode returning :func:`~.state`
+        tile_size (int): Maximal number of rows and columns of a tile
+
+    Yields:
+        tuple[slice, slice, array[float]]: The rows and columns of the kernel matrix
+        covered by a tile, and the kernel values of the tile.
+
+    **Example:**
+
+    The tiles can be written to a memory-mapped array on disk:
+
+    .. code-block :: python
+
+        dev = qml.device('default.qubit', wires=2, shots=None)
+        @qml.qnode(dev)
+        def state(x):
+            qml.templates.AngleEmbedding(x, wires=dev.wires)
+            return qml.state()
+
+    >>> X = np.random.random((10000, 2))
+    >>> K = np.memmap("kernel.dat", dtype=float, mode="w+", shape=(10000, 10000))
+    >>> for rows, cols, tile in qml.kernels.fidelity_kernel_tiles(X, None, state, 1000):
+    ...     K[rows, cols] = tile
+    ...     K[cols, rows] = tile.T
+    """
+    if tile_size < 1:
+        raise ValueError(f"The tile size must be a positive integer; got {tile_size}.")
+
+    states1 = _embedding_states(X1, state)
+    states2 = states1 if X2 is None else _embedding_states(X2, state)
+
+    N = len(X1)
+    M = N if X2 is None else len(X2)
+
+    for i in range(0, N, tile_size):
+        rows = slice(i, min(i + tile_size, N))
+
+        for j in range(i if X2 is None else 0, M, tile_size):
+            cols = slice(j, min(j + tile_size, M))
+            yield rows, cols, _fidelities(states1[rows], states2[cols])
+
+
+def _fill_tiles(tiles, out, symmetric):
+    """Writes the tiles of a kernel matrix into an array."""
+    for rows, cols, tile in tiles:
+        tile = qml.math.toarray(tile)
+        out[rows, cols] = tile
+
+        if symmetric:
+            out[cols, rows] = tile.T
+
+    return out
+
+
+def square_fidelity_kernel_matrix(X, state, tile_size=None, out=None):
+    r"""Computes the square matrix of fidelity kernel values for a given dataset.
+
+    The fidelity kernel :math:`k(x_1, x_2) = |\langle\psi(x_1)|\psi(x_2)\rangle|^2` is computed
+    from the embedding states :math:`|\psi(x)\rangle`. In contrast to
+    :func:`~.square_kernel_matrix`, which evaluates a kernel circuit for each pair of
+    datapoints, the embedding state is simulated only once per datapoint, and the kernel matrix
+    is obtained from the matrix product of the stacked states.
+
+    Args:
+        X (list[datapoint]): List of datapoints
+        state (datapoint -> array[complex]): Function that maps a datapoint to its
+            embedding state vector, for example a QNode returning :func:`~.state`
+        tile_size (int): If given, the kernel matrix is computed in tiles of at most
+            ``tile_size`` rows and columns, see :func:`~.fidelity_kernel_tiles`
+        out (array[float]): Array of shape ``(len(X), len(X))`` to write the kernel matrix
+            into, for example a ``numpy.memmap`` for kernel matrices that do not fit in memory
+
+    Returns:
+        array[float]: The square matrix of kernel values. If ``tile_size`` or ``out`` is given,
+        this is a NumPy array and does not support differentiation.
+
+    **Example:**
+
+    Consider the embedding state of :class:`~.templates.embeddings.AngleEmbedding`:
+
+    .. code-block :: python
+
+        dev = qml.device('default.qubit', wires=2, shots=None)
+        @qml.qnode(dev)
+        def state(x):
+            qml.templates.AngleEmbedding(x, wires=dev.wires)
+            return qml.state()
+
+    The kernel matrix on a set of 4 (random) feature vectors ``X`` requires 4 simulations,
+    rather than one per pair of feature vectors:
+
+    >>> X = np.random.random((4, 2))
+    >>> qml.kernels.square_fidelity_kernel_matrix(X, state)
+    tensor([[1.        , 0.9532702 , 0.96864001, 0.90932897],
+            [0.9532702 , 1.        , 0.99727485, 0.95685561],
+            [0.96864001, 0.99727485, 1.        , 0.96605621],
+            [0.90932897, 0.95685561, 0.96605621, 1.        ]], requires_grad=True)
+    """
+    if tile_size is None and out is None:
+        states = _embedding_states(X, state)
+        return _fidelities(states, states)
+
+    N = len(X)
+    out = onp.empty((N, N)) if out is None else out
+    tiles = fidelity_kernel_tiles(X, None, state, tile_size or max(N, 1))
+
+    return _fill_tiles(tiles, out, symmetric=True)
+
+
+def fidelity_kernel_matrix(X1, X2, state, tile_size=None, out=None):
+    r"""Computes the matrix of fidelity kernel values for two given datasets.
+
+    The fidelity kernel :math:`k(x_1, x_2) = |\langle\psi(x_1)|\psi(x_2)\rangle|^2` is computed
+    from the embedding states :math:`|\psi(x)\rangle`. In contrast to :func:`~.kernel_matrix`,
+    which evaluates a kernel circuit for each pair of datapoints, the embedding state is
+    simulated only once per datapoint, and the kernel matrix is obtained from the matrix
+    product of the stacked states.
+
+    Args:
+        X1 (list[datapoint]): List of datapoints (first argument)
+        X2 (list[datapoint]): List of datapoints (second argument)
+        state (datapoint -> array[complex]): Function that maps a datapoint to its
+            embedding state vector, for example a QNode returning :func:`~.state`
+        tile_size (int): If given, the kernel matrix is computed in tiles of at most
+            ``tile_size`` rows and columns, see :func:`~.fidelity_kernel_tiles`
+        out (array[float]): Array of shape ``(len(X1), len(X2))`` to write the kernel matrix
+            into, for example a ``numpy.memmap`` for kernel matrices that do not fit in memory
+
+    Returns:
+        array[float]: The matrix of kernel values. If ``tile_size`` or ``out`` is given,
+        this is a NumPy array and does not support differentiation.
+
+    **Example:**
+
+    Consider the embedding state of :class:`~.templates.embeddings.AngleEmbedding`:
+
+    .. code-block :: python
+
+        dev = qml.device('default.qubit', wires=2, shots=None)
+        @qml.qnode(dev)
+        def state(x):
+            qml.templates.AngleEmbedding(x, wires=dev.wires)
+            return qml.state()
+
+    The kernel matrix between 4 training and 3 test datapoints requires 7 simulations,
+    rather than 12:
+
+    >>> X_train = np.random.random((4,2))
+    >>> X_test = np.random.random((3,2))
+    >>> qml.kernels.fidelity_kernel_matrix(X_train, X_test, state)
+    tensor([[0.88875298, 0.90655175, 0.89926447],
+            [0.93762197, 0.98163781, 0.93076383],
+            [0.91977339, 0.9799841 , 0.91582698],
+            [0.80376818, 0.98720925, 0.79349212]], requires_grad=True)
+    """
+    if tile_size is None and out is None:
+        return _fidelities(_embedding_states(X1, state), _embedding_states(X2, state))
+
+    out = onp.empty((len(X1), len(X2))) if out is None else out
+    tiles = fidelity_kernel_tiles(X1, X2, state, tile_size or max(len(X1), len(X2), 1))
+
+    return _fill_tiles(tiles, out, symmetric=False)
@@ -29,7 +29,7 @@ from typing import Generic, TypeVar
 import numpy as np
 
 import pennylane as qml
-from pennylane.operation import Operator
+from pennylane.operation import Operator, _structure_value
 from pennylane.wires import Wires
 
 # =============================================================================
@@ -530,6 +530,20 @@ class MeasurementProcess:
 
         return hash(fingerprint)
 
+    @property
+    def structure_key(self):
+        """tuple: returns a hashable key representing the structure of the measurement process,
+        independently of the parameters of its observable"""
+        if self.obs is None:
+            return (
+                str(self.name),
+                tuple(self.wires.tolist()),
+                _structure_value(self._eigvals),
+                self.return_type,
+            )
+
+        return (self.obs.structure_key, self.return_type)
+
     def simplify(self):
         """Reduce the depth of the observable to the minimum.
 
@@ -624,6 +638,12 @@ class ShadowMeasurementProcess(MeasurementProcess):
 
         return self.H.wires
 
+    @property
+    def structure_key(self):
+        """tuple: returns a hashable key representing the structure of the measurement process,
+        including its seed and the observables whose expectation values are estimated"""
+        return super().structure_key + (self.seed, _structure_value(self.H), self.k)
+
     def __copy__(self):
         obj = super().__copy__()
         obj.seed = self.seed
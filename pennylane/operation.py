@@ -104,7 +104,7 @@ from typing import List
 
 import numpy as np
 from numpy.linalg import multi_dot
-from scipy.sparse import coo_matrix, eye, kron
+from scipy.sparse import coo_matrix, eye, issparse, kron
 
 import pennylane as qml
 from pennylane.wires import Wires
@@ -261,6 +261,63 @@ def _process_data(op):
     return str(op.data)
 
 
+class _ObjectKey:
+    """Hashable wrapper of an object without an exact hashable representation. Wrappers
+    compare equal only if they wrap the same object, which they keep alive."""
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __hash__(self):
+        return id(self.obj)
+
+    def __eq__(self, other):
+        return isinstance(other, _ObjectKey) and other.obj is self.obj
+
+
+def _structure_value(value):
+    """Returns an exact and hashable representation of a hyperparameter value.
+
+    Unlike their string representation, tensors are represented by their datatype, shape
+    and raw bytes, so that they are neither truncated nor rounded, and operators by their
+    structure and parameter values. Unhashable objects without such a representation
+    are only equal to themselves."""
+    if isinstance(value, Operator):
+        return (value.structure_key, _structure_value(value.data))
+
+    if isinstance(value, (list, tuple)):
+        return (type(value),) + tuple(_structure_value(v) for v in value)
+
+    if isinstance(value, dict):
+        return (dict,) + tuple((k, _structure_value(v)) for k, v in value.items())
+
+    if isinstance(value, Wires):
+        return (Wires,) + tuple(value.tolist())
+
+    if value is None or isinstance(value, (str, bool, int, float, complex)):
+        return (type(value), value)
+
+    if issparse(value):
+        value = value.tocsr()
+        arrays = (value.data, value.indices, value.indptr)
+        return ("csr", value.shape) + tuple(_structure_value(a) for a in arrays)
+
+    if hasattr(value, "shape") and not qml.math.is_abstract(value):
+        array = np.asarray(qml.math.unwrap([value])[0])
+
+        if array.dtype != object:
+            return (array.dtype.str, array.shape, array.tobytes())
+
+    try:
+        hash(value)
+    except TypeError:
+        return _ObjectKey(value)
+
+    return value
+
+
 class Operator(abc.ABC):
     r"""Base class representing quantum operators.
 
@@ -441,6 +498,19 @@ class Operator(abc.ABC):
             )
         )
 
+    @property
+    def structure_key(self):
+        """tuple: Hashable key that represents the structure of the operator. Unlike
+        :attr:`~.hash`, it does not depend on the values of the parameters, but only on their
+        shapes. The hyperparameters are represented exactly, such that the keys of two
+        operators are equal only if their hyperparameters are."""
+        return (
+            str(self.name),
+            tuple(self.wires.tolist()),
+            _structure_value(self.hyperparameters),
+            tuple(qml.math.shape(d) for d in self.data),
+        )
+
     @staticmethod
     def compute_matrix(*params, **hyperparams):  # pylint:disable=unused-argument
         r"""Representation of the operator as a canonical matrix in the computational basis (static method).
@@ -1822,6 +1892,12 @@ class Tensor(Observable):
         """
         return [o.parameters for o in self.obs]
 
+    @property
+    def structure_key(self):
+        """tuple: Hashable key that represents the structure of the constituent observables
+        in the tensor product, including their hyperparameters."""
+        return ("Tensor",) + tuple(o.structure_key for o in self.obs)
+
     @property
     def non_identity_obs(self):
         """Returns the non-identity observables contained in the tensor product.
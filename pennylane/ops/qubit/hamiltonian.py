@@ -21,6 +21,8 @@ import numbers
 from collections.abc import Iterable
 from copy import copy
 
+import numpy as onp
+
 import pennylane as qml
 from pennylane import numpy as np
 from pennylane.operation import Observable, Tensor
@@ -199,6 +201,13 @@ class Hamiltonian(Observable):
         # commuting observables, since recomputation is costly
         self._grouping_indices = None
 
+        # attribute to store the bitmask representation of the Pauli words
+        # used by simulators, keyed by the order of the device wires
+        self._pauli_masks = {}
+        # attribute to store the sparse matrices built by :func:`~.utils.sparse_hamiltonian`,
+        # keyed by the wire order, together with the coefficients they were built from
+        self._sparse_matrices = {}
+
         if simplify:
             self.simplify()
         if grouping_type is not None:
@@ -342,6 +351,54 @@ class Hamiltonian(Observable):
                 self.ops, grouping_type=grouping_type, method=method
             )
 
+    def pauli_masks(self, wire_order):
+        r"""Bitmask representation of the Hamiltonian terms, if they are all Pauli words.
+
+        Each Pauli word is written as :math:`P = i^{n_Y} X^{\mathbf{x}} Z^{\mathbf{z}}`, where
+        :math:`\mathbf{x}` and :math:`\mathbf{z}` are the binary masks of the wires acted on by
+        :math:`X` or :math:`Y`, and by :math:`Z` or :math:`Y`, respectively, and :math:`n_Y` is the
+        number of :math:`Y` operators. Masks are encoded as integers whose most significant bit
+        corresponds to the first wire in ``wire_order``, matching the ordering of computational
+        basis states.
+
+        The representation only depends on the observables, and is cached for each wire order.
+
+        Args:
+            wire_order (Iterable): ordered wire labels spanning the Hamiltonian wires
+
+        Returns:
+            tuple[array[int]] or None: the arrays of ``x`` masks, ``z`` masks and numbers of
+            :math:`Y` operators of the terms, or ``None`` if some term is not a Pauli word
+
+        **Example**
+
+        >>> H = qml.Hamiltonian([0.5, 0.2], [qml.PauliX(0) @ qml.PauliY(2), qml.PauliZ(1)])
+        >>> H.pauli_masks(wire_order=[0, 1, 2])
+        (array([5, 0]), array([1, 2]), array([1, 0]))
+        """
+        wire_order = qml.wires.Wires(wire_order)
+        key = tuple(wire_order.tolist())
+
+        if key not in self._pauli_masks:
+            if not all(qml.grouping.is_pauli_word(op) for op in self.ops):
+                self._pauli_masks[key] = None
+            else:
+                num_wires = len(wire_order)
+                wire_map = {w: i for i, w in enumerate(wire_order)}
+                binary = onp.array(
+                    qml.grouping.observables_to_binary_matrix(
+                        self.ops, n_qubits=num_wires, wire_map=wire_map
+                    ),
+                    dtype=onp.int64,
+                )
+
+                # weights of the bits corresponding to each wire
+                powers = 2 ** onp.arange(num_wires - 1, -1, -1, dtype=onp.int64)
+                x, z = binary[:, :num_wires], binary[:, num_wires:]
+                self._pauli_masks[key] = (x @ powers, z @ powers, onp.sum(x & z, axis=1))
+
+        return self._pauli_masks[key]
+
     def simplify(self):
         r"""Simplifies the Hamiltonian by combining like-terms.
 
@@ -393,6 +450,8 @@ class Hamiltonian(Observable):
         self._wires = qml.wires.Wires.all_wires([op.wires for op in self.ops], sort=True)
         # reset grouping, since the indices refer to the old observables and coefficients
         self._grouping_indices = None
+        self._pauli_masks = {}
+        self._sparse_matrices = {}
 
     def __str__(self):
         def wires_print(ob: Observable):
@@ -226,6 +226,10 @@ class SparseHamiltonian(Observable):
             raise TypeError("Observable must be a scipy sparse csr_matrix.")
         super().__init__(H, wires=wires, do_queue=do_queue, id=id)
 
+        # attribute to store the matrices expanded to a wire order, together with
+        # the matrix they were expanded from, since permuting the wires is costly
+        self._sparse_matrices = {}
+
     def label(self, decimals=None, base_label=None, cache=None):
         return super().label(decimals=decimals, base_label=base_label or "𝓗", cache=cache)
 
@@ -296,6 +300,33 @@ class SparseHamiltonian(Observable):
         """
         return H
 
+    def sparse_matrix(self, wire_order=None):
+        r"""Representation of the operator as a sparse matrix in the computational basis.
+
+        The matrix expanded to a given ``wire_order`` is cached, and only recomputed if the
+        matrix defining the operator is replaced.
+
+        .. seealso:: :meth:`~.Operator.sparse_matrix`
+
+        Args:
+            wire_order (Iterable): global wire order, must contain all wire labels from the operator's wires
+
+        Returns:
+            scipy.sparse._csr.csr_matrix: sparse matrix representation
+        """
+        if wire_order is None:
+            return self.data[0]
+
+        key = tuple(Wires(wire_order).tolist())
+        cached = self._sparse_matrices.get(key, None)
+
+        # the matrix is recomputed if the data of the operator has been replaced
+        if cached is None or cached[0] is not self.data[0]:
+            cached = (self.data[0], super().sparse_matrix(wire_order=wire_order))
+            self._sparse_matrices[key] = cached
+
+        return cached[1]
+
 
 class Projector(Observable):
     r"""
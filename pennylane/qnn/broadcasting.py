@@ -0,0 +1,116 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""This module contains a function for evaluating the QNodes of quantum layers on a batch of
+inputs at once, using parameter broadcasting."""
+import numpy as np
+
+import pennylane as qml
+from pennylane.measurements import Expectation, Probability, Variance
+
+# measurements whose broadcasted results have the batch dimension along the first axis
+BROADCASTABLE_RETURN_TYPES = {Expectation, Variance, Probability}
+
+# gradient methods supporting broadcasted tapes
+BROADCASTABLE_GRADIENT_FNS = (None, "backprop", qml.gradients.finite_diff)
+
+
+def _params_equal(tape1, tape2):
+    """Returns whether two tapes have the same structure and parameters."""
+    if tape1.structure_key != tape2.structure_key:
+        return False
+
+    params1 = tape1.get_parameters(trainable_only=False)
+    params2 = tape2.get_parameters(trainable_only=False)
+
+    return all(
+        np.allclose(qml.math.toarray(p1), qml.math.toarray(p2)) for p1, p2 in zip(params1, params2)
+    )
+
+
+def _batch_axis(measurements):
+    """Returns the axis of the batch in the broadcasted results of a QNode returning
+    the given measurements, or ``None`` if the results are not stacked into an array."""
+    if len(measurements) == 1:
+        return 0
+
+    # results of single measurements have shape (batch,) or (batch, 2 ** num_wires)
+    shapes = {() if m.return_type is not Probability else (len(m.wires),) for m in measurements}
+
+    # results of several measurements of the same shape are stacked along the first axis
+    return 1 if len(shapes) == 1 else None
+
+
+def batched_qnode(qnode, input_arg, weight_shapes, input_shape):
+    """Returns a function evaluating a QNode on a batch of inputs in a single execution,
+    if the QNode supports it.
+
+    The QNode is constructed with a random batch of two inputs, and with each of these
+    inputs separately. The QNode supports a batch of inputs if splitting the broadcasted tape
+    with :func:`~.broadcast_expand` gives back the tapes of the separate inputs. This is not
+    the case, for example, if the quantum function indexes its inputs along the first axis
+    (``inputs[0]`` rather than ``inputs[..., 0]``), or if the inputs are not used as gate
+    parameters.
+
+    If both the device and the gradient method of the QNode support parameter broadcasting,
+    the batch is simulated in a single broadcasted execution. Otherwise, the broadcasted tape
+    is split with :func:`~.broadcast_expand` and the resulting tapes executed as a single
+    batch, such that the QNode is still only constructed once.
+
+    Args:
+        qnode (.QNode): the QNode
+        input_arg (str): name of the argument of the QNode for input data
+        weight_shapes (dict[str, tuple]): shapes of the remaining arguments of the QNode
+        input_shape (tuple[int]): shape of a single input
+
+    Returns:
+        tuple[callable, int] or None: the function evaluating the QNode on a batch of inputs,
+        with the same signature as the QNode, and the axis of the batch in its output.
+        ``None`` if the QNode does not support a batch of inputs.
+    """
+    rng = np.random.default_rng(0)
+    weights = {name: rng.uniform(size=shape) for name, shape in weight_shapes.items()}
+    inputs = rng.uniform(size=(2,) + tuple(input_shape))
+
+    try:
+        qnode.construct((), {**weights, input_arg: inputs})
+        tape = qnode.tape
+
+        if tape.batch_size != 2:
+            return None
+
+        if any(m.return_type not in BROADCASTABLE_RETURN_TYPES for m in tape.measurements):
+            return None
+
+        expanded_tapes, _ = qml.transforms.broadcast_expand(tape)
+
+        for expanded_tape, x in zip(expanded_tapes, inputs):
+            qnode.construct((), {**weights, input_arg: x})
+
+            if not _params_equal(expanded_tape, qnode.tape):
+                return None
+
+    except Exception:  # pylint: disable=broad-except
+        # the quantum function is not compatible with a batch of inputs
+        return None
+
+    batch_axis = _batch_axis(tape.measurements)
+
+    if (
+        batch_axis is not None
+        and qnode.device.capabilities().get("supports_broadcasting", False)
+        and qnode.gradient_fn in BROADCASTABLE_GRADIENT_FNS
+    ):
+        return qnode, batch_axis
+
+    return qml.transforms.broadcast_expand(qnode), 0
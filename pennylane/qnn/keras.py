@@ -17,6 +17,7 @@ import inspect
 from collections.abc import Iterable
 from typing import Optional, Union, Sequence, Text
 
+from pennylane.qnn.broadcasting import batched_qnode
 from pennylane.transforms.batch_input import batch_input
 
 try:
@@ -132,6 +133,18 @@ class KerasLayer(Layer):
         If ``weight_specs`` is not specified, weights will be added using the Keras default
         initialization and without any regularization or constraints.
 
+        **Batched inputs**
+
+        Inputs with more than one dimension are treated as a batch, with the features of each
+        input along the last dimension. If the QNode supports parameter broadcasting over its
+        ``inputs`` argument, for example by passing it to an embedding template or indexing it
+        as ``inputs[..., i]``, the whole batch is evaluated in a single broadcasted execution.
+        On devices or with differentiation methods that do not support broadcasting, the
+        broadcasted circuit is split into one circuit per input, which are executed as a single
+        batch. QNodes that do not support broadcasting, for example because they index the
+        inputs as ``inputs[i]``, are evaluated separately for each input, unless ``batch_idx``
+        is specified.
+
         **Additional example**
 
         The code block below shows how a circuit composed of templates from the
@@ -247,6 +260,9 @@ class KerasLayer(Layer):
 
         self.qnode_weights = {}
 
+        # evaluation of batches of inputs in a single execution, per input shape
+        self._batched_qnodes = {}
+
         super().__init__(dynamic=True, **kwargs)
 
     def _signature_validation(self, qnode, weight_shapes):
@@ -294,6 +310,24 @@ class KerasLayer(Layer):
             tensor: output data
         """
         if len(tf.shape(inputs)) > 1 and self.argnum is None:
+            batch_dims = tf.shape(inputs)[:-1]
+            batch = tf.reshape(inputs, (-1, tf.shape(inputs)[-1]))
+
+            if batch.shape[0] > 1:
+                batched = self._batched_qnode(batch)
+
+                if batched is not None:
+                    # evaluate the flattened batch in a single execution
+                    qnode, batch_axis, output_shape = batched
+                    res = self._evaluate_qnode(batch, qnode)
+
+                    if batch_axis != 0:
+                        perm = list(range(len(res.shape)))
+                        perm.insert(0, perm.pop(batch_axis))
+                        res = tf.transpose(res, perm)
+
+                    return tf.reshape(res, tf.concat([batch_dims, output_shape], axis=0))
+
             # If the input size is not 1-dimensional, unstack the input along its first dimension,
             # recursively call the forward pass on each of the yielded tensors, and then stack the
             # outputs back into the correct shape
@@ -304,11 +338,37 @@ class KerasLayer(Layer):
 
         return self._evaluate_qnode(inputs)
 
-    def _evaluate_qnode(self, x):
+    def _batched_qnode(self, batch):
+        """Returns the function evaluating the QNode on a batch of inputs at once, the axis
+        of the batch in its output and the output shape for a single input, or ``None`` if
+        the QNode does not support a batch of inputs.
+
+        Args:
+            batch (tensor): two-dimensional batch of inputs
+
+        Returns:
+            tuple[callable, int, tuple] or None: batched evaluation of the QNode
+        """
+        input_shape = tuple(batch.shape[1:])
+
+        if input_shape not in self._batched_qnodes:
+            batched = batched_qnode(self.qnode, self.input_arg, self.weight_shapes, input_shape)
+
+            if batched is not None:
+                # the output shape of a single input, which the batched output is reshaped to
+                batched += (tuple(self._evaluate_qnode(batch[0]).shape),)
+
+            self._batched_qnodes[input_shape] = batched
+
+        return self._batched_qnodes[input_shape]
+
+    def _evaluate_qnode(self, x, qnode=None):
         """Evaluates a QNode for a single input datapoint.
 
         Args:
             x (tensor): the datapoint
+            qnode (callable): the function to evaluate instead of the QNode, such as
+                its batched version
 
         Returns:
             tensor: output datapoint
@@ -317,7 +377,7 @@ class KerasLayer(Layer):
             **{self.input_arg: x},
             **{k: 1.0 * w for k, w in self.qnode_weights.items()},
         }
-        return self.qnode(**kwargs)
+        return (qnode or self.qnode)(**kwargs)
 
     def compute_output_shape(self, input_shape):
         """Computes the output shape after passing data of shape ``input_shape`` through the
@@ -20,6 +20,7 @@ from collections.abc import Iterable
 from typing import Callable, Dict, Union, Any
 
 from pennylane.qnode import QNode
+from pennylane.qnn.broadcasting import batched_qnode
 
 try:
     import torch
@@ -150,6 +151,17 @@ class TorchLayer(Module):
 
             qlayer = qml.qnn.TorchLayer(qnode, weight_shapes=weight_shapes, init_method=init_method)
 
+        **Batched inputs**
+
+        Inputs with more than one dimension are treated as a batch, with the features of each
+        input along the last dimension. If the QNode supports parameter broadcasting over its
+        ``inputs`` argument, for example by passing it to an embedding template or indexing it
+        as ``inputs[..., i]``, the whole batch is evaluated in a single broadcasted execution.
+        On devices or with differentiation methods that do not support broadcasting, the
+        broadcasted circuit is split into one circuit per input, which are executed as a single
+        batch. QNodes that do not support broadcasting, for example because they index the
+        inputs as ``inputs[i]``, are evaluated separately for each input.
+
         **Full code example**
 
         The code block below shows how a circuit composed of templates from the
@@ -267,6 +279,9 @@ class TorchLayer(Module):
 
         self._init_weights(init_method=init_method, weight_shapes=weight_shapes)
 
+        # evaluation of batches of inputs in a single execution, per input shape
+        self._batched_qnodes = {}
+
     def _signature_validation(self, qnode: QNode, weight_shapes: dict):
         sig = inspect.signature(qnode.func).parameters
 
@@ -303,6 +318,18 @@ class TorchLayer(Module):
         """
 
         if len(inputs.shape) > 1:
+            batch_dims = inputs.shape[:-1]
+            batch = torch.reshape(inputs, (-1, inputs.shape[-1]))
+
+            if len(batch) > 1:
+                batched = self._batched_qnode(batch)
+
+                if batched is not None:
+                    # evaluate the flattened batch in a single execution
+                    qnode, batch_axis, output_shape = batched
+                    res = torch.movedim(self._evaluate_qnode(batch, qnode), batch_axis, 0)
+                    return torch.reshape(res, (*batch_dims, *output_shape))
+
             # If the input size is not 1-dimensional, unstack the input along its first dimension,
             # recursively call the forward pass on each of the yielded tensors, and then stack the
             # outputs back into the correct shape
@@ -312,11 +339,38 @@ class TorchLayer(Module):
         # If the input is 1-dimensional, calculate the forward pass as usual
         return self._evaluate_qnode(inputs)
 
-    def _evaluate_qnode(self, x):
+    def _batched_qnode(self, batch):
+        """Returns the function evaluating the QNode on a batch of inputs at once, the axis
+        of the batch in its output and the output shape for a single input, or ``None`` if
+        the QNode does not support a batch of inputs.
+
+        Args:
+            batch (tensor): two-dimensional batch of inputs
+
+        Returns:
+            tuple[callable, int, tuple] or None: batched evaluation of the QNode
+        """
+        input_shape = tuple(batch.shape[1:])
+
+        if input_shape not in self._batched_qnodes:
+            weight_shapes = {arg: tuple(w.shape) for arg, w in self.qnode_weights.items()}
+            batched = batched_qnode(self.qnode, self.input_arg, weight_shapes, input_shape)
+
+            if batched is not None:
+                # the output shape of a single input, which the batched output is reshaped to
+                batched += (tuple(self._evaluate_qnode(batch[0]).shape),)
+
+            self._batched_qnodes[input_shape] = batched
+
+        return self._batched_qnodes[input_shape]
+
+    def _evaluate_qnode(self, x, qnode=None):
         """Evaluates the QNode for a single input datapoint.
 
         Args:
             x (tensor): the datapoint
+            qnode (callable): the function to evaluate instead of the QNode, such as
+                its batched version
 
         Returns:
             tensor: output datapoint
@@ -325,7 +379,7 @@ class TorchLayer(Module):
             **{self.input_arg: x},
             **{arg: weight.to(x) for arg, weight in self.qnode_weights.items()},
         }
-        return self.qnode(**kwargs).type(x.dtype)
+        return (qnode or self.qnode)(**kwargs).type(x.dtype)
 
     def _init_weights(
         self,
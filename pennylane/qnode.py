@@ -15,6 +15,7 @@
 This module contains the QNode class and qnode decorator.
 """
 # pylint: disable=too-many-instance-attributes,too-many-arguments,protected-access,unnecessary-lambda-assignment
+import contextlib
 import functools
 import inspect
 import warnings
@@ -26,6 +27,7 @@ import pennylane as qml
 from pennylane import Device
 from pennylane.interfaces import INTERFACE_MAP, SUPPORTED_INTERFACES, set_shots
 from pennylane.tape import QuantumTape
+from pennylane.tracker import stage
 
 
 class QNode:
@@ -125,12 +127,19 @@ class QNode:
             If ``True``, a cache with corresponding ``cachesize`` is created for each batch
             execution. If ``False``, no caching is used. You may also pass your own cache
             to be used; this can be any object that implements the special methods
-            ``__getitem__()``, ``__setitem__()``, and ``__delitem__()``, such as a dictionary.
+            ``__getitem__()``, ``__setitem__()``, and ``__delitem__()``, such as a dictionary,
+            or a :class:`~.interfaces.DiskCache` to persist results across processes.
         cachesize (int): The size of any auto-created caches. Only applies when ``cache=True``.
         max_diff (int): If ``diff_method`` is a gradient transform, this option specifies
             the maximum number of derivatives to support. Increasing this value allows
             for higher order derivatives to be extracted, at the cost of additional
             (classical) computational overhead during the backwards pass.
+        device_vjp (bool): Whether the device should compute the vector-Jacobian products on
+            the backward pass, instead of the Jacobians. Only applies if ``diff_method="adjoint"``.
+            The cost of the backward pass is then a single adjoint pass, independently of the
+            number of measurements of the QNode, which is beneficial if the QNode has many
+            outputs and is part of a scalar cost function. It is required to differentiate
+            QNodes with broadcasted parameters using the adjoint method.
 
     Keyword Args:
         **kwargs: Any additional keyword arguments provided are passed to the differentiation
@@ -154,6 +163,12 @@ class QNode:
     ...     return expval(qml.PauliZ(0))
     >>> dev = qml.device("default.qubit", wires=1)
     >>> qnode = qml.QNode(circuit, dev)
+
+    Setting the ``decomposition_cache`` attribute to a :class:`~.DecompositionCache` stores
+    the decompositions of operators, such as templates, computed while evaluating the QNode.
+    Later evaluations re-bind the new parameters to the stored decompositions rather than
+    decomposing the operators again. By default, ``decomposition_cache`` is ``None`` and
+    operators are decomposed in every evaluation.
     """
 
     def __init__(
@@ -168,6 +183,7 @@ class QNode:
         cache=True,
         cachesize=10000,
         max_diff=1,
+        device_vjp=False,
         **gradient_kwargs,
     ):
         if interface not in SUPPORTED_INTERFACES:
@@ -207,6 +223,7 @@ class QNode:
             "cachesize": cachesize,
             "max_diff": max_diff,
             "max_expansion": max_expansion,
+            "device_vjp": device_vjp,
         }
 
         if self.expansion_strategy == "device":
@@ -221,9 +238,19 @@ class QNode:
         self.gradient_kwargs = None
         self._tape_cached = False
 
+        # optional cache of decompositions of operators re-used across evaluations of the QNode
+        self.decomposition_cache = None
+
         self._update_gradient_fn()
         functools.update_wrapper(self, func)
 
+    def _decomposition_context(self):
+        """Context manager within which operators are decomposed using the decomposition cache."""
+        if self.decomposition_cache is None:
+            return contextlib.nullcontext()
+
+        return self.decomposition_cache.active()
+
     def __repr__(self):
         """String representation."""
         detail = "<QNode: wires={}, device='{}', interface='{}', diff_method='{}'>"
@@ -439,8 +466,18 @@ class QNode:
                 expand_fn = device.expand_fn
                 batch_transform = device.batch_transform
 
+                kwargs = {}
+                if "complex64" in str(getattr(device, "C_DTYPE", "")) and QNode._accepts_c_dtype(
+                    backprop_devices[mapped_interface]
+                ):
+                    # keep the single precision of the device
+                    kwargs["c_dtype"] = device.C_DTYPE
+
                 device = qml.device(
-                    backprop_devices[mapped_interface], wires=device.wires, shots=device.shots
+                    backprop_devices[mapped_interface],
+                    wires=device.wires,
+                    shots=device.shots,
+                    **kwargs,
                 )
                 device.expand_fn = expand_fn
                 device.batch_transform = batch_transform
@@ -457,6 +494,21 @@ class QNode:
             "autodifferentiation frameworks."
         )
 
+    @staticmethod
+    def _accepts_c_dtype(name):
+        """Returns whether the constructor of a device accepts a ``c_dtype`` argument.
+
+        Args:
+            name (str): short name of the device
+
+        Returns:
+            bool: whether the device can be created with a ``c_dtype`` argument
+        """
+        if name not in qml.plugin_devices:
+            return False
+
+        return "c_dtype" in inspect.signature(qml.plugin_devices[name].load()).parameters
+
     @staticmethod
     def _validate_adjoint_method(device):
         # The conditions below provide a minimal set of requirements that we can likely improve upon in
@@ -522,7 +574,7 @@ class QNode:
 
         self._tape = qml.tape.QuantumTape()
 
-        with self.tape:
+        with stage("construction"), self.tape:
             self._qfunc_output = self.func(*args, **kwargs)
         self._tape._qfunc_output = self._qfunc_output
 
@@ -566,26 +618,27 @@ class QNode:
                     " differentiation method"
                 )
 
-        # Apply the deferred measurement principle if the device doesn't
-        # support mid-circuit measurements natively
-        # TODO:
-        # 1. Change once mid-circuit measurements are not considered as tape
-        # operations
-        # 2. Move this expansion to Device (e.g., default_expand_fn or
-        # batch_transform method)
-        if any(
-            getattr(obs, "return_type", None) == qml.measurements.MidMeasure
-            for obs in self.tape.operations
-        ):
-            self._tape = qml.defer_measurements(self._tape)
+        with stage("expansion"):
+            # Apply the deferred measurement principle if the device doesn't
+            # support mid-circuit measurements natively
+            # TODO:
+            # 1. Change once mid-circuit measurements are not considered as tape
+            # operations
+            # 2. Move this expansion to Device (e.g., default_expand_fn or
+            # batch_transform method)
+            if any(
+                getattr(obs, "return_type", None) == qml.measurements.MidMeasure
+                for obs in self.tape.operations
+            ):
+                self._tape = qml.defer_measurements(self._tape)
 
-        if self.expansion_strategy == "device":
-            self._tape = self.device.expand_fn(self.tape, max_expansion=self.max_expansion)
+            if self.expansion_strategy == "device":
+                self._tape = self.device.expand_fn(self.tape, max_expansion=self.max_expansion)
 
-        # If the gradient function is a transform, expand the tape so that
-        # all operations are supported by the transform.
-        if isinstance(self.gradient_fn, qml.gradients.gradient_transform):
-            self._tape = self.gradient_fn.expand_fn(self._tape)
+            # If the gradient function is a transform, expand the tape so that
+            # all operations are supported by the transform.
+            if isinstance(self.gradient_fn, qml.gradients.gradient_transform):
+                self._tape = self.gradient_fn.expand_fn(self._tape)
 
     def __call__(self, *args, **kwargs):  # pylint: disable=too-many-branches
         override_shots = False
@@ -608,7 +661,8 @@ class QNode:
                 set_shots(self._original_device, override_shots)(self._update_gradient_fn)()
 
         # construct the tape
-        self.construct(args, kwargs)
+        with self._decomposition_context():
+            self.construct(args, kwargs)
 
         cache = self.execute_kwargs.get("cache", False)
         using_custom_cache = (
@@ -619,15 +673,16 @@ class QNode:
         self._tape_cached = using_custom_cache and self.tape.hash in cache
 
         if qml.active_return():
-            res = qml.execute_new(
-                [self.tape],
-                device=self.device,
-                gradient_fn=self.gradient_fn,
-                interface=self.interface,
-                gradient_kwargs=self.gradient_kwargs,
-                override_shots=override_shots,
-                **self.execute_kwargs,
-            )
+            with self._decomposition_context():
+                res = qml.execute_new(
+                    [self.tape],
+                    device=self.device,
+                    gradient_fn=self.gradient_fn,
+                    interface=self.interface,
+                    gradient_kwargs=self.gradient_kwargs,
+                    override_shots=override_shots,
+                    **self.execute_kwargs,
+                )
 
             res = res[0]
 
@@ -658,15 +713,16 @@ class QNode:
 
             return res
 
-        res = qml.execute(
-            [self.tape],
-            device=self.device,
-            gradient_fn=self.gradient_fn,
-            interface=self.interface,
-            gradient_kwargs=self.gradient_kwargs,
-            override_shots=override_shots,
-            **self.execute_kwargs,
-        )
+        with self._decomposition_context():
+            res = qml.execute(
+                [self.tape],
+                device=self.device,
+                gradient_fn=self.gradient_fn,
+                interface=self.interface,
+                gradient_kwargs=self.gradient_kwargs,
+                override_shots=override_shots,
+                **self.execute_kwargs,
+            )
 
         if autograd.isinstance(res, (tuple, list)) and len(res) == 1:
             # If a device batch transform was applied, we need to 'unpack'
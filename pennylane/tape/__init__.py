@@ -16,6 +16,7 @@ This subpackage contains the quantum tape, which tracks, queues, and
 validates quantum operations and measurements.
 """
 from .tape import QuantumTape, get_active_tape, TapeError
+from .expansion_cache import ExpansionCache, DecompositionCache
 from .operation_recorder import OperationRecorder
 from .stop_recording import stop_recording
 from .unwrap import Unwrap, UnwrapTape
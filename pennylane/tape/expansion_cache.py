@@ -0,0 +1,670 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+This module contains the ExpansionCache and DecompositionCache classes, which store
+the results of tape expansions and operator decompositions keyed by their structure.
+"""
+# pylint: disable=protected-access
+import contextlib
+import copy
+
+from cachetools import LRUCache
+import numpy as onp
+
+import pennylane as qml
+from pennylane.operation import DecompositionUndefinedError
+
+
+_SEEN = "seen"
+"""Cache entry for tapes expanded once, whose expansion is stored if the structure recurs."""
+
+_UNCHANGED = "unchanged"
+"""Cache entry for tapes that are returned unchanged by the expansion."""
+
+_NOT_REBINDABLE = "not rebindable"
+"""Cache entry for tapes whose expansion cannot be re-bound to new parameters."""
+
+_UNDEFINED = "undefined"
+"""Cache entry for operators that do not define a decomposition."""
+
+_active_decomposition_caches = []
+"""list[DecompositionCache or None]: stack of the decomposition caches activated by
+:meth:`DecompositionCache.active`; the last one is used by :func:`~.expand_tape`."""
+
+
+def _num_operation_params(tape):
+    """Number of parameters of the operations, excluding the observables, of a tape."""
+    return sum(len(op.data) for op in tape.operations)
+
+
+def _requires_grad(param):
+    """Whether a parameter is trainable; objects unknown to ``qml.math`` are not."""
+    try:
+        return qml.math.requires_grad(param)
+    except ValueError:
+        return False
+
+
+def _unwrap(param):
+    """Converts a parameter to a NumPy array, removing any autodifferentiation information."""
+    return onp.asarray(qml.math.unwrap([param])[0])
+
+
+class _ValueDependentError(Exception):
+    """Raised if a probe parameter is used in a computation that depends on its value."""
+
+
+def _value_dependent(probe, *args, **kwargs):  # pylint: disable=unused-argument
+    raise _ValueDependentError(f"The expansion depends on the value of {probe!r}.")
+
+
+class _ParameterProbe:
+    """Stand-in for a parameter, used to determine how the parameters of an expansion
+    are gathered from the parameters of the expanded tape or operator.
+
+    A probe stands for some elements of the ``idx``-th parameter, multiplied by a constant
+    factor. Indexing a probe, and multiplying or dividing it by a constant, returns a new
+    probe. Any other use of a probe, such as arithmetic with other values, comparisons and
+    conversions to numbers or arrays, depends on the value of the parameter and raises an
+    error. An expansion that succeeds with probes as parameters is therefore independent of
+    the parameter values.
+
+    Args:
+        idx (int): index of the parameter
+        positions (array[int]): flat indices of the elements of the parameter
+        factor (float): constant factor multiplying the elements
+        requires_grad (bool): whether the parameter is trainable
+    """
+
+    # NumPy functions and operators defer to the methods of the probe
+    __array_ufunc__ = None
+
+    def __init__(self, idx, positions, factor=1.0, requires_grad=False):
+        self.idx = idx
+        self.positions = onp.asarray(positions)
+        self.factor = factor
+        self.requires_grad = requires_grad
+
+    @classmethod
+    def of(cls, idx, param):
+        """Returns the probe standing for all elements of a parameter."""
+        shape = qml.math.shape(param)
+        positions = onp.arange(int(onp.prod(shape))).reshape(shape)
+        return cls(idx, positions, requires_grad=_requires_grad(param))
+
+    @property
+    def shape(self):
+        """tuple[int]: shape of the parameter elements"""
+        return self.positions.shape
+
+    @property
+    def ndim(self):
+        """int: number of dimensions of the parameter elements"""
+        return self.positions.ndim
+
+    @property
+    def size(self):
+        """int: number of parameter elements"""
+        return self.positions.size
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def __getitem__(self, key):
+        if isinstance(key, _ParameterProbe):
+            _value_dependent(key)
+
+        return _ParameterProbe(self.idx, self.positions[key], self.factor, self.requires_grad)
+
+    def __mul__(self, other):
+        if (
+            isinstance(other, (bool, _ParameterProbe))
+            or qml.math.get_interface(other) != "numpy"
+            or onp.ndim(other) != 0
+            or not onp.isrealobj(other)
+        ):
+            _value_dependent(self)
+
+        factor = self.factor * float(other)
+        return _ParameterProbe(self.idx, self.positions, factor, self.requires_grad)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        return self * (1 / other)
+
+    def __neg__(self):
+        return self * -1
+
+    def __pos__(self):
+        return self
+
+    def __repr__(self):
+        return f"<probe of parameter {self.idx}, elements {self.positions.tolist()}>"
+
+    __hash__ = object.__hash__
+
+    __array__ = __bool__ = __float__ = __int__ = __complex__ = __index__ = _value_dependent
+    __eq__ = __ne__ = __lt__ = __le__ = __gt__ = __ge__ = _value_dependent
+    __add__ = __radd__ = __sub__ = __rsub__ = __rtruediv__ = _value_dependent
+    __floordiv__ = __rfloordiv__ = __mod__ = __rmod__ = __pow__ = __rpow__ = _value_dependent
+    __matmul__ = __rmatmul__ = __abs__ = __round__ = _value_dependent
+
+
+def _spec(value, shapes):
+    """Describes how a parameter of an expansion with probe parameters is gathered from the
+    original parameters, with shapes ``shapes``. The description is one of
+
+    - ``("param", i)``: the ``i``-th parameter,
+    - ``("element", i, index)``: an element of the ``i``-th parameter,
+    - ``("gather", elements, shape)``: an array of elements ``(i, index)``,
+    - ``("scaled", i, index, factor)``: the product of a factor and an element
+      of the ``i``-th parameter, or
+    - ``("constant", value)``: a constant, which does not depend on the parameters.
+
+    Returns ``None`` if the parameter cannot be described this way.
+    """
+    if not isinstance(value, _ParameterProbe):
+        constant = _unwrap(value)
+        return None if constant.dtype == object else ("constant", constant)
+
+    i, positions, factor = value.idx, value.positions, value.factor
+    full = positions.shape == shapes[i] and onp.array_equal(
+        positions.ravel(), onp.arange(positions.size)
+    )
+
+    if full and factor == 1:
+        return ("param", i)
+
+    if positions.ndim == 0:
+        index = tuple(int(k) for k in onp.unravel_index(int(positions), shapes[i]))
+        return ("element", i, index) if factor == 1 else ("scaled", i, index, factor)
+
+    if factor == 1:
+        elements = [
+            (i, tuple(int(k) for k in onp.unravel_index(int(p), shapes[i]))) for p in positions.flat
+        ]
+        return ("gather", elements, positions.shape)
+
+    return None
+
+
+def _gather_params(specs, data):
+    """Returns the parameters of an expansion, gathered from the original parameters ``data``
+    as described by ``specs`` (see :func:`_spec`)."""
+    params = []
+
+    for spec in specs:
+        if spec[0] == "param":
+            params.append(data[spec[1]])
+        elif spec[0] == "element":
+            params.append(data[spec[1]][spec[2]])
+        elif spec[0] == "gather":
+            elements = qml.math.stack([data[i][idx] for i, idx in spec[1]])
+            params.append(qml.math.reshape(elements, spec[2]))
+        elif spec[0] == "scaled":
+            i, idx, factor = spec[1:]
+            params.append(factor * (data[i][idx] if idx else data[i]))
+        else:
+            params.append(spec[1])
+
+    return params
+
+
+@contextlib.contextmanager
+def _no_decomposition_cache():
+    """Context manager within which :func:`~.expand_tape` decomposes operators without
+    a decomposition cache."""
+    _active_decomposition_caches.append(None)
+
+    try:
+        yield
+    finally:
+        _active_decomposition_caches.pop()
+
+
+def _probe_specs(params, expanded_params, probe_expanded_params):
+    """Returns the descriptions of how the parameters ``expanded_params`` of an expansion are
+    gathered from the original parameters ``params``, given the parameters
+    ``probe_expanded_params`` of the expansion with probes in place of the original parameters.
+    Parameters that are not replaced by probes are constants of the expansion. Returns ``None``
+    if the descriptions do not reproduce the parameters of the expansion."""
+    if len(probe_expanded_params) != len(expanded_params):
+        return None
+
+    shapes = [qml.math.shape(p) for p in params]
+    specs = [_spec(p, shapes) for p in probe_expanded_params]
+
+    if None in specs:
+        return None
+
+    for p1, p2 in zip(_gather_params(specs, params), expanded_params):
+        if qml.math.shape(p1) != qml.math.shape(p2) or not onp.allclose(
+            _unwrap(p1), _unwrap(p2), rtol=0, atol=1e-12
+        ):
+            return None
+
+    return specs
+
+
+class _ParameterTemplate:
+    """An expanded tape, with its parameters described in terms of the original parameters.
+
+    The stored tape does not hold on to the original parameters, which may carry
+    autodifferentiation information; its parameters are converted to NumPy arrays.
+
+    Args:
+        expanded (.QuantumTape): the expanded tape
+        specs (list[tuple]): for each parameter of the operations of ``expanded``, the
+            description of how it is gathered from the original parameters (see :func:`_spec`)
+    """
+
+    def __init__(self, expanded, specs):
+        self.tape = expanded.copy(copy_operations=True)
+        self.specs = specs
+
+        # the stored tape does not keep the original parameters alive
+        self.tape.set_parameters(
+            [_unwrap(p) for p in expanded.get_parameters(trainable_only=False)],
+            trainable_only=False,
+        )
+
+    def params(self, data):
+        """Returns the parameters of the expansion, gathered from the original parameters."""
+        return _gather_params(self.specs, data)
+
+
+class _ExpandedTemplate(_ParameterTemplate):
+    """The expansion of a tape, with the parameters of its operations described in terms of
+    the parameters of the operations of the original tape."""
+
+    def __init__(self, expanded, specs):
+        super().__init__(expanded, specs)
+        self.trainable_params = expanded.trainable_params
+
+    def bind(self, tape):
+        """Returns a copy of the expanded tape, with the parameters and measurements
+        of a tape with the same structure as the original tape.
+
+        Args:
+            tape (.QuantumTape): tape with the same structure as the original tape
+
+        Returns:
+            .QuantumTape: the expansion of ``tape``
+        """
+        new_tape = self.tape.copy(copy_operations=True)
+
+        # measurements are left untouched by the expansion, and are taken from the new tape
+        new_tape._measurements = list(tape.measurements)
+        new_tape._par_info = {}
+        new_tape._update_par_info()
+        new_tape.trainable_params = self.trainable_params
+        new_tape._qfunc_output = tape._qfunc_output
+
+        params = tape.get_parameters(trainable_only=False)
+        num_params = _num_operation_params(tape)
+        new_params = self.params(params[:num_params]) + params[num_params:]
+
+        new_tape.set_parameters(new_params, trainable_only=False)
+        return new_tape
+
+
+def _template(tape, expanded, expand_fn):
+    """Returns the cache entry for the expansion of a tape.
+
+    The expansion can be re-bound to new parameters if it does not depend on the values of
+    the parameters of the operations. This is verified by expanding a copy of the tape
+    whose parameters are replaced by probes, which raise an error if the expansion uses
+    their values (see :class:`_ParameterProbe`).
+    """
+    if expanded is tape:
+        return _UNCHANGED
+
+    if len(expanded.measurements) != len(tape.measurements) or any(
+        m1 is not m2 for m1, m2 in zip(expanded.measurements, tape.measurements)
+    ):
+        return _NOT_REBINDABLE
+
+    if any(isinstance(op, qml.tape.QuantumTape) for op in expanded.operations):
+        return _NOT_REBINDABLE
+
+    num_params = _num_operation_params(tape)
+    params = tape.get_parameters(trainable_only=False)
+    probes = [_ParameterProbe.of(i, p) for i, p in enumerate(params[:num_params])]
+    probe_tape = tape.copy(copy_operations=True)
+
+    try:
+        probe_tape.set_parameters(probes + params[num_params:], trainable_only=False)
+
+        with _no_decomposition_cache():
+            probe_expanded = expand_fn(probe_tape)
+
+        if (
+            probe_expanded is probe_tape
+            or probe_expanded.structure_key != expanded.structure_key
+            or any(
+                m1 is not m2 for m1, m2 in zip(probe_expanded.measurements, probe_tape.measurements)
+            )
+        ):
+            return _NOT_REBINDABLE
+
+        num_expanded_params = _num_operation_params(expanded)
+        specs = _probe_specs(
+            params[:num_params],
+            expanded.get_parameters(trainable_only=False)[:num_expanded_params],
+            probe_expanded.get_parameters(trainable_only=False)[:num_expanded_params],
+        )
+    except Exception:  # pylint: disable=broad-except
+        return _NOT_REBINDABLE
+
+    if specs is None:
+        return _NOT_REBINDABLE
+
+    return _ExpandedTemplate(expanded, specs)
+
+
+class ExpansionCache:
+    """Least-recently-used cache of tape expansions, keyed by the structure of the tapes.
+
+    Expanding a tape is independent of the values of its parameters for most operations.
+    The cache stores the expansion of a tape under its :attr:`~.QuantumTape.structure_key`,
+    and expands later tapes with the same structure by re-binding their parameters to a copy
+    of the stored expansion, skipping the decomposition of the operations.
+
+    Expansions are only re-used if they do not depend on the values of the parameters of the
+    operations, which must be passed to the expanded operations unchanged, sliced, or scaled by
+    constant factors. This is checked once, when the expansion of a tape with a recurring
+    structure is stored, by expanding a copy of the tape with probes in place of its parameters,
+    which raise an error if their values are used. Tapes whose expansion transforms parameters,
+    for example computing rotation angles from a state vector, are expanded anew every time.
+
+    Args:
+        maxsize (int): maximum number of stored expansions
+
+    **Example**
+
+    >>> cache = qml.tape.ExpansionCache()
+    >>> expand_fn = lambda tape: tape.expand(depth=2)
+    >>> def circuit(x):
+    ...     with qml.tape.QuantumTape() as tape:
+    ...         qml.Rot(*x, wires=0)
+    ...         qml.expval(qml.PauliZ(0))
+    ...     return tape
+    >>> for x in [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6], [0.7, 0.8, 0.9]]:
+    ...     print(cache.expand(circuit(x), expand_fn).operations)
+    [RZ(0.1, wires=[0]), RY(0.2, wires=[0]), RZ(0.3, wires=[0])]
+    [RZ(0.4, wires=[0]), RY(0.5, wires=[0]), RZ(0.6, wires=[0])]
+    [RZ(0.7, wires=[0]), RY(0.8, wires=[0]), RZ(0.9, wires=[0])]
+
+    The expansion of the second tape is stored, and the third expansion re-binds its
+    parameters to the stored expansion, rather than decomposing the ``Rot`` operation.
+    """
+
+    def __init__(self, maxsize=128):
+        self._cache = LRUCache(maxsize=maxsize)
+
+    def __len__(self):
+        return len(self._cache)
+
+    def clear(self):
+        """Removes all stored expansions."""
+        self._cache.clear()
+
+    def expand(self, tape, expand_fn, key=None):
+        """Expands a tape, re-using a stored expansion of a tape with the same structure if possible.
+
+        Args:
+            tape (.QuantumTape): the tape to expand
+            expand_fn (callable): function expanding the tape, with signature
+                ``expand_fn(tape)``. It must only depend on the structure of the tape,
+                and on arguments captured by ``key``.
+            key (Hashable): additional key identifying the expansion function and its arguments
+
+        Returns:
+            .QuantumTape: the expanded tape
+        """
+        if tape._obs_sharing_wires:
+            # the expansion diagonalizes the observables of the tape in place
+            return expand_fn(tape)
+
+        # some expansion functions only decompose trainable operations
+        trainable = tuple(_requires_grad(p) for op in tape.operations for p in op.data)
+        cache_key = (tape.structure_key, trainable, key)
+        entry = self._cache.get(cache_key, None)
+
+        if entry is None:
+            # expansions are only checked for re-use once a tape with the same structure recurs,
+            # such that one-off expansions are not expanded a second time with probes
+            self._cache[cache_key] = _SEEN
+            return expand_fn(tape)
+
+        if entry is _SEEN:
+            expanded = expand_fn(tape)
+            self._cache[cache_key] = _template(tape, expanded, expand_fn)
+            return expanded
+
+        if entry is _UNCHANGED:
+            return tape
+
+        if entry is _NOT_REBINDABLE:
+            return expand_fn(tape)
+
+        return entry.bind(tape)
+
+
+def active_decomposition_cache():
+    """Returns the currently active decomposition cache, if any.
+
+    Returns:
+        DecompositionCache or None: the innermost cache activated by :meth:`DecompositionCache.active`
+    """
+    return _active_decomposition_caches[-1] if _active_decomposition_caches else None
+
+
+class _DecompositionTemplate(_ParameterTemplate):
+    """The decomposition of an operator, with its parameters described in terms of the
+    parameters of the operator."""
+
+    def bind(self, op):
+        """Returns a tape recording the decomposition of an operator with the same
+        structure as the original operator."""
+        tape = self.tape.copy(copy_operations=True)
+        tape.set_parameters(self.params(op.data), trainable_only=False)
+        return tape
+
+
+class _ValueKeyed:
+    """Cache entry for operators whose decomposition depends on the values of some
+    non-trainable parameters. Their decompositions are stored separately for each value
+    of these parameters.
+
+    Args:
+        valued (tuple[int]): indices of the parameters whose values are part of the key
+    """
+
+    def __init__(self, valued):
+        self.valued = valued
+
+    def key(self, op, key):
+        """Returns the key of the decomposition of an operator, extending the key of its
+        structure by the exact values of the parameters. Returns ``None`` if these parameters
+        are trainable or cannot be converted to NumPy arrays."""
+        values = []
+
+        for i in self.valued:
+            if _requires_grad(op.data[i]):
+                return None
+
+            value = _unwrap(op.data[i])
+
+            if value.dtype == object:
+                return None
+
+            values.append((value.dtype.str, value.shape, value.tobytes()))
+
+        return (key, tuple(values))
+
+
+class DecompositionCache:
+    """Least-recently-used cache of operator decompositions, keyed by the operator class,
+    wires, hyperparameters and parameter shapes.
+
+    While the cache is active (see :meth:`~.active`), operators expanded by
+    :func:`~.expand_tape` are decomposed once; later operators with the same key re-use the
+    stored decomposition, with their parameters re-bound to it. A QNode uses a decomposition
+    cache when constructing its tape if its ``decomposition_cache`` attribute is set.
+
+    When a decomposition is first stored, the operator is decomposed once more with probes in
+    place of its parameters, which raise an error if the decomposition depends on their values.
+    Decompositions passing elements, slices or fixed multiples of elements of the parameters
+    to their operations, as in layered templates, are re-bound to new parameters. If the
+    decomposition depends on the values of non-trainable parameters, as for basis state
+    preparations, it is stored for each value of these parameters. Other decompositions, which
+    compute new parameters from trainable parameters, are recomputed every time.
+
+    Args:
+        maxsize (int): maximum number of stored decompositions
+
+    **Example**
+
+    >>> cache = qml.tape.DecompositionCache()
+    >>> def decompose(weights):
+    ...     with qml.tape.QuantumTape() as tape:
+    ...         qml.BasicEntanglerLayers(weights, wires=[0, 1])
+    ...     with cache.active():
+    ...         return tape.expand().operations
+    >>> decompose(np.array([[0.1, 0.2]]))
+    [RX(0.1, wires=[0]), RX(0.2, wires=[1]), CNOT(wires=[0, 1])]
+    >>> decompose(np.array([[0.3, 0.4]]))
+    [RX(0.3, wires=[0]), RX(0.4, wires=[1]), CNOT(wires=[0, 1])]
+
+    The second call re-binds the weights to the stored decomposition of the template.
+    """
+
+    def __init__(self, maxsize=1024):
+        self._cache = LRUCache(maxsize=maxsize)
+
+    def __len__(self):
+        return len(self._cache)
+
+    def clear(self):
+        """Removes all stored decompositions."""
+        self._cache.clear()
+
+    @contextlib.contextmanager
+    def active(self):
+        """Context manager within which operators expanded by :func:`~.expand_tape`
+        are decomposed using this cache."""
+        _active_decomposition_caches.append(self)
+
+        try:
+            yield self
+        finally:
+            _active_decomposition_caches.pop()
+
+    def expand(self, op):
+        """Returns a tape recording the decomposition of an operator, re-using a stored
+        decomposition of an operator with the same structure if possible.
+
+        Args:
+            op (.Operator): the operator to decompose
+
+        Returns:
+            .QuantumTape: quantum tape
+
+        Raises:
+            DecompositionUndefinedError: if the operator does not define a decomposition
+        """
+        key = (type(op), op.structure_key)
+        entry = self._cache.get(key, None)
+        valued = ()
+
+        if isinstance(entry, _ValueKeyed):
+            valued = entry.valued
+            key = entry.key(op, key)
+
+            if key is None:
+                return op.expand()
+
+            entry = self._cache.get(key, None)
+
+        if entry is None:
+            try:
+                tape = op.expand()
+            except DecompositionUndefinedError:
+                self._cache[key] = _UNDEFINED
+                raise
+
+            self._store(key, op, tape, valued)
+            return tape
+
+        if entry is _UNDEFINED:
+            raise DecompositionUndefinedError
+
+        if entry is _NOT_REBINDABLE:
+            return op.expand()
+
+        return entry.bind(op)
+
+    def _store(self, key, op, tape, valued):
+        """Stores the cache entry for the decomposition of an operator."""
+        template = self._template(op, tape, valued)
+
+        if template is not _NOT_REBINDABLE or valued:
+            self._cache[key] = template
+            return
+
+        # the decomposition may depend on the values of the non-trainable parameters
+        valued = tuple(i for i, p in enumerate(op.data) if not _requires_grad(p))
+        entry = _ValueKeyed(valued)
+        value_key = entry.key(op, key) if valued else None
+
+        if value_key is None:
+            self._cache[key] = _NOT_REBINDABLE
+            return
+
+        self._cache[key] = entry
+        self._cache[value_key] = self._template(op, tape, valued)
+
+    @staticmethod
+    def _template(op, tape, valued=()):
+        """Returns the cache entry for the decomposition of an operator, whose parameters
+        with indices in ``valued`` are constants of the decomposition."""
+        probes = [p if i in valued else _ParameterProbe.of(i, p) for i, p in enumerate(op.data)]
+        params = tape.get_parameters(trainable_only=False)
+
+        try:
+            if len(valued) == len(op.data):
+                # all parameters of the decomposition are constants
+                specs = _probe_specs(op.data, params, params)
+                return _NOT_REBINDABLE if specs is None else _DecompositionTemplate(tape, specs)
+
+            probe_op = copy.copy(op)
+            probe_op.data = probes
+            probe_tape = probe_op.expand()
+
+            if probe_tape.structure_key != tape.structure_key:
+                return _NOT_REBINDABLE
+
+            specs = _probe_specs(op.data, params, probe_tape.get_parameters(trainable_only=False))
+        except Exception:  # pylint: disable=broad-except
+            return _NOT_REBINDABLE
+
+        if specs is None:
+            return _NOT_REBINDABLE
+
+        return _DecompositionTemplate(tape, specs)
@@ -27,6 +27,7 @@ from pennylane.measurements import Counts, Sample, Shadow, ShadowExpval, AllCoun
 from pennylane.operation import DecompositionUndefinedError, Operator
 from pennylane.queuing import AnnotatedQueue, QueuingContext, QueuingError
 
+from .expansion_cache import active_decomposition_cache
 from .unwrap import UnwrapTape
 
 OPENQASM_GATES = {
@@ -191,7 +192,12 @@ def expand_tape(tape, depth=1, stop_at=None, expand_measurements=False):
             if isinstance(obj, (Operator, qml.measurements.MeasurementProcess)):
                 # Object is an operation; query it for its expansion
                 try:
-                    obj = obj.expand()
+                    cache = active_decomposition_cache()
+
+                    if cache is not None and isinstance(obj, Operator):
+                        obj = cache.expand(obj)
+                    else:
+                        obj = obj.expand()
                 except DecompositionUndefinedError:
                     # Object does not define an expansion; treat this as
                     # a stopping condition.
@@ -1641,3 +1647,31 @@ class QuantumTape(AnnotatedQueue):
         fingerprint.extend(m.hash for m in self.measurements)
         fingerprint.extend(self.trainable_params)
         return hash(tuple(fingerprint))
+
+    @property
+    def structure_key(self):
+        """tuple: returns a hashable key representing the structure of the quantum tape.
+
+        Unlike :attr:`~.hash`, the structure key does not depend on the values of the
+        parameters. Two tapes with equal structure keys differ at most by their parameter
+        values, so that work such as decompositions can be reused between them, with the
+        parameters re-bound. Hyperparameters are represented exactly, rather than by their
+        string representation, and keys are compared by equality rather than by hash.
+
+        **Example**
+
+        >>> def circuit(x):
+        ...     with qml.tape.QuantumTape() as tape:
+        ...         qml.RX(x, wires=0)
+        ...         qml.expval(qml.PauliZ(0))
+        ...     return tape
+        >>> circuit(0.1).hash == circuit(0.2).hash
+        False
+        >>> circuit(0.1).structure_key == circuit(0.2).structure_key
+        True
+        """
+        return (
+            tuple(op.structure_key for op in self.operations),
+            tuple(m.structure_key for m in self.measurements),
+            tuple(self.trainable_params),
+        )
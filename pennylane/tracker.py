@@ -16,9 +16,74 @@ This module contains a class for updating and recording information about device
 """
 
 # pylint: disable=attribute-defined-outside-init
-
+import contextlib
+import json
+import os
+import threading
+import time
+import tracemalloc
 from numbers import Number
 
+# trackers timing the stages of the execution pipeline, while active
+_timing_trackers = []
+_local = threading.local()
+
+
+@contextlib.contextmanager
+def stage(name):
+    """Context manager timing a stage of the execution pipeline, such as
+    ``"expansion"`` or ``"device_apply"``, for all active trackers with ``timing=True``.
+
+    It can also be used as a function decorator. When no such tracker is active,
+    the overhead is a single check.
+
+    Args:
+        name (str): name of the stage
+
+    **Example**
+
+    >>> with qml.Tracker(timing=True) as tracker:
+    ...     with qml.tracker.stage("custom"):
+    ...         time.sleep(0.1)
+    >>> tracker.timings
+    {'custom': 0.10012...}
+    """
+    if not _timing_trackers:
+        yield
+        return
+
+    trackers = list(_timing_trackers)
+    memory = any(t.memory for t in trackers) and tracemalloc.is_tracing()
+
+    # peak allocations of the enclosing stages of this thread, which are
+    # folded in before the peak is reset for this stage
+    peaks = _local.__dict__.setdefault("peaks", [])
+
+    if memory:
+        current, peak = tracemalloc.get_traced_memory()
+        if peaks:
+            peaks[-1] = max(peaks[-1], peak)
+        tracemalloc.reset_peak()
+
+    peaks.append(0)
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        duration = time.perf_counter() - start
+        peak = peaks.pop()
+        allocated = None
+
+        if memory and tracemalloc.is_tracing():
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            allocated = max(peak - current, 0)
+            if peaks:
+                peaks[-1] = max(peaks[-1], peak)
+
+        for tracker in trackers:
+            tracker._record_stage(name, start, duration, len(peaks), allocated)
+
 
 class Tracker:
     """This class stores information about device executions and allows users to interact with that
@@ -36,6 +101,9 @@ class Tracker:
     executions, and batch execution length, but plugins may store additional information with
     no changes to this class.
 
+    With ``timing=True``, the tracker additionally records the wall-clock time spent in each
+    stage of the execution pipeline, see the usage details below.
+
     Information is only stored when the class attribute ``active`` is set to ``True``. This
     attribute can be toggled via a context manager and Python's ``with`` statement. Upon entering a
     context, the stored information is reset, unless ``persistent=True``. Tracking mode can also be
@@ -48,6 +116,10 @@ class Tracker:
             the corresponding attributes.
         persistent=False (bool): Whether to reset stored information upon
             entering a runtime context.
+        timing=False (bool): Whether to record the time spent in each stage of the
+            execution pipeline.
+        memory=False (bool): Whether to also record the peak memory allocated in each
+            stage, using :mod:`tracemalloc`. Requires ``timing=True``.
 
 
     **Example**
@@ -120,16 +192,64 @@ class Tracker:
         >>> tracker.totals['executions']
         2
 
+        **Timing the execution pipeline**
+
+        With ``timing=True``, the tracker records the time spent in each stage of every
+        execution taking place within its context, on any device:
+
+        * ``"construction"``: recording the quantum function of a QNode on a tape
+        * ``"expansion"``: decomposing tapes for the device or the gradient method
+        * ``"gradient_tapes"``: generating the tapes of gradient transforms
+        * ``"device_apply"``: applying the operations of a circuit on the device
+        * ``"measurement"``: sampling and computing the measurement statistics
+        * ``"postprocessing"``: processing the results of batch and gradient transforms
+
+        >>> with qml.Tracker(timing=True, memory=True) as tracker:
+        ...     qml.grad(circuit)(x)
+        >>> tracker.timings
+        {'construction': 0.00021...,
+         'expansion': 0.00011...,
+         'device_apply': 0.00052...,
+         'measurement': 0.00087...,
+         'gradient_tapes': 0.00031...,
+         'postprocessing': 4.9e-05...}
+
+        Each timed stage is also stored as a flat record in ``spans``, containing its start
+        time in seconds relative to the beginning of tracking, duration, nesting depth,
+        thread and, with ``memory=True``, the peak number of bytes it allocated:
+
+        >>> tracker.spans[0]
+        {'stage': 'construction', 'start': 0.00016..., 'duration': 0.00021...,
+         'depth': 0, 'thread': 140234..., 'memory': 3112}
+
+        The spans can be exported in the Chrome trace event format, to be viewed in
+        ``chrome://tracing`` or `Perfetto <https://ui.perfetto.dev>`_:
+
+        >>> tracker.to_chrome_trace("trace.json")
+
+        Stages can be nested, for example expansions performed while generating gradient
+        tapes, so that the total time of all stages may exceed the wall-clock time.
+        Custom stages can be timed with :func:`~.tracker.stage`.
     """
 
-    def __init__(self, dev=None, callback=None, persistent=False):
+    def __init__(self, dev=None, callback=None, persistent=False, timing=False, memory=False):
         self.persistent = persistent
 
         self.callback = callback
 
+        if memory and not timing:
+            raise ValueError("Tracking memory allocations requires timing=True")
+
+        if memory and not hasattr(tracemalloc, "reset_peak"):
+            raise ValueError("Tracking memory allocations requires Python 3.9 or newer")
+
+        self.timing = timing
+        self.memory = memory
+        self._started_tracemalloc = False
+
         self.reset()
 
-        self.active = False
+        self._active = False
 
         if dev is not None:
             if not hasattr(dev, "tracker"):
@@ -146,6 +266,34 @@ class Tracker:
     def __exit__(self, exc_type, exc_value, exc_traceback):
         self.active = False
 
+    @property
+    def active(self):
+        """bool: Whether the tracker is storing information."""
+        return self._active
+
+    @active.setter
+    def active(self, value):
+        if value == self._active:
+            return
+
+        self._active = value
+
+        if not self.timing:
+            return
+
+        if value:
+            _timing_trackers.append(self)
+
+            if self.memory and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+        else:
+            _timing_trackers.remove(self)
+
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+
     def update(self, **kwargs):
         """Store passed keyword-value pairs into ``totals``,``history``, and ``latest`` attributes.
 
@@ -184,6 +332,62 @@ class Tracker:
         self.totals = {}
         self.history = {}
         self.latest = {}
+        self.timings = {}
+        self.spans = []
+        self._start_time = time.perf_counter()
+
+    def _record_stage(self, name, start, duration, depth, allocated):
+        """Stores the timing of a stage of the execution pipeline."""
+        self.timings[name] = duration + self.timings.get(name, 0)
+
+        span = {
+            "stage": name,
+            "start": start - self._start_time,
+            "duration": duration,
+            "depth": depth,
+            "thread": threading.get_ident(),
+        }
+
+        if self.memory:
+            span["memory"] = allocated
+
+        self.spans.append(span)
+
+    def to_chrome_trace(self, filename=None):
+        """Returns the recorded stages in the Chrome trace event format.
+
+        Args:
+            filename (str or None): if provided, the trace is also written to this file as JSON
+
+        Returns:
+            dict: trace, with each stage as a complete event in ``"traceEvents"``
+        """
+        pid = os.getpid()
+        events = []
+
+        for span in self.spans:
+            event = {
+                "name": span["stage"],
+                "cat": "pennylane",
+                "ph": "X",
+                "ts": span["start"] * 1e6,
+                "dur": span["duration"] * 1e6,
+                "pid": pid,
+                "tid": span["thread"],
+            }
+
+            if span.get("memory") is not None:
+                event["args"] = {"memory": span["memory"]}
+
+            events.append(event)
+
+        trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+
+        if filename is not None:
+            with open(filename, "w", encoding="utf-8") as f:
+                json.dump(trace, f)
+
+        return trace
 
     def record(self):
         """This method allows users to interact with the stored data.  While it's intended purpose
@@ -21,6 +21,7 @@ import types
 import warnings
 
 import pennylane as qml
+from pennylane.tracker import stage
 
 
 class batch_transform:
@@ -37,7 +38,10 @@ class batch_transform:
             **must** be the input tape.
         expand_fn (function): An expansion function (if required) to be applied to the
             input tape before the transformation takes place.
-            It **must** take the same input arguments as ``transform_fn``.
+            It **must** take the same input arguments as ``transform_fn``. If the
+            ``expansion_cache`` attribute of the transform is set to an :class:`~.ExpansionCache`,
+            expansions are cached by tape structure, and re-used for tapes that only differ
+            by their parameter values. By default, ``expansion_cache`` is ``None``.
         differentiable (bool): Specifies whether the transform is differentiable or
             not. A transform may be non-differentiable for several reasons:
 
@@ -212,6 +216,7 @@ class batch_transform:
 
         self.transform_fn = transform_fn
         self.expand_fn = expand_fn
+        self.expansion_cache = None
         self.differentiable = differentiable
         self.qnode_wrapper = self.default_qnode_wrapper
         functools.update_wrapper(self, transform_fn)
@@ -398,7 +403,8 @@ class batch_transform:
         expand = kwargs.pop("_expand", True)
 
         if expand and self.expand_fn is not None:
-            tape = self.expand_fn(tape, *args, **kwargs)
+            with stage("expansion"):
+                tape = self._expand(tape, *args, **kwargs)
 
         tapes, processing_fn = self.transform_fn(tape, *args, **kwargs)
 
@@ -407,6 +413,24 @@ class batch_transform:
 
         return tapes, processing_fn
 
+    def _expand(self, tape, *args, **kwargs):
+        """Applies the expansion function to an input tape, re-using the expansion
+        of previous tapes with the same structure and transform arguments."""
+        if self.expansion_cache is None:
+            return self.expand_fn(tape, *args, **kwargs)
+
+        key = (args, tuple(sorted(kwargs.items())))
+
+        try:
+            hash(key)
+        except TypeError:
+            # arguments such as arrays cannot be used to identify the expansion
+            return self.expand_fn(tape, *args, **kwargs)
+
+        return self.expansion_cache.expand(
+            tape, lambda t: self.expand_fn(t, *args, **kwargs), key=(self.expand_fn, key)
+        )
+
     def _device_wrapper(self, *targs, **tkwargs):
         def _wrapper(dev):
             new_dev = copy.deepcopy(dev)
@@ -121,6 +121,20 @@ def decompose_hamiltonian(H, hide_identity=False, wire_order=None):
     return coeffs, obs
 
 
+# parity of the number of set bits of all 16-bit integers
+_PARITY = np.zeros(2**16, dtype=np.int8)
+for _bit in range(16):
+    _PARITY ^= (np.arange(2**16) >> _bit & 1).astype(np.int8)
+
+
+def _parity(values, num_bits):
+    """Parity of the number of set bits of an array of integers with at most ``num_bits`` bits."""
+    res = _PARITY[values & 0xFFFF]
+    for shift in range(16, num_bits, 16):
+        res = res ^ _PARITY[values >> shift & 0xFFFF]
+    return res
+
+
 def sparse_hamiltonian(H, wires=None):
     r"""Computes the sparse matrix representation a Hamiltonian in the computational basis.
 
@@ -153,6 +167,11 @@ def sparse_hamiltonian(H, wires=None):
            [ 0.+0.j  , -1.+0.j  ,  0.+0.j  ,  0.-0.45j],
            [ 0.-0.45j,  0.+0.j  , -1.+0.j  ,  0.+0.j  ],
            [ 0.+0.j  ,  0.+0.45j,  0.+0.j  ,  1.+0.j  ]])
+
+    The matrix is cached on the Hamiltonian for each wire order, so that repeated calls, for
+    example when computing expectation values, do not rebuild it; it is recomputed
+    if the coefficients of the Hamiltonian change. The returned matrix should therefore not be
+    modified in place.
     """
     if not isinstance(H, qml.Hamiltonian):
         raise TypeError("Passed Hamiltonian must be of type `qml.Hamiltonian`")
@@ -162,13 +181,63 @@ def sparse_hamiltonian(H, wires=None):
     else:
         wires = qml.wires.Wires(wires)
 
+    coeffs = qml.math.toarray(H.data)
+    key = tuple(wires.tolist())
+
+    # the matrix is cached on the Hamiltonian, and rebuilt if the coefficients change
+    cached = H._sparse_matrices.get(key, None)
+    if cached is not None and np.array_equal(cached[0], coeffs):
+        return cached[1]
+
+    masks = H.pauli_masks(wires) if set(H.wires).issubset(wires) else None
+
+    if masks is None:
+        matrix = _sparse_hamiltonian_kron(coeffs, H.ops, wires)
+    else:
+        matrix = _sparse_hamiltonian_pauli(coeffs, masks, len(wires))
+
+    H._sparse_matrices[key] = (coeffs, matrix)
+    return matrix
+
+
+def _sparse_hamiltonian_pauli(coeffs, masks, num_wires):
+    r"""Builds the CSR matrix of a linear combination of Pauli words from their bitmasks.
+
+    A Pauli word :math:`i^{n_Y} X^{\mathbf{x}} Z^{\mathbf{z}}` has exactly one non-zero entry
+    per row, :math:`\langle k \oplus x | P | k\rangle = i^{n_Y} (-1)^{|k \wedge z|}`. Terms
+    sharing the same ``x`` mask therefore share their sparsity pattern, and contribute to a
+    single non-zero entry per row.
+    """
+    x_masks, z_masks, num_y = masks
+    dim = 2**num_wires
+    indices = np.arange(dim, dtype=np.int64)
+
+    # the Hermitian conjugate of each term is taken since entries are indexed by their row
+    phases = coeffs * (-1j) ** num_y
+
+    unique_x, groups = np.unique(x_masks, return_inverse=True)
+    data = np.zeros((dim, len(unique_x)), dtype=np.complex128)
+
+    for term, group in enumerate(groups):
+        data[:, group] += phases[term] * (1 - 2 * _parity(indices & z_masks[term], num_wires))
+
+    # row k has non-zero entries at the columns k ^ x, sorted below
+    cols = indices[:, np.newaxis] ^ unique_x[np.newaxis, :]
+    indptr = len(unique_x) * np.arange(dim + 1, dtype=np.int64)
+
+    matrix = scipy.sparse.csr_matrix((data.ravel(), cols.ravel(), indptr), shape=(dim, dim))
+    matrix.eliminate_zeros()
+    matrix.sort_indices()
+    return matrix
+
+
+def _sparse_hamiltonian_kron(coeffs, ops, wires):
+    """Builds the CSR matrix of a Hamiltonian via Kronecker products of single-wire matrices."""
     n = len(wires)
     matrix = scipy.sparse.csr_matrix((2**n, 2**n), dtype="complex128")
 
-    coeffs = qml.math.toarray(H.data)
-
     temp_mats = []
-    for coeff, op in zip(coeffs, H.ops):
+    for coeff, op in zip(coeffs, ops):
         obs = []
         for o in qml.operation.Tensor(op).obs:
             if len(o.wires) > 1:
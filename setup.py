@@ -50,6 +50,8 @@ info = {
             "default.qubit.autograd = pennylane.devices.default_qubit_autograd:DefaultQubitAutograd",
             "default.qubit.jax = pennylane.devices.default_qubit_jax:DefaultQubitJax",
             "default.mixed = pennylane.devices.default_mixed:DefaultMixed",
+            "default.trajectory = pennylane.devices.default_trajectory:DefaultTrajectory",
+            "default.mps = pennylane.devices.default_mps:DefaultMPS",
             "default.qutrit = pennylane.devices.default_qutrit:DefaultQutrit",
         ],
         "console_scripts": ["pl-device-test=pennylane.devices.tests:cli"],
@@ -1148,3 +1148,149 @@ class TestInit:
             match=msg,
         ):
             qml.device("default.mixed", wires=1, shots=1, analytic=True)
+
+
+class TestOperationFusion:
+    """Tests for fusing consecutive gates and channels before applying them to the state"""
+
+    @pytest.mark.parametrize("max_fusion_wires", [0, 4])
+    def test_invalid_max_fusion_wires(self, max_fusion_wires):
+        """Test that an error is raised for an unsupported number of fused wires"""
+        with pytest.raises(DeviceError, match="number of fused wires must be between 1 and 3"):
+            qml.device("default.mixed", wires=2, max_fusion_wires=max_fusion_wires)
+
+    def test_fuse_operations(self):
+        """Test that runs of gates are fused into unitaries, and runs containing channels
+        into superoperators"""
+        dev = qml.device("default.mixed", wires=4, max_fusion_wires=2)
+        ops = [
+            qml.RX(0.1, wires=0),
+            qml.CNOT(wires=[0, 1]),
+            qml.Toffoli(wires=[0, 1, 2]),
+            qml.RY(0.2, wires=2),
+            AmplitudeDamping(0.3, wires=2),
+            qml.CZ(wires=[3, 2]),
+            qml.RX(np.array([0.1, 0.2]), wires=3),
+        ]
+
+        fused = dev._fuse_operations(ops)
+
+        assert len(fused) == 4
+        assert isinstance(fused[0], qml.QubitUnitary)
+        assert fused[0].wires == Wires([0, 1])
+        assert fused[1] is ops[2]
+        assert fused[3] is ops[6]
+
+        superoperator, wires = fused[2]
+        assert wires == Wires([2, 3])
+        assert superoperator.shape == (16, 16)
+
+    def test_superoperator(self, tol):
+        """Test that the superoperator of fused operations maps the flattened density matrix
+        like the operations"""
+        dev = qml.device("default.mixed", wires=2, max_fusion_wires=2)
+        ops = [qml.Hadamard(wires=1), DepolarizingChannel(0.2, wires=1), qml.CRY(0.3, wires=[1, 0])]
+        superoperator, _ = dev._fuse_operations(ops)[0]
+
+        rho = np.array(root_state(2))
+        expected_dev = qml.device("default.mixed", wires=2)
+        expected_dev.apply([qml.QubitDensityMatrix(rho, wires=[0, 1])] + ops)
+
+        # the superoperator is expressed in the order of the fused wires, [1, 0]
+        rho = np.transpose(rho.reshape([2] * 4), [1, 0, 3, 2]).reshape(16)
+        res = np.transpose((superoperator @ rho).reshape([2] * 4), [1, 0, 3, 2]).reshape(4, 4)
+
+        assert np.allclose(res, expected_dev.state, atol=tol, rtol=0)
+
+    def test_channel_superoperator_cached(self, mocker):
+        """Test that superoperators of channels with fixed parameters are cached"""
+        dev = qml.device("default.mixed", wires=2, max_fusion_wires=2)
+        spy = mocker.spy(DepolarizingChannel, "kraus_matrices")
+        ops = [qml.RX(0.1, wires=0), DepolarizingChannel(0.2, wires=0)] * 3
+
+        dev._fuse_operations(ops)
+        dev._fuse_operations(ops)
+
+        assert spy.call_count == 1
+        assert len(dev._superoperator_cache) == 1
+
+    def test_channel_hyperparameters_in_key(self, tol):
+        """Test that superoperators of channels differing only by their hyperparameters
+        are cached separately"""
+
+        class ScaledBitFlip(qml.BitFlip):
+            """Bit flip channel whose probability is scaled by a hyperparameter"""
+
+            def __init__(self, p, scale, wires):
+                self._hyperparameters = {"scale": scale}
+                super().__init__(p, wires=wires)
+
+            @staticmethod
+            def compute_kraus_matrices(p, scale):  # pylint: disable=arguments-differ
+                return qml.BitFlip.compute_kraus_matrices(p * scale)
+
+        dev = qml.device("default.mixed", wires=1, max_fusion_wires=1)
+        ops1 = [qml.RX(0.1, wires=0), ScaledBitFlip(0.2, 1.0, wires=0)]
+        ops2 = [qml.RX(0.1, wires=0), ScaledBitFlip(0.2, 2.0, wires=0)]
+        expected = [qml.RX(0.1, wires=0), qml.BitFlip(0.4, wires=0)]
+
+        dev._fuse_operations(ops1)
+        ((superoperator, _),) = dev._fuse_operations(ops2)
+        ((expected_superoperator, _),) = dev._fuse_operations(expected)
+
+        assert len(dev._superoperator_cache) == 3
+        assert np.allclose(superoperator, expected_superoperator, atol=tol, rtol=0)
+
+    def test_trainable_channel_not_cached(self):
+        """Test that superoperators of channels with trainable parameters are not cached"""
+        dev = qml.device("default.mixed", wires=1, max_fusion_wires=1)
+        p = qml.numpy.array(0.2, requires_grad=True)
+        dev._fuse_operations([qml.RX(0.1, wires=0), DepolarizingChannel(p, wires=0)])
+
+        assert not dev._superoperator_cache
+
+    @pytest.mark.parametrize("max_fusion_wires", [1, 2, 3])
+    def test_fused_noisy_circuit(self, max_fusion_wires, mocker, tol):
+        """Test that fusing operations does not change the results of a noisy circuit,
+        including its gradient"""
+        weights = qml.numpy.array(
+            np.random.random(qml.StronglyEntanglingLayers.shape(n_layers=2, n_wires=3)),
+            requires_grad=True,
+        )
+
+        @qml.transforms.insert(DepolarizingChannel, 0.05, position="all")
+        def circuit(weights):
+            qml.StronglyEntanglingLayers(weights, wires=range(3))
+            qml.Toffoli(wires=[2, 0, 1])
+            return qml.expval(qml.PauliX(0) @ qml.PauliY(2))
+
+        dev = qml.device("default.mixed", wires=3)
+        fused_dev = qml.device("default.mixed", wires=3, max_fusion_wires=max_fusion_wires)
+
+        spy = mocker.spy(DefaultMixed, "_apply_superoperator")
+        expected = qml.QNode(circuit, dev)
+        res = qml.QNode(circuit, fused_dev)
+
+        assert np.allclose(res(weights), expected(weights), atol=tol, rtol=0)
+        assert spy.call_count > 0
+        assert np.allclose(qml.grad(res)(weights), qml.grad(expected)(weights), atol=tol, rtol=0)
+
+    def test_fused_broadcasted_state(self, tol):
+        """Test that a superoperator is applied to each state of a broadcasted state"""
+        x = np.array([0.1, 0.7, 1.2])
+
+        def circuit(x):
+            qml.RX(x, wires=0)
+            qml.CNOT(wires=[0, 1])
+            AmplitudeDamping(0.2, wires=1)
+            qml.RY(0.4, wires=1)
+            return qml.state()
+
+        dev = qml.device("default.mixed", wires=2)
+        fused_dev = qml.device("default.mixed", wires=2, max_fusion_wires=1)
+
+        res = qml.QNode(circuit, fused_dev)(x)
+        expected = qml.QNode(circuit, dev)(x)
+
+        assert res.shape == (3, 4, 4)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
@@ -50,7 +50,7 @@ class TestQNodeIntegration:
             "model": "qubit",
             "supports_finite_shots": True,
             "supports_tensor_observables": True,
-            "supports_broadcasting": False,
+            "supports_broadcasting": True,
             "returns_probs": True,
             "returns_state": True,
             "passthru_devices": {
@@ -0,0 +1,252 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the :mod:`pennylane.devices.DefaultMixed` device when using broadcasting.
+"""
+# pylint: disable=protected-access
+import pytest
+
+import numpy as np
+import pennylane as qml
+from pennylane import numpy as pnp
+from pennylane.wires import Wires
+
+X = np.array([0.1, 0.8, 2.3])
+
+
+def _density_matrices(states):
+    """Density matrices of a batch of state vectors."""
+    return np.einsum("ai,aj->aij", states, np.conj(states))
+
+
+def _noisy_circuit(x, y):
+    """Quantum function with broadcasted gates interleaved with noise channels."""
+    qml.Hadamard(wires=0)
+    qml.RX(x, wires=0)
+    qml.DepolarizingChannel(0.1, wires=0)
+    qml.CNOT(wires=[0, 1])
+    qml.RZ(x, wires=1)
+    qml.CRY(y, wires=[1, 2])
+    qml.AmplitudeDamping(0.2, wires=2)
+    qml.IsingXX(x, wires=[0, 2])
+    qml.PhaseDamping(0.3, wires=1)
+
+
+class TestApplyBroadcasted:
+    """Tests that operations and channels are applied to broadcasted states, and that
+    broadcasted operations are applied to states."""
+
+    def test_broadcasted_unitary(self, tol):
+        """Test that a broadcasted unitary is applied to a single state."""
+        dev = qml.device("default.mixed", wires=1)
+        op = qml.RX(X, wires=0)
+        dev._apply_channel(dev._get_kraus(op), Wires(0))
+
+        states = qml.RX.compute_matrix(X)[:, :, 0]
+        expected = _density_matrices(states)
+        assert np.allclose(dev._state, expected, atol=tol, rtol=0)
+
+    def test_broadcasted_diagonal_unitary(self, tol):
+        """Test that a broadcasted diagonal unitary is applied to a single state."""
+        dev = qml.device("default.mixed", wires=1)
+        dev._apply_channel(dev._get_kraus(qml.Hadamard(0)), Wires(0))
+        op = qml.RZ(X, wires=0)
+        dev._apply_diagonal_unitary(dev._get_kraus(op), Wires(0))
+
+        states = np.einsum("aij,j->ai", qml.RZ.compute_matrix(X), [1, 1]) / np.sqrt(2)
+        expected = _density_matrices(states)
+        assert np.allclose(dev._state, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize(
+        "op", [qml.AmplitudeDamping(0.3, wires=1), qml.RY(0.4, wires=1), qml.PhaseShift(0.2, 1)]
+    )
+    def test_channel_broadcasted_state(self, op, tol):
+        """Test that a channel, unitary or diagonal unitary is applied to each state of a
+        broadcasted state."""
+        dev = qml.device("default.mixed", wires=2)
+        dev.apply([qml.RX(X, wires=1), op])
+        batched_state = dev.state
+
+        for x, rho in zip(X, batched_state):
+            dev.reset()
+            dev.apply([qml.RX(x, wires=1), op])
+            assert np.allclose(rho, dev.state, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("op", [qml.CRX(X, wires=[1, 0]), qml.MultiRZ(X, wires=[0, 1])])
+    def test_broadcasted_unitary_broadcasted_state(self, op, tol):
+        """Test that a broadcasted unitary is applied to a broadcasted state of the same
+        batch size."""
+        dev = qml.device("default.mixed", wires=2)
+        dev.apply([qml.Hadamard(1), qml.RY(X, wires=0), op])
+        batched_state = dev.state
+
+        for i, rho in enumerate(batched_state):
+            dev.reset()
+            dev.apply([qml.Hadamard(1), qml.RY(X[i], wires=0), op.__class__(X[i], wires=op.wires)])
+            assert np.allclose(rho, dev.state, atol=tol, rtol=0)
+
+    @pytest.mark.filterwarnings("error::numpy.ComplexWarning")
+    @pytest.mark.parametrize("wires", [[0, 1], [1, 0], [2, 0]])
+    def test_broadcasted_state_vector(self, wires, tol):
+        """Test that a broadcasted state vector is prepared on all or a subset of wires."""
+        states = np.array([[1, 0, 0, 0], [0, 1, 1, 0], [1, 1j, 1, -1]])
+        states = states / np.linalg.norm(states, axis=1)[:, None]
+
+        dev = qml.device("default.mixed", wires=3)
+        dev.apply([qml.QubitStateVector(states, wires=wires)])
+        batched_state = dev.state
+
+        assert batched_state.shape == (3, 8, 8)
+        for state, rho in zip(states, batched_state):
+            dev.reset()
+            dev.apply([qml.QubitStateVector(state, wires=wires)])
+            assert np.allclose(rho, dev.state, atol=tol, rtol=0)
+
+    def test_broadcasted_state_vector_not_normalized(self):
+        """Test that the normalization of each state in a batch is checked."""
+        dev = qml.device("default.mixed", wires=1)
+        states = np.array([[1, 0], [1, 1]])
+
+        with pytest.raises(ValueError, match="Sum of amplitudes-squared does not equal one."):
+            dev.apply([qml.QubitStateVector(states, wires=0)])
+
+
+class TestMeasurementsBroadcasted:
+    """Tests that measurements of a broadcasted noisy circuit agree with the measurements
+    of the separate circuits."""
+
+    @pytest.mark.parametrize(
+        "measurement",
+        [
+            lambda: qml.expval(qml.PauliZ(0) @ qml.PauliX(2)),
+            lambda: qml.var(qml.PauliY(2)),
+            lambda: qml.probs(wires=[0, 2]),
+            lambda: qml.density_matrix(wires=[1]),
+            qml.state,
+        ],
+    )
+    def test_single_measurement(self, measurement, tol):
+        """Test that a single measurement of a broadcasted circuit has a leading batch
+        dimension."""
+        dev = qml.device("default.mixed", wires=3)
+
+        @qml.qnode(dev)
+        def circuit(x, y):
+            _noisy_circuit(x, y)
+            return measurement()
+
+        res = circuit(X, 0.4)
+        expected = np.stack([circuit(x, 0.4) for x in X])
+
+        assert dev.num_executions == 1 + len(X)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_multiple_expvals(self, tol):
+        """Test that multiple expectation values of a broadcasted circuit have the batch
+        dimension last, as on default.qubit."""
+        dev = qml.device("default.mixed", wires=3)
+
+        @qml.qnode(dev)
+        def circuit(x, y):
+            _noisy_circuit(x, y)
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliY(2))
+
+        res = circuit(X, 0.4)
+        expected = np.stack([circuit(x, 0.4) for x in X], axis=-1)
+
+        assert res.shape == (2, 3)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize(
+        "measurement",
+        [
+            lambda: qml.vn_entropy(wires=[0]),
+            lambda: qml.mutual_info(wires0=[0], wires1=[2]),
+        ],
+    )
+    def test_entropies(self, measurement, tol):
+        """Test that entropies of a broadcasted circuit, which are computed from a single
+        state, are computed separately for each circuit in the batch."""
+        dev = qml.device("default.mixed", wires=3)
+
+        @qml.qnode(dev)
+        def circuit(x, y):
+            _noisy_circuit(x, y)
+            return measurement()
+
+        res = circuit(X, 0.4)
+        expected = [circuit(x, 0.4) for x in X]
+
+        assert res.shape == (3,)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize(
+        "measurement, expected",
+        [
+            (lambda: qml.vn_entropy(wires=[0]), [0.01746306, 0.23028048, 0.62597766]),
+            (lambda: qml.mutual_info(wires0=[0], wires1=[1]), [0.03492612, 0.46056097, 1.25195532]),
+        ],
+    )
+    def test_entropies_backprop(self, measurement, expected, tol):
+        """Test that entropies of broadcasted pure states are computed with backpropagation."""
+        dev = qml.device("default.mixed", wires=2)
+
+        @qml.qnode(dev, diff_method="backprop")
+        def circuit(x):
+            qml.IsingXX(x, wires=[0, 1])
+            return measurement()
+
+        assert np.allclose(circuit(pnp.array([0.1, 0.5, 1.2])), expected, atol=tol, rtol=0)
+
+    def test_readout_error(self, tol):
+        """Test that the readout error is applied to each state of a broadcasted state."""
+        dev = qml.device("default.mixed", wires=2, readout_prob=0.1)
+
+        @qml.qnode(dev)
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        expected = 0.8 * np.cos(X)
+        assert np.allclose(circuit(X), expected, atol=tol, rtol=0)
+
+    def test_samples(self):
+        """Test that samples of a broadcasted circuit have a leading batch dimension."""
+        dev = qml.device("default.mixed", wires=2, shots=10)
+
+        @qml.qnode(dev)
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.sample(qml.PauliZ(0))
+
+        res = circuit(np.array([0.0, np.pi]))
+
+        assert res.shape == (2, 10)
+        assert np.all(res[0] == 1)
+        assert np.all(res[1] == -1)
+
+    def test_backprop(self, tol):
+        """Test that broadcasted noisy circuits can be differentiated with backpropagation."""
+        dev = qml.device("default.mixed", wires=1)
+
+        @qml.qnode(dev, diff_method="backprop")
+        def circuit(x):
+            qml.RX(x, wires=0)
+            qml.BitFlip(0.1, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        x = pnp.array(X, requires_grad=True)
+        jac = qml.jacobian(circuit)(x)
+
+        assert np.allclose(jac, np.diag(-0.8 * np.sin(X)), atol=tol, rtol=0)
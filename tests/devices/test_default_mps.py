@@ -0,0 +1,249 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the :mod:`pennylane.devices.DefaultMPS` device.
+"""
+# pylint: disable=protected-access
+import pytest
+
+import numpy as np
+import pennylane as qml
+from pennylane import DeviceError
+
+WEIGHTS = np.array([[0.1, 0.7], [1.3, 0.4], [2.1, 0.9], [0.5, 1.7], [0.3, 2.5]])
+
+
+def _block(weights, wires):
+    """Block of the MPS template."""
+    qml.RY(weights[0], wires=wires[0])
+    qml.RX(weights[1], wires=wires[1])
+    qml.CNOT(wires=wires)
+
+
+def _circuit(weights):
+    """Quantum function with gates between neighbouring and distant wires."""
+    qml.BasisState(np.array([1, 0, 1]), wires=[0, 3, 5])
+    qml.MPS(range(6), 2, _block, 2, weights)
+    qml.CRY(0.3, wires=[5, 1])
+    qml.Toffoli(wires=[4, 0, 2])
+    qml.IsingXY(0.4, wires=[3, 0])
+    qml.Hadamard(wires=4)
+
+
+def _ghz(num_wires):
+    """Quantum function preparing a GHZ state with a chain of CNOTs."""
+    qml.Hadamard(wires=0)
+    for wire in range(num_wires - 1):
+        qml.CNOT(wires=[wire, wire + 1])
+
+
+class TestInit:
+    """Tests for the initialization of the device"""
+
+    def test_invalid_max_bond_dim(self):
+        """Test that an error is raised for a bond dimension that is not positive"""
+        with pytest.raises(DeviceError, match="bond dimension must be a positive integer"):
+            qml.device("default.mps", wires=2, max_bond_dim=0)
+
+    def test_invalid_cutoff(self):
+        """Test that an error is raised for a negative cutoff"""
+        with pytest.raises(DeviceError, match="cutoff must be non-negative"):
+            qml.device("default.mps", wires=2, cutoff=-1.0)
+
+    def test_product_state(self):
+        """Test that the device is initialized in the all-zero product state"""
+        dev = qml.device("default.mps", wires=3)
+
+        assert dev.bond_dims == [1, 1]
+        assert np.allclose(dev.state, np.eye(8)[0])
+
+
+class TestApply:
+    """Tests that operations are applied to the matrix product state"""
+
+    def test_agrees_with_default_qubit(self, tol):
+        """Test that the state agrees with default.qubit"""
+
+        def circuit():
+            _circuit(WEIGHTS)
+            return qml.state()
+
+        res = qml.QNode(circuit, qml.device("default.mps", wires=6))()
+        expected = qml.QNode(circuit, qml.device("default.qubit", wires=6))()
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize("wires", [[0, 3], [3, 0], [1, 2], [2, 1]])
+    def test_distant_two_wire_gate(self, wires, tol):
+        """Test that two-wire gates are applied to wires that are not neighbours and keep
+        the order of the wires in the chain"""
+        dev = qml.device("default.mps", wires=4)
+        matrix = qml.matrix(qml.CRot(0.1, 0.2, 0.3, wires=[0, 1])) @ qml.matrix(
+            qml.IsingXY(0.4, wires=[0, 1])
+        )
+        ops = [qml.RY(0.5, wires=i) for i in range(4)] + [qml.QubitUnitary(matrix, wires=wires)]
+        dev.apply(ops)
+
+        expected_dev = qml.device("default.qubit", wires=4)
+        expected_dev.apply(ops)
+
+        assert np.allclose(dev.state, expected_dev.state, atol=tol, rtol=0)
+
+    def test_three_wire_operation_decomposed(self):
+        """Test that operations on more than two wires are decomposed"""
+        dev = qml.device("default.mps", wires=3)
+
+        assert not dev.stopping_condition(qml.Toffoli(wires=[0, 1, 2]))
+        assert not dev.stopping_condition(qml.QubitUnitary(np.eye(8), wires=[0, 1, 2]))
+        assert dev.stopping_condition(qml.QubitUnitary(np.eye(4), wires=[0, 2]))
+
+    def test_three_wire_operation_error(self):
+        """Test that an error is raised if an operation on more than two wires is applied"""
+        dev = qml.device("default.mps", wires=3)
+
+        with pytest.raises(DeviceError, match="acts on more than two wires"):
+            dev.apply([qml.QubitUnitary(np.eye(8), wires=[0, 1, 2])])
+
+    def test_basis_state_after_operations(self):
+        """Test that an error is raised if a basis state is prepared after other operations"""
+        dev = qml.device("default.mps", wires=2)
+
+        with pytest.raises(DeviceError, match="cannot be used after other Operations"):
+            dev.apply([qml.PauliX(wires=0), qml.BasisState(np.array([1]), wires=[1])])
+
+    def test_bond_dims_ghz(self):
+        """Test that the bond dimensions of a GHZ state are two"""
+        dev = qml.device("default.mps", wires=50)
+        qml.QNode(lambda: _ghz(50) or qml.expval(qml.PauliZ(0)), dev)()
+
+        assert dev.bond_dims == [2] * 49
+        assert dev.discarded_weight < 1e-12
+
+    def test_max_bond_dim(self):
+        """Test that the bond dimensions are truncated to the maximum bond dimension, and
+        that the state stays normalized"""
+        dev = qml.device("default.mps", wires=6, max_bond_dim=2)
+        ops = [qml.RY(0.2 * i + 0.5, wires=i) for i in range(6)]
+        ops += [qml.IsingXX(0.3 * i + 0.1, wires=[i, (i + 3) % 6]) for i in range(6)]
+        dev.apply(ops)
+
+        assert max(dev.bond_dims) == 2
+        assert dev.discarded_weight > 0
+        assert np.isclose(np.linalg.norm(dev.state), 1)
+
+        dev.reset()
+        assert dev.bond_dims == [1] * 5
+        assert dev.discarded_weight == 0
+
+
+class TestMeasurements:
+    """Tests for the measurements of the matrix product state"""
+
+    @pytest.mark.parametrize(
+        "measurement",
+        [
+            lambda: qml.expval(qml.PauliZ(1)),
+            lambda: qml.expval(qml.PauliX(0) @ qml.PauliY(4) @ qml.Hadamard(2)),
+            lambda: qml.expval(qml.Hermitian(np.diag([1.0, 2.0, 3.0, 4.0]), wires=[5, 1])),
+            lambda: qml.expval(qml.Projector([1, 0], wires=[2, 4])),
+            lambda: qml.var(qml.PauliZ(1) @ qml.PauliX(3)),
+            lambda: qml.var(qml.Hermitian(np.array([[1, 1j], [-1j, 0]]), wires=3)),
+            lambda: qml.probs(wires=[4, 1]),
+            lambda: qml.probs(wires=[0, 5]),
+        ],
+    )
+    def test_analytic(self, measurement, tol):
+        """Test that analytic measurements agree with default.qubit"""
+
+        def circuit():
+            _circuit(WEIGHTS)
+            return measurement()
+
+        res = qml.QNode(circuit, qml.device("default.mps", wires=6))()
+        expected = qml.QNode(circuit, qml.device("default.qubit", wires=6))()
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_probs_wire_order(self, tol):
+        """Test that marginal probabilities follow the order of the requested wires"""
+
+        def circuit():
+            _circuit(WEIGHTS)
+            return qml.state()
+
+        state = qml.QNode(circuit, qml.device("default.qubit", wires=6))()
+        probs = np.sum(np.abs(np.reshape(state, [2] * 6)) ** 2, axis=(1, 3, 5))
+        expected = np.transpose(probs, [2, 0, 1]).ravel()
+
+        dev = qml.device("default.mps", wires=6)
+        qml.QNode(circuit, dev)()
+
+        assert np.allclose(dev.analytic_probability(wires=[4, 0, 2]), expected, atol=tol, rtol=0)
+
+    @pytest.mark.parametrize(
+        "measurement",
+        [
+            lambda: qml.expval(qml.PauliX(0) @ qml.PauliY(4)),
+            lambda: qml.probs(wires=[1, 5, 2]),
+        ],
+    )
+    def test_samples(self, measurement):
+        """Test that measurements estimated from samples agree with default.qubit"""
+
+        def circuit():
+            _circuit(WEIGHTS)
+            return measurement()
+
+        dev = qml.device("default.mps", wires=6, shots=50000, seed=1234)
+        res = qml.QNode(circuit, dev)()
+        expected = qml.QNode(circuit, qml.device("default.qubit", wires=6))()
+
+        assert np.allclose(res, expected, atol=0.02, rtol=0)
+
+    def test_ghz_many_wires(self):
+        """Test the measurements of a GHZ state on many wires"""
+        dev = qml.device("default.mps", wires=80, shots=20)
+
+        @qml.qnode(dev)
+        def circuit():
+            _ghz(80)
+            return qml.sample()
+
+        samples = circuit()
+        assert samples.shape == (20, 80)
+        assert np.all(np.sum(samples, axis=1) % 80 == 0)
+
+        dev = qml.device("default.mps", wires=80)
+
+        @qml.qnode(dev)
+        def probs():
+            _ghz(80)
+            return qml.probs(wires=[79, 0])
+
+        assert np.allclose(probs(), [0.5, 0, 0, 0.5])
+
+    def test_gradient(self, tol):
+        """Test that the parameter-shift gradient agrees with default.qubit"""
+        weights = qml.numpy.array(WEIGHTS, requires_grad=True)
+
+        def circuit(weights):
+            for i, block_weights in enumerate(weights):
+                _block(block_weights, wires=[i, i + 1])
+            qml.CRZ(weights[0, 0], wires=[5, 1])
+            return qml.expval(qml.PauliZ(5) @ qml.PauliX(2))
+
+        res = qml.grad(qml.QNode(circuit, qml.device("default.mps", wires=6)))(weights)
+        expected = qml.grad(qml.QNode(circuit, qml.device("default.qubit", wires=6)))(weights)
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
@@ -1983,6 +1983,52 @@ class TestDtypePreserved:
         res = circuit(p)
         assert res.dtype == c_dtype
 
+    def test_real_dtype_from_complex_dtype(self, r_dtype, c_dtype):
+        """Test that the real dtype is derived from the complex dtype if it is not provided,
+        and that the initial state is created with the complex dtype"""
+        dev = qml.device("default.qubit", wires=2, c_dtype=c_dtype)
+
+        assert dev.R_DTYPE == r_dtype
+        assert dev._state.dtype == c_dtype
+
+    def test_adjoint_jacobian_dtype(self, r_dtype, c_dtype, tol):
+        """Test that the adjoint method computes the Jacobian in the precision of the device"""
+        dev = qml.device("default.qubit", wires=2, r_dtype=r_dtype, c_dtype=c_dtype)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.543, wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.RY(-0.654, wires=1)
+            qml.expval(qml.PauliZ(1))
+
+        tape.trainable_params = {0, 1}
+        dev.execute(tape)
+        jac = dev.adjoint_jacobian(tape)
+
+        expected = [
+            [-np.sin(0.543) * np.cos(-0.654), -np.cos(0.543) * np.sin(-0.654)],
+        ]
+        assert jac.dtype == r_dtype
+        assert np.allclose(jac, expected, atol=1e-6, rtol=0)
+
+    @pytest.mark.parametrize("sparse", [False, True])
+    def test_hamiltonian_expval_dtype(self, r_dtype, c_dtype, sparse):
+        """Test that Hamiltonian expectation values are computed in the precision of the
+        device"""
+        H = qml.Hamiltonian([0.4, -0.7], [qml.PauliZ(0) @ qml.PauliZ(1), qml.PauliX(1)])
+        obs = qml.SparseHamiltonian(qml.utils.sparse_hamiltonian(H), wires=[0, 1]) if sparse else H
+        dev = qml.device("default.qubit", wires=2, r_dtype=r_dtype, c_dtype=c_dtype)
+
+        @qml.qnode(dev, diff_method="parameter-shift")
+        def circuit(x):
+            qml.RY(x, wires=0)
+            qml.Hadamard(wires=1)
+            return qml.expval(obs)
+
+        res = circuit(0.543)
+        assert res.dtype == r_dtype
+        assert np.isclose(res, -0.7, atol=1e-6, rtol=0)
+
 
 class TestProbabilityIntegration:
     """Test probability method for when analytic is True/False"""
@@ -2546,6 +2592,100 @@ class TestHamiltonianSupport:
         with pytest.raises(AssertionError, match="Hamiltonian must be used with shots=None"):
             dev.expval(H)
 
+    @staticmethod
+    def _random_state(wires, batch_size=None):
+        shape = (2**wires,) if batch_size is None else (batch_size, 2**wires)
+        state = np.random.random(shape) + 1j * np.random.random(shape)
+        return state / np.linalg.norm(state, axis=-1, keepdims=True)
+
+    hamiltonians = [
+        qml.Hamiltonian([0.3], [qml.PauliY(1)]),
+        qml.Hamiltonian(
+            [0.1, -0.2, 0.7, 0.4, 1.1],
+            [
+                qml.PauliX(0) @ qml.PauliY(2),
+                qml.PauliZ(1),
+                qml.PauliY(0) @ qml.PauliY(1) @ qml.PauliZ(2),
+                qml.Identity(0),
+                qml.PauliX(2) @ qml.PauliZ(0),
+            ],
+        ),
+        qml.Hamiltonian([0.5, 0.25], [qml.PauliX("a") @ qml.PauliZ(3), qml.PauliY(3)]),
+    ]
+
+    @pytest.mark.parametrize("H", hamiltonians)
+    @pytest.mark.parametrize("batch_size", [None, 3])
+    def test_pauli_word_expval(self, H, batch_size, mocker, tol):
+        """Tests that the expectation value of a Hamiltonian made of Pauli words is computed
+        without constructing its matrix, and agrees with the dense computation."""
+        wires = [3, "a", 0, 1, 2]
+        dev = qml.device("default.qubit", wires=wires)
+        state = self._random_state(len(wires), batch_size)
+        dev._state = dev._pre_rotated_state = np.reshape(
+            state, state.shape[:-1] + (2,) * len(wires)
+        )
+
+        spy = mocker.spy(qml.utils, "sparse_hamiltonian")
+        res = dev.expval(H)
+        spy.assert_not_called()
+
+        mat = qml.matrix(H, wire_order=wires)
+        expected = np.real(np.einsum("...i,ij,...j->...", np.conj(state), mat, state))
+
+        assert np.shape(res) == np.shape(expected)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_pauli_masks_cached(self, mocker):
+        """Tests that the Pauli word representation is computed once per Hamiltonian."""
+        dev = qml.device("default.qubit", wires=3)
+        H = qml.Hamiltonian([0.1, 0.2], [qml.PauliX(0) @ qml.PauliY(2), qml.PauliZ(1)])
+        spy = mocker.spy(qml.grouping, "observables_to_binary_matrix")
+
+        dev.expval(H)
+        dev.expval(H)
+        assert spy.call_count == 1
+
+    def test_non_pauli_word_expval(self, mocker, tol):
+        """Tests that Hamiltonians with terms that are not Pauli words use the sparse matrix."""
+        dev = qml.device("default.qubit", wires=2)
+        dev.apply([qml.Hadamard(0), qml.CNOT(wires=[0, 1])])
+        H = qml.Hamiltonian(
+            [0.5, 0.2], [qml.PauliX(0) @ qml.PauliX(1), qml.Hermitian(np.eye(2), 1)]
+        )
+
+        spy = mocker.spy(qml.utils, "sparse_hamiltonian")
+        res = dev.expval(H)
+
+        spy.assert_called_once()
+        assert np.allclose(res, 0.7, atol=tol, rtol=0)
+
+    def test_pauli_word_expval_backprop(self, tol):
+        """Tests that the Pauli word expectation value is differentiable with autograd."""
+        dev = qml.device("default.qubit.autograd", wires=2)
+        obs = [qml.PauliX(0) @ qml.PauliZ(1), qml.PauliY(1)]
+
+        def cost(x, coeffs):
+            H = qml.Hamiltonian(coeffs, obs)
+
+            @qml.qnode(dev, diff_method="backprop")
+            def circuit():
+                qml.RY(x, wires=0)
+                qml.RX(x, wires=1)
+                return qml.expval(H)
+
+            return circuit()
+
+        x = np.array(0.4, requires_grad=True)
+        coeffs = np.array([0.3, -0.6], requires_grad=True)
+
+        res = cost(x, coeffs)
+        expected = 0.3 * np.sin(x) * np.cos(x) + 0.6 * np.sin(x)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+        grad_x, grad_coeffs = qml.grad(cost)(x, coeffs)
+        assert np.allclose(grad_x, 0.3 * np.cos(2 * x) + 0.6 * np.cos(x), atol=tol, rtol=0)
+        assert np.allclose(grad_coeffs, [np.sin(x) * np.cos(x), -np.sin(x)], atol=tol, rtol=0)
+
 
 class TestGetBatchSize:
     """Tests for the helper method ``_get_batch_size`` of ``QubitDevice``."""
@@ -2577,3 +2717,179 @@ class TestGetBatchSize:
         dev = qml.device("default.qubit", wires=1)
         with pytest.raises(ValueError, match="could not broadcast"):
             dev._get_batch_size([qml.math.ones((2, 3)), qml.math.ones((2, 2))], (2, 2, 2), 8)
+
+
+class TestGateFusion:
+    """Tests for fusing consecutive gates before applying them to the state"""
+
+    @pytest.mark.parametrize("max_fusion_wires", [0, 4])
+    def test_invalid_max_fusion_wires(self, max_fusion_wires):
+        """Test that an error is raised for an unsupported number of fused wires"""
+        with pytest.raises(DeviceError, match="number of fused wires must be between 1 and 3"):
+            qml.device("default.qubit", wires=2, max_fusion_wires=max_fusion_wires)
+
+    def test_fuse_operations(self):
+        """Test that runs of gates acting on few wires are fused into unitaries"""
+        dev = qml.device("default.qubit", wires=4, max_fusion_wires=2)
+        ops = [
+            qml.RX(0.1, wires=0),
+            qml.RY(0.2, wires=1),
+            qml.CNOT(wires=[0, 1]),
+            qml.RZ(0.3, wires=2),
+            qml.Toffoli(wires=[0, 1, 2]),
+            qml.Hadamard(wires=3),
+        ]
+
+        fused = dev._fuse_operations(ops)
+
+        assert len(fused) == 4
+        assert isinstance(fused[0], qml.QubitUnitary)
+        assert fused[0].wires == Wires([0, 1])
+        assert fused[1] is ops[3]
+        assert fused[2] is ops[4]
+        assert fused[3] is ops[5]
+
+        expected = qml.matrix(qml.CNOT(wires=[0, 1])) @ np.kron(
+            qml.matrix(qml.RX(0.1, wires=0)), qml.matrix(qml.RY(0.2, wires=1))
+        )
+        assert np.allclose(fused[0].matrix(), expected)
+
+    def test_broadcasted_and_state_preparation_not_fused(self):
+        """Test that broadcasted operations and state preparations interrupt fusion"""
+        dev = qml.device("default.qubit", wires=2, max_fusion_wires=3)
+        ops = [
+            qml.BasisState(np.array([1, 0]), wires=[0, 1]),
+            qml.RX(0.1, wires=0),
+            qml.RX(np.array([0.1, 0.2]), wires=1),
+            qml.RY(0.3, wires=0),
+        ]
+
+        assert dev._fuse_operations(ops) == ops
+
+    @pytest.mark.parametrize("max_fusion_wires", [1, 2, 3])
+    def test_fused_state(self, max_fusion_wires, mocker, tol):
+        """Test that fusing gates does not change the resulting state"""
+        weights = np.random.random(qml.StronglyEntanglingLayers.shape(n_layers=2, n_wires=4))
+
+        def circuit():
+            qml.BasisState(np.array([1, 0, 1, 0]), wires=range(4))
+            qml.StronglyEntanglingLayers(weights, wires=range(4))
+            qml.Toffoli(wires=[3, 0, 2])
+            qml.QFT(wires=range(4))
+            return qml.expval(qml.PauliX(0) @ qml.PauliY(2))
+
+        dev = qml.device("default.qubit", wires=4)
+        fused_dev = qml.device("default.qubit", wires=4, max_fusion_wires=max_fusion_wires)
+
+        spy = mocker.spy(DefaultQubit, "_fuse_operations")
+        expected = qml.QNode(circuit, dev, diff_method="parameter-shift")()
+        assert spy.call_count == 0
+
+        res = qml.QNode(circuit, fused_dev, diff_method="parameter-shift")()
+        assert spy.call_count == 2
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert np.allclose(fused_dev.state, dev.state, atol=tol, rtol=0)
+
+
+class TestInplaceUpdates:
+    """Tests for updating the state of the device in place while a circuit is applied"""
+
+    @pytest.mark.parametrize(
+        "op",
+        [
+            qml.PauliX(wires=1),
+            qml.PauliY(wires=3),
+            qml.PauliZ(wires=0),
+            qml.S(wires=2),
+            qml.T(wires=1).inv(),
+            qml.Hadamard(wires=0),
+            qml.SX(wires=3),
+            qml.CNOT(wires=[2, 0]),
+            qml.CZ(wires=[1, 3]),
+            qml.Toffoli(wires=[3, 0, 1]),
+            qml.SWAP(wires=[0, 2]),
+            qml.RX(0.4, wires=2),
+            qml.CRY(0.5, wires=[3, 1]),
+            qml.IsingXY(0.6, wires=[2, 0]),
+            qml.ControlledPhaseShift(0.7, wires=[3, 0]),
+            qml.MultiRZ(0.8, wires=[2, 0, 3]),
+            qml.QubitUnitary(qml.matrix(qml.QFT(wires=[0, 1, 2])), wires=[1, 3, 0]),
+        ],
+    )
+    @pytest.mark.parametrize("c_dtype", [np.complex64, np.complex128])
+    def test_agrees_with_allocating_path(self, op, c_dtype, tol):
+        """Test that operations applied in place give the same state as when new arrays
+        are allocated"""
+        state = np.random.random(16) + 1j * np.random.random(16)
+        state /= np.linalg.norm(state)
+        ops = [qml.QubitStateVector(state, wires=range(4)), qml.RY(0.3, wires=1), op]
+
+        dev = qml.device("default.qubit", wires=4, c_dtype=c_dtype)
+        dev.apply(ops)
+
+        expected_dev = qml.device("default.qubit", wires=4, c_dtype=c_dtype)
+        expected_dev._inplace_updates = False
+        expected_dev.apply(ops)
+
+        assert dev.state.dtype == c_dtype
+        assert np.allclose(dev.state, expected_dev.state, atol=1e-6, rtol=0)
+
+    def test_broadcasted_state(self, tol):
+        """Test that operations are applied in place to a broadcasted state"""
+        ops = [qml.RX(np.array([0.1, 0.2, 0.3]), wires=0), qml.CNOT(wires=[0, 1]), qml.S(wires=1)]
+        ops += [qml.Hadamard(wires=1), qml.PhaseShift(0.4, wires=0)]
+
+        dev = qml.device("default.qubit", wires=2)
+        dev.apply(ops)
+
+        expected_dev = qml.device("default.qubit", wires=2)
+        expected_dev._inplace_updates = False
+        expected_dev.apply(ops)
+
+        assert np.allclose(dev.state, expected_dev.state, atol=tol, rtol=0)
+
+    def test_no_allocations(self, mocker):
+        """Test that applying a circuit only uses the state and a single scratch buffer"""
+        dev = qml.device("default.qubit", wires=4)
+        spy = mocker.spy(dev, "_apply_operation")
+        ops = [qml.Hadamard(wires=i) for i in range(4)]
+        ops += [qml.CNOT(wires=[0, 2]), qml.RZ(0.1, wires=3), qml.Toffoli(wires=[1, 2, 3])]
+        ops += [qml.CRX(0.3, wires=[3, 0]), qml.PauliY(wires=2), qml.IsingZZ(0.2, wires=[1, 0])]
+
+        dev.apply(ops)
+
+        buffers = {state.__array_interface__["data"][0] for state in spy.spy_return_list}
+        assert len(buffers) == 2
+
+    def test_input_state_not_modified(self):
+        """Test that the state passed to QubitStateVector is not modified"""
+        state = np.array([1, 0, 0, 1j]) / np.sqrt(2)
+        original = state.copy()
+
+        dev = qml.device("default.qubit", wires=2)
+        dev.apply([qml.QubitStateVector(state, wires=[0, 1]), qml.PauliX(wires=0)])
+
+        assert np.allclose(state, original)
+
+    def test_previous_state_not_modified(self):
+        """Test that applying operations does not modify a state returned earlier"""
+        dev = qml.device("default.qubit", wires=2)
+        dev.apply([qml.Hadamard(wires=0)])
+        state = dev.state
+        original = state.copy()
+
+        dev.apply([qml.CNOT(wires=[0, 1]), qml.PauliZ(wires=0)])
+
+        assert np.allclose(state, original)
+        assert not np.allclose(dev.state, original)
+
+    def test_pre_rotated_state_not_modified(self, tol):
+        """Test that rotations do not modify the pre-rotated state"""
+        dev = qml.device("default.qubit", wires=1)
+        dev.apply([qml.RY(0.3, wires=0)], rotations=[qml.Hadamard(wires=0)])
+
+        expected = [np.cos(0.15), np.sin(0.15)]
+        assert np.allclose(dev.state, expected, atol=tol, rtol=0)
+        assert np.allclose(dev._state, qml.matrix(qml.Hadamard(0)) @ expected, atol=tol, rtol=0)
+        assert dev._scratch is None
@@ -257,6 +257,38 @@ class TestDtypePreserved:
         res = circuit(p)
         assert res.dtype == c_dtype
 
+    @pytest.mark.parametrize(
+        "c_dtype, r_dtype", [(np.complex64, np.float32), (np.complex128, np.float64)]
+    )
+    def test_complex_dtype_argument(self, c_dtype, r_dtype):
+        """Test that the complex data type passed to the device determines the data types
+        of the state and of real-valued results"""
+        dev = qml.device("default.qubit.autograd", wires=2, c_dtype=c_dtype)
+
+        assert dev.C_DTYPE == c_dtype
+        assert dev.R_DTYPE == r_dtype
+        assert dev._state.dtype == c_dtype
+
+    def test_single_precision_backprop_device(self, tol):
+        """Test that backpropagation with a single-precision default.qubit device
+        uses a single-precision passthru device"""
+        dev = qml.device("default.qubit", wires=2, c_dtype=np.complex64)
+
+        @qml.qnode(dev, diff_method="backprop")
+        def circuit(x):
+            qml.RX(x, wires=0)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(1))
+
+        x = np.array(0.543, requires_grad=True)
+        res = circuit(x)
+
+        assert circuit.device.short_name == "default.qubit.autograd"
+        assert circuit.device.C_DTYPE == np.complex64
+        assert res.dtype == np.float32
+        assert np.isclose(res, np.cos(0.543), atol=tol, rtol=0)
+        assert np.isclose(qml.grad(circuit)(x), -np.sin(0.543), atol=tol, rtol=0)
+
 
 @pytest.mark.autograd
 class TestPassthruIntegration:
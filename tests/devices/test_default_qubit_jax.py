@@ -91,6 +91,14 @@ class TestQNodeIntegration:
         assert dev.state.dtype == c_dtype
         assert dev.state.real.dtype == r_dtype
 
+    def test_complex_dtype_argument(self):
+        """Test that a complex data type passed to the device takes precedence over the
+        float precision of the jax config."""
+        config.update("jax_enable_x64", True)
+        dev = qml.device("default.qubit.jax", wires=2, c_dtype=np.complex64)
+        assert dev.state.dtype == np.complex64
+        assert dev.R_DTYPE == jnp.float32
+
     def test_qubit_circuit(self, tol):
         """Test that the device provides the correct
         result for a simple circuit."""
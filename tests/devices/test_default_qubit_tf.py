@@ -276,6 +276,16 @@ class TestTFMatrix:
 class TestApply:
     """Test application of PennyLane operations."""
 
+    @pytest.mark.parametrize("c_dtype", [tf.complex64, np.complex64])
+    def test_complex_dtype_argument(self, c_dtype):
+        """Test that the complex data type passed to the device, as a TensorFlow or NumPy
+        data type, determines the data types of the state and of real-valued results"""
+        dev = DefaultQubitTF(wires=2, c_dtype=c_dtype)
+
+        assert dev.C_DTYPE == tf.complex64
+        assert dev.R_DTYPE == tf.float32
+        assert dev.state.dtype == tf.complex64
+
     def test_basis_state(self, tol):
         """Test basis state initialization"""
         dev = DefaultQubitTF(wires=4)
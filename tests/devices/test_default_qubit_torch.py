@@ -230,6 +230,16 @@ class TestApply:
             rtol=0,
         )
 
+    @pytest.mark.parametrize("c_dtype", [torch.complex64, np.complex64])
+    def test_complex_dtype_argument(self, torch_device, c_dtype):
+        """Test that the complex data type passed to the device, as a torch or NumPy data
+        type, determines the data types of the state and of real-valued results"""
+        dev = DefaultQubitTorch(wires=2, torch_device=torch_device, c_dtype=c_dtype)
+
+        assert dev.C_DTYPE == torch.complex64
+        assert dev.R_DTYPE == torch.float32
+        assert dev.state.dtype == torch.complex64
+
     def test_basis_state(self, device, torch_device, tol):
         """Test basis state initialization"""
 
@@ -0,0 +1,214 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Unit tests for the :mod:`pennylane.devices.DefaultTrajectory` device.
+"""
+# pylint: disable=protected-access
+import pytest
+
+import numpy as np
+import pennylane as qml
+from pennylane import DeviceError
+from pennylane.devices import DefaultTrajectory
+
+
+def _noisy_circuit():
+    """Quantum function with gates interleaved with noise channels."""
+    qml.Hadamard(wires=0)
+    qml.RX(0.4, wires=1)
+    qml.DepolarizingChannel(0.2, wires=0)
+    qml.CNOT(wires=[0, 1])
+    qml.AmplitudeDamping(0.3, wires=1)
+    qml.CRY(0.7, wires=[1, 2])
+    qml.PhaseDamping(0.4, wires=0)
+    qml.RY(0.5, wires=0)
+    qml.BitFlip(0.1, wires=2)
+
+
+class TestInit:
+    """Tests for the initialization of the device"""
+
+    def test_analytic_not_supported(self):
+        """Test that an error is raised if no shots are given"""
+        with pytest.raises(DeviceError, match="requires a finite number of shots"):
+            qml.device("default.trajectory", wires=1, shots=None)
+
+    def test_invalid_batch_size(self):
+        """Test that an error is raised for a batch size that is not positive"""
+        with pytest.raises(DeviceError, match="batch size must be a positive integer"):
+            qml.device("default.trajectory", wires=1, trajectory_batch_size=0)
+
+    def test_default_batch_size(self):
+        """Test that the default batch size limits the number of amplitudes of a batch"""
+        assert qml.device("default.trajectory", wires=20).trajectory_batch_size == 4
+        assert qml.device("default.trajectory", wires=24).trajectory_batch_size == 1
+
+    def test_capabilities(self):
+        """Test that the device does not support analytic computation, broadcasting,
+        or backpropagation"""
+        capabilities = DefaultTrajectory.capabilities()
+
+        assert not capabilities["supports_analytic_computation"]
+        assert not capabilities["supports_broadcasting"]
+        assert not capabilities["returns_state"]
+        assert capabilities["passthru_devices"] == {}
+
+
+class TestApplyChannel:
+    """Tests for sampling the Kraus operators of channels for each trajectory"""
+
+    def test_trajectories_split_at_first_channel(self):
+        """Test that the state is only broadcasted over trajectories once a channel is
+        applied"""
+        dev = qml.device("default.trajectory", wires=2, shots=10)
+        dev._num_trajectories = 10
+
+        state = dev._apply_operation(dev._state, qml.Hadamard(wires=0))
+        assert state.shape == (2, 2)
+
+        state = dev._apply_operation(state, qml.BitFlip(0.5, wires=1))
+        assert state.shape == (10, 2, 2)
+
+    @pytest.mark.parametrize("channel", [qml.BitFlip, qml.AmplitudeDamping, qml.PhaseDamping])
+    def test_trajectories_normalized(self, channel, tol):
+        """Test that each trajectory is normalized after applying a channel"""
+        dev = qml.device("default.trajectory", wires=2, shots=100, seed=42)
+        dev._num_trajectories = 100
+        state = dev._apply_operation(dev._state, qml.Hadamard(wires=1))
+
+        state = dev._apply_operation(state, channel(0.4, wires=1))
+
+        norms = np.sum(np.abs(np.reshape(state, (100, 4))) ** 2, axis=1)
+        assert np.allclose(norms, 1, atol=tol, rtol=0)
+
+    def test_state_dependent_probabilities(self, tol):
+        """Test that Kraus operators are sampled with state-dependent probabilities"""
+        dev = qml.device("default.trajectory", wires=2, shots=100, seed=42)
+        dev._num_trajectories = 100
+        state = dev._apply_operation(dev._state, qml.PauliX(wires=1))
+
+        state = dev._apply_operation(state, qml.AmplitudeDamping(1.0, wires=1))
+
+        expected = np.array([[1, 0], [0, 0]])
+        assert np.allclose(state, expected, atol=tol, rtol=0)
+
+    def test_identity_kraus_operator_skipped(self, mocker):
+        """Test that Kraus operators proportional to the identity are not applied"""
+        dev = qml.device("default.trajectory", wires=1, shots=10, seed=42)
+        dev._num_trajectories = 10
+        spy = mocker.spy(dev, "_apply_kraus")
+
+        state = dev._apply_operation(dev._state, qml.DepolarizingChannel(0.0, wires=0))
+
+        spy.assert_not_called()
+        assert np.allclose(state, [[1, 0]] * 10)
+
+
+class TestStatistics:
+    """Tests that the statistics of the trajectories agree with the noisy circuit"""
+
+    @pytest.mark.parametrize("trajectory_batch_size", [None, 3000, 7000])
+    @pytest.mark.parametrize(
+        "measurement",
+        [
+            lambda: qml.expval(qml.PauliZ(0) @ qml.PauliX(2)),
+            lambda: qml.expval(qml.PauliY(1)),
+            lambda: qml.var(qml.PauliX(0)),
+            lambda: qml.probs(wires=[0, 1, 2]),
+        ],
+    )
+    def test_agrees_with_default_mixed(self, measurement, trajectory_batch_size):
+        """Test that measurements of a noisy circuit agree with default.mixed"""
+
+        def circuit():
+            _noisy_circuit()
+            return measurement()
+
+        dev = qml.device(
+            "default.trajectory",
+            wires=3,
+            shots=20000,
+            seed=1234,
+            trajectory_batch_size=trajectory_batch_size,
+        )
+        res = qml.QNode(circuit, dev)()
+        expected = qml.QNode(circuit, qml.device("default.mixed", wires=3))()
+
+        assert np.allclose(res, expected, atol=0.03, rtol=0)
+
+    def test_multi_wire_channel(self):
+        """Test that channels acting on more than two wires are applied"""
+        kraus = [np.sqrt(0.7) * np.eye(8), np.sqrt(0.3) * qml.matrix(qml.Toffoli(wires=[0, 1, 2]))]
+
+        def circuit():
+            qml.Hadamard(wires=0)
+            qml.Hadamard(wires=1)
+            qml.QubitChannel(kraus, wires=[0, 1, 2])
+            return qml.probs(wires=[0, 1, 2])
+
+        dev = qml.device("default.trajectory", wires=3, shots=20000, seed=1234)
+        res = qml.QNode(circuit, dev)()
+        expected = qml.QNode(circuit, qml.device("default.mixed", wires=3))()
+
+        assert np.allclose(res, expected, atol=0.03, rtol=0)
+
+    def test_noiseless_circuit(self):
+        """Test that a circuit without channels is sampled from a single state"""
+        dev = qml.device("default.trajectory", wires=2, shots=10)
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.PauliX(wires=0)
+            return qml.sample()
+
+        res = circuit()
+        assert res.shape == (10, 2)
+        assert np.all(res == [1, 0])
+        assert dev._state.shape == (2, 2)
+
+    def test_samples(self):
+        """Test that one sample is drawn from each trajectory"""
+        dev = qml.device("default.trajectory", wires=1, shots=10, trajectory_batch_size=3)
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.PauliX(wires=0)
+            qml.AmplitudeDamping(1.0, wires=0)
+            return qml.sample(qml.PauliZ(0))
+
+        assert np.all(circuit() == np.ones(10))
+
+    def test_shot_vector(self):
+        """Test that a shot vector splits the samples of the trajectories"""
+        dev = qml.device("default.trajectory", wires=1, shots=[10, (5, 2)])
+
+        @qml.qnode(dev)
+        def circuit():
+            qml.BitFlip(0.3, wires=0)
+            return qml.sample(qml.PauliZ(0))
+
+        res = circuit()
+        assert [len(r) for r in res] == [10, 5, 5]
+
+    def test_seed(self):
+        """Test that the trajectories are reproducible with a seed"""
+
+        def circuit():
+            _noisy_circuit()
+            return qml.sample()
+
+        res1 = qml.QNode(circuit, qml.device("default.trajectory", wires=3, shots=50, seed=7))()
+        res2 = qml.QNode(circuit, qml.device("default.trajectory", wires=3, shots=50, seed=7))()
+
+        assert np.all(res1 == res2)
@@ -173,6 +173,80 @@ class TestAutogradExecuteUnitTests:
         qml.jacobian(cost)(a)
         spy_gradients.assert_called()
 
+    def test_device_vjp(self, mocker):
+        """Test that device VJPs use the `device.vjps` pathway, with a single adjoint backward
+        pass for all measurements, instead of computing the Jacobian"""
+        dev = qml.device("default.qubit", wires=3)
+        spy_vjps = mocker.spy(qml.devices.DefaultQubit, "vjps")
+        spy_backward = mocker.spy(qml.devices.DefaultQubit, "_adjoint_backward")
+        spy_jacobian = mocker.spy(qml.devices.DefaultQubit, "adjoint_jacobian")
+
+        def cost(a, **kwargs):
+            with qml.tape.QuantumTape() as tape:
+                qml.RY(a[0], wires=0)
+                qml.RX(a[1], wires=1)
+                qml.CNOT(wires=[0, 1])
+                qml.CRY(a[0], wires=[1, 2])
+                qml.expval(qml.PauliZ(0))
+                qml.expval(qml.PauliY(1))
+                qml.expval(qml.PauliX(2))
+
+            res = execute(
+                [tape],
+                dev,
+                gradient_fn="device",
+                gradient_kwargs={"method": "adjoint_jacobian"},
+                **kwargs,
+            )[0]
+            return np.sum(np.sin(res))
+
+        a = np.array([0.1, 0.2], requires_grad=True)
+        res = qml.grad(cost)(a, device_vjp=True)
+
+        spy_vjps.assert_called_once()
+        spy_jacobian.assert_not_called()
+        assert spy_backward.call_count == 1
+        assert spy_backward.call_args[0][3].shape[0] == 1
+
+        expected = qml.grad(cost)(a, mode="forward")
+        assert np.allclose(res, expected, atol=1e-7, rtol=0)
+
+    def test_device_vjp_forward_mode_error(self):
+        """Test that an error is raised if device VJPs are requested in forward mode"""
+        dev = qml.device("default.qubit", wires=1)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(np.array(0.1, requires_grad=True), wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        with pytest.raises(ValueError, match="cannot be used with mode='forward'"):
+            execute(
+                [tape],
+                dev,
+                gradient_fn="device",
+                mode="forward",
+                gradient_kwargs={"method": "adjoint_jacobian"},
+                device_vjp=True,
+            )
+
+    def test_device_vjp_unsupported_method_error(self):
+        """Test that an error is raised if device VJPs are requested for a gradient method
+        without vector-Jacobian products"""
+        dev = qml.device("default.mixed", wires=1)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(np.array(0.1, requires_grad=True), wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        with pytest.raises(ValueError, match="does not support vector-Jacobian products"):
+            execute(
+                [tape],
+                dev,
+                gradient_fn="device",
+                gradient_kwargs={"method": "jacobian"},
+                device_vjp=True,
+            )
+
 
 class TestBatchTransformExecution:
     """Tests to ensure batch transforms can be correctly executed
@@ -248,6 +322,42 @@ class TestCaching:
         cache = spy.call_args[0][1]
         assert cache is custom_cache
 
+    def test_custom_cache_minimal_interface(self):
+        """Test that a custom cache only needs to implement item access, assignment
+        and deletion"""
+        dev = qml.device("default.qubit", wires=1)
+
+        class MinimalCache:
+            """Cache implementing only __getitem__, __setitem__ and __delitem__"""
+
+            def __init__(self):
+                self._data = {}
+
+            def __getitem__(self, key):
+                return self._data[key]
+
+            def __setitem__(self, key, value):
+                self._data[key] = value
+
+            def __delitem__(self, key):
+                del self._data[key]
+
+        def cost(a, cache):
+            with qml.tape.QuantumTape() as tape:
+                qml.RY(a[0], wires=0)
+                qml.RX(a[1], wires=0)
+                qml.probs(wires=0)
+
+            return execute([tape], dev, gradient_fn=param_shift, cache=cache)[0]
+
+        custom_cache = MinimalCache()
+        params = np.array([0.1, 0.2])
+        expected = qml.jacobian(cost)(params, cache=None)
+        res = qml.jacobian(cost)(params, cache=custom_cache)
+
+        assert len(custom_cache._data) > 0
+        assert np.allclose(res, expected)
+
     def test_caching_param_shift(self, tol):
         """Test that, when using parameter-shift transform,
         caching reduces the number of evaluations to their optimum."""
@@ -403,6 +513,12 @@ execute_kwargs = [
         "mode": "backward",
         "gradient_kwargs": {"method": "adjoint_jacobian"},
     },
+    {
+        "gradient_fn": "device",
+        "mode": "backward",
+        "device_vjp": True,
+        "gradient_kwargs": {"method": "adjoint_jacobian"},
+    },
 ]
 
 
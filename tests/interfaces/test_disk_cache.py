@@ -0,0 +1,319 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for the persistent disk cache"""
+import pickle
+
+import numpy as onp
+import pytest
+
+import pennylane as qml
+from pennylane import numpy as np
+from pennylane.gradients import param_shift
+from pennylane.interfaces import DiskCache
+
+
+def _tape(x, wire=0):
+    with qml.tape.QuantumTape() as tape:
+        qml.RX(x, wires=wire)
+        qml.CNOT(wires=[0, 1])
+        qml.expval(qml.PauliZ(1))
+
+    return tape
+
+
+class TestDiskCacheMapping:
+    """Tests for the mapping interface of the disk cache"""
+
+    def test_set_get_delete(self, tmp_path):
+        """Test that results can be stored, retrieved and deleted"""
+        cache = DiskCache(tmp_path / "cache.db")
+        cache["a"] = onp.array([0.1, 0.2])
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert len(cache) == 1
+        assert list(cache) == ["a"]
+        assert onp.allclose(cache["a"], [0.1, 0.2])
+
+        del cache["a"]
+        assert "a" not in cache
+        assert len(cache) == 0
+
+        with pytest.raises(KeyError):
+            cache["a"]  # pylint: disable=pointless-statement
+
+        with pytest.raises(KeyError):
+            del cache["a"]
+
+    def test_persistence(self, tmp_path):
+        """Test that results are available to a new cache instance with the same path"""
+        cache = DiskCache(tmp_path / "cache.db")
+        cache["a"] = onp.array(0.5)
+        cache.close()
+
+        new_cache = DiskCache(tmp_path / "cache.db")
+        assert onp.allclose(new_cache["a"], 0.5)
+
+    def test_eviction(self, tmp_path):
+        """Test that the least recently used results are evicted once the
+        total size exceeds the maximum size"""
+        value = onp.zeros(10)
+        size = len(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+        cache = DiskCache(tmp_path / "cache.db", maxsize=2 * size)
+        cache["a"] = value
+        cache["b"] = value
+
+        # access "a" so that "b" is the least recently used
+        cache["a"]  # pylint: disable=pointless-statement
+        cache["c"] = value
+
+        assert set(cache) == {"a", "c"}
+        assert cache.currsize == 2 * size
+
+    def test_read_does_not_write(self, tmp_path):
+        """Test that reading a result does not start a write transaction, and that its
+        access time is stored with the next write"""
+        cache = DiskCache(tmp_path / "cache.db")
+        cache["a"] = onp.array(0.5)
+        conn = cache._db.connection
+
+        total_changes = conn.total_changes
+        cache["a"]  # pylint: disable=pointless-statement
+        assert conn.total_changes == total_changes
+        assert "a" in cache._db.accessed
+
+        cache["b"] = onp.array(0.5)
+        assert cache._db.accessed == {}
+
+    def test_oversized_result_not_stored(self, tmp_path):
+        """Test that a result larger than the cache is not stored"""
+        cache = DiskCache(tmp_path / "cache.db", maxsize=10)
+        cache["a"] = onp.zeros(100)
+        assert len(cache) == 0
+
+    def test_traced_result_not_stored(self, tmp_path):
+        """Test that results carrying autodifferentiation information are not stored"""
+        cache = DiskCache(tmp_path / "cache.db")
+
+        def f(x):
+            cache["a"] = x
+            return x
+
+        qml.grad(f)(np.array(0.5, requires_grad=True))
+        assert len(cache) == 0
+
+    def test_pickle(self, tmp_path):
+        """Test that the cache can be pickled, for example to be sent to another process"""
+        cache = DiskCache(tmp_path / "cache.db")
+        cache["a"] = onp.array(0.5)
+
+        new_cache = pickle.loads(pickle.dumps(cache))
+        assert onp.allclose(new_cache["a"], 0.5)
+
+
+class TestDiskCacheKeys:
+    """Tests for the keys generated for tapes"""
+
+    def test_key_depends_on_tape(self, tmp_path):
+        """Test that tapes differing in parameters or wires have different keys"""
+        cache = DiskCache(tmp_path / "cache.db")
+
+        assert cache.tape_key(_tape(0.1)) == cache.tape_key(_tape(0.1))
+        assert cache.tape_key(_tape(0.1)) != cache.tape_key(_tape(0.2))
+        assert cache.tape_key(_tape(0.1)) != cache.tape_key(_tape(0.1, wire=1))
+
+    def test_key_exact_parameters(self, tmp_path):
+        """Test that keys distinguish parameters differing beyond the print precision,
+        and large parameters whose string representations are truncated"""
+        cache = DiskCache(tmp_path / "cache.db")
+
+        assert cache.tape_key(_tape(0.1)) != cache.tape_key(_tape(0.1 + 1e-12))
+
+        def state_tape(state):
+            with qml.tape.QuantumTape() as tape:
+                qml.QubitStateVector(state, wires=range(11))
+                qml.expval(qml.PauliZ(0))
+
+            return tape
+
+        state = onp.ones(2**11) / onp.sqrt(2**11)
+        other_state = state.copy()
+        other_state[[500, 501]] = other_state[[501, 500]] * [onp.sqrt(2), 0]
+
+        assert cache.tape_key(state_tape(state)) == cache.tape_key(state_tape(state.copy()))
+        assert cache.tape_key(state_tape(state)) != cache.tape_key(state_tape(other_state))
+
+    @pytest.mark.parametrize(
+        "obs1, obs2",
+        [
+            (
+                qml.Hamiltonian([1.0, 2.0], [qml.PauliZ(0), qml.PauliX(1)]),
+                qml.Hamiltonian([1.0, 2.0], [qml.PauliZ(0), qml.PauliY(1)]),
+            ),
+            (qml.PauliZ(0) @ qml.PauliX(1), qml.PauliZ(0) @ qml.PauliY(1)),
+        ],
+    )
+    def test_key_depends_on_observable_terms(self, obs1, obs2, tmp_path):
+        """Test that the terms of Hamiltonians and tensor products are part of the key"""
+        cache = DiskCache(tmp_path / "cache.db")
+
+        def obs_tape(obs):
+            with qml.tape.QuantumTape() as tape:
+                qml.RX(0.1, wires=0)
+                qml.expval(obs)
+
+            return tape
+
+        assert cache.tape_key(obs_tape(obs1)) != cache.tape_key(obs_tape(obs2))
+
+    def test_key_depends_on_device(self, tmp_path):
+        """Test that binding to devices with different configurations changes the keys"""
+        cache = DiskCache(tmp_path / "cache.db")
+        tape = _tape(0.1)
+
+        dev = qml.device("default.qubit", wires=2)
+        key = cache.bind(dev).tape_key(tape)
+
+        assert key == cache.bind(qml.device("default.qubit", wires=2)).tape_key(tape)
+        assert key != cache.bind(qml.device("default.qubit", wires=[0, 1, 2])).tape_key(tape)
+        assert key != cache.bind(qml.device("default.mixed", wires=2)).tape_key(tape)
+        assert key != cache.bind(dev, shots=100).tape_key(tape)
+
+    def test_key_depends_on_device_settings(self, tmp_path):
+        """Test that binding to devices of the same name and wires, but with different
+        settings, changes the keys, while executing the device does not"""
+        cache = DiskCache(tmp_path / "cache.db")
+        tape = _tape(0.1)
+
+        dev = qml.device("default.mixed", wires=2, readout_prob=0.1)
+        key = cache.bind(dev).tape_key(tape)
+
+        assert key == cache.bind(qml.device("default.mixed", wires=2, readout_prob=0.1)).tape_key(
+            tape
+        )
+        assert key != cache.bind(qml.device("default.mixed", wires=2, readout_prob=0.2)).tape_key(
+            tape
+        )
+        assert key != cache.bind(qml.device("default.mixed", wires=2)).tape_key(tape)
+
+        qml.execute([tape], dev, gradient_fn=None)
+        assert key == cache.bind(dev).tape_key(tape)
+
+        single = qml.device("default.qubit", wires=2, c_dtype=onp.complex64)
+        double = qml.device("default.qubit", wires=2)
+        assert cache.bind(single).tape_key(tape) != cache.bind(double).tape_key(tape)
+
+    def test_key_uses_device_fingerprint(self, tmp_path):
+        """Test that devices can provide the fingerprint of their configuration"""
+        cache = DiskCache(tmp_path / "cache.db")
+        tape = _tape(0.1)
+
+        class FingerprintDevice(qml.devices.DefaultQubit):
+            """Device providing the fingerprint of its configuration"""
+
+            def __init__(self, *args, setting=0, **kwargs):
+                super().__init__(*args, **kwargs)
+                self._setting = [setting]
+
+            def cache_fingerprint(self):
+                return tuple(self._setting)
+
+        key = cache.bind(FingerprintDevice(wires=2)).tape_key(tape)
+        assert key == cache.bind(FingerprintDevice(wires=2)).tape_key(tape)
+        assert key != cache.bind(FingerprintDevice(wires=2, setting=1)).tape_key(tape)
+
+    def test_bound_views_share_database(self, tmp_path):
+        """Test that views returned by bind read and write the same database"""
+        cache = DiskCache(tmp_path / "cache.db")
+        view = cache.bind(qml.device("default.qubit", wires=2))
+        view["a"] = onp.array(0.5)
+
+        assert "a" in cache
+
+
+class TestDiskCacheExecution:
+    """Tests for executing tapes with a disk cache"""
+
+    def test_execute_uses_cache(self, tmp_path):
+        """Test that tapes stored by one execution are not re-executed by a later
+        execution with a new cache instance"""
+        dev = qml.device("default.qubit", wires=2)
+
+        cache = DiskCache(tmp_path / "cache.db")
+        res = qml.execute([_tape(0.5)], dev, gradient_fn=param_shift, cache=cache)
+        assert len(cache) == 1
+
+        new_cache = DiskCache(tmp_path / "cache.db")
+
+        with qml.Tracker(dev) as tracker:
+            new_res = qml.execute([_tape(0.5)], dev, gradient_fn=param_shift, cache=new_cache)
+
+        assert tracker.totals == {}
+        assert onp.allclose(new_res, res)
+        assert onp.allclose(new_res[0], onp.cos(0.5))
+
+    def test_gradient_uses_cache(self, tmp_path):
+        """Test that gradient tapes are stored in, and retrieved from, the cache"""
+        dev = qml.device("default.qubit", wires=2)
+        cache = DiskCache(tmp_path / "cache.db")
+
+        def cost(x):
+            return qml.execute([_tape(x)], dev, gradient_fn=param_shift, cache=cache)[0]
+
+        x = np.array(0.5, requires_grad=True)
+        expected = qml.grad(cost)(x)
+        assert len(cache) == 3
+
+        with qml.Tracker(dev) as tracker:
+            res = qml.grad(cost)(x)
+
+        assert tracker.totals == {}
+        assert np.allclose(res, expected)
+        assert np.allclose(res, -np.sin(0.5))
+
+    def test_device_settings_not_shared(self, tmp_path):
+        """Test that results of devices with different settings are not shared"""
+        cache = DiskCache(tmp_path / "cache.db")
+        tape = _tape(0.5)
+
+        noiseless = qml.device("default.mixed", wires=2)
+        noisy = qml.device("default.mixed", wires=2, readout_prob=0.1)
+
+        res1 = qml.execute([tape], noiseless, gradient_fn=None, cache=cache)
+        res2 = qml.execute([tape], noisy, gradient_fn=None, cache=cache)
+
+        assert len(cache) == 2
+        assert onp.allclose(res1[0], onp.cos(0.5))
+        assert onp.allclose(res2[0], 0.8 * onp.cos(0.5))
+
+    def test_entry_evicted_after_lookup(self, tmp_path):
+        """Test that an entry evicted by another process between looking up a tape and
+        reading its result is executed instead of raising an error"""
+        dev = qml.device("default.qubit", wires=2)
+        cache = DiskCache(tmp_path / "cache.db")
+        qml.execute([_tape(0.5)], dev, gradient_fn=None, cache=cache)
+
+        class EvictingCache(DiskCache):
+            """Disk cache whose entries are evicted right before they are read"""
+
+            def __getitem__(self, key):
+                for k in list(self):
+                    del self[k]
+
+                return super().__getitem__(key)
+
+        evicting_cache = EvictingCache(tmp_path / "cache.db")
+        res = qml.execute([_tape(0.5)], dev, gradient_fn=None, cache=evicting_cache)
+        assert onp.allclose(res[0], onp.cos(0.5))
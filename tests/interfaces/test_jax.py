@@ -374,6 +374,12 @@ execute_kwargs = [
         "mode": "backward",
         "gradient_kwargs": {"method": "adjoint_jacobian"},
     },
+    {
+        "gradient_fn": "device",
+        "mode": "backward",
+        "device_vjp": True,
+        "gradient_kwargs": {"method": "adjoint_jacobian"},
+    },
 ]
 
 
@@ -288,6 +288,13 @@ execute_kwargs = [
         "gradient_kwargs": {"method": "adjoint_jacobian"},
         "interface": "tf",
     },
+    {
+        "gradient_fn": "device",
+        "mode": "backward",
+        "device_vjp": True,
+        "gradient_kwargs": {"method": "adjoint_jacobian"},
+        "interface": "tf",
+    },
 ]
 
 
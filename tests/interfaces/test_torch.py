@@ -348,6 +348,13 @@ execute_kwargs = [
         "gradient_kwargs": {"method": "adjoint_jacobian"},
         "interface": "torch",
     },
+    {
+        "gradient_fn": "device",
+        "mode": "backward",
+        "device_vjp": True,
+        "gradient_kwargs": {"method": "adjoint_jacobian"},
+        "interface": "torch",
+    },
 ]
 
 
@@ -91,6 +91,117 @@ class TestKernelMatrix:
         assert np.allclose(K2, K2_expected)
 
 
+def _embedding_state(x):
+    """The embedding state of AngleEmbedding on two qubits."""
+    dev = qml.device("default.qubit", wires=2)
+
+    @qml.qnode(dev)
+    def state(x):
+        qml.AngleEmbedding(x, wires=dev.wires)
+        return qml.state()
+
+    return state(x)
+
+
+def _fidelity_kernel(x1, x2):
+    """The fidelity kernel of AngleEmbedding on two qubits, evaluated as a kernel circuit."""
+    dev = qml.device("default.qubit", wires=2)
+
+    @qml.qnode(dev)
+    def circuit(x1, x2):
+        qml.AngleEmbedding(x1, wires=dev.wires)
+        qml.adjoint(qml.AngleEmbedding)(x2, wires=dev.wires)
+        return qml.probs(wires=dev.wires)
+
+    return circuit(x1, x2)[0]
+
+
+class TestFidelityKernelMatrix:
+    """Tests kernel matrix computations from embedding states."""
+
+    X1 = pnp.array([[0.1, 0.4], [0.4, 0.2], [0.7, 0.3]], requires_grad=False)
+    X2 = pnp.array([[0.0, 0.1], [0.3, 0.2]], requires_grad=False)
+
+    def test_square_kernel_matrix(self):
+        """Test that square_fidelity_kernel_matrix agrees with square_kernel_matrix
+        and evaluates the embedding state once per datapoint."""
+        history = []
+
+        def state(x):
+            history.append(x)
+            return _embedding_state(x)
+
+        K = kern.square_fidelity_kernel_matrix(self.X1, state)
+        K_expected = kern.square_kernel_matrix(self.X1, _fidelity_kernel)
+
+        assert np.allclose(K, K_expected)
+        assert len(history) == len(self.X1)
+
+    def test_kernel_matrix(self):
+        """Test that fidelity_kernel_matrix agrees with kernel_matrix and evaluates
+        the embedding state once per datapoint."""
+        history = []
+
+        def state(x):
+            history.append(x)
+            return _embedding_state(x)
+
+        K = kern.fidelity_kernel_matrix(self.X1, self.X2, state)
+        K_expected = kern.kernel_matrix(self.X1, self.X2, _fidelity_kernel)
+
+        assert K.shape == (3, 2)
+        assert np.allclose(K, K_expected)
+        assert len(history) == len(self.X1) + len(self.X2)
+
+    @pytest.mark.parametrize("tile_size", [1, 2, 5])
+    def test_tiled_kernel_matrices(self, tile_size):
+        """Test that the kernel matrices computed in tiles agree with the kernel matrices
+        computed at once."""
+        K1 = kern.square_fidelity_kernel_matrix(self.X1, _embedding_state, tile_size=tile_size)
+        K2 = kern.fidelity_kernel_matrix(self.X1, self.X2, _embedding_state, tile_size=tile_size)
+
+        assert isinstance(K1, np.ndarray)
+        assert np.allclose(K1, kern.square_fidelity_kernel_matrix(self.X1, _embedding_state))
+        assert np.allclose(K2, kern.fidelity_kernel_matrix(self.X1, self.X2, _embedding_state))
+
+    def test_out(self):
+        """Test that the kernel matrices are written into the given arrays."""
+        out1 = np.zeros((3, 3))
+        out2 = np.zeros((3, 2))
+
+        K1 = kern.square_fidelity_kernel_matrix(self.X1, _embedding_state, out=out1)
+        K2 = kern.fidelity_kernel_matrix(self.X1, self.X2, _embedding_state, 2, out=out2)
+
+        assert K1 is out1
+        assert K2 is out2
+        assert np.allclose(out1, kern.square_fidelity_kernel_matrix(self.X1, _embedding_state))
+        assert np.allclose(out2, kern.fidelity_kernel_matrix(self.X1, self.X2, _embedding_state))
+
+    def test_tiles(self):
+        """Test that the tiles of a square kernel matrix cover the upper triangle once,
+        and that the tiles of a kernel matrix cover the matrix once."""
+        square_tiles = list(kern.fidelity_kernel_tiles(self.X1, None, _embedding_state, 2))
+        tiles = list(kern.fidelity_kernel_tiles(self.X1, self.X2, _embedding_state, 2))
+
+        assert [(r.start, c.start) for r, c, _ in square_tiles] == [(0, 0), (0, 2), (2, 2)]
+        assert [(r.start, c.start) for r, c, _ in tiles] == [(0, 0), (2, 0)]
+        assert [tile.shape for _, _, tile in tiles] == [(2, 2), (1, 2)]
+
+    def test_invalid_tile_size(self):
+        """Test that an error is raised for a tile size smaller than one."""
+        with pytest.raises(ValueError, match="must be a positive integer"):
+            next(kern.fidelity_kernel_tiles(self.X1, None, _embedding_state, 0))
+
+    def test_gradient(self):
+        """Test that the kernel matrix is differentiable with respect to the datapoints."""
+        X = pnp.array(self.X1, requires_grad=True)
+
+        jac = qml.jacobian(lambda X: kern.fidelity_kernel_matrix(X, self.X2, _embedding_state))
+        jac_expected = qml.jacobian(lambda X: kern.kernel_matrix(X, self.X2, _fidelity_kernel))
+
+        assert np.allclose(jac(X), jac_expected(X))
+
+
 class TestKernelPolarity:
     """Tests kernel methods to compute polarity."""
 
@@ -1386,6 +1386,40 @@ class TestGrouping:
         assert H3.grouping_indices == [[2, 1], [0]]
 
 
+class TestPauliMasks:
+    """Tests for the bitmask representation of Hamiltonians made of Pauli words"""
+
+    def test_pauli_masks(self):
+        """Tests the masks and numbers of Y operators of the terms"""
+        H = qml.Hamiltonian(
+            [0.5, 0.2, 0.1],
+            [qml.PauliX(0) @ qml.PauliY(2), qml.PauliZ(1), qml.Identity(2)],
+        )
+
+        x, z, num_y = H.pauli_masks(wire_order=[0, 1, 2])
+        assert np.array_equal(x, [0b101, 0b000, 0b000])
+        assert np.array_equal(z, [0b001, 0b010, 0b000])
+        assert np.array_equal(num_y, [1, 0, 0])
+
+        x, z, num_y = H.pauli_masks(wire_order=[2, 0, 1, "a"])
+        assert np.array_equal(x, [0b1100, 0b0000, 0b0000])
+        assert np.array_equal(z, [0b1000, 0b0010, 0b0000])
+        assert np.array_equal(num_y, [1, 0, 0])
+
+    def test_pauli_masks_not_pauli_words(self):
+        """Tests that None is returned if a term is not a Pauli word"""
+        H = qml.Hamiltonian([0.5, 0.2], [qml.PauliX(0), qml.Hermitian(np.eye(2), 1)])
+        assert H.pauli_masks(wire_order=[0, 1]) is None
+
+    def test_pauli_masks_reset_when_simplifying(self):
+        """Tests that calling simplify() resets the cached masks"""
+        H = qml.Hamiltonian([0.5, 0.2], [qml.PauliX(0), qml.PauliX(0)])
+        assert len(H.pauli_masks(wire_order=[0])[0]) == 2
+
+        H.simplify()
+        assert len(H.pauli_masks(wire_order=[0])[0]) == 1
+
+
 class TestHamiltonianEvaluation:
     """Test the usage of a Hamiltonian as an observable"""
 
@@ -97,6 +97,22 @@ class TestSparse:
         assert np.allclose(res_dynamic, sparse_hamiltonian, atol=tol, rtol=0)
         assert np.allclose(res_static, sparse_hamiltonian, atol=tol, rtol=0)
 
+    def test_sparse_matrix_wire_order_cached(self):
+        """Test that the matrix expanded to a wire order is cached, and recomputed
+        if the matrix defining the operator is replaced."""
+        H = qml.SparseHamiltonian(csr_matrix(H_hydrogen), wires=range(4))
+        wire_order = [3, 1, 0, 2]
+
+        res1 = H.sparse_matrix(wire_order=wire_order)
+        res2 = H.sparse_matrix(wire_order=wire_order)
+        assert res1 is res2
+        assert np.allclose(res1.toarray(), qml.matrix(H, wire_order=wire_order))
+
+        H.data = [csr_matrix(2 * H_hydrogen)]
+        res3 = H.sparse_matrix(wire_order=wire_order)
+        assert res3 is not res1
+        assert np.allclose(res3.toarray(), 2 * res1.toarray())
+
     def test_sparse_diffmethod_error(self):
         """Test that an error is raised when the observable is SparseHamiltonian and the
         differentiation method is not parameter-shift."""
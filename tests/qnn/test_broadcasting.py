@@ -0,0 +1,150 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Tests for the pennylane.qnn.broadcasting module.
+"""
+import pytest
+
+import pennylane as qml
+from pennylane import numpy as np
+from pennylane.qnn.broadcasting import batched_qnode
+
+WEIGHT_SHAPES = {"w": (2,)}
+
+
+def embedding_circuit(inputs, w):
+    qml.AngleEmbedding(inputs, wires=[0, 1])
+    qml.RX(w[0], wires=0)
+    qml.RY(w[1], wires=1)
+    return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))
+
+
+def indexed_circuit(inputs, w):
+    qml.RX(inputs[..., 0], wires=0)
+    qml.RY(inputs[..., 1], wires=1)
+    qml.CRX(w[0], wires=[0, 1])
+    return qml.probs(wires=[0, 1])
+
+
+def probs_circuit(inputs, w):
+    qml.AngleEmbedding(inputs, wires=[0, 1])
+    qml.CRX(w[0], wires=[0, 1])
+    return qml.probs(wires=0), qml.probs(wires=1)
+
+
+def _stacked(qnode, inputs, w):
+    return np.stack([qnode(inputs=x, w=w) for x in inputs])
+
+
+class TestBatchedQNode:
+    """Tests for the batched_qnode function"""
+
+    @pytest.mark.parametrize(
+        "circuit, batch_axis", [(embedding_circuit, 1), (indexed_circuit, 0), (probs_circuit, 1)]
+    )
+    def test_broadcasted_execution(self, circuit, batch_axis, mocker):
+        """Test that a QNode on a device supporting broadcasting is evaluated on a batch
+        of inputs in a single broadcasted execution"""
+        dev = qml.device("default.qubit", wires=2)
+        qnode = qml.QNode(circuit, dev, diff_method="backprop")
+        fn, axis = batched_qnode(qnode, "inputs", WEIGHT_SHAPES, (2,))
+
+        assert fn is qnode
+        assert axis == batch_axis
+
+        inputs = np.random.random((4, 2), requires_grad=False)
+        w = np.random.random(2, requires_grad=True)
+        spy = mocker.spy(qnode.device, "batch_execute")
+        res = np.moveaxis(fn(inputs=inputs, w=w), axis, 0)
+
+        assert spy.call_args[0][0][0].batch_size == 4
+        assert np.allclose(res, _stacked(qnode, inputs, w))
+
+    @pytest.mark.parametrize(
+        "device, diff_method",
+        [("default.qubit", "parameter-shift"), ("default.mixed", "parameter-shift")],
+    )
+    def test_split_execution(self, device, diff_method, mocker):
+        """Test that a batch of inputs is split into a single batch of circuits if the device
+        or the differentiation method do not support broadcasting"""
+        dev = qml.device(device, wires=2)
+        qnode = qml.QNode(embedding_circuit, dev, diff_method=diff_method)
+        fn, axis = batched_qnode(qnode, "inputs", WEIGHT_SHAPES, (2,))
+
+        assert fn is not qnode
+        assert axis == 0
+
+        inputs = np.random.random((4, 2), requires_grad=False)
+        w = np.random.random(2, requires_grad=True)
+        spy = mocker.spy(qnode.device, "batch_execute")
+        res = fn(inputs=inputs, w=w)
+
+        assert spy.call_count == 1
+        assert len(spy.call_args[0][0]) == 4
+        assert np.allclose(res, _stacked(qnode, inputs, w))
+
+        jac = qml.jacobian(lambda w: fn(inputs=inputs, w=w))(w)
+        expected = qml.jacobian(lambda w: _stacked(qnode, inputs, w))(w)
+        assert np.allclose(jac, expected)
+
+    def test_inputs_indexed_along_first_axis(self):
+        """Test that QNodes indexing their inputs along the first axis are not batched"""
+
+        def circuit(inputs, w):
+            qml.RX(inputs[0], wires=0)
+            qml.RY(inputs[1], wires=1)
+            return qml.expval(qml.PauliZ(0))
+
+        qnode = qml.QNode(circuit, qml.device("default.qubit", wires=2))
+        assert batched_qnode(qnode, "inputs", WEIGHT_SHAPES, (2,)) is None
+
+    def test_unsupported_measurement(self):
+        """Test that QNodes returning measurements whose broadcasted results are not
+        batched along a known axis are not batched"""
+
+        def circuit(inputs, w):
+            qml.AngleEmbedding(inputs, wires=[0, 1])
+            return qml.state()
+
+        qnode = qml.QNode(circuit, qml.device("default.qubit", wires=2))
+        assert batched_qnode(qnode, "inputs", WEIGHT_SHAPES, (2,)) is None
+
+    def test_measurements_of_different_shapes(self, mocker):
+        """Test that the batch of inputs is split into separate circuits if the QNode returns
+        measurements with results of different shapes, which are not stacked into an array"""
+
+        def circuit(inputs, w):
+            qml.AngleEmbedding(inputs, wires=[0, 1])
+            return qml.probs(wires=0), qml.probs(wires=[0, 1])
+
+        dev = qml.device("default.qubit", wires=2)
+        qnode = qml.QNode(circuit, dev, diff_method="backprop")
+        fn, axis = batched_qnode(qnode, "inputs", WEIGHT_SHAPES, (2,))
+
+        assert fn is not qnode
+        assert axis == 0
+
+        spy = mocker.spy(qnode.device, "batch_execute")
+        fn(inputs=np.random.random((4, 2), requires_grad=False), w=np.zeros(2))
+        assert len(spy.call_args[0][0]) == 4
+
+    def test_incompatible_inputs(self):
+        """Test that QNodes that cannot be constructed with a batch of inputs are not batched"""
+
+        def circuit(inputs, w):
+            qml.BasisState(inputs, wires=[0, 1])
+            return qml.expval(qml.PauliZ(0))
+
+        qnode = qml.QNode(circuit, qml.device("default.qubit", wires=2))
+        assert batched_qnode(qnode, "inputs", WEIGHT_SHAPES, (2,)) is None
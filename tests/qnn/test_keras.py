@@ -425,6 +425,50 @@ class TestKerasLayer:
         assert g_layer is not None
         assert layer_out.shape == (batch_size, middle_dim, output_dim)
 
+    @pytest.mark.parametrize("n_qubits, output_dim", indices_up_to(2))
+    def test_call_batch_single_execution(self, get_circuit, output_dim, n_qubits, mocker):
+        """Test if the call() method evaluates a batch of inputs in a single broadcasted
+        execution, with results that agree with evaluating each input separately"""
+        c, w = get_circuit
+        layer = KerasLayer(c, w, output_dim)
+        x = tf.random.uniform((2, 5, n_qubits))
+
+        layer_out = layer(x)
+
+        spy = mocker.spy(layer.qnode.device, "batch_execute")
+        layer_out = layer(x)
+
+        assert spy.call_count == 1
+        assert spy.call_args[0][0][0].batch_size == 10
+        assert layer_out.shape == (2, 5, output_dim)
+
+        weights = [w.numpy() for w in layer.qnode_weights.values()]
+
+        for i in range(2):
+            for j in range(5):
+                assert np.allclose(layer_out[i, j], c(x[i, j], *weights), atol=1e-6)
+
+    @pytest.mark.parametrize("n_qubits, output_dim", indices_up_to(1))
+    def test_call_batch_indexed_inputs(self, n_qubits, output_dim):
+        """Test if the call() method evaluates each input separately if the QNode indexes
+        its inputs along the first dimension, which is not compatible with broadcasting"""
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev, interface="tf")
+        def circuit(inputs, w):
+            qml.RX(inputs[0], wires=0)
+            qml.RX(inputs[1], wires=1)
+            qml.RY(w, wires=0)
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))
+
+        layer = KerasLayer(circuit, {"w": 1}, output_dim=2)
+        x = tf.random.uniform((2, 2))
+
+        layer_out = layer(x)
+
+        assert layer._batched_qnodes == {(2,): None}
+        assert np.allclose(layer_out[1], circuit(x[1], layer.qnode_weights["w"].numpy()))
+
     @pytest.mark.parametrize("n_qubits, output_dim", indices_up_to(1))
     def test_str_repr(self, get_circuit, output_dim):
         """Test the __str__ and __repr__ representations"""
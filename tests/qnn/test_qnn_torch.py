@@ -455,6 +455,72 @@ class TestTorchLayer:
         assert g_layer.count(None) == 0
         assert layer_out.shape == torch.Size((batch_size, middle_dim, output_dim))
 
+    @pytest.mark.parametrize("n_qubits, output_dim", indices_up_to(2))
+    def test_forward_batch_single_execution(self, get_circuit, output_dim, n_qubits, mocker):
+        """Test if the forward() method evaluates a batch of inputs in a single broadcasted
+        execution, with results that agree with evaluating each input separately"""
+        c, w = get_circuit
+        layer = TorchLayer(c, w)
+        x = torch.rand((2, 5, n_qubits))
+
+        layer_out = layer.forward(x)
+
+        spy = mocker.spy(layer.qnode.device, "batch_execute")
+        layer_out = layer.forward(x)
+
+        assert spy.call_count == 1
+        assert spy.call_args[0][0][0].batch_size == 10
+        assert layer_out.shape == torch.Size((2, 5, output_dim))
+
+        for i in range(2):
+            for j in range(5):
+                assert torch.allclose(layer_out[i, j], layer.forward(x[i, j]), atol=1e-6)
+
+    @pytest.mark.parametrize("n_qubits, output_dim", indices_up_to(1))
+    def test_forward_batch_indexed_inputs(self, n_qubits, output_dim):
+        """Test if the forward() method evaluates each input separately if the QNode indexes
+        its inputs along the first dimension, which is not compatible with broadcasting"""
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev, interface="torch")
+        def circuit(inputs, w):
+            qml.RX(inputs[0], wires=0)
+            qml.RX(inputs[1], wires=1)
+            qml.RY(w, wires=0)
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))
+
+        layer = TorchLayer(circuit, {"w": 1})
+        x = torch.rand((2, 2))
+
+        layer_out = layer.forward(x)
+
+        assert layer._batched_qnodes == {(2,): None}
+        assert torch.allclose(layer_out[1], layer.forward(x[1]))
+
+    @pytest.mark.parametrize("n_qubits, output_dim", indices_up_to(1))
+    def test_forward_batch_parameter_shift(self, n_qubits, output_dim, mocker):
+        """Test if the forward() method splits a batch of inputs into a single batch of
+        circuits if the differentiation method does not support broadcasting"""
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev, interface="torch", diff_method="parameter-shift")
+        def circuit(inputs, w):
+            qml.AngleEmbedding(inputs, wires=[0, 1])
+            qml.RY(w, wires=0)
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliZ(1))
+
+        layer = TorchLayer(circuit, {"w": 1})
+        x = torch.rand((3, 2))
+        layer.forward(x)
+
+        spy = mocker.spy(dev, "batch_execute")
+        layer_out = layer.forward(x)
+        layer_out.backward(torch.ones_like(layer_out))
+
+        assert len(spy.call_args_list[0][0][0]) == 3
+        assert layer_out.shape == torch.Size((3, 2))
+        assert layer.qnode_weights["w"].grad is not None
+
     @pytest.mark.parametrize("n_qubits, output_dim", indices_up_to(1))
     def test_str_repr(self, get_circuit):
         """Test the __str__ and __repr__ representations"""
@@ -1260,3 +1260,15 @@ class TestQubitDeviceNewUnits:
         msg = "Returning the mutual information is not supported when using custom wire labels"
         with pytest.raises(qml.QuantumFunctionError, match=msg):
             qml.execute_new(tapes=[tape], device=dev, gradient_fn=None)
+
+    def test_device_vjp_error(self):
+        """Test that an error is raised if device vector-Jacobian products are requested,
+        which are not supported yet with the new return types"""
+        dev = qml.device("default.qubit", wires=1)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.5, wires=0)
+            qml.expval(qml.PauliZ(0))
+
+        with pytest.raises(ValueError, match="Device vector-Jacobian products are not supported"):
+            qml.execute_new(tapes=[tape], device=dev, gradient_fn="device", device_vjp=True)
@@ -0,0 +1,608 @@
+# Copyright 2018-2022 Xanadu Quantum Technologies Inc.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for the ExpansionCache and DecompositionCache classes"""
+import pytest
+
+import pennylane as qml
+from pennylane import numpy as np
+from pennylane.operation import DecompositionUndefinedError
+from pennylane.tape import DecompositionCache, ExpansionCache
+
+
+def _expand(tape):
+    return tape.expand(depth=3)
+
+
+def _rot_tape(x, obs=None):
+    with qml.tape.QuantumTape() as tape:
+        qml.Rot(*x, wires=0)
+        qml.CNOT(wires=[0, 1])
+        qml.expval(obs or qml.PauliZ(1))
+
+    return tape
+
+
+def _store(cache, tape, expand_fn):
+    """Expands a tape twice, such that the expansion of its recurring structure is stored"""
+    for _ in range(2):
+        cache.expand(tape, expand_fn)
+
+
+class TestExpansionCache:
+    """Tests for the ExpansionCache class"""
+
+    def test_parameters_rebound(self, mocker):
+        """Test that the expansion of a tape with the same structure is re-used,
+        with the parameters of the new tape"""
+        cache = ExpansionCache()
+        spy = mocker.spy(qml.Rot, "compute_decomposition")
+
+        expanded1 = cache.expand(_rot_tape([0.1, 0.2, 0.3]), _expand)
+        assert spy.call_count == 1
+
+        # the structure recurs, and the tape is expanded a second time with probe parameters
+        cache.expand(_rot_tape([0.7, 0.8, 0.9]), _expand)
+        assert spy.call_count == 3
+
+        expanded2 = cache.expand(_rot_tape([0.4, 0.5, 0.6]), _expand)
+
+        assert spy.call_count == 3
+        assert len(cache) == 1
+        assert [op.name for op in expanded2.operations] == ["RZ", "RY", "RZ", "CNOT"]
+        assert expanded2.get_parameters() == [0.4, 0.5, 0.6]
+
+        # the first expansion is left unchanged
+        assert expanded1.get_parameters() == [0.1, 0.2, 0.3]
+
+    def test_measurements_taken_from_new_tape(self):
+        """Test that the measurements of the new tape, including the parameters
+        of their observables, are used"""
+        cache = ExpansionCache()
+        _store(cache, _rot_tape([0.1, 0.2, 0.3], qml.Hermitian(np.eye(2), wires=1)), _expand)
+
+        tape = _rot_tape([0.4, 0.5, 0.6], qml.Hermitian(2 * np.eye(2), wires=1))
+        expanded = cache.expand(tape, _expand)
+
+        assert expanded.measurements == tape.measurements
+        assert np.allclose(expanded.get_parameters()[-1], 2 * np.eye(2))
+        assert expanded.trainable_params == [0, 1, 2, 3]
+
+    def test_result_matches_expansion(self):
+        """Test that executing the re-bound tape gives the same result as the expanded tape"""
+        cache = ExpansionCache()
+        dev = qml.device("default.qubit", wires=2)
+        x = [0.4, 0.5, 0.6]
+
+        _store(cache, _rot_tape([0.1, 0.2, 0.3]), _expand)
+        res = dev.execute(cache.expand(_rot_tape(x), _expand))
+        expected = dev.execute(_expand(_rot_tape(x)))
+
+        assert np.allclose(res, expected)
+
+    def test_unchanged_tape(self):
+        """Test that tapes returned unchanged by the expansion are returned on later calls"""
+        cache = ExpansionCache()
+        expand_fn = lambda tape: tape
+
+        _store(cache, _rot_tape([0.1, 0.2, 0.3]), expand_fn)
+        tape = _rot_tape([0.4, 0.5, 0.6])
+        assert cache.expand(tape, expand_fn) is tape
+
+    def test_constant_parameters(self, mocker):
+        """Test that constant parameters introduced by the expansion are kept"""
+        cache = ExpansionCache()
+        spy = mocker.spy(qml.PauliRot, "compute_decomposition")
+
+        def circuit(x):
+            with qml.tape.QuantumTape() as tape:
+                qml.PauliRot(x, "XY", wires=[0, 1])
+                qml.expval(qml.PauliZ(0))
+
+            return tape
+
+        expand_fn = lambda tape: tape.expand(depth=1)
+        _store(cache, circuit(0.1), expand_fn)
+        expanded = cache.expand(circuit(0.5), expand_fn)
+
+        # the tape is expanded a second time with probe parameters when stored
+        assert spy.call_count == 3
+        assert qml.equal(expanded.operations[2], qml.MultiRZ(0.5, wires=[0, 1]))
+        assert np.allclose(expanded.get_parameters(), [np.pi / 2, 0.5, -np.pi / 2])
+
+    def test_transformed_parameters_not_rebound(self):
+        """Test that expansions computing new parameters from the original ones are recomputed"""
+        cache = ExpansionCache()
+
+        def circuit(phi, delta):
+            with qml.tape.QuantumTape() as tape:
+                qml.U2(phi, delta, wires=0)
+                qml.expval(qml.PauliZ(0))
+
+            return tape
+
+        _store(cache, circuit(0.1, 0.2), _expand)
+        expanded = cache.expand(circuit(0.5, 0.6), _expand)
+
+        assert np.allclose(expanded.get_parameters(), _expand(circuit(0.5, 0.6)).get_parameters())
+
+    def test_consumed_parameters_not_rebound(self):
+        """Test that expansions in which parameters are not passed through
+        unchanged are recomputed"""
+        cache = ExpansionCache()
+
+        def circuit(state):
+            with qml.tape.QuantumTape() as tape:
+                qml.BasisState(np.array(state), wires=[0, 1])
+                qml.expval(qml.PauliZ(0))
+
+            return tape
+
+        expand_fn = lambda tape: tape.expand(depth=2)
+        _store(cache, circuit([1, 0]), expand_fn)
+        expanded1 = cache.expand(circuit([1, 0]), expand_fn)
+        expanded2 = cache.expand(circuit([0, 1]), expand_fn)
+
+        assert [op.wires.tolist() for op in expanded1.operations] == [[0]]
+        assert [op.wires.tolist() for op in expanded2.operations] == [[1]]
+
+    def test_shared_parameters_not_rebound(self):
+        """Test that expansions are recomputed if a parameter object is shared between
+        operations, since the parameters cannot be told apart"""
+        cache = ExpansionCache()
+        x = 0.1
+
+        _store(cache, _rot_tape([x, x, 0.3]), _expand)
+        expanded = cache.expand(_rot_tape([0.4, 0.5, 0.6]), _expand)
+
+        assert expanded.get_parameters() == [0.4, 0.5, 0.6]
+
+    def test_value_dependent_expansion_not_rebound(self):
+        """Test that expansions depending on the values of the parameters are recomputed,
+        even if the parameters of the expanded operations are passed through unchanged"""
+        cache = ExpansionCache()
+
+        def expand_fn(tape):
+            with qml.tape.QuantumTape() as new_tape:
+                for op in tape.operations:
+                    if op.data[0] > 0:
+                        qml.RY(op.data[0], wires=op.wires)
+                    else:
+                        qml.RX(op.data[0], wires=op.wires)
+
+                for m in tape.measurements:
+                    qml.apply(m)
+
+            return new_tape
+
+        def circuit(x):
+            with qml.tape.QuantumTape() as tape:
+                qml.RZ(x, wires=0)
+                qml.expval(qml.PauliZ(0))
+
+            return tape
+
+        _store(cache, circuit(0.1), expand_fn)
+        expanded = cache.expand(circuit(-0.1), expand_fn)
+
+        assert qml.equal(expanded.operations[0], qml.RX(-0.1, wires=0))
+
+    def test_stored_parameters_unwrapped(self):
+        """Test that the stored expansion does not hold on to the parameters of the
+        original tape, which carry autodifferentiation information"""
+        cache = ExpansionCache()
+
+        def cost(x):
+            tape = cache.expand(_rot_tape(x), _expand)
+            return tape.get_parameters()[0]
+
+        for _ in range(2):
+            qml.grad(cost)(np.array([0.1, 0.2, 0.3], requires_grad=True))
+
+        (entry,) = cache._cache.values()
+
+        for p in entry.tape.get_parameters(trainable_only=False):
+            assert isinstance(p, np.ndarray) and not isinstance(p, np.tensor)
+
+    def test_key(self, mocker):
+        """Test that expansions are stored separately for different keys"""
+        cache = ExpansionCache()
+        spy = mocker.spy(qml.Rot, "compute_decomposition")
+
+        for _ in range(3):
+            cache.expand(_rot_tape([0.1, 0.2, 0.3]), _expand, key=1)
+            cache.expand(_rot_tape([0.1, 0.2, 0.3]), _expand, key=2)
+
+        assert spy.call_count == 6
+        assert len(cache) == 2
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_gradient(self):
+        """Test that the re-bound tape is differentiable"""
+        cache = ExpansionCache()
+        dev = qml.device("default.qubit", wires=2)
+        _store(cache, _rot_tape(np.array([0.1, 0.2, 0.3])), _expand)
+
+        def cost(x):
+            tape = cache.expand(_rot_tape(x), _expand)
+            return qml.execute([tape], dev, gradient_fn=qml.gradients.param_shift)[0]
+
+        x = np.array([0.4, 0.5, 0.6], requires_grad=True)
+        expected = qml.jacobian(
+            lambda x: qml.execute([_expand(_rot_tape(x))], dev, qml.gradients.param_shift)[0]
+        )(x)
+        assert np.allclose(qml.jacobian(cost)(x), expected)
+
+
+class DoubleRX(qml.operation.Operation):
+    """Dummy operation without a matrix, decomposed by the device"""
+
+    num_wires = 1
+    num_params = 1
+
+    @staticmethod
+    def compute_decomposition(x, wires):  # pylint: disable=arguments-differ
+        return [qml.RX(x, wires=wires), qml.RX(x, wires=wires)]
+
+
+class TestDeviceExpansionCache:
+    """Tests for the expansion cache of devices"""
+
+    def test_device_expansion_cached(self, mocker):
+        """Test that the device re-uses the expansion of circuits with the same structure"""
+        dev = qml.device("default.qubit", wires=2)
+        dev.expansion_cache = ExpansionCache()
+        spy = mocker.spy(DoubleRX, "compute_decomposition")
+
+        @qml.qnode(dev, diff_method="parameter-shift")
+        def circuit(x):
+            DoubleRX(x, wires=0)
+            return qml.probs(wires=[0, 1])
+
+        circuit(0.1)
+        assert spy.call_count == 1
+
+        circuit(0.3)
+        assert spy.call_count == 3
+
+        res = circuit(0.5)
+        assert spy.call_count == 3
+
+        assert np.allclose(res, [np.cos(0.5) ** 2, 0, np.sin(0.5) ** 2, 0])
+
+        dev.expansion_cache = None
+        assert np.allclose(circuit(0.5), res)
+        assert spy.call_count == 4
+
+    def test_disabled_by_default(self, mocker):
+        """Test that devices expand circuits in every execution by default"""
+        dev = qml.device("default.qubit", wires=2)
+        assert dev.expansion_cache is None
+
+        spy = mocker.spy(DoubleRX, "compute_decomposition")
+
+        @qml.qnode(dev, diff_method="parameter-shift")
+        def circuit(x):
+            DoubleRX(x, wires=0)
+            return qml.probs(wires=[0, 1])
+
+        for x in [0.1, 0.3, 0.5]:
+            circuit(x)
+
+        assert spy.call_count == 3
+
+    def test_hyperparameters_compared_exactly(self):
+        """Test that circuits whose operators have hyperparameters with the same string
+        representation, such as Hamiltonians, are not expanded alike"""
+        dev = qml.device("default.qubit", wires=2)
+        dev.expansion_cache = ExpansionCache()
+
+        H1 = qml.Hamiltonian([0.1, 0.2], [qml.PauliZ(0), qml.PauliX(1)])
+        H2 = qml.Hamiltonian([0.1, 0.2], [qml.PauliX(0), qml.PauliZ(1)])
+        op1, op2 = qml.ApproxTimeEvolution(H1, 0.5, 1), qml.ApproxTimeEvolution(H2, 0.5, 1)
+        assert str(op1.hyperparameters.values()) == str(op2.hyperparameters.values())
+
+        def tape(H, t):
+            with qml.tape.QuantumTape() as tape:
+                qml.ApproxTimeEvolution(H, t, 1)
+                qml.probs(wires=[0, 1])
+
+            return tape
+
+        for _ in range(2):
+            dev.expand_fn(tape(H1, 0.5))
+
+        expanded = dev.expand_fn(tape(H2, 0.5))
+        expected = dev.default_expand_fn(tape(H2, 0.5))
+
+        assert expanded.structure_key == expected.structure_key
+        assert expanded.get_parameters() == expected.get_parameters()
+
+    def test_obs_sharing_wires_not_cached(self):
+        """Test that circuits whose observables share wires, which are diagonalized
+        in place, are always expanded"""
+        dev = qml.device("default.qubit", wires=2)
+        dev.expansion_cache = ExpansionCache()
+
+        def tape(x):
+            with qml.tape.QuantumTape() as tape:
+                qml.RX(x, wires=0)
+                qml.expval(qml.PauliX(0))
+                qml.expval(qml.PauliX(0) @ qml.PauliZ(1))
+
+            return tape
+
+        dev.expand_fn(tape(0.1))
+        assert len(dev.expansion_cache) == 0
+
+        res = dev.execute(dev.expand_fn(tape(0.5)))
+        assert np.allclose(res, [0, 0])
+
+
+class TestBatchTransformExpansionCache:
+    """Tests for the expansion cache of batch transforms"""
+
+    def test_batch_transform_expansion_cached(self, mocker):
+        """Test that a batch transform re-uses the expansion of tapes with the same structure"""
+        transform = qml.batch_transform(lambda tape: ([tape], None), expand_fn=_expand)
+        transform.expansion_cache = ExpansionCache()
+        spy = mocker.spy(qml.Rot, "compute_decomposition")
+
+        for _ in range(2):
+            tapes1, _ = transform(_rot_tape([0.1, 0.2, 0.3]))
+
+        tapes2, _ = transform(_rot_tape([0.4, 0.5, 0.6]))
+
+        assert spy.call_count == 3
+        assert tapes1[0].get_parameters() == [0.1, 0.2, 0.3]
+        assert tapes2[0].get_parameters() == [0.4, 0.5, 0.6]
+
+    def test_unhashable_arguments(self, mocker):
+        """Test that expansions are not cached if the transform arguments are not hashable"""
+
+        def expand_fn(tape, arr):
+            return _expand(tape)
+
+        transform = qml.batch_transform(lambda tape, arr: ([tape], None), expand_fn=expand_fn)
+        transform.expansion_cache = ExpansionCache()
+        spy = mocker.spy(qml.Rot, "compute_decomposition")
+
+        transform(_rot_tape([0.1, 0.2, 0.3]), np.array([1]))
+        transform(_rot_tape([0.4, 0.5, 0.6]), np.array([1]))
+
+        assert spy.call_count == 2
+        assert len(transform.expansion_cache) == 0
+
+    def test_disabled_by_default(self, mocker):
+        """Test that batch transforms expand tapes every time by default"""
+        transform = qml.batch_transform(lambda tape: ([tape], None), expand_fn=_expand)
+        assert transform.expansion_cache is None
+
+        spy = mocker.spy(qml.Rot, "compute_decomposition")
+
+        for _ in range(3):
+            transform(_rot_tape([0.1, 0.2, 0.3]))
+
+        assert spy.call_count == 3
+
+
+def _decompose(cache, op):
+    with qml.tape.QuantumTape() as tape:
+        qml.apply(op)
+
+    with cache.active():
+        return tape.expand()
+
+
+class TestDecompositionCache:
+    """Tests for the DecompositionCache class"""
+
+    def test_parameters_rebound(self, mocker):
+        """Test that the decomposition of an operator with the same structure is re-used,
+        with the parameters of the new operator"""
+        cache = DecompositionCache()
+        spy = mocker.spy(qml.BasicEntanglerLayers, "compute_decomposition")
+
+        _decompose(cache, qml.BasicEntanglerLayers(np.array([[0.1, 0.2]]), wires=[0, 1]))
+
+        # the operator is decomposed once more with probe parameters when stored
+        assert spy.call_count == 2
+
+        op = qml.BasicEntanglerLayers(np.array([[0.3, 0.4]]), wires=[0, 1])
+        tape = _decompose(cache, op)
+
+        assert spy.call_count == 2
+        assert len(cache) == 1
+        assert all(qml.equal(o1, o2) for o1, o2 in zip(tape.operations, op.decomposition()))
+
+    def test_scaled_parameters_rebound(self, mocker):
+        """Test that decompositions using fixed multiples of the parameters are re-used"""
+        cache = DecompositionCache()
+        spy = mocker.spy(qml.FermionicSingleExcitation, "compute_decomposition")
+
+        _decompose(cache, qml.FermionicSingleExcitation(0.1, wires=[0, 1, 2]))
+        op = qml.FermionicSingleExcitation(0.5, wires=[0, 1, 2])
+        tape = _decompose(cache, op)
+
+        assert spy.call_count == 2
+        assert np.allclose(tape.get_parameters(), [p for o in op.decomposition() for p in o.data])
+
+    def test_computed_parameters_not_rebound(self):
+        """Test that decompositions computing new parameters from the operator
+        parameters are recomputed"""
+        cache = DecompositionCache()
+        wires = [0, 1]
+
+        _decompose(cache, qml.MottonenStatePreparation(np.array([1, 0, 0, 0]), wires=wires))
+        state = np.array([1, 1, 1, 1]) / 2
+        tape = _decompose(cache, qml.MottonenStatePreparation(state, wires=wires))
+
+        dev = qml.device("default.qubit", wires=2)
+        dev.apply(tape.operations)
+        assert np.allclose(dev.state, state)
+
+    def test_value_dependent_decomposition(self, mocker):
+        """Test that decompositions depending on the values of non-trainable parameters
+        are stored for each value of the parameters"""
+        cache = DecompositionCache()
+        spy = mocker.spy(qml.BasisStatePreparation, "compute_decomposition")
+        dev = qml.device("default.qubit", wires=2)
+
+        for state in [[0, 0], [1, 1], [0, 0], [1, 1]]:
+            op = qml.BasisStatePreparation(np.array(state, requires_grad=False), wires=[0, 1])
+            tape = _decompose(cache, op)
+
+            dev.reset()
+            dev.apply(tape.operations)
+            expected = np.zeros(4)
+            expected[2 * state[0] + state[1]] = 1
+            assert np.allclose(dev.state, expected)
+
+        # each value is decomposed once, plus once with probe parameters
+        assert spy.call_count == 3
+        assert len(cache) == 3
+
+    def test_value_dependent_trainable_decomposition(self):
+        """Test that decompositions depending on the values of trainable parameters
+        are recomputed"""
+        cache = DecompositionCache()
+        wires = [0, 1]
+
+        def state(x):
+            op = qml.MottonenStatePreparation(x, wires=wires)
+            tape = _decompose(cache, op)
+            dev = qml.device("default.qubit", wires=2)
+            dev.apply(tape.operations)
+            return dev.state
+
+        for x in [np.array([1, 0, 0, 0], requires_grad=True), np.array([1, 1, 1, 1]) / 2]:
+            assert np.allclose(state(x), x)
+
+    def test_different_wires(self):
+        """Test that decompositions are stored separately for operators on different wires"""
+        cache = DecompositionCache()
+
+        _decompose(cache, qml.Rot(0.1, 0.2, 0.3, wires=0))
+        tape = _decompose(cache, qml.Rot(0.1, 0.2, 0.3, wires=1))
+
+        assert len(cache) == 2
+        assert all(op.wires.tolist() == [1] for op in tape.operations)
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_different_hyperparameters(self):
+        """Test that decompositions are stored separately for operators whose hyperparameters
+        have the same string representation, such as Hamiltonians or truncated arrays"""
+        cache = DecompositionCache()
+
+        H1 = qml.Hamiltonian([0.1, 0.2], [qml.PauliZ(0), qml.PauliX(1)])
+        H2 = qml.Hamiltonian([0.1, 0.2], [qml.PauliX(0), qml.PauliZ(1)])
+
+        for _ in range(2):
+            _decompose(cache, qml.ApproxTimeEvolution(H1, 0.5, 1))
+
+        op = qml.ApproxTimeEvolution(H2, 0.5, 1)
+        tape = _decompose(cache, op)
+        assert tape.structure_key == op.expand().structure_key
+
+        class Permutation(qml.operation.Operation):
+            """Dummy operation whose decomposition depends on an array hyperparameter"""
+
+            num_wires = 1
+            num_params = 1
+
+            def __init__(self, x, perm, wires):
+                self._hyperparameters = {"perm": perm}
+                super().__init__(x, wires=wires)
+
+            @staticmethod
+            def compute_decomposition(x, wires, perm):  # pylint: disable=arguments-differ
+                return [qml.RX(x, wires=wires) if perm[500] else qml.RY(x, wires=wires)]
+
+        perm1 = np.arange(2000)
+        perm2 = perm1.copy()
+        perm2[500] = 0
+        assert str(perm1) == str(perm2)
+
+        for _ in range(2):
+            _decompose(cache, Permutation(0.1, perm1, wires=0))
+
+        tape = _decompose(cache, Permutation(0.1, perm2, wires=0))
+        assert [op.name for op in tape.operations] == ["RY"]
+
+    def test_undefined_decomposition(self):
+        """Test that an error is raised for operators without a decomposition"""
+        cache = DecompositionCache()
+        op = qml.Hermitian(np.eye(2), wires=0)
+
+        for _ in range(2):
+            with pytest.raises(DecompositionUndefinedError):
+                cache.expand(op)
+
+    def test_inactive(self):
+        """Test that the cache is not used outside of the ``active`` context"""
+        cache = DecompositionCache()
+
+        with qml.tape.QuantumTape() as tape:
+            qml.Rot(0.1, 0.2, 0.3, wires=0)
+
+        tape.expand()
+        assert len(cache) == 0
+
+    def test_qnode(self, mocker):
+        """Test that a QNode decomposes templates once across evaluations"""
+        dev = qml.device("default.qubit", wires=4)
+        spy = mocker.spy(qml.StronglyEntanglingLayers, "compute_decomposition")
+
+        @qml.qnode(dev, diff_method="parameter-shift")
+        def circuit(weights):
+            qml.StronglyEntanglingLayers(weights, wires=range(4))
+            return qml.expval(qml.PauliZ(0))
+
+        assert circuit.decomposition_cache is None
+        circuit.decomposition_cache = DecompositionCache()
+
+        shape = qml.StronglyEntanglingLayers.shape(n_layers=2, n_wires=4)
+        weights = np.random.random(shape, requires_grad=True)
+        circuit(weights)
+        assert spy.call_count == 2
+
+        weights = np.random.random(shape, requires_grad=True)
+        res = circuit(weights)
+        grad = qml.grad(circuit)(weights)
+        assert spy.call_count == 2
+
+        circuit.decomposition_cache = None
+        assert np.allclose(circuit(weights), res)
+        assert np.allclose(qml.grad(circuit)(weights), grad)
+        assert spy.call_count > 2
+
+    def test_qnode_basis_state(self):
+        """Test that a QNode preparing different basis states with a decomposition cache
+        prepares the requested states"""
+        dev = qml.device("default.qubit", wires=2)
+
+        @qml.qnode(dev, expansion_strategy="device")
+        def circuit(state):
+            qml.BasisStatePreparation(state, wires=[0, 1])
+            return qml.probs(wires=[0, 1])
+
+        circuit.decomposition_cache = DecompositionCache()
+
+        for state in [[0, 0], [1, 1], [0, 1]]:
+            expected = np.zeros(4)
+            expected[2 * state[0] + state[1]] = 1
+            assert np.allclose(circuit(np.array(state, requires_grad=False)), expected)
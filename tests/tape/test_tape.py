@@ -1921,6 +1921,79 @@ multi_measurements = [
 ]
 
 
+class TestStructureKey:
+    """Tests for the structure key of tapes"""
+
+    @staticmethod
+    def _tape(x, coeff=1.0, wire=0, trainable_params=None):
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(x, wires=wire)
+            qml.Rot(x, 0.2, 0.3, wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.Hamiltonian([coeff], [qml.PauliZ(0) @ qml.PauliX(1)]))
+
+        if trainable_params is not None:
+            tape.trainable_params = trainable_params
+
+        return tape
+
+    def test_independent_of_parameters(self):
+        """Tests that tapes differing only by their parameter values have the same structure key"""
+        tape1 = self._tape(0.1)
+        tape2 = self._tape(0.5, coeff=-0.4)
+
+        assert tape1.hash != tape2.hash
+        assert tape1.structure_key == tape2.structure_key
+
+    def test_depends_on_structure(self):
+        """Tests that tapes differing in wires, trainable parameters, operations or
+        measurements have different structure keys"""
+        tape = self._tape(0.1)
+        assert tape.structure_key != self._tape(0.1, wire=2).structure_key
+        assert tape.structure_key != self._tape(0.1, trainable_params=[0]).structure_key
+
+        with qml.tape.QuantumTape() as tape2:
+            qml.RY(0.1, wires=0)
+            qml.Rot(0.1, 0.2, 0.3, wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.Hamiltonian([1.0], [qml.PauliZ(0) @ qml.PauliX(1)]))
+
+        with qml.tape.QuantumTape() as tape3:
+            qml.RX(0.1, wires=0)
+            qml.Rot(0.1, 0.2, 0.3, wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.Hamiltonian([1.0], [qml.PauliZ(0) @ qml.PauliY(1)]))
+
+        assert tape.structure_key != tape2.structure_key
+        assert tape.structure_key != tape3.structure_key
+
+    def test_depends_on_parameter_shapes(self):
+        """Tests that broadcasted parameters change the structure key"""
+        tape1 = self._tape(0.1)
+        tape2 = self._tape(np.array([0.1, 0.2]))
+
+        assert tape1.structure_key != tape2.structure_key
+
+    def test_hyperparameters_compared_exactly(self):
+        """Tests that operators and measurements differing only in hyperparameters or
+        eigenvalues that have the same string representation have different structure keys"""
+        H1 = qml.Hamiltonian([0.1, 0.2], [qml.PauliZ(0), qml.PauliX(1)])
+        H2 = qml.Hamiltonian([0.1, 0.2], [qml.PauliX(0), qml.PauliZ(1)])
+        op1, op2 = qml.ApproxTimeEvolution(H1, 0.5, 1), qml.ApproxTimeEvolution(H2, 0.5, 1)
+
+        assert str(op1.hyperparameters.values()) == str(op2.hyperparameters.values())
+        assert op1.structure_key != op2.structure_key
+        assert op1.structure_key == qml.ApproxTimeEvolution(H1, 0.3, 1).structure_key
+
+        eigvals1 = np.array([1.0, -1.0])
+        eigvals2 = np.array([1.0, -1.0 + 1e-12])
+        m1 = qml.measurements.MeasurementProcess(qml.measurements.Expectation, eigvals=eigvals1)
+        m2 = qml.measurements.MeasurementProcess(qml.measurements.Expectation, eigvals=eigvals2)
+
+        assert str(eigvals1) == str(eigvals2)
+        assert m1.structure_key != m2.structure_key
+
+
 @pytest.mark.filterwarnings("ignore:Creating an ndarray from ragged nested sequences")
 class TestOutputShape:
     """Tests for determining the tape output shape of tapes."""
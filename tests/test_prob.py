@@ -71,16 +71,16 @@ def test_marginal_prob(init_state, tol):
 
 def test_marginal_prob_more_wires(init_state, mocker, tol):
     """Test that the correct marginal probability is returned, when the
-    states_to_binary method is used for probability computations."""
+    marginal probability is permuted for more than two wires."""
     dev = qml.device("default.qubit", wires=4)
     state = init_state(4)
 
-    spy = mocker.spy(qml.QubitDevice, "states_to_binary")
+    spy = mocker.spy(qml.QubitDevice, "_marginal_indices")
 
     @qml.qnode(dev)
     def circuit():
         qml.QubitStateVector(state, wires=list(range(4)))
-        return qml.probs(wires=[1, 0, 3])  # <--- more than 2 wires: states_to_binary used
+        return qml.probs(wires=[1, 0, 3])  # <--- more than 2 wires: permutation computed
 
     res = circuit()
 
@@ -158,6 +158,29 @@ class TestValidation:
         assert method == "backprop"
         assert isinstance(device, qml.devices.DefaultGaussian)
 
+    def test_validate_backprop_child_method_single_precision(self, monkeypatch):
+        """Test that the complex data type of a single-precision device is only passed
+        to a child device supporting backprop if its constructor accepts it"""
+        dev = qml.device("default.qubit", wires=1, c_dtype=np.complex64)
+        test_interface = "something"
+
+        orig_capabilities = dev.capabilities().copy()
+        orig_capabilities["passthru_devices"] = {test_interface: "default.gaussian"}
+        monkeypatch.setattr(dev, "capabilities", lambda: orig_capabilities)
+
+        method, _, device = QNode._validate_backprop_method(dev, test_interface)
+
+        assert method == "backprop"
+        assert isinstance(device, qml.devices.DefaultGaussian)
+
+    @pytest.mark.parametrize(
+        "name, accepted",
+        [("default.mixed", True), ("default.gaussian", False), ("nonexistent.device", False)],
+    )
+    def test_accepts_c_dtype(self, name, accepted):
+        """Test that devices accepting a complex data type argument are identified"""
+        assert QNode._accepts_c_dtype(name) is accepted
+
     def test_validate_backprop_child_method_wrong_interface(self, monkeypatch):
         """Test that the method for validating the backprop diff method
         tape raises an error if a child device supports backprop but using a different interface"""
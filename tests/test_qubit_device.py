@@ -385,28 +385,219 @@ class TestGenerateSamples:
 
         assert dev._samples == (number_of_states, dev.num_wires)
 
+    def test_basis_state_samples_stored(self):
+        """Test that samples are stored as basis states in base 10 representation, and are
+        only converted to the binary representation if raw samples are returned"""
+        dev = qml.device("default.qubit", wires=3, shots=100, seed=42)
+
+        with QuantumTape() as tape:
+            qml.Hadamard(wires=0)
+            qml.CNOT(wires=[0, 2])
+            qml.expval(qml.PauliZ(0))
+            qml.probs(wires=[2, 1])
+            qml.counts(wires=[0, 2])
+            qml.sample(qml.PauliZ(2))
+
+        expval, probs, counts, sample = dev.execute(tape)
+
+        assert dev._binary_samples is None
+        assert dev._basis_state_samples.shape == (100,)
+        assert set(np.unique(dev._basis_state_samples)) <= {0, 5}
+        assert np.isclose(probs[0] + probs[2], 1)
+        assert sum(counts.values()) == 100 and set(counts) <= {"00", "11"}
+
+        samples = dev._samples
+        assert samples.shape == (100, 3)
+        assert np.array_equal(samples @ [4, 2, 1], dev._basis_state_samples)
+        assert np.isclose(expval, np.mean(1 - 2 * samples[:, 0]))
+        assert np.array_equal(sample, 1 - 2 * samples[:, 2])
+
+    @pytest.mark.parametrize("all_outcomes", [False, True])
+    @pytest.mark.parametrize("bin_size", [None, 4])
+    def test_basis_states_to_counts(self, all_outcomes, bin_size):
+        """Test that counts computed from the sampled basis states agree with counts
+        computed from the binary samples"""
+        dev = qml.device("default.qubit", wires=3, shots=12)
+        dev._samples = np.random.randint(0, 2, size=(12, 3))
+        mp = qml.counts(wires=[2, 0], all_outcomes=all_outcomes)
+
+        res = dev.sample(mp, bin_size=bin_size, counts=True)
+
+        if bin_size is None:
+            expected = dev._samples_to_counts(dev._samples[:, [2, 0]], mp, 2)
+        else:
+            expected = [
+                dev._samples_to_counts(s, mp, 2)
+                for s in dev._samples[:, [2, 0]].reshape((-1, bin_size, 2))
+            ]
+
+        assert res == expected
+
+    @pytest.mark.parametrize("bin_size", [None, 4])
+    @pytest.mark.parametrize(
+        "mp", [qml.counts(wires=[2, 0]), qml.counts(), qml.counts(qml.PauliZ(1), all_outcomes=True)]
+    )
+    def test_broadcasted_counts(self, mp, bin_size):
+        """Test that the counts of each element of a broadcasted batch of samples are
+        computed separately"""
+        dev = qml.device("default.qubit", wires=3, shots=12)
+        samples = np.random.randint(0, 2, size=(2, 12, 3))
+        samples[0, :, 1] = 0
+        samples[1, :, 1] = 1
+        dev._samples = samples
+
+        res = dev.sample(mp, bin_size=bin_size, counts=True)
+        expected = []
+
+        for batch_samples in samples:
+            dev._samples = batch_samples
+            expected.append(dev.sample(mp, bin_size=bin_size, counts=True))
+
+        assert res == expected
+
+    def test_basis_state_counts_stored(self):
+        """Test that only the number of samples of each basis state is sampled if only counts
+        are measured, independently of the number of shots"""
+        dev = qml.device("default.qubit", wires=2, shots=10**12, seed=42)
+
+        with QuantumTape() as tape:
+            qml.Hadamard(wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.counts(wires=[0, 1])
+            qml.counts(qml.PauliZ(1), all_outcomes=True)
+
+        res = dev.execute(tape)
+
+        assert dev._basis_state_samples is None and dev._binary_samples is None
+        assert dev._basis_state_counts.shape == (4,)
+        assert set(res[0]) == {"00", "11"} and sum(res[0].values()) == 10**12
+        assert res[1] == {1: res[0]["00"], -1: res[0]["11"]}
+        assert np.isclose(res[0]["00"] / 10**12, 0.5)
+
+    @pytest.mark.parametrize(
+        "mp",
+        [
+            qml.counts(wires=[2, 0]),
+            qml.counts(wires=[2, 0, 1]),
+            qml.counts(wires=[1], all_outcomes=True),
+            qml.counts(),
+            qml.counts(qml.PauliX(1)),
+            qml.counts(qml.Hermitian(np.diag([1.0, 2.0, 2.0, 3.0]), wires=[0, 2])),
+            qml.counts(qml.Hermitian(np.diag(np.arange(8.0)), wires=[1, 2, 0])),
+            qml.counts(
+                qml.Hermitian(np.diag([4.0, 2.0, 2.0, 3.0]), wires=[2, 1]), all_outcomes=True
+            ),
+        ],
+    )
+    def test_sampled_counts(self, mp):
+        """Test that counts computed from the sampled number of occurrences of each basis
+        state agree with counts computed from the corresponding samples"""
+        dev = qml.device("default.qubit", wires=3, shots=30)
+        dev._basis_state_counts = np.array([3, 0, 7, 1, 0, 12, 5, 2])
+
+        res = dev.sample(mp, counts=True)
+        # samples with the sampled number of occurrences of each basis state
+        samples = dev._samples
+        assert np.array_equal(
+            np.bincount(samples @ [4, 2, 1], minlength=8), [3, 0, 7, 1, 0, 12, 5, 2]
+        )
+
+        dev._samples = samples
+        expected = dev.sample(mp, counts=True)
+
+        assert res == expected
+        assert list(res) == list(expected)
+
+    def test_basis_state_counts_expval_var_probs(self, mocker):
+        """Test that the number of samples of each basis state is sampled instead of the
+        individual samples if only expectation values, variances and probabilities are
+        measured"""
+        dev = qml.device("default.qubit", wires=2, shots=100000, seed=42)
+        spy = mocker.spy(dev, "sample_basis_states")
+
+        with QuantumTape() as tape:
+            qml.RY(0.6, wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(0) @ qml.PauliZ(1))
+            qml.var(qml.PauliZ(0))
+            qml.probs(wires=[1])
+
+        expval, var, probs = dev.execute(tape)
+
+        spy.assert_not_called()
+        assert dev._basis_state_counts.shape == (4,) and dev._basis_state_samples is None
+        assert np.isclose(expval, 1)
+        assert np.isclose(var, np.sin(0.6) ** 2, atol=0.01)
+        assert np.allclose(probs, [np.cos(0.3) ** 2, np.sin(0.3) ** 2], atol=0.01)
+
+    @pytest.mark.parametrize(
+        "obs",
+        [
+            qml.PauliZ(1),
+            qml.PauliX(0) @ qml.PauliZ(2),
+            qml.Hermitian(np.diag([1.0, 2.0, 2.0, 3.0]), wires=[2, 0]),
+            qml.Hermitian(np.diag([1.0, 2.0, 2.0, 3.0]), wires=[2, 0]) @ qml.Identity(1),
+            qml.Projector([1, 0], wires=[0, 1]),
+        ],
+    )
+    def test_sampled_expval_var(self, obs, tol):
+        """Test that expectation values and variances computed from the sampled number of
+        occurrences of each basis state agree with those computed from the corresponding
+        samples"""
+        dev = qml.device("default.qubit", wires=3, shots=30)
+        dev._basis_state_counts = np.array([3, 0, 7, 1, 0, 12, 5, 2])
+
+        res = [dev.expval(obs), dev.var(obs), dev.probability(wires=obs.wires)]
+
+        dev._samples = dev._samples
+        expected = [dev.expval(obs), dev.var(obs), dev.probability(wires=obs.wires)]
+
+        assert all(np.allclose(r, e, atol=tol, rtol=0) for r, e in zip(res, expected))
+
 
 class TestSampleBasisStates:
     """Test the sample_basis_states method"""
 
-    def test_sampling_with_correct_arguments(self, mock_qubit_device, monkeypatch):
-        """Tests that the sample_basis_states method samples with the correct arguments"""
+    def test_sampling_distribution(self, mock_qubit_device):
+        """Tests that the sample_basis_states method samples from the given distribution"""
 
-        shots = 1000
+        shots = 100000
 
         number_of_states = 4
         dev = mock_qubit_device()
         dev.shots = shots
+        dev._rng = np.random.default_rng(42)
         state_probs = [0.1, 0.2, 0.3, 0.4]
 
-        with monkeypatch.context() as m:
-            # Mock the numpy.random.choice method such that it returns the expected values
-            m.setattr("numpy.random.choice", lambda x, y, p: (x, y, p))
-            res = dev.sample_basis_states(number_of_states, state_probs)
+        res = dev.sample_basis_states(number_of_states, state_probs)
+
+        assert res.shape == (shots,)
+        assert np.allclose(np.bincount(res, minlength=4) / shots, state_probs, atol=0.01)
+
+    def test_sampling_zero_probabilities(self, mock_qubit_device):
+        """Tests that basis states with zero probability are never sampled"""
+
+        dev = mock_qubit_device()
+        dev.shots = 10000
+        state_probs = [0.0, 0.5, 0.0, 0.5, 0.0, 0.0, 0.0, 0.0]
+
+        res = dev.sample_basis_states(8, state_probs)
+        assert set(res.flat) == {1, 3}
+
+    def test_sampling_with_seed(self):
+        """Tests that devices initialized with the same seed draw the same samples"""
+
+        state_probs = [0.1, 0.2, 0.3, 0.4]
+        dev1 = qml.device("default.qubit", wires=2, shots=100, seed=1234)
+        dev2 = qml.device("default.qubit", wires=2, shots=100, seed=1234)
+        dev3 = qml.device("default.qubit", wires=2, shots=100, seed=4321)
 
-        assert np.array_equal(res[0], np.array([0, 1, 2, 3]))
-        assert res[1] == shots
-        assert res[2] == state_probs
+        res1 = dev1.sample_basis_states(4, state_probs)
+        res2 = dev2.sample_basis_states(4, state_probs)
+        res3 = dev3.sample_basis_states(4, state_probs)
+
+        assert np.array_equal(res1, res2)
+        assert not np.array_equal(res1, res3)
 
     def test_raises_deprecation_warning(self, mock_qubit_device, monkeypatch):
         """Test that sampling basis states on a device with shots=None produces a warning."""
@@ -423,31 +614,23 @@ class TestSampleBasisStates:
             dev.sample_basis_states(number_of_states, state_probs)
 
     @pytest.mark.filterwarnings("ignore:Creating an ndarray from ragged nested")
-    def test_sampling_with_broadcasting(self, mock_qubit_device, monkeypatch):
-        """Tests that the sample_basis_states method samples with the correct arguments
-        when using broadcasted probabilities"""
+    def test_sampling_with_broadcasting(self, mock_qubit_device):
+        """Tests that the sample_basis_states method samples from each of the
+        distributions when using broadcasted probabilities"""
 
-        shots = 1000
+        shots = 100000
 
         number_of_states = 4
         dev = mock_qubit_device()
         dev.shots = shots
-        state_probs = [[0.1, 0.2, 0.3, 0.4], [0.5, 0.2, 0.1, 0.2]]
-        # First run the sampling to see that it is using numpy.random.choice correctly
-        res = dev.sample_basis_states(number_of_states, state_probs)
-        assert qml.math.shape(res) == (2, shots)
-        assert set(res.flat).issubset({0, 1, 2, 3})
+        dev._rng = np.random.default_rng(42)
+        state_probs = [[0.1, 0.2, 0.3, 0.4], [0.5, 0.2, 0.1, 0.2], [0.0, 0.0, 0.0, 1.0]]
 
-        with monkeypatch.context() as m:
-            # Mock the numpy.random.choice method such that it returns the expected values
-            m.setattr("numpy.random.choice", lambda x, y, p: (x, y, p))
-            res = dev.sample_basis_states(number_of_states, state_probs)
+        res = dev.sample_basis_states(number_of_states, state_probs)
+        assert qml.math.shape(res) == (3, shots)
 
-        assert len(res) == 2
         for _res, prob in zip(res, state_probs):
-            assert np.array_equal(_res[0], np.array([0, 1, 2, 3]))
-            assert _res[1] == 1000
-            assert _res[2] == prob
+            assert np.allclose(np.bincount(_res, minlength=4) / shots, prob, atol=0.01)
 
 
 class TestStatesToBinary:
@@ -940,6 +1123,30 @@ class TestEstimateProb:
 
         assert np.allclose(res, expected)
 
+    @pytest.mark.parametrize("wires", [[0], [2, 0], [1, 2], [3, 1, 0], [0, 1, 2, 3], [2, 3, 0, 1]])
+    def test_marginal_indices(self, wires):
+        """Test that the basis states of some wires extracted from the basis states in base 10
+        representation agree with their binary representation"""
+        indices = np.arange(2**4)
+        binary = QubitDevice.states_to_binary(indices, 4)[:, wires]
+        expected = binary @ 2 ** np.arange(len(wires))[::-1]
+
+        assert np.array_equal(QubitDevice._marginal_indices(indices, 4, wires), expected)
+
+    def test_sample_indices_cached(self, mock_qubit_device_with_original_statistics):
+        """Test that the sampled basis states of each set of wires are computed once, and
+        recomputed once new samples are stored"""
+        dev = mock_qubit_device_with_original_statistics(wires=3)
+        dev._samples = np.array([[0, 1, 1], [1, 0, 1], [1, 1, 0]])
+
+        indices = dev._sample_indices([2, 0])
+        assert np.array_equal(indices, [2, 3, 1])
+        assert dev._sample_indices([2, 0]) is indices
+        assert np.array_equal(dev._sample_indices(), [3, 5, 6])
+
+        dev._samples = np.array([[0, 0, 1], [1, 0, 0], [1, 1, 0]])
+        assert np.array_equal(dev._sample_indices([2, 0]), [2, 1, 1])
+
 
 class TestMarginalProb:
     """Test the marginal_prob method"""
@@ -1269,6 +1476,92 @@ class TestBatchExecution:
         assert len(res) == 3
         assert np.allclose(res[0], dev.execute(empty_tape), rtol=tol, atol=0)
 
+    def test_invalid_max_workers(self):
+        """Tests that an error is raised if the number of workers is not positive."""
+        with pytest.raises(DeviceError, match="number of workers must be a positive integer"):
+            qml.device("default.qubit", wires=2, max_workers=0)
+
+    @pytest.mark.parametrize("max_workers", [2, 3, 8])
+    def test_parallel_result(self, max_workers, tol):
+        """Tests that executing circuits in parallel gives the same results as a serial
+        execution, and leaves the device in the state of the final circuit."""
+        tapes = []
+        for x in np.linspace(0.1, 1.0, 5):
+            with qml.tape.QuantumTape() as tape:
+                qml.RX(x, wires=0)
+                qml.CNOT(wires=[0, 1])
+                qml.probs(wires=[0, 1])
+
+            tapes.append(tape)
+
+        dev = qml.device("default.qubit", wires=2)
+        expected = dev.batch_execute(tapes)
+
+        parallel_dev = qml.device("default.qubit", wires=2, max_workers=max_workers)
+        res = parallel_dev.batch_execute(tapes)
+
+        assert len(res) == len(tapes)
+        for r, e in zip(res, expected):
+            assert np.allclose(r, e, atol=tol, rtol=0)
+
+        assert np.allclose(parallel_dev.state, dev.state, atol=tol, rtol=0)
+        assert parallel_dev.num_executions == dev.num_executions == len(tapes)
+
+    def test_parallel_tracker(self):
+        """Tests that circuits executed by worker threads are recorded by the tracker."""
+        tapes = [self.tape2] * 4
+        dev = qml.device("default.qubit", wires=2, max_workers=2)
+
+        with qml.Tracker(dev) as tracker:
+            dev.batch_execute(tapes)
+
+        assert tracker.totals == {"executions": 4, "batches": 1, "batch_len": 4}
+
+    def test_parallel_tracker_records(self):
+        """Tests that the tracker records the updates of the worker threads in the order of
+        the circuits, as for a serial execution."""
+
+        class TrackingDevice(qml.devices.DefaultQubit):
+            """Device recording the number of operations of each circuit"""
+
+            def execute(self, circuit, **kwargs):
+                if self.tracker.active:
+                    self.tracker.update(num_operations=len(circuit.operations))
+                    self.tracker.record()
+
+                return super().execute(circuit, **kwargs)
+
+        tapes = [self.tape1, self.tape2, self.tape1]
+
+        dev = TrackingDevice(wires=2, shots=100)
+        with qml.Tracker(dev) as expected:
+            dev.batch_execute(tapes)
+
+        dev = TrackingDevice(wires=2, shots=100, max_workers=3)
+        with qml.Tracker(dev) as tracker:
+            dev.batch_execute(tapes)
+
+        assert tracker.history == expected.history
+
+    def test_parallel_seeded_reproducible(self):
+        """Tests that seeded parallel executions are reproducible, and that circuits
+        executed by different threads draw different samples."""
+        with qml.tape.QuantumTape() as tape:
+            qml.Hadamard(wires=0)
+            qml.sample(qml.PauliZ(0))
+
+        tapes = [tape] * 6
+
+        res = [
+            qml.device("default.qubit", wires=1, shots=50, seed=42, max_workers=3).batch_execute(
+                tapes
+            )
+            for _ in range(3)
+        ]
+
+        assert all(np.array_equal(r, res[0]) for r in res[1:])
+        assert not all(np.array_equal(r, res[0][0]) for r in res[0][1:])
+
 
 class TestShotList:
     """Tests for passing shots as a list"""
@@ -1471,6 +1764,57 @@ class TestShotList:
         assert circuit.device._shot_vector == shot_vector
         assert circuit.device.shots == total_shots
 
+    measurements = [
+        [qml.expval(qml.PauliZ(0))],
+        [qml.var(qml.PauliX(1)), qml.expval(qml.PauliZ(0) @ qml.PauliY(2))],
+        [qml.probs(wires=[2, 0])],
+        [qml.expval(qml.Projector([1, 0], wires=[0, 2]))],
+        [qml.expval(qml.Projector([0], wires=[1])), qml.var(qml.Projector([1, 1], wires=[1, 2]))],
+        [qml.var(qml.Hermitian(np.diag([1.0, 2.0, 3.0, 5.0]), wires=[1, 2]))],
+    ]
+
+    @pytest.mark.parametrize("measurements", measurements)
+    @pytest.mark.parametrize(
+        "shot_list", [[1, 2, 3, 10], [(5, 3), 7, 1, (4, 2)], [(1, 20)], [(10, 3)]]
+    )
+    def test_partitioned_statistics(self, measurements, shot_list, mocker, monkeypatch):
+        """Test that the statistics of all partitions of a shot vector computed at once agree
+        with the statistics computed separately for each partition"""
+        with QuantumTape() as tape:
+            qml.RX(0.4, wires=0)
+            qml.RY(1.1, wires=1)
+            qml.CNOT(wires=[0, 2])
+            qml.Hadamard(wires=1)
+            for m in measurements:
+                qml.apply(m)
+
+        dev = qml.device("default.qubit", wires=3, shots=shot_list, seed=42)
+        spy = mocker.spy(dev, "statistics")
+        res = dev.execute(tape)
+        spy.assert_not_called()
+
+        dev = qml.device("default.qubit", wires=3, shots=shot_list, seed=42)
+        monkeypatch.setattr(dev, "_partitioned_statistics", lambda observables: None)
+        expected = dev.execute(tape)
+
+        assert np.shape(res) == np.shape(expected)
+        assert np.allclose(res, expected, atol=1e-10, rtol=0)
+
+    def test_partitioned_statistics_unsupported(self, mocker):
+        """Test that the statistics are computed separately for each partition if a
+        measurement is not supported by the vectorized computation"""
+        dev = qml.device("default.qubit", wires=2, shots=[5, (2, 3)])
+
+        with QuantumTape() as tape:
+            qml.Hadamard(wires=0)
+            qml.expval(qml.PauliZ(0))
+            qml.sample(qml.PauliZ(1))
+
+        spy = mocker.spy(dev, "statistics")
+        dev.execute(tape)
+
+        assert spy.call_count == 2
+
     def test_invalid_shot_list(self):
         """Test exception raised if the shot list is the wrong type"""
         with pytest.raises(qml.DeviceError, match="Shots must be"):
@@ -296,6 +296,166 @@ class TestAdjointJacobian:
         ):
             res = dev.adjoint_jacobian(tape)
 
+    def test_multiple_observables(self, tol):
+        """Test that the derivatives of several observables, whose bras are propagated
+        together, agree with the derivatives of each observable on its own"""
+        dev = qml.device("default.qubit", wires=3)
+        observables = [qml.PauliZ(0), qml.PauliX(1) @ qml.PauliY(2), qml.Hadamard(2)]
+
+        def ansatz():
+            qml.RX(0.4, wires=0)
+            qml.CRY(-0.3, wires=[0, 1])
+            qml.IsingXY(0.8, wires=[1, 2])
+            qml.PhaseShift(1.2, wires=2)
+            qml.Rot(0.1, -0.2, 0.5, wires=1)
+
+        with qml.tape.QuantumTape() as tape:
+            ansatz()
+            for obs in observables:
+                qml.expval(obs)
+
+        res = dev.adjoint_jacobian(tape)
+        assert res.shape == (3, 7)
+
+        for i, obs in enumerate(observables):
+            with qml.tape.QuantumTape() as single_tape:
+                ansatz()
+                qml.expval(obs)
+
+            expected = dev.adjoint_jacobian(single_tape)
+            assert np.allclose(res[i], expected[0], atol=tol, rtol=0)
+
+    def test_generators_reused(self, mocker):
+        """Test that the generator matrix is computed once per type of operation"""
+        dev = qml.device("default.qubit", wires=3)
+
+        with qml.tape.QuantumTape() as tape:
+            for layer in range(3):
+                for wire in range(3):
+                    qml.RX(0.1 * layer + wire, wires=wire)
+                    qml.RY(0.2 * layer - wire, wires=wire)
+                qml.CRZ(0.3 * layer, wires=[layer, (layer + 1) % 3])
+            qml.expval(qml.PauliZ(0))
+
+        spy = mocker.spy(qml, "generator")
+        dev.adjoint_jacobian(tape)
+
+        assert spy.call_count == 3
+
+    @pytest.mark.parametrize("use_starting_state", [False, True])
+    def test_broadcasted(self, use_starting_state, tol):
+        """Test that the derivatives of a broadcasted tape agree with the derivatives of
+        each batch element"""
+        dev = qml.device("default.qubit", wires=2)
+        x = np.array([0.4, -1.3, 2.1])
+
+        def ansatz(x):
+            qml.RX(x, wires=0)
+            qml.RY(0.6, wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.CRX(x, wires=[1, 0])
+            qml.RZ(-0.2, wires=1)
+            qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+            qml.expval(qml.PauliY(1))
+
+        with qml.tape.QuantumTape() as tape:
+            ansatz(x)
+
+        starting_state = None
+        if use_starting_state:
+            dev.execute(tape)
+            starting_state = dev._pre_rotated_state
+
+        res = dev.adjoint_jacobian(tape, starting_state=starting_state)
+        assert res.shape == (2, 3, 4)
+
+        for i, x_i in enumerate(x):
+            with qml.tape.QuantumTape() as single_tape:
+                ansatz(x_i)
+
+            expected = dev.adjoint_jacobian(single_tape)
+            assert np.allclose(res[:, i], expected, atol=tol, rtol=0)
+
+
+class TestAdjointVJP:
+    """Tests for the adjoint_vjp method"""
+
+    def test_not_expval(self):
+        """Test if a QuantumFunctionError is raised for a tape with measurements that are not
+        expectation values"""
+        dev = qml.device("default.qubit", wires=1)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.1, wires=0)
+            qml.var(qml.PauliZ(0))
+
+        with pytest.raises(qml.QuantumFunctionError, match="Adjoint differentiation method does"):
+            dev.adjoint_vjp(tape, np.array([1.0]))
+
+    def test_single_backward_pass(self, mocker, tol):
+        """Test that the vector-Jacobian product is computed with a single bra vector, and
+        agrees with the contraction of the Jacobian"""
+        dev = qml.device("default.qubit", wires=3)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.4, wires=0)
+            qml.CRY(-0.3, wires=[0, 1])
+            qml.IsingXY(0.8, wires=[1, 2])
+            qml.Rot(0.1, -0.2, 0.5, wires=1)
+            qml.expval(qml.PauliZ(0))
+            qml.expval(qml.PauliX(1) @ qml.PauliY(2))
+            qml.expval(qml.Hadamard(2))
+
+        dy = np.array([0.3, -1.2, 0.7])
+        spy = mocker.spy(dev, "_adjoint_backward")
+        res = dev.adjoint_vjp(tape, dy)
+
+        assert spy.call_args[0][2].shape == (1, 2, 2, 2)
+
+        expected = dy @ dev.adjoint_jacobian(tape)
+        assert res.shape == (6,)
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+    def test_use_device_state(self, tol):
+        """Test that the device state can be used as the starting state"""
+        dev = qml.device("default.qubit", wires=2)
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(0.4, wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.RY(-0.2, wires=1)
+            qml.expval(qml.PauliZ(0))
+            qml.expval(qml.PauliZ(1))
+
+        dy = np.array([1.0, 0.5])
+        res1 = dev.adjoint_vjp(tape, dy)
+
+        qml.execute([tape], dev, None)
+        res2 = dev.adjoint_vjp(tape, dy, use_device_state=True)
+
+        assert np.allclose(res1, res2, atol=tol, rtol=0)
+
+    def test_broadcasted(self, tol):
+        """Test that the vector-Jacobian product of a broadcasted tape has the shape of the
+        broadcasted parameters, and is summed over the batch for other parameters"""
+        dev = qml.device("default.qubit", wires=2)
+        x = np.array([0.4, -1.3, 2.1])
+
+        with qml.tape.QuantumTape() as tape:
+            qml.RX(x, wires=0)
+            qml.RY(0.6, wires=1)
+            qml.CNOT(wires=[0, 1])
+            qml.expval(qml.PauliZ(0) @ qml.PauliX(1))
+            qml.expval(qml.PauliY(1))
+
+        dy = np.array([[0.1, 0.2, 0.3], [-1.0, 0.4, 0.5]])
+        res = dev.adjoint_vjp(tape, dy)
+
+        jac = dev.adjoint_jacobian(tape)
+        assert len(res) == 2
+        assert np.allclose(res[0], np.einsum("kb,kb->b", dy, jac[..., 0]), atol=tol, rtol=0)
+        assert np.allclose(res[1], np.einsum("kb,kb->", dy, jac[..., 1]), atol=tol, rtol=0)
+
 
 class TestAdjointJacobianQNode:
     """Test QNode integration with the adjoint_jacobian method"""
@@ -357,6 +517,98 @@ class TestAdjointJacobianQNode:
 
         assert np.allclose(grad_A, grad_F, atol=tol, rtol=0)
 
+    @pytest.mark.autograd
+    def test_device_vjp(self, mocker, tol):
+        """Test that the gradient of a cost function of the outputs of a QNode is computed
+        with the adjoint vector-Jacobian product if device_vjp=True"""
+        dev = qml.device("default.qubit", wires=3)
+        params = np.array([0.54, 0.1, 0.5], requires_grad=True)
+
+        def circuit(params):
+            qml.RX(params[0], wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.RY(params[1], wires=1)
+            qml.CRZ(params[2], wires=[1, 2])
+            qml.Hadamard(wires=2)
+            return [qml.expval(qml.PauliZ(i)) for i in range(3)]
+
+        def cost(qnode):
+            return lambda params: np.sum(np.cos(qnode(params)))
+
+        qnode1 = QNode(circuit, dev, diff_method="adjoint", device_vjp=True)
+        spy_vjp = mocker.spy(dev, "adjoint_vjp")
+        spy_jac = mocker.spy(dev, "adjoint_jacobian")
+
+        grad_A = qml.grad(cost(qnode1))(params)
+
+        spy_vjp.assert_called_once()
+        spy_jac.assert_not_called()
+
+        qnode2 = QNode(circuit, dev, diff_method="parameter-shift")
+        grad_PS = qml.grad(cost(qnode2))(params)
+
+        assert np.allclose(grad_A, grad_PS, atol=tol, rtol=0)
+
+    @pytest.mark.autograd
+    def test_device_vjp_reuses_state(self, mocker, tol):
+        """Test that the adjoint vector-Jacobian product starts from the state stored on the
+        forward pass, instead of executing the circuit again"""
+        dev = qml.device("default.qubit", wires=2)
+        params = np.array([0.54, 0.1], requires_grad=True)
+
+        def circuit(params):
+            qml.RX(params[0], wires=0)
+            qml.CNOT(wires=[0, 1])
+            qml.RY(params[1], wires=1)
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliX(1))
+
+        def cost(qnode):
+            return lambda params: np.sum(np.cos(qnode(params)))
+
+        qnode1 = QNode(circuit, dev, diff_method="adjoint", device_vjp=True)
+        spy_execute = mocker.spy(dev, "execute")
+        spy_vjp = mocker.spy(dev, "adjoint_vjp")
+
+        grad_A = qml.grad(cost(qnode1))(params)
+
+        assert spy_execute.call_count == 1
+        assert spy_vjp.call_args[1]["starting_state"] is not None
+
+        qnode2 = QNode(circuit, dev, diff_method="parameter-shift")
+        grad_PS = qml.grad(cost(qnode2))(params)
+
+        assert np.allclose(grad_A, grad_PS, atol=tol, rtol=0)
+
+    @pytest.mark.autograd
+    def test_broadcasted(self, tol):
+        """Test that the gradient of a broadcasted QNode agrees with backpropagation"""
+        dev = qml.device("default.qubit", wires=2)
+        x = np.array([0.1, 0.4, 0.9], requires_grad=True)
+        y = np.array(0.3, requires_grad=True)
+
+        def circuit(x, y):
+            qml.RX(x, wires=0)
+            qml.RY(y, wires=1)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(0)), qml.expval(qml.PauliX(1))
+
+        def cost(qnode):
+            return lambda x, y: np.sum(qnode(x, y) ** 2)
+
+        qnode1 = QNode(circuit, dev, diff_method="adjoint", device_vjp=True)
+        grad_A = qml.grad(cost(qnode1))(x, y)
+
+        qnode2 = QNode(circuit, dev, diff_method="backprop")
+        grad_B = qml.grad(cost(qnode2))(x, y)
+
+        assert np.allclose(grad_A[0], grad_B[0], atol=tol, rtol=0)
+        assert np.allclose(grad_A[1], grad_B[1], atol=tol, rtol=0)
+
+        qnode3 = QNode(circuit, dev, diff_method="adjoint")
+
+        with pytest.raises(ValueError, match="only be differentiated with the adjoint method"):
+            qml.grad(cost(qnode3))(x, y)
+
     thetas = np.linspace(-2 * np.pi, 2 * np.pi, 8)
 
     @pytest.mark.autograd
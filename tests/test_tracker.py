@@ -14,9 +14,12 @@
 """
 Unit tests for the Tracker and constructor
 """
+import json
+
 import pytest
 
 import pennylane as qml
+from pennylane import numpy as np
 from pennylane import Tracker
 
 
@@ -160,6 +163,133 @@ class TestTrackerCoreBehavior:
         assert kwargs_called["latest"] == tracker.latest
 
 
+class TestTiming:
+    """Tests for timing the stages of the execution pipeline"""
+
+    def test_stage(self):
+        """Test that stages are recorded by active trackers with timing enabled only"""
+        tracker = Tracker(timing=True)
+        untimed = Tracker()
+
+        with qml.tracker.stage("outside"):
+            pass
+
+        with tracker, untimed:
+            with qml.tracker.stage("outer"):
+                with qml.tracker.stage("inner"):
+                    pass
+
+        with qml.tracker.stage("outside"):
+            pass
+
+        assert [s["stage"] for s in tracker.spans] == ["inner", "outer"]
+        assert [s["depth"] for s in tracker.spans] == [1, 0]
+        assert set(tracker.timings) == {"inner", "outer"}
+        assert tracker.timings["outer"] >= tracker.timings["inner"] >= 0
+        assert untimed.spans == []
+        assert "memory" not in tracker.spans[0]
+
+    def test_stage_decorator(self):
+        """Test that a stage can be used as a function decorator"""
+
+        @qml.tracker.stage("custom")
+        def f(x):
+            return 2 * x
+
+        with Tracker(timing=True) as tracker:
+            assert f(2) == 4
+
+        assert [s["stage"] for s in tracker.spans] == ["custom"]
+
+    def test_stage_exception(self):
+        """Test that a stage raising an exception is recorded"""
+        with Tracker(timing=True) as tracker:
+            with pytest.raises(ValueError, match="failed"):
+                with qml.tracker.stage("custom"):
+                    raise ValueError("failed")
+
+        assert list(tracker.timings) == ["custom"]
+
+    def test_reset(self):
+        """Test that recorded stages are reset upon entering a context"""
+        tracker = Tracker(timing=True)
+
+        with tracker:
+            with qml.tracker.stage("custom"):
+                pass
+
+        with tracker:
+            pass
+
+        assert tracker.timings == {}
+        assert tracker.spans == []
+
+    def test_memory(self):
+        """Test that the memory allocated by each stage is recorded"""
+        tracker = Tracker(timing=True, memory=True)
+
+        with tracker:
+            with qml.tracker.stage("outer"):
+                with qml.tracker.stage("inner"):
+                    x = np.ones(100000)
+
+                del x
+
+        inner, outer = tracker.spans
+        assert inner["memory"] >= 800000
+        assert outer["memory"] >= inner["memory"]
+
+    def test_memory_requires_timing(self):
+        """Test that an error is raised if memory is tracked without timing"""
+        with pytest.raises(ValueError, match="requires timing=True"):
+            Tracker(memory=True)
+
+    def test_execution_stages(self):
+        """Test that the stages of a QNode execution and gradient are timed"""
+        dev = qml.device("default.qubit", wires=2, shots=10)
+
+        @qml.qnode(dev, diff_method="parameter-shift")
+        def circuit(x):
+            qml.RX(x, wires=0)
+            qml.CNOT(wires=[0, 1])
+            return qml.expval(qml.PauliZ(1))
+
+        x = np.array(0.1, requires_grad=True)
+
+        with Tracker(dev, timing=True) as tracker:
+            qml.grad(circuit)(x)
+
+        stages = [s["stage"] for s in tracker.spans]
+        assert set(stages) == {
+            "construction",
+            "expansion",
+            "gradient_tapes",
+            "device_apply",
+            "measurement",
+            "postprocessing",
+        }
+        assert stages.count("device_apply") == tracker.totals["executions"] == 3
+        assert stages.count("measurement") == 3
+
+    def test_chrome_trace(self, tmp_path):
+        """Test that the stages are exported in the Chrome trace event format"""
+        with Tracker(timing=True, memory=True) as tracker:
+            with qml.tracker.stage("custom"):
+                pass
+
+        filename = tmp_path / "trace.json"
+        trace = tracker.to_chrome_trace(str(filename))
+
+        with open(filename, encoding="utf-8") as f:
+            assert json.load(f) == trace
+
+        (event,) = trace["traceEvents"]
+        assert event["name"] == "custom"
+        assert event["ph"] == "X"
+        assert event["dur"] == pytest.approx(tracker.spans[0]["duration"] * 1e6)
+        assert "memory" in event["args"]
+
+
 # Integration test definitions
 
 dev_qubit = qml.device("default.qubit", wires=1)
@@ -300,6 +300,61 @@ class TestSparse:
             )
             qml.utils.sparse_hamiltonian(H, wires=["a", "c", "b"])
 
+    def test_pauli_words_match_kronecker_products(self):
+        """Tests that the matrix built from the bitmasks of Pauli words matches the
+        one built from Kronecker products of the single-wire matrices"""
+        coeffs = [0.5, -0.2, 0.3, 1.1, 0.7]
+        obs = [
+            qml.PauliZ(0) @ qml.PauliZ(2),
+            qml.PauliY(0) @ qml.PauliX(1),
+            qml.PauliX(0) @ qml.PauliY(1),
+            qml.PauliY(2),
+            qml.Identity(1),
+        ]
+        H = qml.Hamiltonian(coeffs, obs)
+        wires = [2, 0, 3, 1]
+
+        sparse_matrix = qml.utils.sparse_hamiltonian(H, wires)
+        expected = qml.utils._sparse_hamiltonian_kron(coeffs, H.ops, qml.wires.Wires(wires))
+
+        assert sparse_matrix.has_sorted_indices
+        assert np.allclose(sparse_matrix.toarray(), expected.toarray())
+        assert np.allclose(sparse_matrix.toarray(), qml.matrix(H, wire_order=wires))
+
+    def test_matrix_cached(self, mocker):
+        """Tests that the matrix is cached on the Hamiltonian for each wire order"""
+        H = qml.Hamiltonian([0.5, -0.2], [qml.PauliZ(0) @ qml.PauliX(1), qml.PauliY(1)])
+        spy = mocker.spy(qml.utils, "_sparse_hamiltonian_pauli")
+
+        res1 = qml.utils.sparse_hamiltonian(H)
+        res2 = qml.utils.sparse_hamiltonian(H)
+        assert res1 is res2
+        assert spy.call_count == 1
+
+        res3 = qml.utils.sparse_hamiltonian(H, wires=[1, 0])
+        assert res3 is not res1
+        assert spy.call_count == 2
+        assert np.allclose(res3.toarray(), qml.matrix(H, wire_order=[1, 0]))
+
+    def test_cache_invalidated_by_new_coefficients(self):
+        """Tests that the cached matrix is rebuilt if the coefficients change"""
+        H = qml.Hamiltonian([0.5, -0.2], [qml.PauliZ(0) @ qml.PauliX(1), qml.PauliY(1)])
+        res1 = qml.utils.sparse_hamiltonian(H)
+
+        H.data = [np.array(0.1), np.array(0.3)]
+        res2 = qml.utils.sparse_hamiltonian(H)
+
+        assert res2 is not res1
+        assert np.allclose(res2.toarray(), qml.matrix(H))
+
+    def test_empty_hamiltonian(self):
+        """Tests that a Hamiltonian without terms results in the zero matrix"""
+        H = qml.Hamiltonian([], [])
+        sparse_matrix = qml.utils.sparse_hamiltonian(H, wires=[0, 1])
+
+        assert sparse_matrix.shape == (4, 4)
+        assert sparse_matrix.nnz == 0
+
 
 class TestFlatten:
     """Tests the flatten and unflatten functions"""